@@ -1,6 +1,12 @@
 -- Use the prospectio database
 \c prospectio;
 
+-- Trigram matching for the partial, case-insensitive searches
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Vector similarity for the description embeddings
+CREATE EXTENSION IF NOT EXISTS vector;
+
 -- Create companies table
 CREATE TABLE IF NOT EXISTS companies (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -14,10 +20,33 @@ CREATE TABLE IF NOT EXISTS companies (
     website TEXT,
     description TEXT,
     opportunities TEXT[],
+    description_embedding vector(768),
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Normalized deduplication keys, shared by the unique indexes and the upsert statements
+CREATE OR REPLACE FUNCTION job_dedup_key(
+    job_title TEXT, location TEXT, company_id UUID, job_type TEXT, description TEXT
+)
+RETURNS TEXT AS $$
+    SELECT md5(
+        coalesce(lower(trim(job_title)), '') || '|' ||
+        coalesce(lower(trim(location)), '') || '|' ||
+        coalesce(company_id::text, '') || '|' ||
+        coalesce(lower(trim(job_type)), '') || '|' ||
+        coalesce(lower(trim(description)), '')
+    );
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Contacts are deduplicated per company, contacts without name are never deduplicated
+CREATE OR REPLACE FUNCTION contact_dedup_key(company_id UUID, name TEXT, title TEXT)
+RETURNS TEXT AS $$
+    SELECT CASE WHEN nullif(trim(name), '') IS NOT NULL THEN
+        coalesce(company_id::text, '') || '|' || lower(trim(name)) || '|' || coalesce(lower(trim(title)), '')
+    END;
+$$ LANGUAGE sql IMMUTABLE;
+
 -- Create jobs table
 CREATE TABLE IF NOT EXISTS jobs (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -32,6 +61,10 @@ CREATE TABLE IF NOT EXISTS jobs (
     sectors TEXT,
     apply_url TEXT[],
     compatibility_score INTEGER,
+    description_embedding vector(768),
+    dedup_key TEXT GENERATED ALWAYS AS (
+        job_dedup_key(job_title, location, company_id, job_type, description)
+    ) STORED,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
@@ -62,13 +95,91 @@ CREATE TABLE IF NOT EXISTS profile (
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Create provider responses cache table
+CREATE TABLE IF NOT EXISTS provider_responses (
+    cache_key VARCHAR(64) PRIMARY KEY,
+    provider TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    params JSONB NOT NULL,
+    payload BYTEA NOT NULL,
+    fetched_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create compatibility scores cache table
+CREATE TABLE IF NOT EXISTS compatibility_scores (
+    cache_key VARCHAR(64) PRIMARY KEY,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    score SMALLINT NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Upgrade the tables of a volume created before the deduplication keys and the embeddings
+ALTER TABLE companies ADD COLUMN IF NOT EXISTS description_embedding vector(768);
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS description_embedding vector(768);
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS dedup_key TEXT GENERATED ALWAYS AS (
+    job_dedup_key(job_title, location, company_id, job_type, description)
+) STORED;
+
+-- Merge the duplicates an older volume may hold, so the unique indexes below can be built.
+-- Companies keep their oldest row, their jobs and contacts are moved to it.
+BEGIN;
+
+CREATE TEMP TABLE company_duplicates ON COMMIT DROP AS
+SELECT id, kept_id FROM (
+    SELECT id, first_value(id) OVER (PARTITION BY lower(trim(name)) ORDER BY created_at, id) AS kept_id
+    FROM companies
+    WHERE name IS NOT NULL
+) ranked
+WHERE id <> kept_id;
+
+UPDATE jobs SET company_id = d.kept_id FROM company_duplicates d WHERE jobs.company_id = d.id;
+UPDATE contacts SET company_id = d.kept_id FROM company_duplicates d WHERE contacts.company_id = d.id;
+DELETE FROM companies USING company_duplicates d WHERE companies.id = d.id;
+
+-- Jobs keep their scored row first, then their oldest one, their contacts are moved to it
+CREATE TEMP TABLE job_duplicates ON COMMIT DROP AS
+SELECT id, kept_id FROM (
+    SELECT id, first_value(id) OVER (
+        PARTITION BY dedup_key ORDER BY compatibility_score IS NULL, created_at, id
+    ) AS kept_id
+    FROM jobs
+) ranked
+WHERE id <> kept_id;
+
+UPDATE contacts SET job_id = d.kept_id FROM job_duplicates d WHERE contacts.job_id = d.id;
+DELETE FROM jobs USING job_duplicates d WHERE jobs.id = d.id;
+
+-- Contacts keep their oldest row
+DELETE FROM contacts USING (
+    SELECT id, first_value(id) OVER (
+        PARTITION BY contact_dedup_key(company_id, name, title) ORDER BY created_at, id
+    ) AS kept_id
+    FROM contacts
+    WHERE contact_dedup_key(company_id, name, title) IS NOT NULL
+) ranked
+WHERE contacts.id = ranked.id AND ranked.id <> ranked.kept_id;
+
+COMMIT;
+
 -- Create indexes for better performance
 CREATE INDEX IF NOT EXISTS idx_jobs_company_id ON jobs(company_id);
 CREATE INDEX IF NOT EXISTS idx_contacts_company_id ON contacts(company_id);
 CREATE INDEX IF NOT EXISTS idx_contacts_job_id ON contacts(job_id);
 CREATE INDEX IF NOT EXISTS idx_companies_name ON companies(name);
-CREATE INDEX IF NOT EXISTS idx_jobs_title ON jobs(job_title);
+CREATE INDEX IF NOT EXISTS idx_jobs_title_trgm ON jobs USING gin (job_title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_jobs_location_trgm ON jobs USING gin (location gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_companies_name_trgm ON companies USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_contacts_name_trgm ON contacts USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_contacts_title_trgm ON contacts USING gin (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_jobs_score_id ON jobs ((COALESCE(compatibility_score, -1)) DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_contacts_email ON contacts(email);
+CREATE INDEX IF NOT EXISTS idx_provider_responses_fetched_at ON provider_responses(fetched_at);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_companies_name_key ON companies ((lower(trim(name))));
+CREATE UNIQUE INDEX IF NOT EXISTS uq_jobs_dedup_key ON jobs (dedup_key);
+CREATE INDEX IF NOT EXISTS idx_jobs_description_embedding ON jobs USING hnsw (description_embedding vector_cosine_ops);
+CREATE INDEX IF NOT EXISTS idx_companies_description_embedding ON companies USING hnsw (description_embedding vector_cosine_ops);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_contacts_dedup_key ON contacts ((contact_dedup_key(company_id, name, title)));
 
 -- Create function to automatically update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -80,22 +191,22 @@ END;
 $$ language 'plpgsql';
 
 -- Create triggers to automatically update updated_at column
-CREATE TRIGGER update_companies_updated_at 
+CREATE OR REPLACE TRIGGER update_companies_updated_at 
     BEFORE UPDATE ON companies 
     FOR EACH ROW 
     EXECUTE FUNCTION update_updated_at_column();
 
-CREATE TRIGGER update_jobs_updated_at 
+CREATE OR REPLACE TRIGGER update_jobs_updated_at 
     BEFORE UPDATE ON jobs 
     FOR EACH ROW 
     EXECUTE FUNCTION update_updated_at_column();
 
-CREATE TRIGGER update_contacts_updated_at 
+CREATE OR REPLACE TRIGGER update_contacts_updated_at 
     BEFORE UPDATE ON contacts 
     FOR EACH ROW 
     EXECUTE FUNCTION update_updated_at_column();
 
-CREATE TRIGGER update_profiles_updated_at 
+CREATE OR REPLACE TRIGGER update_profiles_updated_at 
     BEFORE UPDATE ON profile
     FOR EACH ROW 
     EXECUTE FUNCTION update_updated_at_column();
\ No newline at end of file
@@ -0,0 +1,39 @@
+import logging
+import traceback
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+from domain.ports.enrich_leads import EnrichLeadsPort
+
+
+logger = logging.getLogger(__name__)
+
+
+def debug_router(
+    enrich_leads: EnrichLeadsPort,
+) -> APIRouter:
+    """
+    Create an APIRouter exposing debugging views of the injected components.
+
+    Args:
+        enrich_leads (EnrichLeadsPort): The enrichment agent.
+
+    Returns:
+        APIRouter: Configured router with debug endpoints.
+    """
+    debug_router = APIRouter()
+
+    @debug_router.get("/debug/enrich/graph", response_class=PlainTextResponse)
+    async def get_enrich_graph() -> str:
+        """
+        Get the graph of the enrichment agent, to paste in any Mermaid viewer.
+
+        Returns:
+            str: The graph as a Mermaid diagram.
+        """
+        try:
+            return enrich_leads.draw()
+        except Exception as e:
+            logger.error(f"Error in get enrich graph: {e}\n{traceback.format_exc()}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    return debug_router
@@ -1,17 +1,21 @@
 import asyncio
 import logging
 import traceback
-from typing import Union
-from fastapi import APIRouter, HTTPException, Path
+from typing import Optional, Union
+from fastapi import APIRouter, HTTPException, Path, Query
 from application.requests.insert_leads import InsertLeadsRequest
 from application.use_cases.generate_message import GenerateMessageUseCase
 from application.use_cases.get_leads import GetLeadsUseCase
+from application.use_cases.search_leads import SearchLeadsUseCase
+from application.use_cases.similar_jobs import SimilarJobsUseCase
 from domain.entities.company import CompanyEntity
 from domain.entities.contact import ContactEntity
 from domain.entities.job import JobEntity
 from domain.entities.leads import Leads
 from domain.entities.prospect_message import ProspectMessage
+from domain.entities.search import SearchFilters, SearchResult
 from domain.ports.compatibility_score import CompatibilityScorePort
+from domain.ports.embedder import EmbedderPort
 from domain.ports.enrich_leads import EnrichLeadsPort
 from domain.ports.generate_message import GenerateMessagePort
 from domain.ports.profile_respository import ProfileRepositoryPort
@@ -22,7 +26,8 @@ from prospectio_api_mcp.application.use_cases.insert_leads import (
 )
 from collections.abc import Callable
 from domain.services.leads.strategy import LeadsStrategy
-from domain.ports.leads_repository import LeadsRepositoryPort
+from domain.ports.leads_cache import LeadsCachePort
+from domain.ports.leads_repository import InvalidCursorError, LeadsRepositoryPort
 from application.api.mcp_routes import mcp_prospectio
 from uuid import uuid4
 from domain.entities.task import Task
@@ -39,6 +44,8 @@ def leads_router(
     enrich_port: EnrichLeadsPort,
     message_port: GenerateMessagePort,
     task_manager: TaskManagerPort,
+    leads_cache: Optional[LeadsCachePort] = None,
+    embedder: Optional[EmbedderPort] = None,
 ) -> APIRouter:
     """
     Create an APIRouter for company jobs endpoints with injected strategy.
@@ -46,6 +53,8 @@ def leads_router(
     Args:
         jobs_strategy (dict[str, callable]): Mapping of source to strategy factory.
         repository (LeadsRepositoryPort): Repository for data persistence.
+        leads_cache (Optional[LeadsCachePort]): Read-through cache of the get/leads pages.
+        embedder (Optional[EmbedderPort]): Embedder of the descriptions, None when the embeddings are disabled.
     Returns:
         APIRouter: Configured router with endpoints.
     """
@@ -56,6 +65,7 @@ def leads_router(
         description="ALWAYS USE THIS FIRST to retrieve existing data from the database before searching for new opportunities. "
         "Returns companies, jobs, contacts or leads that are already stored in the database. "
         "This endpoint is paginated: use the 'offset' parameter to paginate through results. Offset begins at 0. "
+        "Each page returns a 'next_cursor': pass it as 'cursor' to fetch the following page efficiently (offset is then ignored). "
         "Pagination size: 5 for companies, 10 for contacts, 3 for jobs. "
         "Use this tool when the user wants to see existing leads, companies, jobs, or contacts. "
         "Only use the insert/leads endpoint when the user specifically asks for new opportunities or when no relevant data is found in the database. "
@@ -66,14 +76,63 @@ def leads_router(
         type: str = Path(..., description="Lead source"),
         offset: int = Path(..., description="Offset for pagination"),
         limit: int = Path(..., description="Limit for pagination"),
+        cursor: Optional[str] = Query(
+            None, description="Opaque cursor returned as 'next_cursor' by the previous page"
+        ),
     ) -> Union[Leads, CompanyEntity, JobEntity, ContactEntity]:
         try:
-            leads = await GetLeadsUseCase(type, repository).get_leads(offset, limit)
+            leads = await GetLeadsUseCase(type, repository, leads_cache).get_leads(offset, limit, cursor)
             return leads
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except Exception as e:
             logger.error(f"Error in get leads: {e}\n{traceback.format_exc()}")
             raise HTTPException(status_code=500, detail=str(e))
 
+    @leads_router.get("/search/{type}")
+    @mcp_prospectio.tool(
+        description="Search companies, jobs or contacts already stored in the database with text filters. "
+        "Use this instead of paginating through get/leads when looking for something specific. "
+        "The parameter 'type' can be: 'companies', 'jobs' or 'contacts'. "
+        "Filters are partial and case-insensitive: 'job_title' and 'location' apply to jobs, "
+        "'company' to jobs, companies and contacts, 'contact' matches the contact name or title. "
+        "The response metadata contains the number of results and the query time in milliseconds. "
+        "Example: GET /search/jobs?job_title=python&location=paris&limit=10"
+    )
+    async def search_leads(
+        type: str = Path(..., description="Data type to search"),
+        job_title: Optional[str] = Query(None, description="Text contained in the job title"),
+        location: Optional[str] = Query(None, description="Text contained in the job location"),
+        company: Optional[str] = Query(None, description="Text contained in the company name"),
+        contact: Optional[str] = Query(None, description="Text contained in the contact name or title"),
+        limit: int = Query(10, ge=1, le=100, description="Maximum number of results"),
+    ) -> SearchResult:
+        try:
+            filters = SearchFilters(
+                job_title=job_title, location=location, company=company, contact=contact
+            )
+            return await SearchLeadsUseCase(type, repository).search(filters, limit)
+        except Exception as e:
+            logger.error(f"Error in search leads: {e}\n{traceback.format_exc()}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    @leads_router.get("/similar/jobs")
+    @mcp_prospectio.tool(
+        description="Find the stored jobs whose description is the closest in meaning to the user profile. "
+        "Unlike search/jobs, this does not need matching words: the profile and the job descriptions are compared as embeddings. "
+        "Use this when the user asks for the jobs that fit their profile best among the existing data. "
+        "Only jobs inserted while embeddings are enabled are ranked. "
+        "Example: GET /similar/jobs?limit=10"
+    )
+    async def similar_jobs(
+        limit: int = Query(10, ge=1, le=100, description="Maximum number of jobs"),
+    ) -> JobEntity:
+        try:
+            return await SimilarJobsUseCase(repository, profile_repository, embedder).get_similar_jobs(limit)
+        except Exception as e:
+            logger.error(f"Error in similar jobs: {e}\n{traceback.format_exc()}")
+            raise HTTPException(status_code=500, detail=str(e))
+
     @leads_router.post("/insert/leads")
     @mcp_prospectio.tool(
         description="Use this ONLY when the user asks for NEW opportunities/leads or when get/leads returns insufficient data. "
@@ -110,7 +169,8 @@ def leads_router(
 
             asyncio.create_task(
                 InsertLeadsUseCase(
-                    task_uuid, strategy, repository, processor, profile_repository, enrich_port, task_manager
+                    task_uuid, strategy, repository, processor, profile_repository, enrich_port, task_manager,
+                    embedder=embedder,
                 ).insert_leads()
             )
 
@@ -0,0 +1,38 @@
+import logging
+import traceback
+from fastapi import APIRouter, HTTPException
+from domain.ports.metrics import MetricsPort
+
+
+logger = logging.getLogger(__name__)
+
+
+def metrics_router(
+    providers: dict[str, MetricsPort],
+) -> APIRouter:
+    """
+    Create an APIRouter exposing the runtime metrics of the injected components.
+
+    Args:
+        providers (dict[str, MetricsPort]): Mapping of metrics group name to its provider.
+
+    Returns:
+        APIRouter: Configured router with metrics endpoints.
+    """
+    metrics_router = APIRouter()
+
+    @metrics_router.get("/metrics")
+    async def get_metrics() -> dict[str, dict[str, float]]:
+        """
+        Get a snapshot of every metrics group.
+
+        Returns:
+            dict[str, dict[str, float]]: Metrics grouped by provider name.
+        """
+        try:
+            return {name: provider.get_metrics() for name, provider in providers.items()}
+        except Exception as e:
+            logger.error(f"Error in get metrics: {e}\n{traceback.format_exc()}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    return metrics_router
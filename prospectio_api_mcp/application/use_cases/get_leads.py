@@ -3,6 +3,7 @@ from domain.entities.company import CompanyEntity
 from domain.entities.contact import ContactEntity
 from domain.entities.job import JobEntity
 from domain.entities.leads import Leads
+from domain.ports.leads_cache import LeadsCachePort
 from domain.ports.leads_repository import LeadsRepositoryPort
 
 
@@ -12,23 +13,74 @@ class GetLeadsUseCase:
     This class acts as a dispatcher to fetch specific data types based on the requested type.
     """
 
-    def __init__(self, type: str, repository: LeadsRepositoryPort):
+    RESULT_TYPES: dict[str, type[Union[Leads, CompanyEntity, JobEntity, ContactEntity]]] = {
+        "companies": CompanyEntity,
+        "jobs": JobEntity,
+        "contacts": ContactEntity,
+        "leads": Leads,
+    }
+
+    def __init__(
+        self,
+        type: str,
+        repository: LeadsRepositoryPort,
+        cache: Optional[LeadsCachePort] = None,
+    ):
         """
         Initialize the InsertCompanyJobsUseCase with the data type and repository.
 
         Args:
             type (str): The data type to retrieve ('companies', 'jobs', 'contacts', or 'leads').
             repository (LeadsRepositoryPort): The repository interface for data access.
+            cache (Optional[LeadsCachePort]): Read-through cache of the pages, disabled when None.
         """
         self.type = type
         self.repository = repository
+        self.cache = cache
 
     async def get_leads(
-        self, offset: int, limit: int
+        self, offset: int, limit: int, cursor: Optional[str] = None
+    ) -> Union[Leads, CompanyEntity, JobEntity, ContactEntity]:
+        """
+        Retrieve data based on the specified type, from the cache when a fresh page is available.
+
+        Args:
+            offset (int): Number of items to skip (ignored when a cursor is given).
+            limit (int): Maximum number of items to return.
+            cursor (Optional[str]): Opaque keyset cursor returned by the previous page.
+
+        Returns:
+            Union[Leads, CompanyEntity, JobEntity, ContactEntity]: The retrieved data object
+            corresponding to the requested type.
+
+        Raises:
+            KeyError: If the specified type is not supported ('companies', 'jobs', 'contacts', 'leads').
+        """
+        if self.cache is None:
+            return await self._get_from_repository(offset, limit, cursor)
+        result_type = self.RESULT_TYPES.get(self.type)
+        if result_type is None:
+            raise KeyError(f"Unsupported type: {self.type}")
+        key = f"{self.type}:{offset}:{limit}:{cursor or ''}"
+        generation = await self.cache.generation()
+        cached = await self.cache.get(generation, key)
+        if cached is not None:
+            return result_type.model_validate_json(cached)
+        result = await self._get_from_repository(offset, limit, cursor)
+        await self.cache.set(generation, key, result.model_dump_json())
+        return result
+
+    async def _get_from_repository(
+        self, offset: int, limit: int, cursor: Optional[str] = None
     ) -> Union[Leads, CompanyEntity, JobEntity, ContactEntity]:
         """
         Retrieve data based on the specified type from the repository.
 
+        Args:
+            offset (int): Number of items to skip (ignored when a cursor is given).
+            limit (int): Maximum number of items to return.
+            cursor (Optional[str]): Opaque keyset cursor returned by the previous page.
+
         Returns:
             Union[Leads, CompanyEntity, JobEntity, ContactEntity]: The retrieved data object
             corresponding to the requested type.
@@ -37,12 +89,12 @@ class GetLeadsUseCase:
             KeyError: If the specified type is not supported ('companies', 'jobs', 'contacts', 'leads').
         """
         if self.type == "companies":
-            return await self.repository.get_companies(offset, limit)
+            return await self.repository.get_companies(offset, limit, cursor)
         elif self.type == "jobs":
-            return await self.repository.get_jobs(offset, limit)
+            return await self.repository.get_jobs(offset, limit, cursor)
         elif self.type == "contacts":
-            return await self.repository.get_contacts(offset, limit)
+            return await self.repository.get_contacts(offset, limit, cursor)
         elif self.type == "leads":
-            return await self.repository.get_leads(offset, limit)
+            return await self.repository.get_leads(offset, limit, cursor)
         else:
             raise KeyError(f"Unsupported type: {self.type}")
@@ -1,3 +1,14 @@
+import logging
+from typing import Optional
+from config import PipelineConfig
+from domain.entities.company import Company, CompanyEntity
+from domain.entities.contact import ContactEntity
+from domain.entities.job import JobEntity
+from domain.entities.leads import Leads
+from domain.entities.pipeline_stats import StageStats
+from domain.entities.profile import Profile
+from domain.entities.upsert_result import UpsertResult
+from domain.ports.embedder import EmbedderPort
 from domain.ports.enrich_leads import EnrichLeadsPort
 from domain.ports.profile_respository import ProfileRepositoryPort
 from domain.ports.task_manager import TaskManagerPort
@@ -5,12 +16,17 @@ from domain.services.leads.strategy import LeadsStrategy
 from domain.entities.leads_result import LeadsResult
 from domain.ports.leads_repository import LeadsRepositoryPort
 from domain.services.leads.leads_processor import LeadsProcessor
+from domain.services.pipeline import Pipeline, Stage
 
 
+logger = logging.getLogger(__name__)
+
 class InsertLeadsUseCase:
     """
     Use case for retrieving leads with contacts from a specified source using the strategy pattern.
-    This class selects the appropriate strategy based on the source and delegates the lead retrieval logic.
+    The leads flow through a staged pipeline (deduplicate, diff against the database, score,
+    enrich, persist, and embed when an embedder is given) as the provider pages arrive, instead
+    of waiting for the whole fetch.
     """
 
     def __init__(
@@ -21,16 +37,23 @@ class InsertLeadsUseCase:
         leads_processor: LeadsProcessor,
         profile_repository: ProfileRepositoryPort,
         enrich_leads: EnrichLeadsPort,
-        task_manager: TaskManagerPort
+        task_manager: TaskManagerPort,
+        config: Optional[PipelineConfig] = None,
+        embedder: Optional[EmbedderPort] = None,
     ):
         """
-        Initialize the GetLeadsUseCase with the required parameters and available strategies.
+        Initialize the InsertLeadsUseCase with the strategy and the services of each stage.
 
         Args:
-            source (str): The lead source identifier (e.g., 'mantiks', 'clearbit').
-            location (str): The location to search for leads.
-            job_title (list[str]): List of job titles to filter leads.
-            port (ProspectAPIPort): The port interface to the external prospect API.
+            task_uuid (str): ID of the task reporting the progress of the insertion.
+            strategy (LeadsStrategy): The strategy fetching the leads from the source.
+            repository (LeadsRepositoryPort): The leads repository.
+            leads_processor (LeadsProcessor): Deduplication, diff and scoring of the leads.
+            profile_repository (ProfileRepositoryPort): The profile repository.
+            enrich_leads (EnrichLeadsPort): The enrichment agent.
+            task_manager (TaskManagerPort): The task manager.
+            config (Optional[PipelineConfig]): Queue sizes, concurrency and batch size of the pipeline.
+            embedder (Optional[EmbedderPort]): Embeds the descriptions of the saved jobs and companies.
         """
         self.strategy = strategy
         self.repository = repository
@@ -39,15 +62,17 @@ class InsertLeadsUseCase:
         self.enrich_leads = enrich_leads
         self.task_uuid = task_uuid
         self.task_manager = task_manager
+        self.config = config or PipelineConfig()
+        self.embedder = embedder
 
     async def insert_leads(self) -> LeadsResult:
         """
-        Retrieve leads using the selected strategy for the given source.
+        Retrieve leads using the selected strategy and insert the new ones.
 
         Returns:
-            str: The leads data as a string (JSON or similar).
+            LeadsResult: Statistics about the inserted companies, jobs and contacts.
         Raises:
-            KeyError: If the specified source is not supported.
+            ValueError: If no profile exists or the source returned no jobs or companies.
         """
         self.task = await self.task_manager.submit_task(self.task_uuid)
         profile = await self.profile_repository.get_profile()
@@ -56,66 +81,224 @@ class InsertLeadsUseCase:
             raise ValueError(
                 "Profile not found. Please create a profile before inserting leads."
             )
-        leads = await self.strategy.execute()
-        if not leads.jobs:
-            await self.task_manager.update_task(self.task_uuid, "No jobs found in the leads data.", "failed")
+        self.profile: Profile = profile
+        self.fetched = {"companies": 0, "jobs": 0}
+        self.inserted = {"companies": 0, "jobs": 0, "contacts": 0}
+        self.seen_companies: dict[str, str] = {}
+        self.seen_jobs: set[tuple] = set()
+        self.existing_companies: dict[str, str] = {}
+        self.pending_companies: dict[str, Company] = {}
+
+        stages = [
+            Stage("deduplicate", self._deduplicate),
+            Stage("diff", self._diff),
+            Stage("score", self._score, self.config.PIPELINE_SCORE_CONCURRENCY),
+            Stage("enrich", self._enrich, self.config.PIPELINE_ENRICH_CONCURRENCY),
+            Stage("persist", self._persist, batch_size=self.config.PIPELINE_PERSIST_BATCH_SIZE),
+        ]
+        if self.embedder is not None:
+            stages.append(Stage("embed", self._embed))
+        pipeline = Pipeline(
+            stages,
+            queue_size=self.config.PIPELINE_QUEUE_SIZE,
+            weight=lambda leads: len(leads.jobs.jobs) if leads.jobs else 0,
+            on_progress=self._report,
+        )
+        try:
+            stages = await pipeline.run(self.strategy.stream())
+        except Exception as e:
+            await self.task_manager.update_task(self.task_uuid, f"Lead insertion failed: {e}", "failed", pipeline.stats())
+            raise
+        if not self.fetched["jobs"]:
+            await self.task_manager.update_task(self.task_uuid, "No jobs found in the leads data.", "failed", stages)
             raise ValueError("No jobs found in the leads data.")
-        if not leads.companies:
-            await self.task_manager.update_task(self.task_uuid, "No companies found in the leads data.", "failed")
+        if not self.fetched["companies"]:
+            await self.task_manager.update_task(self.task_uuid, "No companies found in the leads data.", "failed", stages)
             raise ValueError("No companies found in the leads data.")
-        await self.task_manager.update_task(self.task_uuid, "Processing and deduplicating leads", "in_progress")
+
+        leads_result = LeadsResult(
+            companies=f"Insert of {self.inserted['companies']} companies",
+            jobs=f"insert of {self.inserted['jobs']} jobs",
+            contacts=f"insert of {self.inserted['contacts']} contacts",
+        )
+        await self.task_manager.update_task(self.task_uuid, f"Lead insertion completed with companies : {leads_result.companies}, jobs : {leads_result.jobs}, and contacts : {leads_result.contacts} saved", "completed", stages, prefiltered_jobs=self.leads_processor.prefiltered)
+        return leads_result
+
+    async def _report(self, stages: list[StageStats]) -> None:
+        """
+        Publish the progress of the pipeline on the task.
+
+        Args:
+            stages (list[StageStats]): The statistics of the stages.
+        """
+        progress = ", ".join(f"{stage.name} {stage.jobs}" for stage in stages)
+        await self.task_manager.update_task(self.task_uuid, f"Processing leads (jobs per stage: {progress})", "in_progress", stages, prefiltered_jobs=self.leads_processor.prefiltered)
+
+    async def _deduplicate(self, leads: Leads) -> Optional[Leads]:
+        """
+        Remove the companies and jobs already seen in this chunk or an earlier one.
+        Jobs and contacts of a duplicated company are moved to the company seen first.
+
+        Args:
+            leads (Leads): A chunk of leads from the source.
+
+        Returns:
+            Optional[Leads]: The unique leads, or None when nothing is left to insert.
+        """
+        if not leads.jobs or not leads.jobs.jobs or not leads.companies or not leads.companies.companies:
+            self.fetched["jobs"] += len(leads.jobs.jobs) if leads.jobs else 0
+            return None
+        self.fetched["jobs"] += len(leads.jobs.jobs)
+        self.fetched["companies"] += len(leads.companies.companies)
         leads.companies = await self.leads_processor.deduplicate_companies(
             leads.companies, leads.jobs
         )
-        leads.jobs = await self.leads_processor.deduplicate_jobs(leads.jobs)
+        duplicates = {}
+        companies = []
+        for company in leads.companies.companies:
+            first_id = self.seen_companies.setdefault(company.name or "", company.id or "")
+            if first_id != company.id and company.id:
+                duplicates[company.id] = first_id
+            else:
+                companies.append(company)
+        leads.companies = CompanyEntity(companies=companies) # type: ignore
+        for job in leads.jobs.jobs:
+            job.company_id = duplicates.get(job.company_id or "", job.company_id)
         if leads.contacts:
-            names = [
-                contact.name
-                for contact in leads.contacts.contacts
-                if contact.name is not None
-            ]
-            titles = [
-                contact.title
-                for contact in leads.contacts.contacts
-                if contact.title is not None
-            ]
-            db_contacts = await self.repository.get_contacts_by_name_and_title(
-                names, titles
-            )
-        company_names = [
-            company.name for company in leads.companies.companies if company.name is not None
-        ]
-        db_companies = await self.repository.get_companies_by_names(company_names)
+            for contact in leads.contacts.contacts:
+                contact.company_id = duplicates.get(contact.company_id or "", contact.company_id)
+
+        leads.jobs = await self.leads_processor.deduplicate_jobs(leads.jobs)
+        jobs = []
+        for job in leads.jobs.jobs:
+            identifier = (job.job_title, job.location, job.job_type, job.company_id)
+            if identifier not in self.seen_jobs:
+                self.seen_jobs.add(identifier)
+                jobs.append(job)
+        leads.jobs = JobEntity(jobs=jobs) # type: ignore
+        return leads if leads.jobs.jobs or leads.companies.companies else None
+
+    async def _diff(self, leads: Leads) -> Optional[Leads]:
+        """
+        Keep only the companies and jobs of a chunk that are not stored yet.
+        The stored rows are only looked up, nothing is written before the persist stage so an
+        interrupted insertion leaves no unscored rows behind.
+
+        Args:
+            leads (Leads): A chunk of unique leads.
+
+        Returns:
+            Optional[Leads]: The new leads, or None when everything was already stored.
+        """
+        companies_result = await self.repository.match_companies(leads.companies) # type: ignore
+        self.existing_companies.update(companies_result.existing)
+        known_companies = UpsertResult(existing=self.existing_companies) # type: ignore
         leads.jobs = await self.leads_processor.change_jobs_company_id(
-            leads.jobs, leads.companies, db_companies
+            leads.jobs, known_companies # type: ignore
         )
         leads.companies = await self.leads_processor.new_companies(
-            leads.companies, db_companies
-        )
-        job_titles = [job.job_title for job in leads.jobs.jobs if job.job_title]
-        locations = [job.location for job in leads.jobs.jobs if job.location]
-        db_jobs = await self.repository.get_jobs_by_title_and_location(
-            job_titles, locations
+            leads.companies, companies_result # type: ignore
         )
-        leads.jobs = await self.leads_processor.new_jobs(leads.jobs, db_jobs)
-        if leads.contacts and db_contacts:
-            leads.contacts = await self.leads_processor.new_contacts(
-                leads.contacts, db_contacts
-            )
+        self.pending_companies.update({company.id: company for company in leads.companies.companies if company.id})
+        jobs_result = await self.repository.match_jobs(leads.jobs) # type: ignore
+        leads.jobs = await self.leads_processor.new_jobs(leads.jobs, jobs_result) # type: ignore
+        if leads.contacts:
             leads.contacts = (
                 await self.leads_processor.change_contacts_job_and_company_id(
-                    leads.contacts, leads.jobs, leads.companies
+                    leads.contacts, jobs_result, known_companies
                 )
             )
-        await self.task_manager.update_task(self.task_uuid, "Calculating compatibility scores", "in_progress")
-        await self.leads_processor.calculate_compatibility_scores(profile, leads.jobs)
-        await self.task_manager.update_task(self.task_uuid, "Enriching leads with additional data", "in_progress")
-        await self.leads_processor.enrich_leads(self.enrich_leads, leads, profile, self.task_uuid)
-        if leads.contacts:
+        if not leads.jobs.jobs and not leads.companies.companies and not (leads.contacts and leads.contacts.contacts):
+            return None
+        return leads
+
+    async def _score(self, leads: Leads) -> Leads:
+        """
+        Calculate the compatibility score of the new jobs of a chunk.
+
+        Args:
+            leads (Leads): A chunk of new leads.
+
+        Returns:
+            Leads: The chunk with scored jobs.
+        """
+        await self.leads_processor.calculate_compatibility_scores(self.profile, leads.jobs) # type: ignore
+        return leads
+
+    async def _enrich(self, leads: Leads) -> Leads:
+        """
+        Enrich the companies of a chunk and find their contacts.
+
+        Args:
+            leads (Leads): A chunk of scored leads.
+
+        Returns:
+            Leads: The enriched chunk.
+        """
+        return await self.leads_processor.enrich_leads(self.enrich_leads, leads, self.profile, self.task_uuid)
+
+    async def _persist(self, batch: list[Leads]) -> Optional[Leads]:
+        """
+        Save a batch of enriched chunks at once.
+        The chunks may arrive out of order, so a company of an earlier chunk that is referenced
+        here but not saved yet is saved with this batch.
+
+        Args:
+            batch (list[Leads]): The enriched chunks.
+
+        Returns:
+            Optional[Leads]: The companies and the inserted jobs and contacts, forwarded to the embed stage when there is one.
+        """
+        companies = {c.id: c for item in batch if item.companies for c in item.companies.companies}
+        jobs = [j for item in batch if item.jobs for j in item.jobs.jobs]
+        contacts = [c for item in batch if item.contacts for c in item.contacts.contacts]
+        for company_id in [job.company_id for job in jobs] + [contact.company_id for contact in contacts]:
+            if company_id in self.pending_companies and company_id not in companies:
+                companies[company_id] = self.pending_companies[company_id]
+        leads = Leads(
+            companies=CompanyEntity(companies=list(companies.values())), # type: ignore
+            jobs=JobEntity(jobs=jobs), # type: ignore
+            contacts=ContactEntity(contacts=contacts), # type: ignore
+        ) # type: ignore
+        if leads.contacts.contacts: # type: ignore
             leads.contacts = await self.leads_processor.deduplicate_contacts(
-                leads.contacts
+                leads.contacts # type: ignore
             )
-        leads_result = await self.leads_processor.calculate_statistics(leads)
-        await self.repository.save_leads(leads)
-        await self.task_manager.update_task(self.task_uuid, f"Lead insertion completed with companies : {leads_result.companies}, jobs : {leads_result.jobs}, and contacts : {leads_result.contacts} saved", "completed")
-        return leads_result
+        result = await self.repository.save_leads(leads)
+        new_jobs = await self.leads_processor.new_jobs(leads.jobs, result) # type: ignore
+        new_contacts = await self.leads_processor.new_contacts(leads.contacts, result) # type: ignore
+        saved = [company_id for company_id in companies if self.pending_companies.pop(company_id, None) is not None]
+        self.inserted["companies"] += len(saved)
+        self.inserted["jobs"] += len(new_jobs.jobs)
+        self.inserted["contacts"] += len(new_contacts.contacts)
+        if self.embedder is None:
+            return None
+        return Leads(companies=leads.companies, jobs=new_jobs, contacts=new_contacts) # type: ignore
+
+    async def _embed(self, leads: Leads) -> None:
+        """
+        Embed the descriptions of the saved jobs and companies for the similarity search.
+        A failure is logged without failing the insertion, the leads are already saved.
+
+        Args:
+            leads (Leads): The saved leads.
+        """
+        jobs = {
+            job.id: f"{job.job_title or ''}\n{job.description}"
+            for job in leads.jobs.jobs if job.id and job.description # type: ignore
+        }
+        companies = {
+            company.id: f"{company.name or ''}\n{company.description}"
+            for company in leads.companies.companies if company.id and company.description # type: ignore
+        }
+        if not jobs and not companies:
+            return None
+        try:
+            vectors = await self.embedder.embed(list(jobs.values()) + list(companies.values())) # type: ignore
+            await self.repository.save_embeddings(
+                dict(zip(jobs, vectors[:len(jobs)])),
+                dict(zip(companies, vectors[len(jobs):])),
+            )
+        except Exception as e:
+            logger.warning(f"Embedding of {len(jobs)} jobs and {len(companies)} companies failed: {e}")
+        return None
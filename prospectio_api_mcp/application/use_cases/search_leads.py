@@ -0,0 +1,54 @@
+import time
+from domain.entities.search import SearchFilters, SearchMetadata, SearchResult
+from domain.ports.leads_repository import LeadsRepositoryPort
+
+
+class SearchLeadsUseCase:
+    """
+    Use case for searching companies, jobs or contacts in the repository with text filters.
+    """
+
+    def __init__(self, type: str, repository: LeadsRepositoryPort):
+        """
+        Initialize the SearchLeadsUseCase with the data type and repository.
+
+        Args:
+            type (str): The data type to search ('companies', 'jobs' or 'contacts').
+            repository (LeadsRepositoryPort): The repository interface for data access.
+        """
+        self.type = type
+        self.repository = repository
+
+    async def search(self, filters: SearchFilters, limit: int) -> SearchResult:
+        """
+        Search the repository and time the query.
+
+        Args:
+            filters (SearchFilters): The search filters, unset ones are ignored.
+            limit (int): Maximum number of results to return.
+
+        Returns:
+            SearchResult: The matching data along with the search metadata.
+
+        Raises:
+            KeyError: If the specified type is not supported ('companies', 'jobs', 'contacts').
+        """
+        start = time.perf_counter()
+        if self.type == "companies":
+            results = await self.repository.search_companies(filters, limit)
+            count = len(results.companies)
+        elif self.type == "jobs":
+            results = await self.repository.search_jobs(filters, limit)
+            count = len(results.jobs)
+        elif self.type == "contacts":
+            results = await self.repository.search_contacts(filters, limit)
+            count = len(results.contacts)
+        else:
+            raise KeyError(f"Unsupported type: {self.type}")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        return SearchResult(
+            results=results,
+            metadata=SearchMetadata(
+                type=self.type, filters=filters, count=count, elapsed_ms=round(elapsed_ms, 3)
+            ),
+        )
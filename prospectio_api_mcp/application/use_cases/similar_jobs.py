@@ -0,0 +1,72 @@
+from typing import Optional
+from domain.entities.job import JobEntity
+from domain.entities.profile import Profile
+from domain.ports.embedder import EmbedderPort
+from domain.ports.leads_repository import LeadsRepositoryPort
+from domain.ports.profile_respository import ProfileRepositoryPort
+
+
+class SimilarJobsUseCase:
+    """
+    Use case for ranking the stored jobs by the similarity of their description with the profile.
+    The profile is embedded like the job descriptions and the ranking runs in the database.
+    """
+
+    def __init__(
+        self,
+        repository: LeadsRepositoryPort,
+        profile_repository: ProfileRepositoryPort,
+        embedder: Optional[EmbedderPort],
+    ):
+        """
+        Initialize the SimilarJobsUseCase with the repositories and the embedder.
+
+        Args:
+            repository (LeadsRepositoryPort): The leads repository.
+            profile_repository (ProfileRepositoryPort): The profile repository.
+            embedder (Optional[EmbedderPort]): The embedder of the job descriptions, None when disabled.
+        """
+        self.repository = repository
+        self.profile_repository = profile_repository
+        self.embedder = embedder
+
+    @staticmethod
+    def profile_text(profile: Profile) -> str:
+        """
+        Render the profile as a text comparable with a job description.
+
+        Args:
+            profile (Profile): The profile.
+
+        Returns:
+            str: The job title, technos, bio and work experience of the profile.
+        """
+        lines = [profile.job_title or "", ", ".join(profile.technos), profile.bio or ""]
+        lines += [
+            f"{experience.position or ''}: {experience.description or ''}"
+            for experience in profile.work_experience
+        ]
+        return "\n".join(line for line in lines if line.strip())
+
+    async def get_similar_jobs(self, limit: int) -> JobEntity:
+        """
+        Retrieve the jobs the most similar to the profile.
+
+        Args:
+            limit (int): Maximum number of jobs to return.
+
+        Returns:
+            JobEntity: The jobs, most similar first. Jobs without an embedding are left out.
+
+        Raises:
+            ValueError: If the embeddings are disabled or no profile exists.
+        """
+        if self.embedder is None:
+            raise ValueError("Embeddings are disabled. Set EMBEDDINGS_ENABLED to search similar jobs.")
+        profile = await self.profile_repository.get_profile()
+        if not profile:
+            raise ValueError(
+                "Profile not found. Please create a profile before searching similar jobs."
+            )
+        [embedding] = await self.embedder.embed([self.profile_text(profile)])
+        return await self.repository.get_similar_jobs(embedding, limit)
@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -15,16 +16,43 @@ class MantiksConfig(BaseSettings):
 
 class RapidApiConfig(BaseSettings):
     RAPIDAPI_API_KEY: list[str] = Field(..., json_schema_extra={"env": "RAPIDAPI_API_KEY"})
+    RAPIDAPI_KEY_COOLDOWN: float = Field(60.0, json_schema_extra={"env": "RAPIDAPI_KEY_COOLDOWN"})
+    RAPIDAPI_KEY_MAX_WAIT: float = Field(30.0, json_schema_extra={"env": "RAPIDAPI_KEY_MAX_WAIT"})
 
 
 class JsearchConfig(RapidApiConfig):
     JSEARCH_API_URL: str = Field(..., json_schema_extra={"env": "JSEARCH_API_URL"})
+    JSEARCH_MAX_PAGES: int = Field(3, json_schema_extra={"env": "JSEARCH_MAX_PAGES"})
+    JSEARCH_MAX_QUERIES: int = Field(10, json_schema_extra={"env": "JSEARCH_MAX_QUERIES"})
+    JSEARCH_CONCURRENCY: int = Field(4, json_schema_extra={"env": "JSEARCH_CONCURRENCY"})
 
 
 class ActiveJobsDBConfig(RapidApiConfig):
     ACTIVE_JOBS_DB_URL: str = Field(
         ..., json_schema_extra={"env": "ACTIVE_JOBS_DB_URL"}
     )
+    ACTIVE_JOBS_DB_PAGE_SIZE: int = Field(10, json_schema_extra={"env": "ACTIVE_JOBS_DB_PAGE_SIZE"})
+    ACTIVE_JOBS_DB_MAX_JOBS: int = Field(50, json_schema_extra={"env": "ACTIVE_JOBS_DB_MAX_JOBS"})
+    ACTIVE_JOBS_DB_TIME_BUDGET: float = Field(
+        30.0, json_schema_extra={"env": "ACTIVE_JOBS_DB_TIME_BUDGET"}
+    )
+
+
+class HttpClientConfig(BaseSettings):
+    """
+    Configuration of the HTTP client shared by the lead API adapters.
+    """
+
+    HTTP2: bool = Field(True, json_schema_extra={"env": "HTTP2"})
+    HTTP_TIMEOUT: float = Field(30.0, json_schema_extra={"env": "HTTP_TIMEOUT"})
+    HTTP_MAX_CONNECTIONS: int = Field(100, json_schema_extra={"env": "HTTP_MAX_CONNECTIONS"})
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        20, json_schema_extra={"env": "HTTP_MAX_KEEPALIVE_CONNECTIONS"}
+    )
+    HTTP_KEEPALIVE_EXPIRY: float = Field(30.0, json_schema_extra={"env": "HTTP_KEEPALIVE_EXPIRY"})
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = Field(
+        10, json_schema_extra={"env": "HTTP_MAX_CONNECTIONS_PER_HOST"}
+    )
 
 
 class DatabaseConfig(BaseSettings):
@@ -33,6 +61,97 @@ class DatabaseConfig(BaseSettings):
     """
 
     DATABASE_URL: str = Field(..., json_schema_extra={"env": "DATABASE_URL"})
+    COUNT_STRATEGY: str = Field("exact", json_schema_extra={"env": "COUNT_STRATEGY"})
+    COUNT_CACHE_TTL: float = Field(30.0, json_schema_extra={"env": "COUNT_CACHE_TTL"})
+    BULK_INSERT: bool = Field(False, json_schema_extra={"env": "BULK_INSERT"})
+    POOL_SIZE: int = Field(5, json_schema_extra={"env": "POOL_SIZE"})
+    POOL_MAX_OVERFLOW: int = Field(10, json_schema_extra={"env": "POOL_MAX_OVERFLOW"})
+    POOL_TIMEOUT: float = Field(30.0, json_schema_extra={"env": "POOL_TIMEOUT"})
+    POOL_PRE_PING: bool = Field(True, json_schema_extra={"env": "POOL_PRE_PING"})
+    STATEMENT_TIMEOUT: int = Field(30000, json_schema_extra={"env": "STATEMENT_TIMEOUT"})
+    STATEMENT_CACHE_SIZE: int = Field(100, json_schema_extra={"env": "STATEMENT_CACHE_SIZE"})
+
+
+class CacheConfig(BaseSettings):
+    """
+    Configuration of the read-through cache of the leads endpoints.
+    """
+
+    LEADS_CACHE_BACKEND: str = Field("memory", json_schema_extra={"env": "LEADS_CACHE_BACKEND"})
+    LEADS_CACHE_TTL: float = Field(30.0, json_schema_extra={"env": "LEADS_CACHE_TTL"})
+    LEADS_CACHE_MAX_ENTRIES: int = Field(512, json_schema_extra={"env": "LEADS_CACHE_MAX_ENTRIES"})
+    REDIS_URL: Optional[str] = Field(None, json_schema_extra={"env": "REDIS_URL"})
+
+
+class ResponseCacheConfig(BaseSettings):
+    """
+    Configuration of the cache of the lead provider responses.
+    """
+
+    RESPONSE_CACHE_ENABLED: bool = Field(True, json_schema_extra={"env": "RESPONSE_CACHE_ENABLED"})
+    RESPONSE_CACHE_TTL: float = Field(21600.0, json_schema_extra={"env": "RESPONSE_CACHE_TTL"})
+    RESPONSE_CACHE_TTLS: dict[str, float] = Field(
+        {}, json_schema_extra={"env": "RESPONSE_CACHE_TTLS"}
+    )
+    RESPONSE_CACHE_STALE_TTL: float = Field(
+        86400.0, json_schema_extra={"env": "RESPONSE_CACHE_STALE_TTL"}
+    )
+
+
+class ScoreCacheConfig(BaseSettings):
+    """
+    Configuration of the cache of the compatibility scores.
+    """
+
+    SCORE_CACHE_ENABLED: bool = Field(True, json_schema_extra={"env": "SCORE_CACHE_ENABLED"})
+
+
+class PipelineConfig(BaseSettings):
+    """
+    Configuration of the staged lead insertion pipeline.
+    """
+
+    PIPELINE_QUEUE_SIZE: int = Field(4, json_schema_extra={"env": "PIPELINE_QUEUE_SIZE"})
+    PIPELINE_SCORE_CONCURRENCY: int = Field(
+        2, json_schema_extra={"env": "PIPELINE_SCORE_CONCURRENCY"}
+    )
+    PIPELINE_ENRICH_CONCURRENCY: int = Field(
+        2, json_schema_extra={"env": "PIPELINE_ENRICH_CONCURRENCY"}
+    )
+    PIPELINE_PERSIST_BATCH_SIZE: int = Field(
+        50, json_schema_extra={"env": "PIPELINE_PERSIST_BATCH_SIZE"}
+    )
+
+
+class EnrichConfig(BaseSettings):
+    """
+    Configuration of the contact enrichment of the companies.
+    """
+
+    ENRICH_SEARCH_CONCURRENCY: int = Field(4, json_schema_extra={"env": "ENRICH_SEARCH_CONCURRENCY"})
+    ENRICH_EMAIL_WORKERS: int = Field(8, json_schema_extra={"env": "ENRICH_EMAIL_WORKERS"})
+    ENRICH_CONTACT_BATCH_SIZE: int = Field(1, json_schema_extra={"env": "ENRICH_CONTACT_BATCH_SIZE"})
+
+
+class EmbeddingConfig(BaseSettings):
+    """
+    Configuration of the description embeddings used by the similarity search.
+    """
+
+    EMBEDDINGS_ENABLED: bool = Field(False, json_schema_extra={"env": "EMBEDDINGS_ENABLED"})
+    EMBEDDING_MODEL: str = Field(
+        "Ollama/nomic-embed-text", json_schema_extra={"env": "EMBEDDING_MODEL"}
+    )
+    EMBEDDING_BATCH_SIZE: int = Field(32, json_schema_extra={"env": "EMBEDDING_BATCH_SIZE"})
+
+
+class PromptConfig(BaseSettings):
+    """
+    Configuration of the prompts loaded at startup.
+    """
+
+    PROMPT_HOT_RELOAD: bool = Field(False, json_schema_extra={"env": "PROMPT_HOT_RELOAD"})
+    PROMPT_RELOAD_INTERVAL: float = Field(2.0, json_schema_extra={"env": "PROMPT_RELOAD_INTERVAL"})
 
 
 class LLMConfig(BaseSettings):
@@ -49,8 +168,32 @@ class LLMConfig(BaseSettings):
     GOOGLE_API_KEY: str = Field(..., json_schema_extra={"env": "GOOGLE_API_KEY"})
     MISTRAL_API_KEY: str = Field(..., json_schema_extra={"env": "MISTRAL_API_KEY"})
     CONCURRENT_CALLS: int = Field(..., json_schema_extra={"env": "CONCURRENT_CALLS"})
+    COMPATIBILITY_BATCH_SIZE: int = Field(1, json_schema_extra={"env": "COMPATIBILITY_BATCH_SIZE"})
+    COMPATIBILITY_JOB_TOKEN_BUDGET: int = Field(
+        512, json_schema_extra={"env": "COMPATIBILITY_JOB_TOKEN_BUDGET"}
+    )
+    COMPATIBILITY_PREFILTER_THRESHOLD: float = Field(
+        0.0, json_schema_extra={"env": "COMPATIBILITY_PREFILTER_THRESHOLD"}
+    )
+    COMPATIBILITY_PREFILTER_LOCATION_WEIGHT: float = Field(
+        0.2, json_schema_extra={"env": "COMPATIBILITY_PREFILTER_LOCATION_WEIGHT"}
+    )
     OPEN_ROUTER_API_URL: str = Field(..., json_schema_extra={"env": "OPEN_ROUTER_API_URL"})
     OPEN_ROUTER_API_KEY: str = Field(..., json_schema_extra={"env": "OPEN_ROUTER_API_KEY"})
+    LLM_RATE_LIMITS: dict[str, dict[str, int]] = Field(
+        {}, json_schema_extra={"env": "LLM_RATE_LIMITS"}
+    )
+    LLM_MAX_RETRIES: int = Field(3, json_schema_extra={"env": "LLM_MAX_RETRIES"})
+    LLM_BACKOFF_BASE: float = Field(1.0, json_schema_extra={"env": "LLM_BACKOFF_BASE"})
+    LLM_BACKOFF_MAX: float = Field(60.0, json_schema_extra={"env": "LLM_BACKOFF_MAX"})
+    LLM_MAX_CONNECTIONS: int = Field(20, json_schema_extra={"env": "LLM_MAX_CONNECTIONS"})
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        10, json_schema_extra={"env": "LLM_MAX_KEEPALIVE_CONNECTIONS"}
+    )
+    LLM_KEEPALIVE_EXPIRY: float = Field(60.0, json_schema_extra={"env": "LLM_KEEPALIVE_EXPIRY"})
+    LLM_PROVIDER_MAX_CONNECTIONS: dict[str, int] = Field(
+        {}, json_schema_extra={"env": "LLM_PROVIDER_MAX_CONNECTIONS"}
+    )
 
 
 class CrawlConfig(BaseSettings):
@@ -38,4 +38,7 @@ class CompanyEntity(BaseModel):
     """
     companies: List[Company] = Field(..., description="List of companies")
     pages: Optional[int] = Field(None, description="Total number of pages available")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor to fetch the next page (keyset pagination)"
+    )
     pass
@@ -7,3 +7,20 @@ class CompatibilityScore(BaseModel):
     score: int = Field(
         ..., ge=0, le=100, description="Compatibility score from 0 to 100"
     )
+
+
+class JobCompatibilityScore(BaseModel):
+    """Compatibility score of one job of a batch."""
+
+    job_id: str = Field(..., description="Key of the job in the batch, e.g. job_1")
+    score: int = Field(
+        ..., ge=0, le=100, description="Compatibility score from 0 to 100"
+    )
+
+
+class CompatibilityScores(BaseModel):
+    """Response model for the compatibility scores of a batch of jobs."""
+
+    scores: list[JobCompatibilityScore] = Field(
+        ..., description="One compatibility score per job of the batch"
+    )
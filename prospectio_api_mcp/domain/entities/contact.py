@@ -33,4 +33,7 @@ class ContactEntity(BaseModel):
     """
     contacts: List[Contact] = Field(..., description="List of contacts")
     pages: Optional[int] = Field(None, description="Total number of pages available")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor to fetch the next page (keyset pagination)"
+    )
     pass
@@ -0,0 +1,15 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class QueryStats(BaseModel):
+    """
+    Represents the cost and yield of a single provider query.
+    """
+
+    provider: str = Field(..., description="Name of the lead provider")
+    query: str = Field(..., description="Search sent to the provider")
+    page: int = Field(..., description="Page or offset requested")
+    latency_ms: float = Field(..., description="Time spent on the query in milliseconds")
+    results: int = Field(0, description="Number of jobs returned by the query")
+    error: Optional[str] = Field(None, description="Error raised by the query, if any")
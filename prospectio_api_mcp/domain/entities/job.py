@@ -44,4 +44,7 @@ class JobEntity(BaseModel):
     """
     jobs: List[Job] = Field(..., description="List of jobs")
     pages: Optional[int] = Field(None, description="Total number of pages available")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor to fetch the next page (keyset pagination)"
+    )
     pass
@@ -19,3 +19,6 @@ class Leads(BaseModel):
         None, description="List of contacts associated with the companies and jobs"
     )
     pages: Optional[int] = Field(None, description="Total number of pages available")
+    next_cursor: Optional[str] = Field(
+        None, description="Opaque cursor to fetch the next page (keyset pagination)"
+    )
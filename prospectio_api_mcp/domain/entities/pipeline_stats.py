@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+
+
+class StageStats(BaseModel):
+    """
+    Represents the progress of one stage of an ingestion pipeline.
+    """
+
+    name: str = Field(..., description="Name of the stage")
+    concurrency: int = Field(1, description="Number of workers of the stage")
+    queue_depth: int = Field(0, description="Items waiting in the input queue of the stage")
+    in_flight: int = Field(0, description="Items being processed by the stage")
+    items: int = Field(0, description="Items processed by the stage")
+    jobs: int = Field(0, description="Jobs contained in the processed items")
+    jobs_per_second: float = Field(0.0, description="Jobs processed per second since the pipeline started")
+    busy_seconds: float = Field(0.0, description="Time spent processing items, summed over the workers")
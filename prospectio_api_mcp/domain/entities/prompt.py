@@ -0,0 +1,11 @@
+from pydantic import BaseModel, Field
+
+
+class Prompt(BaseModel):
+    """
+    Represents a prompt template loaded from the prompts folder.
+    """
+
+    name: str = Field(..., description="Name of the prompt")
+    text: str = Field(..., description="Template text of the prompt")
+    version: str = Field(..., description="Short SHA-256 of the text, changing with its content")
@@ -0,0 +1,40 @@
+from typing import Optional, Union
+from pydantic import BaseModel, Field
+from domain.entities.company import CompanyEntity
+from domain.entities.contact import ContactEntity
+from domain.entities.job import JobEntity
+
+
+class SearchFilters(BaseModel):
+    """
+    Represents the filters of a leads search, each one a partial, case-insensitive match.
+    """
+
+    job_title: Optional[str] = Field(None, description="Text contained in the job title")
+    location: Optional[str] = Field(None, description="Text contained in the job location")
+    company: Optional[str] = Field(None, description="Text contained in the company name")
+    contact: Optional[str] = Field(
+        None, description="Text contained in the contact name or title"
+    )
+
+
+class SearchMetadata(BaseModel):
+    """
+    Metadata describing how a search was executed.
+    """
+
+    type: str = Field(..., description="Searched data type (companies, jobs or contacts)")
+    filters: SearchFilters = Field(..., description="Filters applied to the search")
+    count: int = Field(..., description="Number of results returned")
+    elapsed_ms: float = Field(..., description="Time spent running the search, in milliseconds")
+
+
+class SearchResult(BaseModel):
+    """
+    Results of a leads search along with its metadata.
+    """
+
+    results: Union[CompanyEntity, JobEntity, ContactEntity] = Field(
+        ..., description="Matching companies, jobs or contacts"
+    )
+    metadata: SearchMetadata = Field(..., description="Search execution metadata")
@@ -1,7 +1,14 @@
+from typing import Optional
 from pydantic import BaseModel
+from domain.entities.pipeline_stats import StageStats
 
 class Task(BaseModel):
     """Domain entity representing a background task."""
     task_id: str
     message: str
-    status: str
\ No newline at end of file
+    status: str
+    stages: list[StageStats] = []
+    # Longest delay between the start of an enrichment and its first step, over the chunks of the task
+    enrichment_startup_seconds: Optional[float] = None
+    # Jobs scored by the pre-filter heuristic instead of the LLM
+    prefiltered_jobs: Optional[int] = None
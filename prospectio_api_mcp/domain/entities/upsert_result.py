@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+
+
+class UpsertResult(BaseModel):
+    """
+    Represents the outcome of an upsert into the leads repository, or of a lookup of the stored rows.
+    """
+
+    inserted: list[str] = Field(
+        [], description="IDs of the submitted rows that were actually inserted, or are not stored yet"
+    )
+    existing: dict[str, str] = Field(
+        {}, description="Mapping from submitted ID to the ID of the row already stored"
+    )
@@ -1,5 +1,7 @@
+import asyncio
 from abc import ABC, abstractmethod
 from domain.entities.compatibility_score import CompatibilityScore
+from domain.entities.job import Job
 from domain.entities.profile import Profile
 
 
@@ -10,3 +12,29 @@ class CompatibilityScorePort(ABC):
         self, profile: Profile, job_description: str, job_location: str
     ) -> CompatibilityScore:
         pass
+
+    async def get_compatibility_scores(
+        self, profile: Profile, jobs: list[Job]
+    ) -> dict[str, int]:
+        """
+        Score several jobs against a profile. Scores each job separately unless the
+        implementation supports batches.
+
+        Args:
+            profile (Profile): The profile entity.
+            jobs (list[Job]): Jobs with a description to score.
+
+        Returns:
+            dict[str, int]: The compatibility score of each job, keyed by job ID.
+        """
+        results = await asyncio.gather(
+            *(
+                self.get_compatibility_score(
+                    profile=profile,
+                    job_description=job.description or "",
+                    job_location=job.location or "",
+                )
+                for job in jobs
+            )
+        )
+        return {job.id or "": result.score for job, result in zip(jobs, results)}
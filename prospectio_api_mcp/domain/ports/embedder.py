@@ -0,0 +1,22 @@
+from abc import abstractmethod
+from domain.ports.metrics import MetricsPort
+
+
+class EmbedderPort(MetricsPort):
+    """
+    Port for turning texts into vectors whose cosine similarity reflects their meaning.
+    Every vector of an embedder has the same size, the one of the database columns.
+    """
+
+    @abstractmethod
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed several texts at once.
+
+        Args:
+            texts (list[str]): The texts to embed.
+
+        Returns:
+            list[list[float]]: One vector per text, in the same order.
+        """
+        pass
@@ -11,3 +11,13 @@ class EnrichLeadsPort(ABC):
     @abstractmethod
     async def execute(self, leads: Leads, profile: Profile, task_uuid: str) -> Leads:
         pass
+
+    @abstractmethod
+    def draw(self) -> str:
+        """
+        Describe the enrichment workflow, for debugging.
+
+        Returns:
+            str: The workflow as a Mermaid diagram.
+        """
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 from domain.entities.leads import Leads
 
 
@@ -19,3 +20,16 @@ class FetchLeadsPort(ABC):
             dict: The leads data retrieved from the provider.
         """
         pass
+
+    async def stream_leads(self, location: str, job_title: list[str]) -> AsyncIterator[Leads]:
+        """
+        Stream leads from the provider as its pages complete.
+        Providers fetching several pages override it; by default the whole fetch is yielded once.
+
+        Args:
+            location (str): The location to search for leads.
+            job_title (list[str]): List of job titles to filter leads.
+        Yields:
+            Leads: A chunk of the leads retrieved from the provider.
+        """
+        yield await self.fetch_leads(location, job_title)
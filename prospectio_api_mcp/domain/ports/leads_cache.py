@@ -0,0 +1,57 @@
+from abc import abstractmethod
+from typing import Optional
+from domain.ports.metrics import MetricsPort
+
+
+class LeadsCachePort(MetricsPort):
+    """
+    Port for caching serialized leads pages.
+    Entries are scoped to a generation: invalidating bumps the generation so pages
+    read before a write are never served after it.
+    """
+
+    @abstractmethod
+    async def generation(self) -> int:
+        """
+        Return the current cache generation.
+
+        Returns:
+            int: The generation to read and write entries with.
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, generation: int, key: str) -> Optional[str]:
+        """
+        Retrieve a cached entry.
+
+        Args:
+            generation (int): The generation returned by generation().
+            key (str): The entry key.
+
+        Returns:
+            Optional[str]: The serialized entry, or None on a miss.
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, generation: int, key: str, value: str) -> None:
+        """
+        Store an entry computed while the given generation was current.
+
+        Args:
+            generation (int): The generation returned by generation() before computing the value.
+            key (str): The entry key.
+            value (str): The serialized entry.
+        """
+        pass
+
+    @abstractmethod
+    async def invalidate(self) -> int:
+        """
+        Bump the generation so every existing entry becomes unreachable.
+
+        Returns:
+            int: The new generation.
+        """
+        pass
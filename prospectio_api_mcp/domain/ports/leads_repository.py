@@ -4,6 +4,14 @@ from domain.entities.leads import Leads
 from domain.entities.company import CompanyEntity, Company
 from domain.entities.job import JobEntity
 from domain.entities.contact import Contact, ContactEntity
+from domain.entities.search import SearchFilters
+from domain.entities.upsert_result import UpsertResult
+
+
+class InvalidCursorError(ValueError):
+    """
+    Raised when a pagination cursor given by a client cannot be decoded.
+    """
 
 
 class LeadsRepositoryPort(ABC):
@@ -12,23 +20,60 @@ class LeadsRepositoryPort(ABC):
     """
 
     @abstractmethod
-    async def save_leads(self, leads: Leads) -> None:
+    async def save_leads(self, leads: Leads) -> UpsertResult:
         """
-        Insert leads into the database.
+        Insert leads into the database, updating the rows already stored with the same IDs
+        and skipping duplicates of stored rows.
 
         Args:
             leads (Leads): The leads data to insert.
+
+        Returns:
+            UpsertResult: IDs actually inserted and mapping of the skipped companies, jobs and
+                contacts to the stored ones.
+        """
+        pass
+
+    @abstractmethod
+    async def match_companies(self, companies: CompanyEntity) -> UpsertResult:
+        """
+        Resolve companies to the stored ones with the same normalized name, without writing.
+
+        Args:
+            companies (CompanyEntity): The companies to look up.
+
+        Returns:
+            UpsertResult: IDs of the companies not stored yet and mapping of the others to the stored ones.
         """
         pass
 
     @abstractmethod
-    async def get_jobs(self, offset: int, limit: int) -> JobEntity:
+    async def match_jobs(self, jobs: JobEntity) -> UpsertResult:
+        """
+        Resolve jobs to the stored ones with the same normalized title, location, company, type
+        and description, without writing. A stored job without compatibility score, left by an
+        interrupted insertion, is returned as not stored yet and takes the ID of the stored row
+        so saving it completes that row.
+
+        Args:
+            jobs (JobEntity): The jobs to look up.
+
+        Returns:
+            UpsertResult: IDs of the jobs not stored yet and mapping of the others to the stored ones.
+        """
+        pass
+
+    @abstractmethod
+    async def get_jobs(
+        self, offset: int, limit: int, cursor: Optional[str] = None
+    ) -> JobEntity:
         """
         Retrieve jobs from the database with pagination.
 
         Args:
-            offset (int): Number of jobs to skip.
+            offset (int): Number of jobs to skip (ignored when a cursor is given).
             limit (int): Maximum number of jobs to return.
+            cursor (Optional[str]): Opaque keyset cursor returned by the previous page.
 
         Returns:
             JobEntity: Domain entity containing list of jobs.
@@ -52,10 +97,17 @@ class LeadsRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    async def get_companies(self, offset: int, limit: int) -> CompanyEntity:
+    async def get_companies(
+        self, offset: int, limit: int, cursor: Optional[str] = None
+    ) -> CompanyEntity:
         """
         Retrieve companies from the database.
 
+        Args:
+            offset (int): Number of companies to skip (ignored when a cursor is given).
+            limit (int): Maximum number of companies to return.
+            cursor (Optional[str]): Opaque keyset cursor returned by the previous page.
+
         Returns:
             CompanyEntity: Domain entity containing list of companies.
         """
@@ -75,10 +127,17 @@ class LeadsRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    async def get_contacts(self, offset: int, limit: int) -> ContactEntity:
+    async def get_contacts(
+        self, offset: int, limit: int, cursor: Optional[str] = None
+    ) -> ContactEntity:
         """
         Retrieve contacts from the database.
 
+        Args:
+            offset (int): Number of contacts to skip (ignored when a cursor is given).
+            limit (int): Maximum number of contacts to return.
+            cursor (Optional[str]): Opaque keyset cursor returned by the previous page.
+
         Returns:
             ContactEntity: Domain entity containing list of contacts.
         """
@@ -99,6 +158,75 @@ class LeadsRepositoryPort(ABC):
         """
         pass
 
+    @abstractmethod
+    async def search_jobs(self, filters: SearchFilters, limit: int) -> JobEntity:
+        """
+        Search jobs matching the job title, location and company filters.
+
+        Args:
+            filters (SearchFilters): The search filters, unset ones are ignored.
+            limit (int): Maximum number of jobs to return.
+
+        Returns:
+            JobEntity: Domain entity containing the matching jobs, best scored first.
+        """
+        pass
+
+    @abstractmethod
+    async def search_companies(self, filters: SearchFilters, limit: int) -> CompanyEntity:
+        """
+        Search companies matching the company filter.
+
+        Args:
+            filters (SearchFilters): The search filters, unset ones are ignored.
+            limit (int): Maximum number of companies to return.
+
+        Returns:
+            CompanyEntity: Domain entity containing the matching companies.
+        """
+        pass
+
+    @abstractmethod
+    async def search_contacts(self, filters: SearchFilters, limit: int) -> ContactEntity:
+        """
+        Search contacts matching the contact and company filters.
+
+        Args:
+            filters (SearchFilters): The search filters, unset ones are ignored.
+            limit (int): Maximum number of contacts to return.
+
+        Returns:
+            ContactEntity: Domain entity containing the matching contacts.
+        """
+        pass
+
+    @abstractmethod
+    async def save_embeddings(
+        self, jobs: dict[str, list[float]], companies: dict[str, list[float]]
+    ) -> None:
+        """
+        Store the description embeddings of jobs and companies.
+
+        Args:
+            jobs (dict[str, list[float]]): Embedding of each job description, keyed by job ID.
+            companies (dict[str, list[float]]): Embedding of each company description, keyed by company ID.
+        """
+        pass
+
+    @abstractmethod
+    async def get_similar_jobs(self, embedding: list[float], limit: int) -> JobEntity:
+        """
+        Retrieve the jobs whose description is the closest to an embedding.
+
+        Args:
+            embedding (list[float]): The embedding to compare the job descriptions with.
+            limit (int): Maximum number of jobs to return.
+
+        Returns:
+            JobEntity: Domain entity containing the jobs, most similar first.
+        """
+        pass
+
     @abstractmethod
     async def get_contact_by_id(self, id: str) -> Optional[Contact]:
         """
@@ -126,10 +254,17 @@ class LeadsRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    async def get_leads(self, offset: int, limit: int) -> Leads:
+    async def get_leads(
+        self, offset: int, limit: int, cursor: Optional[str] = None
+    ) -> Leads:
         """
         Retrieve all leads data (companies, jobs, and contacts) from the database.
 
+        Args:
+            offset (int): Number of jobs to skip (ignored when a cursor is given).
+            limit (int): Maximum number of jobs to return.
+            cursor (Optional[str]): Opaque keyset cursor returned by the previous page.
+
         Returns:
             Leads: Domain entity containing all companies, jobs, and contacts.
         """
@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class MetricsPort(ABC):
+    """
+    Port for components exposing runtime metrics.
+    """
+
+    @abstractmethod
+    def get_metrics(self) -> dict[str, float]:
+        """
+        Return a snapshot of the component metrics.
+
+        Returns:
+            dict[str, float]: Metric names mapped to their current values.
+        """
+        pass
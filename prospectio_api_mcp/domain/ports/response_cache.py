@@ -0,0 +1,33 @@
+from abc import abstractmethod
+from typing import Any, Awaitable, Callable
+from domain.ports.metrics import MetricsPort
+
+
+class ResponseCachePort(MetricsPort):
+    """
+    Port for caching the raw payloads returned by the lead providers.
+    Entries are keyed by provider, endpoint and normalized request parameters.
+    """
+
+    @abstractmethod
+    async def fetch(
+        self,
+        provider: str,
+        endpoint: str,
+        params: dict[str, Any],
+        request: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the payload of a provider request, from the cache when possible.
+
+        Args:
+            provider (str): The provider name, e.g. jsearch.
+            endpoint (str): The provider endpoint.
+            params (dict[str, Any]): The request parameters.
+            request (Callable[[], Awaitable[Any]]): Performs the request and returns
+                its JSON payload, called on a miss or to revalidate a stale entry.
+
+        Returns:
+            Any: The JSON payload.
+        """
+        pass
@@ -0,0 +1,35 @@
+from abc import abstractmethod
+from domain.ports.metrics import MetricsPort
+
+
+class ScoreCachePort(MetricsPort):
+    """
+    Port for caching the compatibility scores computed by the LLM.
+    Keys identify the profile, the job content, the model and the prompt version,
+    so changing any of them misses the cache without purging it.
+    """
+
+    @abstractmethod
+    async def get_scores(self, keys: list[str]) -> dict[str, int]:
+        """
+        Look up the scores of several keys at once.
+
+        Args:
+            keys (list[str]): The score keys.
+
+        Returns:
+            dict[str, int]: The cached scores, keyed by score key. Missing keys are left out.
+        """
+        pass
+
+    @abstractmethod
+    async def save_scores(self, scores: dict[str, int], model: str, prompt_version: str) -> None:
+        """
+        Store computed scores.
+
+        Args:
+            scores (dict[str, int]): The scores, keyed by score key.
+            model (str): The model that computed the scores.
+            prompt_version (str): Version of the scoring prompt.
+        """
+        pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Optional
+from domain.entities.pipeline_stats import StageStats
 from domain.entities.task import Task
 
 
@@ -23,12 +24,25 @@ class TaskManagerPort(ABC):
         pass
 
     @abstractmethod
-    async def update_task(self, task_id: str, message: str, status: str) -> Task:
+    async def update_task(
+        self,
+        task_id: str,
+        message: str,
+        status: str,
+        stages: Optional[list[StageStats]] = None,
+        enrichment_startup_seconds: Optional[float] = None,
+        prefiltered_jobs: Optional[int] = None,
+    ) -> Task:
         """
         Update the status of a background task.
 
         Args:
             task_id (str): Unique task identifier.
+            stages (Optional[list[StageStats]]): Progress of the pipeline stages, unchanged when None.
+            enrichment_startup_seconds (Optional[float]): Startup latency of an enrichment, the
+                longest one is kept.
+            prefiltered_jobs (Optional[int]): Number of jobs scored by the pre-filter so far,
+                unchanged when None.
 
         Returns:
             str: The updated task ID.
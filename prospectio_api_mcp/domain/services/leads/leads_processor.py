@@ -4,25 +4,35 @@ from domain.entities.job import Job, JobEntity
 from domain.entities.leads import Leads
 from domain.entities.leads_result import LeadsResult
 from domain.entities.profile import Profile
+from domain.entities.upsert_result import UpsertResult
 from domain.ports.compatibility_score import CompatibilityScorePort
 from domain.entities.contact import ContactEntity
 from domain.ports.enrich_leads import EnrichLeadsPort
+from domain.services.leads.prefilter import JobPrefilter
 import asyncio
 
 from domain.ports.task_manager import TaskManagerPort
 
+# Chunks with more described jobs are pre-filtered in a worker thread
+PREFILTER_INLINE_JOBS = 50
+
 
 class LeadsProcessor:
 
     def __init__(self, compatibility_score_port: CompatibilityScorePort):
         config = LLMConfig() # type: ignore
-        concurrency_limit = config.CONCURRENT_CALLS
-        self.semaphore = asyncio.Semaphore(concurrency_limit)
+        self.batch_size = max(config.COMPATIBILITY_BATCH_SIZE, 1)
+        self.prefilter = JobPrefilter(
+            config.COMPATIBILITY_PREFILTER_THRESHOLD,
+            config.COMPATIBILITY_PREFILTER_LOCATION_WEIGHT,
+        )
+        self.prefiltered = 0
         self.compatibility_score_port = compatibility_score_port
 
     async def deduplicate_contacts(self, contacts: ContactEntity) -> ContactEntity:
         """
-        Remove duplicate contacts based on normalized name and title.
+        Remove duplicate contacts based on company, normalized name and title.
+        Contacts without name are kept, they cannot be told apart.
 
         Args:
             contacts (ContactEntity): Contacts to deduplicate.
@@ -35,174 +45,110 @@ class LeadsProcessor:
         for contact in contacts.contacts:
             contact.name = contact.name.strip().lower() if contact.name else ""
             contact.title = contact.title.strip().lower() if contact.title else ""
-            identifier = (contact.name, contact.title)
-            if identifier not in seen and contact.email and contact.title:
+            if not contact.email or not contact.title:
+                continue
+            identifier = (contact.company_id, contact.name, contact.title)
+            if not contact.name or identifier not in seen:
                 seen.add(identifier)
                 unique_contacts.append(contact)
         return ContactEntity(contacts=unique_contacts) # type: ignore
 
     async def new_contacts(
-        self, contacts: ContactEntity, db_contacts: ContactEntity
+        self, contacts: ContactEntity, upsert_result: UpsertResult
     ) -> ContactEntity:
         """
-        Filter out contacts that already exist in the database, based on normalized name and title.
+        Keep only the contacts that were actually inserted by the repository upsert.
 
         Args:
-            contacts (ContactEntity): Contacts to check for uniqueness.
-            db_contacts (ContactEntity): Contacts already present in the database.
+            contacts (ContactEntity): Contacts submitted to the upsert.
+            upsert_result (UpsertResult): Result of the contacts upsert.
 
         Returns:
             ContactEntity: Entity containing only new contacts not present in the database.
         """
-        existing_contacts = {
-            (
-                contact.name.strip().lower() if contact.name else "",
-                contact.title.strip().lower() if contact.title else "",
-            )
-            for contact in db_contacts.contacts
-        }
+        inserted = set(upsert_result.inserted)
         new_contacts = [
-            contact
-            for contact in contacts.contacts
-            if (
-                contact.name.strip().lower() if contact.name else "",
-                contact.title.strip().lower() if contact.title else "",
-            )
-            not in existing_contacts
+            contact for contact in contacts.contacts if contact.id in inserted
         ]
         return ContactEntity(contacts=new_contacts) # type: ignore
 
     async def change_contacts_job_and_company_id(
-        self, contacts: ContactEntity, jobs: JobEntity, companies: CompanyEntity
+        self,
+        contacts: ContactEntity,
+        jobs_result: UpsertResult,
+        companies_result: UpsertResult,
     ) -> ContactEntity:
         """
-        Update the job_id and company_id of each contact to match the corresponding job and company in the provided entities, using normalized name/title for jobs and companies.
+        Update the job_id and company_id of each contact to reference the jobs and companies already stored in the database.
 
         Args:
             contacts (ContactEntity): Contacts to update.
-            jobs (JobEntity): Jobs to match for job_id.
-            companies (CompanyEntity): Companies to match for company_id.
+            jobs_result (UpsertResult): Result of the jobs upsert.
+            companies_result (UpsertResult): Result of the companies upsert.
 
         Returns:
             ContactEntity: Contacts with updated job_id and company_id if a match is found.
         """
-        job_lookup = {
-            (
-                job.job_title.strip().lower() if job.job_title else "",
-                job.location.strip().lower() if job.location else "",
-            ): job.id
-            for job in jobs.jobs
-            if job.id is not None
-            and job.job_title is not None
-            and job.location is not None
-        }
-        company_lookup = {
-            company.name.strip().lower(): company.id
-            for company in companies.companies
-            if company.id is not None and company.name is not None
-        }
         for contact in contacts.contacts:
             if contact.company_id:
-                name = contact.company_id.strip().lower()
-                contact.company_id = company_lookup.get(name, contact.company_id)
-            if contact.title and contact.company_id:
-                key = (
-                    contact.title.strip().lower(),
-                    contact.company_id.strip().lower(),
+                contact.company_id = companies_result.existing.get(
+                    contact.company_id, contact.company_id
                 )
-                contact.job_id = job_lookup.get(key, contact.job_id)
+            if contact.job_id:
+                contact.job_id = jobs_result.existing.get(contact.job_id, contact.job_id)
         return contacts
 
     async def change_jobs_company_id(
-        self, jobs: JobEntity, companies: CompanyEntity, db_companies: CompanyEntity
+        self, jobs: JobEntity, companies_result: UpsertResult
     ) -> JobEntity:
         """
-        Update the company_id of each job to match the corresponding company in the database, using normalized company names.
+        Update the company_id of each job to reference the company already stored in the database.
 
         Args:
             jobs (JobEntity): Jobs to update.
-            companies (CompanyEntity): Companies from the current batch.
-            db_companies (CompanyEntity): Companies from the database.
+            companies_result (UpsertResult): Result of the companies upsert.
 
         Returns:
-            JobEntity: Jobs with updated company_id if a match is found in the database.
+            JobEntity: Jobs with updated company_id if the company was already stored.
         """
-        company_db_mapping = {
-            company.name.strip().lower(): company.id
-            for company in db_companies.companies
-            if company.name is not None
-        }
-        company_ids = {
-            company.id: company.name.strip().lower()
-            for company in companies.companies
-            if company.id is not None and company.name is not None
-        }
         for job in jobs.jobs:
-            if job.company_id and job.company_id in company_ids:
-                company_name = company_ids[job.company_id]
-                company_id = company_db_mapping.get(company_name)
-                if company_id is not None:
-                    job.company_id = company_id
+            if job.company_id:
+                job.company_id = companies_result.existing.get(
+                    job.company_id, job.company_id
+                )
         return jobs
 
-    async def new_jobs(self, jobs: JobEntity, db_jobs: JobEntity) -> JobEntity:
+    async def new_jobs(self, jobs: JobEntity, upsert_result: UpsertResult) -> JobEntity:
         """
-        Filter out jobs that already exist in the database, based on normalized job title, location, type, and company_id.
+        Keep only the jobs that were actually inserted by the repository upsert.
 
         Args:
-            jobs (JobEntity): Jobs to check for uniqueness.
-            db_jobs (JobEntity): Jobs already present in the database.
+            jobs (JobEntity): Jobs submitted to the upsert.
+            upsert_result (UpsertResult): Result of the jobs upsert.
 
         Returns:
             JobEntity: Entity containing only new jobs not present in the database.
         """
-        existing_jobs = {
-            (
-                job.job_title.strip().lower() if job.job_title else "",
-                job.location.strip().lower() if job.location else "",
-                job.company_id.strip().lower() if job.company_id else "",
-                job.job_type.strip().lower() if job.job_type else "",
-                job.description.strip().lower() if job.description else "",
-            )
-            for job in db_jobs.jobs
-        }
-
-        new_jobs = [
-            job
-            for job in jobs.jobs
-            if (
-                job.job_title.strip().lower() if job.job_title else "",
-                job.location.strip().lower() if job.location else "",
-                job.company_id.strip().lower() if job.company_id else "",
-                job.job_type.strip().lower() if job.job_type else "",
-                job.description.strip().lower() if job.description else "",
-            )
-            not in existing_jobs
-        ]
+        inserted = set(upsert_result.inserted)
+        new_jobs = [job for job in jobs.jobs if job.id in inserted]
         return JobEntity(jobs=new_jobs) # type: ignore
 
     async def new_companies(
-        self, companies: CompanyEntity, db_companies: CompanyEntity
+        self, companies: CompanyEntity, upsert_result: UpsertResult
     ) -> CompanyEntity:
         """
-        Filter out companies that already exist in the database, based on normalized company names.
+        Keep only the companies that were actually inserted by the repository upsert.
 
         Args:
-            companies (CompanyEntity): Companies to check for uniqueness.
-            db_companies (CompanyEntity): Companies already present in the database.
+            companies (CompanyEntity): Companies submitted to the upsert.
+            upsert_result (UpsertResult): Result of the companies upsert.
 
         Returns:
             CompanyEntity: Entity containing only new companies not present in the database.
         """
-        existing_companies = {
-            company.name.strip().lower()
-            for company in db_companies.companies
-            if company.name is not None
-        }
+        inserted = set(upsert_result.inserted)
         new_companies = [
-            company
-            for company in companies.companies
-            if company.name and company.name.strip().lower() not in existing_companies
+            company for company in companies.companies if company.id in inserted
         ]
         return CompanyEntity(companies=new_companies) # type: ignore
 
@@ -292,6 +238,8 @@ class LeadsProcessor:
     ) -> JobEntity:
         """
         Calculate compatibility scores for each job using the provided profile and update the jobs in place.
+        Jobs the pre-filter finds irrelevant get its heuristic score, the others are sent to the LLM
+        most relevant first.
 
         Args:
             profile (Profile): The user profile to use for scoring.
@@ -300,19 +248,33 @@ class LeadsProcessor:
         Returns:
             JobEntity: Jobs with updated compatibility_score fields.
         """
+        for job in jobs.jobs:
+            if not job.description:
+                job.compatibility_score = 0
+        described = [job for job in jobs.jobs if job.description]
+        if len(described) > PREFILTER_INLINE_JOBS:
+            # The regex scan of large chunks would block the event loop
+            candidates, skipped = await asyncio.get_running_loop().run_in_executor(
+                None, self.prefilter.split, profile, described
+            )
+        else:
+            candidates, skipped = self.prefilter.split(profile, described)
+        self.prefiltered += len(skipped)
 
+        if self.batch_size > 1:
+            await self._calculate_batched_scores(profile, candidates)
+            return jobs
+
+        # The concurrency of the LLM calls is bounded by the process-wide scheduler of the adapter
         async def calculate_single_score(job: Job):
-            async with self.semaphore:
-                if not job.description:
-                    return job, 0
-                result = await self.compatibility_score_port.get_compatibility_score(
-                    profile=profile,
-                    job_description=job.description,
-                    job_location=job.location or "",
-                )
-                return job, result.score
+            result = await self.compatibility_score_port.get_compatibility_score(
+                profile=profile,
+                job_description=job.description or "",
+                job_location=job.location or "",
+            )
+            return job, result.score
 
-        tasks = [calculate_single_score(job) for job in jobs.jobs]
+        tasks = [calculate_single_score(job) for job in candidates]
         results = await asyncio.gather(*tasks)
 
         for job, score in results:
@@ -320,6 +282,29 @@ class LeadsProcessor:
 
         return jobs
 
+    async def _calculate_batched_scores(
+        self, profile: Profile, jobs: list[Job]
+    ) -> None:
+        """
+        Calculate compatibility scores by batches of COMPATIBILITY_BATCH_SIZE jobs per call.
+
+        Args:
+            profile (Profile): The user profile to use for scoring.
+            jobs (list[Job]): Jobs with a description, in scoring order.
+        """
+        batches = [
+            jobs[i:i + self.batch_size]
+            for i in range(0, len(jobs), self.batch_size)
+        ]
+
+        results = await asyncio.gather(
+            *(self.compatibility_score_port.get_compatibility_scores(profile, batch) for batch in batches)
+        )
+        scores = {job_id: score for result in results for job_id, score in result.items()}
+
+        for job in jobs:
+            job.compatibility_score = scores.get(job.id or "", 0)
+
     async def enrich_leads(self, enrich_leads: EnrichLeadsPort, leads: Leads, profile: Profile, task_uuid: str) -> Leads:
         """
         Enrich leads with deduplication and compatibility scoring.
@@ -0,0 +1,205 @@
+import re
+import numpy as np
+from scipy import sparse
+from domain.entities.job import Job
+from domain.entities.profile import Profile
+
+
+TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = frozenset(
+    "a an and at de des du en et for in la le les of on or the to with un une".split()
+)
+
+REMOTE = frozenset({"remote", "teletravail", "télétravail", "anywhere"})
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split a text into lowercase terms, keeping techno names such as c++, c# or node.js.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        list[str]: The terms, without stopwords.
+    """
+    return [token for token in TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class JobPrefilter:
+    """
+    Local, deterministic relevance of jobs for a profile, computed before the LLM scoring.
+    The profile technos, job title and past positions form a weighted query matched against
+    the job descriptions with the BM25 term saturation and length normalization. A location
+    match is blended in. Terms are weighted by their source rather than by an IDF, which is
+    unstable over chunks of a few dozen jobs. Jobs below the threshold get a heuristic score
+    and skip the LLM.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.0,
+        location_weight: float = 0.2,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        """
+        Initialize the pre-filter.
+
+        Args:
+            threshold (float): Relevance, between 0 and 1, under which a job skips the LLM.
+            location_weight (float): Share of the location match in the relevance.
+            k1 (float): BM25 term frequency saturation.
+            b (float): BM25 length normalization.
+        """
+        self.threshold = threshold
+        self.location_weight = location_weight
+        self.k1 = k1
+        self.b = b
+
+    def query(self, profile: Profile) -> dict[str, float]:
+        """
+        Build the weighted query terms of a profile.
+        Technos weigh the most, then the target job title, then the past positions.
+
+        Args:
+            profile (Profile): The profile.
+
+        Returns:
+            dict[str, float]: Weight of each term.
+        """
+        weights: dict[str, float] = {}
+        sources = [(3.0, " ".join(profile.technos)), (2.0, profile.job_title or "")]
+        sources += [(1.0, experience.position or "") for experience in profile.work_experience]
+        for weight, text in sources:
+            for term in tokenize(text):
+                weights[term] = max(weights.get(term, 0.0), weight)
+        return weights
+
+    def text_relevance(self, query: dict[str, float], jobs: list[Job]) -> np.ndarray:
+        """
+        Match the query against the job descriptions.
+
+        Args:
+            query (dict[str, float]): Weight of each query term.
+            jobs (list[Job]): The jobs.
+
+        Returns:
+            np.ndarray: Relevance of each job, between 0 and 1.
+        """
+        terms = sorted(query, key=len, reverse=True)
+        tf, lengths = self.term_frequencies(terms, jobs)
+        return self.bm25(tf, lengths, np.array([query[term] for term in terms]))
+
+    def term_frequencies(self, terms: list[str], jobs: list[Job]) -> tuple[sparse.csr_matrix, np.ndarray]:
+        """
+        Count the query terms in the job descriptions.
+
+        Args:
+            terms (list[str]): The query terms, longest first.
+            jobs (list[Job]): The jobs.
+
+        Returns:
+            tuple[sparse.csr_matrix, np.ndarray]: Jobs x terms frequencies and the length of each description in words.
+        """
+        columns = {term: index for index, term in enumerate(terms)}
+        # One scan per description for every query term
+        matcher = re.compile(
+            r"(?<![a-z0-9+#.])(" + "|".join(map(re.escape, terms)) + r")(?![a-z0-9+#]|\.[a-z0-9])"
+        )
+        rows, cols = [], []
+        lengths = np.zeros(len(jobs))
+        for row, job in enumerate(jobs):
+            description = (job.description or "").lower()
+            lengths[row] = len(description.split())
+            found = matcher.findall(description)
+            rows.extend([row] * len(found))
+            cols.extend(columns[term] for term in found)
+        # Duplicate (row, col) pairs are summed into term frequencies
+        tf = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(jobs), len(terms))
+        )
+        tf.sum_duplicates()
+        return tf, lengths
+
+    def bm25(self, tf: sparse.csr_matrix, lengths: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """
+        Score the term frequencies with the BM25 saturation and length normalization.
+
+        Args:
+            tf (sparse.csr_matrix): Jobs x terms frequencies.
+            lengths (np.ndarray): Length of each description in words.
+            weights (np.ndarray): Weight of each term.
+
+        Returns:
+            np.ndarray: Weighted share of the query found in each job, between 0 and 1.
+        """
+        average = lengths.mean() if len(lengths) and lengths.mean() > 0 else 1.0
+        norm = self.k1 * (1 - self.b + self.b * lengths / average)
+        saturated = tf.copy()
+        # Saturates to 1 for a term repeated many times
+        saturated.data = tf.data / (tf.data + np.repeat(norm, np.diff(tf.indptr)))
+        return np.asarray(saturated @ weights).ravel() / weights.sum()
+
+    def location_relevance(self, profile: Profile, jobs: list[Job]) -> np.ndarray:
+        """
+        Match the job locations against the profile location.
+
+        Args:
+            profile (Profile): The profile.
+            jobs (list[Job]): The jobs.
+
+        Returns:
+            np.ndarray: 1 for a shared location term or a remote job, 0.5 when unknown, 0 otherwise.
+        """
+        wanted = set(tokenize(profile.location or ""))
+        relevance = np.full(len(jobs), 0.5)
+        if not wanted:
+            return relevance
+        for index, job in enumerate(jobs):
+            terms = set(tokenize(job.location or ""))
+            if terms:
+                relevance[index] = 1.0 if terms & (wanted | REMOTE) else 0.0
+        return relevance
+
+    def relevance(self, profile: Profile, jobs: list[Job]) -> np.ndarray:
+        """
+        Compute the relevance of jobs for a profile.
+
+        Args:
+            profile (Profile): The profile.
+            jobs (list[Job]): The jobs.
+
+        Returns:
+            np.ndarray: Relevance of each job, between 0 and 1. All ones when the profile has no query terms.
+        """
+        query = self.query(profile)
+        if not query or not jobs:
+            return np.ones(len(jobs))
+        text = self.text_relevance(query, jobs)
+        location = self.location_relevance(profile, jobs)
+        return (1 - self.location_weight) * text + self.location_weight * location
+
+    def split(self, profile: Profile, jobs: list[Job]) -> tuple[list[Job], list[Job]]:
+        """
+        Rank the jobs by relevance and set the heuristic score of the ones below the threshold.
+
+        Args:
+            profile (Profile): The profile.
+            jobs (list[Job]): Jobs with a description.
+
+        Returns:
+            tuple[list[Job], list[Job]]: Jobs to score with the LLM, most relevant first, and
+                jobs scored by the heuristic.
+        """
+        relevance = self.relevance(profile, jobs)
+        candidates, skipped = [], []
+        for index in np.argsort(-relevance, kind="stable"):
+            job = jobs[index]
+            if relevance[index] < self.threshold:
+                job.compatibility_score = int(round(100 * relevance[index]))
+                skipped.append(job)
+            else:
+                candidates.append(job)
+        return candidates, skipped
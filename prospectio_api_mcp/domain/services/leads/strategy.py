@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 from domain.ports.fetch_leads import FetchLeadsPort
 from domain.entities.leads import Leads
 
@@ -33,3 +34,13 @@ class LeadsStrategy(ABC):
             dict: The leads data retrieved from the external provider API.
         """
         pass
+
+    async def stream(self) -> AsyncIterator[Leads]:
+        """
+        Stream the leads of the provider as its pages complete.
+
+        Yields:
+            Leads: A chunk of the leads retrieved from the external provider API.
+        """
+        async for leads in self.port.stream_leads(self.location, self.job_title):
+            yield leads
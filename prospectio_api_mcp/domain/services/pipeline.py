@@ -0,0 +1,214 @@
+import asyncio
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+from domain.entities.pipeline_stats import StageStats
+
+
+_END = object()
+
+
+class Stage:
+    """
+    A step of a pipeline, run by one or more workers reading a bounded input queue.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], Awaitable[Optional[Any]]],
+        concurrency: int = 1,
+        batch_size: Optional[int] = None,
+    ):
+        """
+        Initialize the stage.
+
+        Args:
+            name (str): Name of the stage, reported in the statistics.
+            handler (Callable[[Any], Awaitable[Optional[Any]]]): Processes an item and returns the
+                item to forward to the next stage, or None to drop it. Batching stages receive a
+                list of items instead.
+            concurrency (int): Number of workers. Stages that must keep the order of the items
+                use a single worker.
+            batch_size (Optional[int]): When set, the stage receives the items available in its
+                queue as one batch, up to this weight.
+        """
+        self.name = name
+        self.handler = handler
+        self.concurrency = max(concurrency, 1)
+        self.batch_size = batch_size
+        self.queue: Optional[asyncio.Queue] = None
+        self.stats = StageStats(name=name, concurrency=self.concurrency) # type: ignore
+
+
+class Pipeline:
+    """
+    Chain of stages connected by bounded queues.
+    A full queue blocks the stage feeding it, so a slow stage slows down the source instead of
+    buffering every item in memory. The first failing stage cancels the whole pipeline.
+    """
+
+    def __init__(
+        self,
+        stages: list[Stage],
+        queue_size: int = 4,
+        weight: Callable[[Any], int] = lambda item: 1,
+        on_progress: Optional[Callable[[list[StageStats]], Awaitable[None]]] = None,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            stages (list[Stage]): The stages, in order.
+            queue_size (int): Capacity of the queue in front of each stage.
+            weight (Callable[[Any], int]): Size of an item, e.g. its number of jobs, used for
+                the throughput statistics and the batch sizes.
+            on_progress (Optional[Callable[[list[StageStats]], Awaitable[None]]]): Called with
+                the statistics each time a stage completes an item.
+        """
+        self.stages = stages
+        self.queue_size = max(queue_size, 1)
+        self.weight = weight
+        self.on_progress = on_progress
+        self.source_stats = StageStats(name="fetch") # type: ignore
+        self._started = 0.0
+
+    def stats(self) -> list[StageStats]:
+        """
+        Snapshot the statistics of the source and of every stage.
+
+        Returns:
+            list[StageStats]: The statistics, in pipeline order.
+        """
+        elapsed = time.perf_counter() - self._started if self._started else 0.0
+        snapshot = []
+        for stats, queue in [(self.source_stats, None)] + [
+            (stage.stats, stage.queue) for stage in self.stages
+        ]:
+            stats.queue_depth = queue.qsize() if queue is not None else 0
+            stats.jobs_per_second = round(stats.jobs / elapsed, 3) if elapsed > 0 else 0.0
+            snapshot.append(stats.model_copy())
+        return snapshot
+
+    async def run(self, source: AsyncIterator[Any]) -> list[StageStats]:
+        """
+        Feed the items of the source through every stage until the source is exhausted.
+
+        Args:
+            source (AsyncIterator[Any]): The items to process.
+
+        Raises:
+            Exception: The first error raised by the source or a stage.
+
+        Returns:
+            list[StageStats]: The final statistics.
+        """
+        self._started = time.perf_counter()
+        for stage in self.stages:
+            stage.queue = asyncio.Queue(self.queue_size)
+        tasks = [asyncio.create_task(self._produce(source))]
+        for index, stage in enumerate(self.stages):
+            output = self.stages[index + 1].queue if index + 1 < len(self.stages) else None
+            remaining = [stage.concurrency]
+            tasks.extend(
+                asyncio.create_task(self._work(stage, output, remaining))
+                for _ in range(stage.concurrency)
+            )
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return self.stats()
+
+    async def _produce(self, source: AsyncIterator[Any]) -> None:
+        """
+        Push the items of the source into the first stage.
+
+        Args:
+            source (AsyncIterator[Any]): The items to process.
+        """
+        queue = self.stages[0].queue if self.stages else None
+        async for item in source:
+            self.source_stats.items += 1
+            self.source_stats.jobs += self.weight(item)
+            if queue is not None:
+                await queue.put(item)
+            await self._progress()
+        if queue is not None:
+            await queue.put(_END)
+
+    async def _work(self, stage: Stage, output: Optional[asyncio.Queue], remaining: list[int]) -> None:
+        """
+        Process the items of a stage until its input is exhausted.
+
+        Args:
+            stage (Stage): The stage.
+            output (Optional[asyncio.Queue]): The queue of the next stage, None for the last one.
+            remaining (list[int]): Number of workers of the stage still running, shared by them.
+        """
+        queue: asyncio.Queue = stage.queue # type: ignore
+        while True:
+            item = await queue.get()
+            if item is _END:
+                await queue.put(_END)
+                break
+            if stage.batch_size:
+                item = self._batch(queue, [item], stage.batch_size)
+                ended = item[-1] is _END
+                if ended:
+                    item.pop()
+                    await queue.put(_END)
+            else:
+                ended = False
+            weight = sum(self.weight(i) for i in item) if stage.batch_size else self.weight(item)
+            stage.stats.in_flight += 1
+            start = time.perf_counter()
+            try:
+                result = await stage.handler(item)
+            finally:
+                stage.stats.in_flight -= 1
+                stage.stats.busy_seconds = round(stage.stats.busy_seconds + time.perf_counter() - start, 6)
+            stage.stats.items += len(item) if stage.batch_size else 1
+            stage.stats.jobs += weight
+            if result is not None and output is not None:
+                await output.put(result)
+            await self._progress()
+            if ended:
+                break
+        remaining[0] -= 1
+        if remaining[0] == 0:
+            # The last worker takes back the end marker left for its siblings
+            while not queue.empty():
+                queue.get_nowait()
+            if output is not None:
+                await output.put(_END)
+
+    def _batch(self, queue: asyncio.Queue, batch: list[Any], batch_size: int) -> list[Any]:
+        """
+        Complete a batch with the items already waiting in the queue.
+
+        Args:
+            queue (asyncio.Queue): The input queue of the stage.
+            batch (list[Any]): The batch, holding the first item.
+            batch_size (int): Maximum weight of the batch.
+
+        Returns:
+            list[Any]: The batch, ending with the end marker when it was reached.
+        """
+        weight = sum(self.weight(item) for item in batch)
+        while weight < batch_size and not queue.empty():
+            item = queue.get_nowait()
+            batch.append(item)
+            if item is _END:
+                break
+            weight += self.weight(item)
+        return batch
+
+    async def _progress(self) -> None:
+        """
+        Report the statistics to the progress callback.
+        """
+        if self.on_progress is not None:
+            await self.on_progress(self.stats())
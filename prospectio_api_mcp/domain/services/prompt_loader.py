@@ -3,21 +3,25 @@ import os
 class PromptLoader:
     prompt_mapping = {
         "compatibility_score": "../prompts/compatibility_score.md",
+        "compatibility_score_batch": "../prompts/compatibility_score_batch.md",
         "company_decision": "../prompts/company_decision.md",
         "company_description": "../prompts/company_description.md",
         "company_info": "../prompts/company_info.md",
         "contact_info": "../prompts/contact_info.md",
+        "contact_info_batch": "../prompts/contact_info_batch.md",
         "job_titles": "../prompts/job_titles.md",
         "prospecting_message": "../prompts/prospecting_message.md",
     }
 
-    def load_prompt(self, chat_profile: str) -> str:
-        prompt_path = os.path.join(
+    def prompt_path(self, chat_profile: str) -> str:
+        return os.path.join(
             os.path.dirname(__file__),
             f"{self.prompt_mapping.get(chat_profile)}",
         )
+
+    def load_prompt(self, chat_profile: str) -> str:
         try:
-            with open(prompt_path, "r", encoding="utf-8") as f:
+            with open(self.prompt_path(chat_profile), "r", encoding="utf-8") as f:
                 return f.read().strip()
         except FileNotFoundError:
             return "You are a helpful AI assistant."
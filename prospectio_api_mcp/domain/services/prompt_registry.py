@@ -0,0 +1,121 @@
+import hashlib
+import logging
+import os
+import time
+from typing import Optional
+from domain.entities.prompt import Prompt
+from domain.services.prompt_loader import PromptLoader
+
+
+logger = logging.getLogger(__name__)
+
+
+class PromptRegistry:
+    """
+    Prompts read once and kept in memory, each with a version hashing its content so the
+    results computed with a prompt can be keyed by it. With hot-reload, the files are checked
+    for changes at most once per interval and reloaded without restarting.
+    """
+
+    def __init__(
+        self,
+        loader: Optional[PromptLoader] = None,
+        hot_reload: bool = False,
+        reload_interval: float = 2.0,
+    ):
+        """
+        Initialize the registry and load every known prompt.
+
+        Args:
+            loader (Optional[PromptLoader]): Reads the prompt files.
+            hot_reload (bool): Reload the prompts whose file changed.
+            reload_interval (float): Minimum seconds between two checks of the files.
+        """
+        self.loader = loader or PromptLoader()
+        self.hot_reload = hot_reload
+        self.reload_interval = reload_interval
+        self.prompts: dict[str, Prompt] = {}
+        self.mtimes: dict[str, float] = {}
+        self.checked_at = time.monotonic()
+        for name in self.loader.prompt_mapping:
+            self._load(name)
+
+    def _load(self, name: str) -> Prompt:
+        """
+        Read a prompt and compute its version.
+
+        Args:
+            name (str): Name of the prompt.
+
+        Returns:
+            Prompt: The loaded prompt.
+        """
+        self.mtimes[name] = self._mtime(name)
+        text = self.loader.load_prompt(name)
+        prompt = Prompt(
+            name=name,
+            text=text,
+            version=hashlib.sha256(text.encode("utf-8")).hexdigest()[:12],
+        )
+        self.prompts[name] = prompt
+        return prompt
+
+    def _mtime(self, name: str) -> float:
+        """
+        Get the modification time of a prompt file.
+
+        Args:
+            name (str): Name of the prompt.
+
+        Returns:
+            float: The modification time, 0 when the file does not exist.
+        """
+        try:
+            return os.stat(self.loader.prompt_path(name)).st_mtime
+        except OSError:
+            return 0.0
+
+    def get(self, name: str) -> Prompt:
+        """
+        Get a prompt from memory.
+
+        Args:
+            name (str): Name of the prompt.
+
+        Returns:
+            Prompt: The prompt, loaded on first use when it is not a known one.
+        """
+        if self.hot_reload and time.monotonic() - self.checked_at >= self.reload_interval:
+            self.reload()
+        prompt = self.prompts.get(name)
+        return prompt if prompt is not None else self._load(name)
+
+    def version(self, *names: str) -> str:
+        """
+        Combine the versions of several prompts.
+
+        Args:
+            *names (str): Names of the prompts.
+
+        Returns:
+            str: Short SHA-256 of their versions, changing when any of them changes.
+        """
+        versions = ":".join(self.get(name).version for name in names)
+        return hashlib.sha256(versions.encode("utf-8")).hexdigest()[:12]
+
+    def reload(self) -> list[str]:
+        """
+        Reload the prompts whose file changed since they were read.
+
+        Returns:
+            list[str]: Names of the prompts whose version changed.
+        """
+        self.checked_at = time.monotonic()
+        changed = []
+        for name, prompt in list(self.prompts.items()):
+            if self._mtime(name) != self.mtimes.get(name):
+                if self._load(name).version != prompt.version:
+                    changed.append(name)
+        if changed:
+            logger.info(f"Reloaded prompts: {', '.join(changed)}")
+        return changed
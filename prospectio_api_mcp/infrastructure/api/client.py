@@ -1,67 +1,193 @@
-from typing import Any, Dict, Optional
+import asyncio
+import contextlib
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, Optional
 import httpx
+from config import HttpClientConfig
+from domain.ports.metrics import MetricsPort
 
 
-class BaseApiClient:
+logger = logging.getLogger(__name__)
+
+
+class BaseApiClient(MetricsPort):
     """
-    Generic HTTP client for consuming external lead APIs.
-    Uses httpx.AsyncClient for asynchronous requests.
+    Shared HTTP client for consuming external lead APIs.
+    Wraps a single httpx.AsyncClient (HTTP/2, keep-alive pool) reused by every adapter,
+    so retries and key rotations go through warm connections instead of new TLS handshakes.
+    Credentials are passed per request and never stored on the client.
     """
 
     def __init__(
         self,
-        base_url: str,
-        headers: Optional[Dict[str, str]] = None,
-        timeout: float = 30.0,
+        config: Optional[HttpClientConfig] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ) -> None:
         """
-        Initialize the client with a base URL, optional headers, and a timeout.
+        Initialize the client without opening any connection.
 
         Args:
-            base_url (str): The base URL of the API.
-            headers (Optional[Dict[str, str]]): Default HTTP headers.
-            timeout (float): Timeout in seconds for HTTP requests.
+            config (Optional[HttpClientConfig]): Pool settings, defaults when omitted.
+            transport (Optional[httpx.AsyncBaseTransport]): Custom transport, e.g. a mock server.
+        """
+        self.config = config or HttpClientConfig()
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+        self.requests = 0
+        self.errors = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        The shared httpx client, created on first access.
+
+        Returns:
+            httpx.AsyncClient: The shared client.
+        """
+        if self._client is None:
+            self.start()
+        return self._client # type: ignore
+
+    def start(self) -> httpx.AsyncClient:
         """
-        self.base_url = base_url.rstrip("/")
-        self.headers = headers or {}
+        Create the shared httpx client and its connection pool.
+
+        Returns:
+            httpx.AsyncClient: The shared client.
+        """
+        if self._client is not None:
+            return self._client
         self._client = httpx.AsyncClient(
-            base_url=self.base_url, headers=self.headers, timeout=timeout
+            http2=self.config.HTTP2,
+            transport=self.transport,
+            timeout=self.config.HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=self.config.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=self.config.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=self.config.HTTP_KEEPALIVE_EXPIRY,
+            ),
         )
+        logger.info(
+            f"HTTP client started (http2={self.config.HTTP2}, "
+            f"max_connections={self.config.HTTP_MAX_CONNECTIONS})"
+        )
+        return self._client
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        """
+        Return the semaphore capping the concurrent requests sent to the host of a URL.
+
+        Args:
+            url (str): The absolute request URL.
+
+        Returns:
+            asyncio.Semaphore: The semaphore of the host.
+        """
+        host = httpx.URL(url).host
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.config.HTTP_MAX_CONNECTIONS_PER_HOST)
+        return self._host_limits[host]
+
+    @contextlib.asynccontextmanager
+    async def _slot(self, url: str) -> AsyncIterator[None]:
+        """
+        Hold one of the per-host request slots for the duration of a request.
+
+        Args:
+            url (str): The absolute request URL.
+        """
+        start = time.perf_counter()
+        async with self._host_limit(url):
+            waited = time.perf_counter() - start
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+            self.requests += 1
+            try:
+                yield
+            except httpx.HTTPError:
+                self.errors += 1
+                raise
 
     async def get(
-        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> httpx.Response:
         """
         Perform an asynchronous GET request.
 
         Args:
-            endpoint (str): Relative path of the endpoint.
+            url (str): Absolute URL of the endpoint.
             params (Optional[Dict[str, Any]]): Optional query parameters.
+            headers (Optional[Dict[str, str]]): Headers of this request, e.g. the API key.
 
         Returns:
             httpx.Response: The HTTP response object.
         """
-        response = await self._client.get(endpoint, params=params)
-        return response
+        async with self._slot(url):
+            return await self.client.get(url, params=params, headers=headers)
 
     async def post(
-        self, endpoint: str, data: Optional[Any] = None, json: Optional[Any] = None
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
     ) -> httpx.Response:
         """
         Perform an asynchronous POST request.
 
         Args:
-            endpoint (str): Relative path of the endpoint.
+            url (str): Absolute URL of the endpoint.
             data (Optional[Any]): Data to send in the request body.
             json (Optional[Any]): JSON data to send in the request body.
+            headers (Optional[Dict[str, str]]): Headers of this request, e.g. the API key.
 
         Returns:
             httpx.Response: The HTTP response object.
         """
-        return await self._client.post(endpoint, data=data, json=json)
+        async with self._slot(url):
+            return await self.client.post(url, data=data, json=json, headers=headers)
 
     async def close(self) -> None:
         """
-        Properly close the HTTPX client.
+        Close every pooled connection and drop the client.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._host_limits.clear()
+
+    @contextlib.asynccontextmanager
+    async def run(self) -> AsyncIterator["BaseApiClient"]:
+        """
+        Open the client for the lifetime of the context, typically the application lifespan.
+
+        Yields:
+            BaseApiClient: The started client.
+        """
+        self.start()
+        try:
+            yield self
+        finally:
+            await self.close()
+
+    def get_metrics(self) -> dict[str, float]:
+        """
+        Report the requests sent and the time spent waiting for a per-host slot.
+
+        Returns:
+            dict[str, float]: The client metrics.
         """
-        await self._client.aclose()
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "hosts": len(self._host_limits),
+            "slot_wait_seconds_total": round(self.wait_seconds_total, 6),
+            "slot_wait_seconds_max": round(self.wait_seconds_max, 6),
+        }
@@ -1,36 +1,135 @@
-from langchain_ollama import ChatOllama
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_mistralai import ChatMistralAI
-from langchain_openai import ChatOpenAI
-from typing import Type
+import threading
+import httpx
+from langchain_core.embeddings import Embeddings
+from langchain_ollama import ChatOllama, OllamaEmbeddings
+from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
+from langchain_mistralai import ChatMistralAI, MistralAIEmbeddings
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from typing import Any, Type
 from config import LLMConfig
 from infrastructure.api.llm_generic_client import LLMGenericClient
 
 
 class LLMClientFactory:
+    """
+    Builds the LLM and embedding clients of a "Provider/model" name.
+    Clients are kept in a process-wide registry keyed by provider, model, temperature and
+    base URL, so every service asking for the same model shares one client and its pool of
+    warm HTTP connections.
+    """
+
+    _clients: dict[tuple, LLMGenericClient] = {}
+    _embeddings: dict[tuple, Embeddings] = {}
+    _lock = threading.Lock()
+
     def __init__(self, model: str, config: LLMConfig):
         self.model = model
         self.temperature = config.TEMPERATURE
         self.ollama_base_url = config.OLLAMA_BASE_URL
         self.open_router_base_url = config.OPEN_ROUTER_API_URL
         self.open_router_api_key = config.OPEN_ROUTER_API_KEY
+        self.max_connections = config.LLM_MAX_CONNECTIONS
+        self.max_keepalive_connections = config.LLM_MAX_KEEPALIVE_CONNECTIONS
+        self.keepalive_expiry = config.LLM_KEEPALIVE_EXPIRY
+        self.provider_max_connections = config.LLM_PROVIDER_MAX_CONNECTIONS
         self.model_mapping: dict[str, Type[LLMGenericClient]] = {  # type: ignore
             "Ollama": ChatOllama,
             "Google": ChatGoogleGenerativeAI,
             "Mistral": ChatMistralAI,
             "OpenRouter": ChatOpenAI
         }
+        self.embeddings_mapping: dict[str, Type[Embeddings]] = {
+            "Ollama": OllamaEmbeddings,
+            "Google": GoogleGenerativeAIEmbeddings,
+            "Mistral": MistralAIEmbeddings,
+            "OpenRouter": OpenAIEmbeddings
+        }
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Forget every shared client, e.g. after a configuration change.
+        """
+        with cls._lock:
+            cls._clients.clear()
+            cls._embeddings.clear()
+
+    def base_url(self, category: str) -> str:
+        if category == "Ollama":
+            return self.ollama_base_url
+        if category == "OpenRouter":
+            return self.open_router_base_url
+        return ""
+
+    def limits(self, category: str) -> httpx.Limits:
+        """
+        Size the connection pool of a provider client.
+
+        Args:
+            category (str): The provider.
+
+        Returns:
+            httpx.Limits: LLM_PROVIDER_MAX_CONNECTIONS of the provider, or LLM_MAX_CONNECTIONS,
+                concurrent connections at most.
+        """
+        max_connections = self.provider_max_connections.get(category, self.max_connections)
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(self.max_keepalive_connections, max_connections),
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def pool_params(self, category: str) -> dict[str, Any]:
+        """
+        Build the constructor parameters setting the connection pool of a provider client.
+        The Google and Mistral clients do not accept pool settings and keep their defaults.
+
+        Args:
+            category (str): The provider.
+
+        Returns:
+            dict[str, Any]: The pool parameters of the client.
+        """
+        if category == "Ollama":
+            return {"client_kwargs": {"limits": self.limits(category)}}
+        if category == "OpenRouter":
+            return {"http_async_client": httpx.AsyncClient(limits=self.limits(category))}
+        return {}
 
     def create_client(self) -> LLMGenericClient:
         category = self.model.split("/")[0]
         model = self.model.split("/", 1)[1]
-        params = {"model": model, "temperature": self.temperature}
         client = self.model_mapping.get(category)
         if not client:
             raise ValueError(f"Invalid model name: {self.model}")
-        if category == "Ollama":
-            params["base_url"] = self.ollama_base_url
-        if category == "OpenRouter":
-            params["api_key"] = self.open_router_api_key
-            params["base_url"] = self.open_router_base_url
-        return client(**params)
+        key = (category, model, self.temperature, self.base_url(category))
+        with self._lock:
+            shared = self._clients.get(key)
+            if shared is None:
+                params = {"model": model, "temperature": self.temperature}
+                if category == "Ollama":
+                    params["base_url"] = self.ollama_base_url
+                if category == "OpenRouter":
+                    params["api_key"] = self.open_router_api_key
+                    params["base_url"] = self.open_router_base_url
+                shared = self._clients[key] = client(**params, **self.pool_params(category))
+        return shared
+
+    def create_embeddings(self) -> Embeddings:
+        category = self.model.split("/")[0]
+        model = self.model.split("/", 1)[1]
+        embeddings = self.embeddings_mapping.get(category)
+        if not embeddings:
+            raise ValueError(f"Invalid embedding model name: {self.model}")
+        key = (category, model, self.base_url(category))
+        with self._lock:
+            shared = self._embeddings.get(key)
+            if shared is None:
+                params = {"model": model}
+                if category == "Ollama":
+                    params["base_url"] = self.ollama_base_url
+                if category == "OpenRouter":
+                    params["api_key"] = self.open_router_api_key
+                    params["base_url"] = self.open_router_base_url
+                shared = self._embeddings[key] = embeddings(**params, **self.pool_params(category))
+        return shared
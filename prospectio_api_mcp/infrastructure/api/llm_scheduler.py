@@ -0,0 +1,389 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Optional
+from config import LLMConfig
+from domain.ports.metrics import MetricsPort
+
+
+logger = logging.getLogger(__name__)
+
+# Priority classes, a lower value is served first
+INTERACTIVE = 0
+ENRICHMENT = 1
+BULK = 2
+
+CHARS_PER_TOKEN = 4
+
+_PROVIDERS = {
+    "ChatOllama": "Ollama",
+    "ChatGoogleGenerativeAI": "Google",
+    "ChatMistralAI": "Mistral",
+    "ChatOpenAI": "OpenRouter",
+}
+
+
+def model_key(llm_client: Any) -> str:
+    """
+    Name the model of a client like the configuration does, e.g. Ollama/qwen2.5:7b.
+
+    Args:
+        llm_client (Any): The LLM client.
+
+    Returns:
+        str: The provider and model of the client.
+    """
+    provider = _PROVIDERS.get(type(llm_client).__name__, type(llm_client).__name__)
+    model = getattr(llm_client, "model", None) or getattr(llm_client, "model_name", None) or ""
+    return f"{provider}/{model}"
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """
+    Recognize a rate limited call.
+
+    Args:
+        error (Exception): The error raised by the call.
+
+    Returns:
+        Optional[float]: None when the error is not a 429, else the Retry-After delay in
+            seconds, 0 when the response gives none.
+    """
+    response = getattr(error, "response", None)
+    status = getattr(error, "status_code", None) or getattr(response, "status_code", None)
+    if status != 429 and type(error).__name__ not in ("RateLimitError", "ResourceExhausted"):
+        return None
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return max(float(headers.get("retry-after", 0)), 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class _Bucket:
+    """
+    Per-minute budget refilled continuously, e.g. requests or tokens per minute.
+    """
+
+    def __init__(self, per_minute: Optional[int], clock: Callable[[], float]):
+        """
+        Initialize a full bucket.
+
+        Args:
+            per_minute (Optional[int]): The budget, unlimited when None or 0.
+            clock (Callable[[], float]): Monotonic clock, in seconds.
+        """
+        self.capacity = float(per_minute or 0)
+        self.level = self.capacity
+        self.clock = clock
+        self.updated = clock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.capacity / 60)
+        self.updated = now
+
+    def delay(self, amount: float) -> float:
+        """
+        Compute how long to wait before the budget allows an amount.
+
+        Args:
+            amount (float): The amount to spend, capped to the whole budget.
+
+        Returns:
+            float: Seconds to wait, 0 when it can be spent now.
+        """
+        if not self.capacity:
+            return 0.0
+        self._refill()
+        missing = min(amount, self.capacity) - self.level
+        return missing * 60 / self.capacity if missing > 0 else 0.0
+
+    def spend(self, amount: float) -> None:
+        """
+        Spend an amount, or give it back when negative. The level may go below zero.
+
+        Args:
+            amount (float): The amount to spend.
+        """
+        if self.capacity:
+            self._refill()
+            self.level = min(self.capacity, self.level - amount)
+
+
+class _ModelLimiter:
+    """
+    Admission of the calls to one model: at most max_in_flight at once, within the requests
+    and tokens per minute budgets, served by priority then arrival order.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        requests_per_minute: Optional[int],
+        tokens_per_minute: Optional[int],
+        clock: Callable[[], float],
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_in_flight (int): Maximum number of concurrent calls.
+            requests_per_minute (Optional[int]): Requests budget, unlimited when None.
+            tokens_per_minute (Optional[int]): Tokens budget, unlimited when None.
+            clock (Callable[[], float]): Monotonic clock, in seconds.
+        """
+        self.max_in_flight = max(max_in_flight, 1)
+        self.requests = _Bucket(requests_per_minute, clock)
+        self.tokens = _Bucket(tokens_per_minute, clock)
+        self.clock = clock
+        self.blocked_until = 0.0
+        self.waiters: list[tuple[int, int, int, asyncio.Future]] = []
+        self.sequence = itertools.count()
+        self.dispatcher: Optional[asyncio.Task] = None
+        self.in_flight = 0
+        self.calls = 0
+        self.rate_limited = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    async def acquire(self, priority: int, tokens: int) -> None:
+        """
+        Wait for the turn of a call.
+
+        Args:
+            priority (int): Priority class of the call.
+            tokens (int): Estimated tokens of the call.
+        """
+        start = self.clock()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.waiters, (priority, next(self.sequence), tokens, future))
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        waited = self.clock() - start
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def release(self) -> None:
+        """
+        Free the slot of a finished call.
+        """
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """
+        Start the dispatcher when none is running on the current event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self.dispatcher is None or self.dispatcher.done() or self.dispatcher.get_loop() is not loop:
+            self.dispatcher = loop.create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        """
+        Admit the waiting calls in priority order while slots and budgets allow.
+        A delay is re-evaluated after sleeping, so a call of a higher priority arriving
+        meanwhile goes first.
+        """
+        while self.waiters and self.in_flight < self.max_in_flight:
+            _, _, tokens, future = self.waiters[0]
+            if future.done():
+                heapq.heappop(self.waiters)
+                continue
+            delay = max(
+                self.blocked_until - self.clock(),
+                self.requests.delay(1),
+                self.tokens.delay(tokens),
+            )
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            heapq.heappop(self.waiters)
+            self.requests.spend(1)
+            self.tokens.spend(tokens)
+            self.in_flight += 1
+            self.calls += 1
+            future.set_result(None)
+
+
+class LLMScheduler(MetricsPort):
+    """
+    Process-wide admission of the LLM calls, per provider and model.
+    Every call, whatever the service or request issuing it, waits for a slot of its model
+    within the configured in-flight, requests per minute and tokens per minute limits.
+    Interactive calls are served before enrichment and bulk scoring ones. A 429 answer
+    pauses the model for its Retry-After delay, or a jittered exponential backoff, and the
+    call is retried.
+    """
+
+    _shared: Optional["LLMScheduler"] = None
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        limits: Optional[dict[str, dict[str, int]]] = None,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_in_flight (int): Default maximum of concurrent calls per model.
+            limits (Optional[dict[str, dict[str, int]]]): Limits per "Provider/model" or
+                per provider, with the keys in_flight, rpm and tpm.
+            max_retries (int): Retries of a rate limited call.
+            backoff_base (float): First backoff in seconds when no Retry-After is given.
+            backoff_max (float): Maximum backoff in seconds.
+            clock (Callable[[], float]): Monotonic clock, in seconds.
+        """
+        self.max_in_flight = max_in_flight
+        self.limits = limits or {}
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.clock = clock
+        self.models: dict[str, _ModelLimiter] = {}
+
+    @classmethod
+    def shared(cls) -> "LLMScheduler":
+        """
+        Get the scheduler shared by the whole process, built on first use.
+
+        Returns:
+            LLMScheduler: The shared scheduler.
+        """
+        if cls._shared is None:
+            config = LLMConfig() # type: ignore
+            cls._shared = cls(
+                config.CONCURRENT_CALLS,
+                config.LLM_RATE_LIMITS,
+                config.LLM_MAX_RETRIES,
+                config.LLM_BACKOFF_BASE,
+                config.LLM_BACKOFF_MAX,
+            )
+        return cls._shared
+
+    def limiter(self, model: str) -> _ModelLimiter:
+        """
+        Get the limiter of a model, created with the limits of the model or of its provider.
+
+        Args:
+            model (str): The provider and model, e.g. Ollama/qwen2.5:7b.
+
+        Returns:
+            _ModelLimiter: The limiter of the model.
+        """
+        limiter = self.models.get(model)
+        if limiter is None:
+            limits = self.limits.get(model) or self.limits.get(model.split("/")[0]) or {}
+            limiter = self.models[model] = _ModelLimiter(
+                limits.get("in_flight", self.max_in_flight),
+                limits.get("rpm"),
+                limits.get("tpm"),
+                self.clock,
+            )
+        return limiter
+
+    def backoff(self, attempt: int, delay: Optional[float]) -> float:
+        """
+        Compute the pause after a rate limited call.
+
+        Args:
+            attempt (int): Number of the retry, from 0.
+            delay (Optional[float]): The Retry-After delay, 0 when the response gives none.
+
+        Returns:
+            float: The Retry-After delay plus up to 10% of jitter, or a full jitter
+                exponential backoff.
+        """
+        if delay:
+            return delay * random.uniform(1.0, 1.1)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def run(
+        self,
+        model: str,
+        call: Callable[[], Awaitable[Any]],
+        priority: int = BULK,
+        tokens: int = 0,
+    ) -> Any:
+        """
+        Run an LLM call when its model admits it.
+
+        Args:
+            model (str): The provider and model of the call.
+            call (Callable[[], Awaitable[Any]]): Sends the call, invoked once per attempt.
+            priority (int): INTERACTIVE, ENRICHMENT or BULK.
+            tokens (int): Estimated tokens of the prompt.
+
+        Raises:
+            Exception: The error of the call, or the 429 once the retries are exhausted.
+
+        Returns:
+            Any: The result of the call.
+        """
+        limiter = self.limiter(model)
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire(priority, tokens)
+            try:
+                result = await call()
+            except Exception as e:
+                delay = retry_after(e)
+                if delay is None or attempt == self.max_retries:
+                    raise
+                limiter.rate_limited += 1
+                pause = self.backoff(attempt, delay)
+                limiter.blocked_until = max(limiter.blocked_until, self.clock() + pause)
+                logger.warning(f"{model} rate limited, retrying in {pause:.1f}s")
+                continue
+            finally:
+                limiter.release()
+            used = self.usage(result)
+            if used is not None:
+                limiter.tokens.spend(used - tokens)
+            return result
+
+    @staticmethod
+    def usage(result: Any) -> Optional[int]:
+        """
+        Read the tokens actually used by a call.
+
+        Args:
+            result (Any): A message, or the output of a structured call including the raw message.
+
+        Returns:
+            Optional[int]: The input and output tokens, None when not reported.
+        """
+        message = result.get("raw") if isinstance(result, dict) else result
+        usage = getattr(message, "usage_metadata", None)
+        if not usage:
+            return None
+        return usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+
+    def get_metrics(self) -> dict[str, float]:
+        """
+        Report the calls, rate limits and queue waits of every model.
+
+        Returns:
+            dict[str, float]: The per-model counters.
+        """
+        metrics: dict[str, float] = {}
+        for model, limiter in self.models.items():
+            metrics[f"{model}_calls"] = limiter.calls
+            metrics[f"{model}_in_flight"] = limiter.in_flight
+            metrics[f"{model}_queued"] = sum(1 for waiter in limiter.waiters if not waiter[3].done())
+            metrics[f"{model}_rate_limited"] = limiter.rate_limited
+            metrics[f"{model}_queue_wait_seconds_total"] = round(limiter.wait_seconds_total, 6)
+            metrics[f"{model}_queue_wait_seconds_max"] = round(limiter.wait_seconds_max, 6)
+        return metrics
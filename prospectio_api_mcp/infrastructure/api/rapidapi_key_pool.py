@@ -0,0 +1,179 @@
+import time
+from typing import Callable, Optional
+import httpx
+from domain.ports.metrics import MetricsPort
+
+
+class _KeyState:
+    """
+    Usage and quota of a single RapidAPI key.
+    """
+
+    def __init__(self, key: str):
+        """
+        Initialize the state of a key whose quota is not known yet.
+
+        Args:
+            key (str): The RapidAPI key.
+        """
+        self.key = key
+        self.remaining: Optional[int] = None
+        self.limit: Optional[int] = None
+        self.cooldown_until = 0.0
+        self.in_flight = 0
+        self.requests = 0
+        self.rate_limited = 0
+
+
+class RapidApiKeyPool(MetricsPort):
+    """
+    Scheduler of the RapidAPI keys shared by the requests of an API.
+    Each request takes the available key with the most remaining quota, as reported by the
+    x-ratelimit-*-remaining headers of its previous responses. A key running out of quota is
+    cooled down until its quota resets, a key answering 429 with quota left only for its
+    Retry-After delay, instead of being retried.
+    """
+
+    REMAINING_HEADERS = ("x-ratelimit-requests-remaining", "x-ratelimit-remaining")
+    LIMIT_HEADERS = ("x-ratelimit-requests-limit", "x-ratelimit-limit")
+    RESET_HEADERS = ("x-ratelimit-requests-reset", "x-ratelimit-reset")
+
+    def __init__(
+        self,
+        keys: list[str],
+        default_cooldown: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            keys (list[str]): The RapidAPI keys.
+            default_cooldown (float): Cooldown in seconds of a rate limited key whose
+                response gives no reset time.
+            clock (Callable[[], float]): Monotonic clock, in seconds.
+        """
+        self.keys = [_KeyState(key) for key in dict.fromkeys(keys)]
+        self.default_cooldown = default_cooldown
+        self.clock = clock
+
+    def available(self) -> int:
+        """
+        Count the keys that are not cooling down.
+
+        Returns:
+            int: The number of keys a request can use right now.
+        """
+        now = self.clock()
+        return sum(1 for state in self.keys if state.cooldown_until <= now)
+
+    def next_available_in(self) -> float:
+        """
+        Time until a key can be used again.
+
+        Returns:
+            float: Seconds until the earliest cooldown ends, 0 when a key is available.
+        """
+        now = self.clock()
+        return max(min((state.cooldown_until for state in self.keys), default=now) - now, 0.0)
+
+    def acquire(self) -> str:
+        """
+        Reserve the available key with the most remaining quota.
+        Keys whose quota is unknown come first, then the least used ones.
+
+        Raises:
+            Exception: If every key is cooling down.
+
+        Returns:
+            str: The key to send the request with.
+        """
+        now = self.clock()
+        available = [state for state in self.keys if state.cooldown_until <= now]
+        if not available:
+            raise Exception("All API keys exhausted due to rate limiting")
+        state = max(
+            available,
+            key=lambda s: (
+                float("inf") if s.remaining is None else s.remaining,
+                -s.in_flight,
+                -s.requests,
+            ),
+        )
+        state.in_flight += 1
+        state.requests += 1
+        if state.remaining is not None:
+            state.remaining = max(state.remaining - 1, 0)
+        return state.key
+
+    def release(self, key: str, response: Optional[httpx.Response] = None) -> None:
+        """
+        Release a key reserved by acquire and record the quota reported by the response.
+
+        Args:
+            key (str): The key returned by acquire.
+            response (Optional[httpx.Response]): The response, None when the request failed.
+        """
+        state = next(state for state in self.keys if state.key == key)
+        state.in_flight = max(state.in_flight - 1, 0)
+        if response is None:
+            return
+        remaining = self._header(response, self.REMAINING_HEADERS)
+        if remaining is not None:
+            state.remaining = int(remaining)
+        limit = self._header(response, self.LIMIT_HEADERS)
+        if limit is not None:
+            state.limit = int(limit)
+        if remaining == 0:
+            # Quota spent: the key is back when the quota period resets
+            cooldown = self._header(response, self.RESET_HEADERS + ("retry-after",))
+        elif response.status_code == 429:
+            # Throttled with quota left: only a short burst limit was hit
+            cooldown = self._header(response, ("retry-after",))
+        else:
+            return
+        if response.status_code == 429:
+            state.rate_limited += 1
+        state.cooldown_until = self.clock() + (cooldown if cooldown is not None else self.default_cooldown)
+        state.remaining = None
+
+    @staticmethod
+    def _header(response: httpx.Response, names: tuple[str, ...]) -> Optional[float]:
+        """
+        Read the first numeric header found among the given names.
+
+        Args:
+            response (httpx.Response): The response.
+            names (tuple[str, ...]): The header names, by priority.
+
+        Returns:
+            Optional[float]: The header value, None when absent or not numeric.
+        """
+        for name in names:
+            value = response.headers.get(name)
+            if value is None:
+                continue
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                continue
+        return None
+
+    def get_metrics(self) -> dict[str, float]:
+        """
+        Report the usage of every key, identified by its position in the pool only so no
+        part of the key is exposed.
+
+        Returns:
+            dict[str, float]: The per-key counters.
+        """
+        now = self.clock()
+        metrics: dict[str, float] = {}
+        for index, state in enumerate(self.keys):
+            name = f"key_{index}"
+            metrics[f"{name}_requests"] = state.requests
+            metrics[f"{name}_rate_limited"] = state.rate_limited
+            metrics[f"{name}_in_flight"] = state.in_flight
+            metrics[f"{name}_remaining"] = -1 if state.remaining is None else state.remaining
+            metrics[f"{name}_cooldown_seconds"] = round(max(state.cooldown_until - now, 0.0), 3)
+        return metrics
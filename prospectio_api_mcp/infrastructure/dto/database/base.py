@@ -1,6 +1,9 @@
 from sqlalchemy.orm import DeclarativeBase
 
 
+# Size of the description_embedding columns, the embedding model must produce vectors of this size
+EMBEDDING_DIMENSIONS = 768
+
 class Base(DeclarativeBase):
     """
     Base class for SQLAlchemy models.
@@ -1,9 +1,10 @@
 from typing import List, Optional
 from sqlalchemy import ARRAY, String, Text, JSON
 from sqlalchemy.orm import Mapped, mapped_column
+from pgvector.sqlalchemy import Vector
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
-from infrastructure.dto.database.base import Base
+from infrastructure.dto.database.base import Base, EMBEDDING_DIMENSIONS
 
 
 class Company(Base):
@@ -48,6 +49,11 @@ class Company(Base):
         ARRAY(String),
         doc="List of opportunities or keywords associated with the company",
     )
+    description_embedding: Mapped[Optional[List[float]]] = mapped_column(
+        Vector(EMBEDDING_DIMENSIONS),
+        deferred=True,
+        doc="Embedding of the description, loaded only by the similarity queries",
+    )
 
     def __repr__(self) -> str:
         """
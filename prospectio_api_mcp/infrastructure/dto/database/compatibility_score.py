@@ -0,0 +1,31 @@
+from datetime import datetime
+from sqlalchemy import DateTime, SmallInteger, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.dto.database.base import Base
+
+
+class CompatibilityScoreCache(Base):
+    """
+    SQLAlchemy model of a cached compatibility score.
+    The key hashes the profile, the job description and location, the model and the prompt version.
+    """
+
+    __tablename__ = "compatibility_scores"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    model: Mapped[str] = mapped_column(Text, nullable=False)
+    prompt_version: Mapped[str] = mapped_column(Text, nullable=False)
+    score: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        """
+        String representation of the CompatibilityScoreCache object.
+
+        Returns:
+            str: A string representation showing the model and the score.
+        """
+        return f"CompatibilityScoreCache(model={self.model!r}, score={self.score!r})"
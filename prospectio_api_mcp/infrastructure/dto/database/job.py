@@ -1,11 +1,12 @@
 from typing import List, Optional
 from datetime import datetime
-from sqlalchemy import ARRAY, INTEGER, DateTime, String, Text, JSON, ForeignKey
+from sqlalchemy import ARRAY, INTEGER, Computed, DateTime, String, Text, JSON, ForeignKey
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from pgvector.sqlalchemy import Vector
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from domain.ports import compatibility_score
-from infrastructure.dto.database.base import Base
+from infrastructure.dto.database.base import Base, EMBEDDING_DIMENSIONS
 
 
 class Job(Base):
@@ -57,6 +58,16 @@ class Job(Base):
     compatibility_score: Mapped[Optional[int]] = mapped_column(
         INTEGER, doc="Compatibility score for the job"
     )
+    description_embedding: Mapped[Optional[List[float]]] = mapped_column(
+        Vector(EMBEDDING_DIMENSIONS),
+        deferred=True,
+        doc="Embedding of the description, loaded only by the similarity queries",
+    )
+    dedup_key: Mapped[Optional[str]] = mapped_column(
+        Text,
+        Computed("job_dedup_key(job_title, location, company_id, job_type, description)"),
+        doc="Normalized key used to deduplicate jobs",
+    )
 
     def __repr__(self) -> str:
         """
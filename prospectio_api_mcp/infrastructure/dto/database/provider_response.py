@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import Any
+from sqlalchemy import DateTime, LargeBinary, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.dto.database.base import Base
+
+
+class ProviderResponse(Base):
+    """
+    SQLAlchemy model of a cached lead provider response.
+    The payload is the raw JSON body compressed with zlib, so it can be parsed again
+    when the provider DTOs change.
+    """
+
+    __tablename__ = "provider_responses"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    provider: Mapped[str] = mapped_column(Text, nullable=False)
+    endpoint: Mapped[str] = mapped_column(Text, nullable=False)
+    params: Mapped[Any] = mapped_column(JSONB, nullable=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        """
+        String representation of the ProviderResponse object.
+
+        Returns:
+            str: A string representation showing the provider and the fetch date.
+        """
+        return f"ProviderResponse(provider={self.provider!r}, fetched_at={self.fetched_at!r})"
@@ -1,17 +1,24 @@
-from re import A
+import asyncio
+import logging
+import time
 import httpx
 from uuid import uuid4
-from typing import TypeVar
+from typing import Any, AsyncIterator, Optional
 from prospectio_api_mcp.domain.ports.fetch_leads import FetchLeadsPort
 from infrastructure.dto.rapidapi.active_jobs_db import ActiveJobsResponseDTO
 from config import ActiveJobsDBConfig
 from infrastructure.api.client import BaseApiClient
+from infrastructure.api.rapidapi_key_pool import RapidApiKeyPool
+from infrastructure.services.query_metrics import QueryMetrics
+from domain.ports.response_cache import ResponseCachePort
 from domain.entities.company import Company, CompanyEntity
 from domain.entities.job import Job, JobEntity
+from domain.entities.fetch_stats import QueryStats
 from domain.entities.leads import Leads
 from datetime import datetime
 
-T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
 
 
 class ActiveJobsDBAPI(FetchLeadsPort):
@@ -19,41 +26,53 @@ class ActiveJobsDBAPI(FetchLeadsPort):
     Adapter for the Active Jobs DB API to fetch job data.
     """
 
-    def __init__(self, config: ActiveJobsDBConfig) -> None:
+    def __init__(
+        self,
+        config: ActiveJobsDBConfig,
+        client: Optional[BaseApiClient] = None,
+        key_pool: Optional[RapidApiKeyPool] = None,
+        response_cache: Optional[ResponseCachePort] = None,
+        query_metrics: Optional[QueryMetrics] = None,
+    ) -> None:
         """
         Initialize ActiveJobsDBAPI with configuration.
 
         Args:
             config (ActiveJobsDBConfig): Active Jobs DB API configuration object.
+            client (Optional[BaseApiClient]): Shared HTTP client, a private one when omitted.
+            key_pool (Optional[RapidApiKeyPool]): Shared scheduler of the RapidAPI keys, a private one when omitted.
+            response_cache (Optional[ResponseCachePort]): Cache of the raw responses, disabled when omitted.
+            query_metrics (Optional[QueryMetrics]): Shared counters of the queries, private ones when omitted.
         """
         self.api_base = config.ACTIVE_JOBS_DB_URL
         self.api_keys = config.RAPIDAPI_API_KEY
+        self.client = client or BaseApiClient()
+        self.key_pool = key_pool or RapidApiKeyPool(self.api_keys, config.RAPIDAPI_KEY_COOLDOWN)
+        self.response_cache = response_cache
         self.endpoint = "/active-ats-7d"
+        self.page_size = config.ACTIVE_JOBS_DB_PAGE_SIZE
+        self.max_jobs = config.ACTIVE_JOBS_DB_MAX_JOBS
+        self.time_budget = config.ACTIVE_JOBS_DB_TIME_BUDGET
+        self.query_metrics = query_metrics or QueryMetrics()
 
     async def _check_error(
-        self, client: BaseApiClient, result: httpx.Response, dto_type: type[T]
-    ) -> T:
+        self, result: httpx.Response
+    ) -> Any:
         """
-        Check the HTTP response for errors and parse the response into the given DTO type.
-        Closes the client after processing.
+        Check the HTTP response for errors and return its JSON payload.
 
         Args:
-            client (BaseApiClient): The API client instance to close.
             result (httpx.Response): The HTTP response from the API call.
-            dto_type (type[T]): The DTO class to parse the response into.
 
         Raises:
             Exception: If the response status code is not 200.
 
         Returns:
-            T: An instance of the DTO type with the response data.
+            Any: The JSON payload of the response.
         """
         if result.status_code != 200:
-            await client.close()
             raise Exception(f"Failed to fetch jobs: {result.text}")
-        dto = dto_type(**{"active_jobs": result.json()})
-        await client.close()
-        return dto
+        return result.json()
     
     def _get_headers(self, api_key: str) -> dict[str, str]:
         """
@@ -71,14 +90,13 @@ class ActiveJobsDBAPI(FetchLeadsPort):
             "x-rapidapi-key": api_key,
         }
     
-    async def _make_request_with_retry(self, endpoint: str, params: dict, key_index: int = 0) -> ActiveJobsResponseDTO:
+    async def _make_request_with_retry(self, endpoint: str, params: dict) -> ActiveJobsResponseDTO:
         """
-        Make API request with recursive retry logic for different API keys on 429 errors.
+        Make API request through the response cache when configured.
 
         Args:
             endpoint (str): The API endpoint to call.
             params (dict): Request parameters.
-            key_index (int): Current key index to try.
 
         Returns:
             ActiveJobsResponseDTO: The parsed response data.
@@ -86,18 +104,43 @@ class ActiveJobsDBAPI(FetchLeadsPort):
         Raises:
             Exception: If all API keys are exhausted or other errors occur.
         """
-        if key_index >= len(self.api_keys):
-            raise Exception("All API keys exhausted due to rate limiting")
+        if self.response_cache is None:
+            payload = await self._request_payload(endpoint, params)
+        else:
+            payload = await self.response_cache.fetch(
+                "active_jobs_db", endpoint, params, lambda: self._request_payload(endpoint, params)
+            )
+        return ActiveJobsResponseDTO(**{"active_jobs": payload})
+
+    async def _request_payload(self, endpoint: str, params: dict) -> Any:
+        """
+        Make API request with the key of the pool having the most remaining quota,
+        retrying with another key on 429 errors.
 
-        headers = self._get_headers(self.api_keys[key_index])
-        client = BaseApiClient(self.api_base, headers)
-        result = await client.get(endpoint, params)
-        
-        if result.status_code == 429:
-            await client.close()
-            return await self._make_request_with_retry(endpoint, params, key_index + 1)
-        
-        return await self._check_error(client, result, ActiveJobsResponseDTO)
+        Args:
+            endpoint (str): The API endpoint to call.
+            params (dict): Request parameters.
+
+        Returns:
+            Any: The JSON payload of the response.
+
+        Raises:
+            Exception: If all API keys are exhausted or other errors occur.
+        """
+        for _ in range(len(self.key_pool.keys)):
+            api_key = self.key_pool.acquire()
+            result = None
+            try:
+                result = await self.client.get(
+                    f"{self.api_base.rstrip('/')}{endpoint}", params, self._get_headers(api_key)
+                )
+            finally:
+                self.key_pool.release(api_key, result)
+
+            if result.status_code != 429:
+                return await self._check_error(result)
+
+        raise Exception("All API keys exhausted due to rate limiting")
 
     async def to_company_entity(
         self, dto: ActiveJobsResponseDTO
@@ -167,27 +210,128 @@ class ActiveJobsDBAPI(FetchLeadsPort):
 
         return JobEntity(jobs=jobs) # type: ignore
 
-    async def fetch_leads(self, location: str, job_title: list[str]) -> Leads:
+    def _search_params(self, location: str, job_title: list[str], offset: int, limit: int) -> dict:
         """
-        Fetch jobs from the Active Jobs DB API based on search parameters.
+        Build the parameters of the query for one offset page.
 
         Args:
             location (str): The location to search jobs in.
             job_title (list[str]): List of job titles to search for.
+            offset (int): Index of the first job of the page.
+            limit (int): Number of jobs of the page.
 
         Returns:
-            Leads: The leads containing companies and jobs data.
+            dict: The request parameters.
         """
-        params = {
-            "limit": 10,
-            "offset": 0,
+        return {
+            "limit": limit,
+            "offset": offset,
             "advanced_title_filter": f"{' | '.join(job_title)}",
             "location_filter": location,
             "description_type": "text",
         }
-        active_jobs = await self._make_request_with_retry(self.endpoint, params)
 
+    async def _search_page(
+        self, location: str, job_title: list[str], offset: int, limit: int
+    ) -> tuple[Leads, QueryStats]:
+        """
+        Fetch one offset page and convert it into leads.
+
+        Args:
+            location (str): The location to search jobs in.
+            job_title (list[str]): List of job titles to search for.
+            offset (int): Index of the first job of the page.
+            limit (int): Number of jobs of the page.
+
+        Returns:
+            tuple[Leads, QueryStats]: The leads of the page and the query statistics.
+        """
+        params = self._search_params(location, job_title, offset, limit)
+        start = time.perf_counter()
+        active_jobs = await self._make_request_with_retry(self.endpoint, params)
         company_entity, ids = await self.to_company_entity(active_jobs)
         job_entity = await self.to_job_entity(active_jobs, ids)
+        stats = QueryStats(
+            provider="active_jobs_db",
+            query=params["advanced_title_filter"],
+            page=offset,
+            latency_ms=round((time.perf_counter() - start) * 1000, 2),
+            results=len(job_entity.jobs),
+        ) # type: ignore
+        return Leads(companies=company_entity, jobs=job_entity, contacts=None), stats # type: ignore
+
+    async def stream_leads(self, location: str, job_title: list[str]) -> AsyncIterator[Leads]:
+        """
+        Stream the offset pages of the search until max_jobs jobs were fetched, the time
+        budget is spent or a page comes back short. The next page is downloaded while the
+        caller processes the current one.
+
+        Args:
+            location (str): The location to search jobs in.
+            job_title (list[str]): List of job titles to search for.
+
+        Yields:
+            Leads: The companies and jobs of one page.
+        """
+        start = time.perf_counter()
+        fetched = 0
+        limit = min(self.page_size, self.max_jobs)
+        next_page: Optional[asyncio.Task] = asyncio.create_task(
+            self._search_page(location, job_title, 0, limit)
+        )
+        try:
+            while next_page is not None:
+                try:
+                    leads, stats = await next_page
+                except Exception as e:
+                    self.query_metrics.record(
+                        QueryStats(
+                            provider="active_jobs_db",
+                            query=self._search_params(location, job_title, fetched, limit)["advanced_title_filter"],
+                            page=fetched,
+                            latency_ms=0.0,
+                            error=str(e),
+                        ) # type: ignore
+                    )
+                    raise
+                next_page = None
+                self.query_metrics.record(stats)
+                fetched += stats.results
+                logger.info(
+                    f"Active Jobs DB offset {stats.page}: {stats.results} jobs in {stats.latency_ms:.0f}ms"
+                )
+                remaining = self.max_jobs - fetched
+                if (
+                    stats.results == limit
+                    and remaining > 0
+                    and time.perf_counter() - start < self.time_budget
+                ):
+                    limit = min(self.page_size, remaining)
+                    next_page = asyncio.create_task(
+                        self._search_page(location, job_title, fetched, limit)
+                    )
+                if stats.results:
+                    yield leads
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def fetch_leads(self, location: str, job_title: list[str]) -> Leads:
+        """
+        Fetch jobs from the Active Jobs DB API based on search parameters.
+
+        Args:
+            location (str): The location to search jobs in.
+            job_title (list[str]): List of job titles to search for.
+
+        Returns:
+            Leads: The leads containing companies and jobs data.
+        """
+        company_entity: CompanyEntity = CompanyEntity(companies=[]) # type: ignore
+        job_entity: JobEntity = JobEntity(jobs=[]) # type: ignore
+
+        async for leads in self.stream_leads(location, job_title):
+            company_entity.companies.extend(leads.companies.companies)
+            job_entity.jobs.extend(leads.jobs.jobs)
 
         return Leads(companies=company_entity, jobs=job_entity, contacts=None) # type: ignore
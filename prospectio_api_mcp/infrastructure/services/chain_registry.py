@@ -0,0 +1,152 @@
+from typing import Any, Optional, Type
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompt_values import PromptValue
+from langchain_core.prompts import BasePromptTemplate, ChatPromptTemplate, PromptTemplate
+from langchain_core.runnables import Runnable, RunnableLambda
+from pydantic import BaseModel
+from config import PromptConfig
+from domain.ports.metrics import MetricsPort
+from domain.services.prompt_registry import PromptRegistry
+from infrastructure.api.llm_generic_client import LLMGenericClient
+from infrastructure.api.llm_scheduler import BULK, CHARS_PER_TOKEN, LLMScheduler, model_key
+
+
+class ChainRegistry(MetricsPort):
+    """
+    Prompt templates and LLM chains built once and reused by every call.
+    A chain is kept per prompt, client, output schema and priority, and rebuilt only when
+    the version of its prompt changes. Its LLM step waits for a slot of the scheduler.
+    """
+
+    _shared: Optional["ChainRegistry"] = None
+
+    def __init__(self, prompts: PromptRegistry, scheduler: Optional[LLMScheduler] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            prompts (PromptRegistry): The preloaded prompts.
+            scheduler (Optional[LLMScheduler]): Admission of the LLM calls, the shared one by default.
+        """
+        self.prompts = prompts
+        self.scheduler = scheduler or LLMScheduler.shared()
+        self.templates: dict[tuple[str, bool], tuple[str, BasePromptTemplate]] = {}
+        # The client is kept in the value so its id is not reused while the entry lives
+        self.chains: dict[tuple, tuple[str, Any, Runnable]] = {}
+        self.builds = 0
+        self.hits = 0
+
+    @classmethod
+    def shared(cls) -> "ChainRegistry":
+        """
+        Get the registry shared by the whole process, built on first use.
+
+        Returns:
+            ChainRegistry: The shared registry.
+        """
+        if cls._shared is None:
+            config = PromptConfig()
+            cls._shared = cls(
+                PromptRegistry(
+                    hot_reload=config.PROMPT_HOT_RELOAD,
+                    reload_interval=config.PROMPT_RELOAD_INTERVAL,
+                )
+            )
+        return cls._shared
+
+    def version(self, *names: str) -> str:
+        """
+        Combine the versions of several prompts, e.g. to key cached results.
+
+        Args:
+            *names (str): Names of the prompts.
+
+        Returns:
+            str: Short SHA-256 of their versions.
+        """
+        return self.prompts.version(*names)
+
+    def template(self, name: str, chat: bool = True) -> BasePromptTemplate:
+        """
+        Get the template of a prompt.
+
+        Args:
+            name (str): Name of the prompt.
+            chat (bool): A chat template with a single user message, or a plain text template.
+
+        Returns:
+            BasePromptTemplate: The template of the current version of the prompt.
+        """
+        prompt = self.prompts.get(name)
+        cached = self.templates.get((name, chat))
+        if cached is not None and cached[0] == prompt.version:
+            return cached[1]
+        template = (
+            ChatPromptTemplate.from_messages([("user", prompt.text)])
+            if chat
+            else PromptTemplate.from_template(prompt.text)
+        )
+        self.templates[(name, chat)] = (prompt.version, template)
+        return template
+
+    def chain(
+        self,
+        name: str,
+        llm_client: LLMGenericClient,
+        schema: Optional[Type[BaseModel]] = None,
+        include_raw: bool = False,
+        chat: bool = True,
+        priority: int = BULK,
+    ) -> Runnable:
+        """
+        Get the chain running a prompt on a client.
+
+        Args:
+            name (str): Name of the prompt.
+            llm_client (LLMGenericClient): The LLM client.
+            schema (Optional[Type[BaseModel]]): Structured output of the chain, text when None.
+            include_raw (bool): Return the raw message along with the parsed output.
+            chat (bool): Use a chat template rather than a plain text one.
+            priority (int): Scheduling class of the calls, INTERACTIVE, ENRICHMENT or BULK.
+
+        Returns:
+            Runnable: The chain, built on first use or after its prompt changed.
+        """
+        template = self.template(name, chat)
+        version = self.prompts.get(name).version
+        key = (name, chat, id(llm_client), schema, include_raw, priority)
+        cached = self.chains.get(key)
+        if cached is not None and cached[0] == version:
+            self.hits += 1
+            return cached[2]
+        llm: Runnable = llm_client if schema is None else llm_client.with_structured_output(schema, include_raw=include_raw)
+        model = model_key(llm_client)
+
+        async def scheduled(prompt: PromptValue) -> Any:
+            return await self.scheduler.run(
+                model,
+                lambda: llm.ainvoke(prompt),
+                priority,
+                len(prompt.to_string()) // CHARS_PER_TOKEN,
+            )
+
+        chain = template | RunnableLambda(scheduled)
+        if schema is None:
+            chain = chain | StrOutputParser()
+        self.chains[key] = (version, llm_client, chain)
+        self.builds += 1
+        return chain
+
+    def get_metrics(self) -> dict[str, float]:
+        """
+        Report the chains built and reused.
+
+        Returns:
+            dict[str, float]: The registry metrics.
+        """
+        return {
+            "prompts": len(self.prompts.prompts),
+            "chains": len(self.chains),
+            "builds": self.builds,
+            "hits": self.hits,
+        }
@@ -1,25 +1,97 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Optional, Type
+from pydantic import BaseModel
 from config import LLMConfig
+from domain.entities.job import Job
 from domain.entities.profile import Profile
 from domain.ports.compatibility_score import CompatibilityScorePort
-from domain.services.prompt_loader import PromptLoader
+from domain.ports.metrics import MetricsPort
+from domain.ports.score_cache import ScoreCachePort
 from infrastructure.api.llm_client_factory import LLMClientFactory
-from langchain.prompts import PromptTemplate
-from domain.entities.compatibility_score import CompatibilityScore
+from infrastructure.services.chain_registry import ChainRegistry
+from domain.entities.compatibility_score import CompatibilityScore, CompatibilityScores
 
-class CompatibilityScoreLLM(CompatibilityScorePort):
 
-    def __init__(self):
-        model = LLMConfig().MODEL # type: ignore
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+
+
+class CompatibilityScoreLLM(CompatibilityScorePort, MetricsPort):
+
+    def __init__(self, cache: Optional[ScoreCachePort] = None, chains: Optional[ChainRegistry] = None):
+        """
+        Initialize the scorer.
+
+        Args:
+            cache (Optional[ScoreCachePort]): Cache of the computed scores, checked before calling the LLM.
+            chains (Optional[ChainRegistry]): Registry of the prepared chains, the shared one by default.
+        """
+        config = LLMConfig() # type: ignore
+        self.model = config.MODEL
+        self.cache = cache
+        self.chains = chains or ChainRegistry.shared()
         self.llm_client = LLMClientFactory(
-            model=model,
-            config=LLMConfig(), # type: ignore
+            model=self.model,
+            config=config,
         ).create_client()
+        self.job_token_budget = config.COMPATIBILITY_JOB_TOKEN_BUDGET
+        self.calls = {"single": 0, "batch": 0}
+        self.jobs = {"single": 0, "batch": 0}
+        self.tokens = {"single": 0, "batch": 0}
+        self.seconds = {"single": 0.0, "batch": 0.0}
+        self.fallbacks = 0
+
+    @property
+    def prompt_version(self) -> str:
+        """
+        Version of the scoring prompts, part of the cache keys.
+
+        Returns:
+            str: The combined version of the single and batch prompts.
+        """
+        return self.chains.version("compatibility_score", "compatibility_score_batch")
+
+    @staticmethod
+    def profile_hash(profile: Profile) -> str:
+        """
+        Hash the profile fields used by the scoring prompts.
+
+        Args:
+            profile (Profile): The profile entity.
+
+        Returns:
+            str: The SHA-256 hex digest of the job title, location, bio and work experience.
+        """
+        fields = profile.model_dump(mode="json", include={"job_title", "location", "bio", "work_experience"})
+        return hashlib.sha256(json.dumps(fields, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def score_key(self, profile_hash: str, job_description: str, job_location: str) -> str:
+        """
+        Build the cache key of a score.
+
+        Args:
+            profile_hash (str): Hash of the profile.
+            job_description (str): The job description.
+            job_location (str): The job location.
+
+        Returns:
+            str: The SHA-256 hex digest of the profile, job content, model and prompt version.
+        """
+        job_hash = hashlib.sha256(f"{job_description}\x00{job_location}".encode("utf-8")).hexdigest()
+        return hashlib.sha256(
+            f"{profile_hash}:{job_hash}:{self.model}:{self.prompt_version}".encode("utf-8")
+        ).hexdigest()
 
     async def get_compatibility_score(
         self, profile: Profile, job_description: str, job_location: str
     ) -> CompatibilityScore:
         """
-        Get compatibility score for a profile against a job description.
+        Get compatibility score for a profile against a job description, from the cache when possible.
 
         Args:
             profile (Profile): The profile entity.
@@ -28,20 +100,34 @@ class CompatibilityScoreLLM(CompatibilityScorePort):
         Returns:
             dict: The compatibility score and other relevant data.
         """
-        prompt = PromptLoader().load_prompt("compatibility_score")
-        template = PromptTemplate(
-            input_variables=[
-                "job_title",
-                "profile_location",
-                "bio",
-                "work_experience",
-                "job_location",
-                "job_description",
-            ],
-            template=prompt,
-        )
-        chain = template | self.llm_client.with_structured_output(CompatibilityScore)
-        result = await chain.ainvoke(
+        if self.cache is None:
+            return await self._score_job(profile, job_description, job_location)
+        key = self.score_key(self.profile_hash(profile), job_description, job_location)
+        cached = await self.cache.get_scores([key])
+        if key in cached:
+            return CompatibilityScore(score=cached[key])
+        result = await self._score_job(profile, job_description, job_location)
+        await self.cache.save_scores({key: result.score}, self.model, self.prompt_version)
+        return result
+
+    async def _score_job(
+        self, profile: Profile, job_description: str, job_location: str
+    ) -> CompatibilityScore:
+        """
+        Score a single job with one LLM call.
+
+        Args:
+            profile (Profile): The profile entity.
+            job_description (str): The job description to compare against.
+            job_location (str): The job location.
+
+        Returns:
+            CompatibilityScore: The compatibility score.
+        """
+        result = await self._invoke(
+            "single",
+            "compatibility_score",
+            CompatibilityScore,
             {
                 "job_title": profile.job_title,
                 "profile_location": profile.location,
@@ -49,6 +135,185 @@ class CompatibilityScoreLLM(CompatibilityScorePort):
                 "work_experience": profile.work_experience,
                 "job_location": job_location,
                 "job_description": job_description,
-            }
+            },
+            jobs=1,
         )
         return CompatibilityScore.model_validate(result)
+
+    async def get_compatibility_scores(
+        self, profile: Profile, jobs: list[Job]
+    ) -> dict[str, int]:
+        """
+        Score a batch of jobs, from the cache when possible. The other jobs are scored with a
+        single call sending the rubric and the profile once.
+
+        Args:
+            profile (Profile): The profile entity.
+            jobs (list[Job]): Jobs with a description to score.
+
+        Returns:
+            dict[str, int]: The compatibility score of each job, keyed by job ID.
+        """
+        if self.cache is None:
+            return await self._score_batch(profile, jobs)
+        profile_hash = self.profile_hash(profile)
+        keys = {
+            job.id or "": self.score_key(profile_hash, job.description or "", job.location or "")
+            for job in jobs
+        }
+        cached = await self.cache.get_scores(list(keys.values()))
+        scores = {job_id: cached[key] for job_id, key in keys.items() if key in cached}
+        computed = await self._score_batch(profile, [job for job in jobs if job.id not in scores])
+        await self.cache.save_scores(
+            {keys[job_id]: score for job_id, score in computed.items()},
+            self.model,
+            self.prompt_version,
+        )
+        return scores | computed
+
+    async def _score_batch(self, profile: Profile, jobs: list[Job]) -> dict[str, int]:
+        """
+        Score a batch of jobs with one LLM call. Jobs missing from the answer, or every job
+        when it cannot be parsed, are scored with one call each.
+
+        Args:
+            profile (Profile): The profile entity.
+            jobs (list[Job]): Jobs with a description to score.
+
+        Returns:
+            dict[str, int]: The compatibility score of each job, keyed by job ID.
+        """
+        batch = {f"job_{index}": job for index, job in enumerate(jobs, 1)}
+        scores: dict[str, int] = {}
+        if len(batch) > 1:
+            try:
+                result = await self._invoke(
+                    "batch",
+                    "compatibility_score_batch",
+                    CompatibilityScores,
+                    {
+                        "job_title": profile.job_title,
+                        "profile_location": profile.location,
+                        "bio": profile.bio,
+                        "work_experience": profile.work_experience,
+                        "jobs": self.format_jobs(batch),
+                    },
+                    jobs=len(batch),
+                )
+                scores = {
+                    score.job_id: score.score
+                    for score in CompatibilityScores.model_validate(result).scores
+                    if score.job_id in batch
+                }
+            except Exception as e:
+                logger.warning(f"Batch compatibility scoring failed, scoring jobs one by one: {e}")
+
+        missing = [key for key in batch if key not in scores]
+        if len(batch) > 1:
+            self.fallbacks += len(missing)
+        results = await asyncio.gather(
+            *(
+                self._score_job(
+                    profile=profile,
+                    job_description=batch[key].description or "",
+                    job_location=batch[key].location or "",
+                )
+                for key in missing
+            )
+        )
+        scores.update({key: result.score for key, result in zip(missing, results)})
+        return {job.id or "": scores[key] for key, job in batch.items()}
+
+    def format_jobs(self, batch: dict[str, Job]) -> str:
+        """
+        Render the jobs of a batch for the prompt, each description truncated to the token budget.
+
+        Args:
+            batch (dict[str, Job]): Jobs keyed by their ID in the batch.
+
+        Returns:
+            str: One JSON object per line.
+        """
+        return "\n".join(
+            json.dumps(
+                {
+                    "job_id": key,
+                    "location": job.location or "",
+                    "description": self.truncate(job.description or ""),
+                },
+                ensure_ascii=False,
+            )
+            for key, job in batch.items()
+        )
+
+    def truncate(self, text: str) -> str:
+        """
+        Cut a text to the token budget of a job, on a word boundary.
+
+        Args:
+            text (str): The text to cut.
+
+        Returns:
+            str: The text, truncated to about COMPATIBILITY_JOB_TOKEN_BUDGET tokens.
+        """
+        text = " ".join(text.split())
+        limit = self.job_token_budget * CHARS_PER_TOKEN
+        if len(text) <= limit:
+            return text
+        return text[:limit].rsplit(" ", 1)[0] + " ..."
+
+    async def _invoke(
+        self,
+        mode: str,
+        prompt: str,
+        schema: Type[BaseModel],
+        inputs: dict[str, Any],
+        jobs: int,
+    ) -> Any:
+        """
+        Run a structured output call and record its latency and token usage.
+
+        Args:
+            mode (str): single or batch, the metrics group of the call.
+            prompt (str): Name of the prompt.
+            schema (Type[BaseModel]): The expected output.
+            inputs (dict[str, Any]): The prompt variables.
+            jobs (int): Number of jobs scored by the call.
+
+        Raises:
+            Exception: When the call fails or its output cannot be parsed.
+
+        Returns:
+            Any: The parsed output.
+        """
+        chain = self.chains.chain(prompt, self.llm_client, schema, include_raw=True, chat=False)
+        start = time.perf_counter()
+        result = await chain.ainvoke(inputs)
+        self.seconds[mode] += time.perf_counter() - start
+        self.calls[mode] += 1
+        self.jobs[mode] += jobs
+        usage = getattr(result.get("raw"), "usage_metadata", None)
+        if usage:
+            self.tokens[mode] += usage.get("input_tokens", 0) + usage.get("output_tokens", 0)
+        else:
+            self.tokens[mode] += len(self.chains.template(prompt, chat=False).format(**inputs)) // CHARS_PER_TOKEN
+        if result.get("parsing_error") is not None or result.get("parsed") is None:
+            raise ValueError(f"Unparsable compatibility score: {result.get('parsing_error')}")
+        return result["parsed"]
+
+    def get_metrics(self) -> dict[str, float]:
+        """
+        Report the calls, tokens per job and jobs per second of the single and batch scoring.
+
+        Returns:
+            dict[str, float]: The scoring metrics.
+        """
+        metrics: dict[str, float] = {"fallbacks": self.fallbacks}
+        for mode in ("single", "batch"):
+            jobs = self.jobs[mode]
+            seconds = self.seconds[mode]
+            metrics[f"{mode}_calls"] = self.calls[mode]
+            metrics[f"{mode}_jobs"] = jobs
+            metrics[f"{mode}_tokens_per_job"] = round(self.tokens[mode] / jobs, 1) if jobs else 0.0
+            metrics[f"{mode}_jobs_per_second"] = round(jobs / seconds, 3) if seconds else 0.0
+        return metrics
@@ -0,0 +1,198 @@
+import contextlib
+import logging
+import time
+from typing import AsyncIterator, Optional
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from config import DatabaseConfig
+from domain.ports.metrics import MetricsPort
+
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMetrics:
+    """
+    Counters of the connection checkouts of a pool.
+    """
+
+    def __init__(self):
+        """
+        Initialize the counters at zero.
+        """
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        """
+        Record the time spent waiting for a connection.
+
+        Args:
+            seconds (float): Time spent in the pool checkout.
+            timed_out (bool): Whether the checkout gave up after the pool timeout.
+        """
+        if timed_out:
+            self.timeouts += 1
+        else:
+            self.checkouts += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+
+class _MeteredQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool timing how long each checkout waits for a connection.
+    """
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+    def recreate(self) -> "_MeteredQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics # type: ignore
+        return pool # type: ignore
+
+
+class DatabaseEngine(MetricsPort):
+    """
+    Registry of the async SQLAlchemy engine shared by every repository.
+    The engine is created when the application starts (or on first use when running
+    without the FastAPI lifespan, e.g. over stdio) and disposed on shutdown.
+    """
+
+    def __init__(self, config: DatabaseConfig):
+        """
+        Initialize the registry without connecting.
+
+        Args:
+            config (DatabaseConfig): Database URL and pool settings.
+        """
+        self.config = config
+        self.metrics = PoolMetrics()
+        self._engine: Optional[AsyncEngine] = None
+        self._session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """
+        The shared engine, created on first access.
+
+        Returns:
+            AsyncEngine: The shared engine.
+        """
+        if self._engine is None:
+            self.start()
+        return self._engine # type: ignore
+
+    def start(self) -> AsyncEngine:
+        """
+        Create the shared engine and its session factory.
+
+        Returns:
+            AsyncEngine: The shared engine.
+        """
+        if self._engine is not None:
+            return self._engine
+        connect_args: dict = {
+            "prepared_statement_cache_size": self.config.STATEMENT_CACHE_SIZE,
+            "statement_cache_size": self.config.STATEMENT_CACHE_SIZE,
+        }
+        if self.config.STATEMENT_TIMEOUT > 0:
+            connect_args["server_settings"] = {
+                "statement_timeout": str(self.config.STATEMENT_TIMEOUT)
+            }
+        self._engine = create_async_engine(
+            self.config.DATABASE_URL,
+            poolclass=_MeteredQueuePool,
+            pool_size=self.config.POOL_SIZE,
+            max_overflow=self.config.POOL_MAX_OVERFLOW,
+            pool_timeout=self.config.POOL_TIMEOUT,
+            pool_pre_ping=self.config.POOL_PRE_PING,
+            connect_args=connect_args,
+        )
+        self._engine.sync_engine.pool.metrics = self.metrics # type: ignore
+        self._session_factory = async_sessionmaker(self._engine)
+        logger.info(
+            f"Database engine started (pool_size={self.config.POOL_SIZE}, "
+            f"max_overflow={self.config.POOL_MAX_OVERFLOW})"
+        )
+        return self._engine
+
+    def session(self) -> AsyncSession:
+        """
+        Open a session bound to the shared engine.
+
+        Returns:
+            AsyncSession: A new session, to be used as an async context manager.
+        """
+        if self._session_factory is None:
+            self.start()
+        return self._session_factory() # type: ignore
+
+    async def dispose(self) -> None:
+        """
+        Close every pooled connection and drop the engine.
+        """
+        if self._engine is not None:
+            await self._engine.dispose()
+        self._engine = None
+        self._session_factory = None
+
+    @contextlib.asynccontextmanager
+    async def run(self) -> AsyncIterator["DatabaseEngine"]:
+        """
+        Start the engine for the lifetime of the context, typically the application lifespan.
+
+        Yields:
+            DatabaseEngine: The started registry.
+        """
+        self.start()
+        try:
+            yield self
+        finally:
+            await self.dispose()
+
+    def get_metrics(self) -> dict[str, float]:
+        """
+        Report the pool usage and the checkout wait times.
+
+        Returns:
+            dict[str, float]: The pool metrics.
+        """
+        metrics: dict[str, float] = {
+            "checkouts": self.metrics.checkouts,
+            "checkout_timeouts": self.metrics.timeouts,
+            "checkout_wait_seconds_total": round(self.metrics.wait_seconds_total, 6),
+            "checkout_wait_seconds_max": round(self.metrics.wait_seconds_max, 6),
+            "checkout_wait_seconds_avg": round(
+                self.metrics.wait_seconds_total / self.metrics.checkouts, 6
+            ) if self.metrics.checkouts else 0.0,
+        }
+        if self._engine is not None:
+            pool: AsyncAdaptedQueuePool = self._engine.sync_engine.pool # type: ignore
+            metrics.update(
+                {
+                    "pool_size": pool.size(),
+                    "connections_in_use": pool.checkedout(),
+                    "connections_idle": pool.checkedin(),
+                    "overflow": pool.overflow(),
+                }
+            )
+        return metrics
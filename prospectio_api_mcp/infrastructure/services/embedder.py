@@ -0,0 +1,60 @@
+import time
+from config import EmbeddingConfig, LLMConfig
+from domain.ports.embedder import EmbedderPort
+from infrastructure.api.llm_client_factory import LLMClientFactory
+
+
+class LLMEmbedder(EmbedderPort):
+    """
+    Embedder backed by a langchain embedding model, e.g. nomic-embed-text served by Ollama on CPU.
+    """
+
+    def __init__(self, config: EmbeddingConfig):
+        """
+        Initialize the embedder.
+
+        Args:
+            config (EmbeddingConfig): The embedding model and batch size.
+        """
+        self.model = config.EMBEDDING_MODEL
+        self.batch_size = max(config.EMBEDDING_BATCH_SIZE, 1)
+        self.embeddings = LLMClientFactory(
+            model=self.model,
+            config=LLMConfig(), # type: ignore
+        ).create_embeddings()
+        self.calls = 0
+        self.texts = 0
+        self.seconds = 0.0
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed several texts, EMBEDDING_BATCH_SIZE per call.
+
+        Args:
+            texts (list[str]): The texts to embed.
+
+        Returns:
+            list[list[float]]: One vector per text, in the same order.
+        """
+        vectors: list[list[float]] = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = texts[start:start + self.batch_size]
+            began = time.perf_counter()
+            vectors.extend(await self.embeddings.aembed_documents(batch))
+            self.seconds += time.perf_counter() - began
+            self.calls += 1
+            self.texts += len(batch)
+        return vectors
+
+    def get_metrics(self) -> dict[str, float]:
+        """
+        Report the calls and throughput of the embedding model.
+
+        Returns:
+            dict[str, float]: The embedding metrics.
+        """
+        return {
+            "calls": self.calls,
+            "texts": self.texts,
+            "texts_per_second": round(self.texts / self.seconds, 3) if self.seconds else 0.0,
+        }
@@ -1,4 +1,7 @@
+import sys
+import time
 from langgraph.graph import END, START, StateGraph
+from langgraph.graph.state import CompiledStateGraph
 from domain.entities.leads import Leads
 from domain.entities.profile import Profile
 from domain.ports.enrich_leads import EnrichLeadsPort
@@ -21,6 +24,7 @@ class EnrichLeadsAgent(EnrichLeadsPort):
         """
         self.EnrichLeadsNodes = EnrichLeadsNodes()
         self.task_manager = task_manager
+        self.graph: CompiledStateGraph = self.build_graph().compile()
 
     def build_graph(self) -> StateGraph:
         """
@@ -33,6 +37,7 @@ class EnrichLeadsAgent(EnrichLeadsPort):
 
         # Add nodes to the graph
         builder.add_node("first_step", self.EnrichLeadsNodes.first_step)
+        builder.add_node("prepare_contacts", self.EnrichLeadsNodes.prepare_contacts)
         builder.add_node(
             "create_enrich_companies_tasks",
             self.EnrichLeadsNodes.create_enrich_companies_tasks,
@@ -58,7 +63,8 @@ class EnrichLeadsAgent(EnrichLeadsPort):
         # Define the graph structure
         builder.add_edge(START, "first_step")
         builder.add_edge("first_step", "create_enrich_companies_tasks")
-        builder.add_edge("first_step", "create_enrich_contacts_tasks")
+        builder.add_edge("first_step", "prepare_contacts")
+        builder.add_edge("prepare_contacts", "create_enrich_contacts_tasks")
 
         builder.add_conditional_edges(
             "create_enrich_companies_tasks",
@@ -89,25 +95,42 @@ class EnrichLeadsAgent(EnrichLeadsPort):
 
         return builder
 
+    def draw(self) -> str:
+        """
+        Describe the graph of the agent, rendered locally without any network call.
+
+        Returns:
+            str: The graph as a Mermaid diagram.
+        """
+        return self.graph.get_graph().draw_mermaid()
+
     async def execute(self, leads: Leads, profile: Profile, task_uuid: str) -> Leads:
         """
-        Compile and return the agent's state graph.
+        Run the compiled graph of the agent on a chunk of leads.
+
+        Args:
+            leads (Leads): The leads to enrich.
+            profile (Profile): The profile of the user.
+            task_uuid (str): The task reporting the progress of the enrichment.
 
         Returns:
-            StateGraph: The compiled agent graph.
+            Leads: The enriched leads.
         """
-        agent = self.build_graph().compile()
-        with open("graph.png", "wb") as f:
-            f.write(agent.get_graph().draw_mermaid_png())
-        stream = agent.astream(input={"leads": leads, "profile": profile}, stream_mode="updates")
+        start = time.perf_counter()
+        startup: float | None = None
+        stream = self.graph.astream(input={"leads": leads, "profile": profile}, stream_mode="updates")
         async for chunk in stream:
+            if startup is None:
+                # Delay between the call and the first completed step of the graph
+                startup = time.perf_counter() - start
             for value in chunk.values():
                 step = value.get("step") if isinstance(value, dict) else None
                 if step is not None:
                     await self.task_manager.update_task(
                         task_uuid,
                         f"Enrichment step: {step}",
-                        "in_progress"
+                        "in_progress",
+                        enrichment_startup_seconds=startup,
                     )
                 aggregate = (
                     value.get("aggregate")
@@ -120,5 +143,17 @@ class EnrichLeadsAgent(EnrichLeadsPort):
                     if enriched_companies is not None:
                         leads.companies.companies = enriched_companies  # type: ignore
                     if enriched_contacts is not None:
-                        leads.contacts.contacts = enriched_contacts # type: ignore                       
+                        leads.contacts.contacts = enriched_contacts # type: ignore
         return leads
+
+
+if __name__ == "__main__":
+    # Draw the graph of the agent: python -m infrastructure.services.enrich_leads_agent.agent [graph.png]
+    from infrastructure.services.task_manager import InMemoryTaskManager
+
+    graph = EnrichLeadsAgent(InMemoryTaskManager()).graph.get_graph()
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "wb") as f:
+            f.write(graph.draw_mermaid_png())
+    else:
+        print(graph.draw_mermaid())
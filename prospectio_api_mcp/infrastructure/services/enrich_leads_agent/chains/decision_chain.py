@@ -1,24 +1,25 @@
-from langchain_core.prompts import ChatPromptTemplate
+from typing import Optional
 from domain.entities.company import Company
-from domain.services.prompt_loader import PromptLoader
 from infrastructure.api.llm_generic_client import LLMGenericClient
+from infrastructure.api.llm_scheduler import ENRICHMENT
+from infrastructure.services.chain_registry import ChainRegistry
 from infrastructure.services.enrich_leads_agent.models.make_decision import (
     MakeDecisionResult,
 )
-from typing import cast
 
 
 class DecisionChain:
 
-    def __init__(self, llm_client: LLMGenericClient):
+    def __init__(self, llm_client: LLMGenericClient, chains: Optional[ChainRegistry] = None):
         """
         Initialize the EnoughDataCompanyChain with an LLM client.
 
         Args:
             llm_client: The LLM client to use for processing the decision.
+            chains: Registry of the prepared chains, the shared one by default.
         """
         self.llm_client = llm_client
-        self.prompt_loader = PromptLoader()
+        self.chains = chains or ChainRegistry.shared()
 
     async def decide_enrichment(self, company: Company) -> MakeDecisionResult:
         """
@@ -30,16 +31,9 @@ class DecisionChain:
         Returns:
             MakeDecisionResult: The decision result from the LLM.
         """
-        prompt = self.prompt_loader.load_prompt("company_decision")
-        decision_prompt = ChatPromptTemplate.from_messages([
-            (
-                "user",
-                (
-                  prompt
-                ),
-            )
-        ])
-        chain = decision_prompt | self.llm_client.with_structured_output(MakeDecisionResult)
+        chain = self.chains.chain(
+            "company_decision", self.llm_client, MakeDecisionResult, priority=ENRICHMENT
+        )
         try:
             result = await chain.ainvoke({"company": company})
             return MakeDecisionResult.model_validate(result)
@@ -1,10 +1,13 @@
-from langchain_core.prompts import ChatPromptTemplate
+import asyncio
+import hashlib
+import json
+from typing import Optional
 from domain.entities.profile import Profile
-from domain.services.prompt_loader import PromptLoader
 from infrastructure.api.llm_generic_client import LLMGenericClient
-from langchain_core.output_parsers import StrOutputParser
+from infrastructure.api.llm_scheduler import ENRICHMENT
+from infrastructure.services.chain_registry import ChainRegistry
 from infrastructure.services.enrich_leads_agent.models.company_info import CompanyInfo
-from infrastructure.services.enrich_leads_agent.models.contact_info import ContactInfo
+from infrastructure.services.enrich_leads_agent.models.contact_info import ContactInfo, ContactInfos
 import logging
 import traceback
 from infrastructure.services.enrich_leads_agent.models.job_titles import JobTitles
@@ -18,17 +21,22 @@ class EnrichChain:
     A chain that enriches company data using web page content while preserving existing information.
     """
 
-    def __init__(self, llm_client: LLMGenericClient):
+    # Profiles whose prospect titles are kept, the oldest is forgotten first
+    JOB_TITLES_CACHE_SIZE = 64
+
+    def __init__(self, llm_client: LLMGenericClient, chains: Optional[ChainRegistry] = None):
         """
         Initialize the EnrichChain with an LLM client.
 
         Args:
             llm_client: The LLM client to use for enriching company data.
+            chains: Registry of the prepared chains, the shared one by default.
         """
 
         # Store llm_client for later use
         self.llm_client = llm_client
-        self.prompt_loader = PromptLoader()
+        self.chains = chains or ChainRegistry.shared()
+        self.job_titles: dict[str, list[str]] = {}
 
     async def get_company_description(self, company: str, web_content: list[str]) -> str:
         """
@@ -41,22 +49,12 @@ class EnrichChain:
         Returns:
             str: The generated company description.
         """
-        # Create the output parser for structured Company output
-        prompt = self.prompt_loader.load_prompt("company_description")
-        prompt_template = ChatPromptTemplate.from_messages([
-            (
-                "user",
-                (
-                    prompt
-                ),
-            )
-        ])
-        self.chain = prompt_template | self.llm_client | StrOutputParser()
+        chain = self.chains.chain("company_description", self.llm_client, priority=ENRICHMENT)
         try:
             web_content_str = ""
             if web_content:
                 web_content_str = "\n".join(web_content)
-            result = await self.chain.ainvoke({"company": company, "web_content": web_content_str})
+            result = await chain.ainvoke({"company": company, "web_content": web_content_str})
             return result.strip()
         except Exception as e:
             logger.error(f"Error in get_company_description: {e}\n{traceback.format_exc()}")
@@ -72,16 +70,7 @@ class EnrichChain:
         Returns:
             CompanyInfo: The extracted company info, or default values if extraction fails.
         """
-        prompt = self.prompt_loader.load_prompt("company_info")
-        prompt_template = ChatPromptTemplate.from_messages([
-            (
-                "user",
-                (
-                    prompt
-                ),
-            )
-        ])
-        chain = prompt_template | self.llm_client.with_structured_output(CompanyInfo)
+        chain = self.chains.chain("company_info", self.llm_client, CompanyInfo, priority=ENRICHMENT)
         try:
             result = await chain.ainvoke({"web_content": web_content})
             return CompanyInfo.model_validate(result)
@@ -100,16 +89,7 @@ class EnrichChain:
         Returns:
             list[dict]: A list of contacts found, each as a dictionary. Returns an empty list if no contacts are found or on error.
         """
-        prompt = self.prompt_loader.load_prompt("contact_info")
-        prompt_template = ChatPromptTemplate.from_messages([
-            (
-                "user",
-                (
-                    prompt
-                ),
-            )
-        ])
-        chain = prompt_template | self.llm_client.with_structured_output(ContactInfo)
+        chain = self.chains.chain("contact_info", self.llm_client, ContactInfo, priority=ENRICHMENT)
         try:
             result = await chain.ainvoke({"company": company, "title": web_search.title, "url": web_search.url, "snippet": web_search.snippet})
             return ContactInfo.model_validate(result)
@@ -117,9 +97,51 @@ class EnrichChain:
             logger.error(f"Error in extract_contact_from_web_content: {e}\n{traceback.format_exc()}")
             return None
 
+    async def extract_contacts_from_web_search(
+        self, company: str, web_search: list[SearchResultModel]
+    ) -> dict[str, ContactInfo | None]:
+        """
+        Extract the contacts of several search results with one LLM call, sending the
+        instructions once. Results missing from the answer, or every result when it cannot be
+        parsed, are extracted with one call each.
+
+        Args:
+            company (str): The name of the company to extract contacts for.
+            web_search (list[SearchResultModel]): The search results, one profile page each.
+
+        Returns:
+            dict[str, ContactInfo | None]: The contact of each result keyed by its URL, None on error.
+        """
+        contacts: dict[str, ContactInfo | None] = {}
+        urls = {result.url for result in web_search}
+        if len(web_search) > 1:
+            chain = self.chains.chain("contact_info_batch", self.llm_client, ContactInfos, priority=ENRICHMENT)
+            results = "\n".join(
+                json.dumps(result.model_dump(include={"url", "title", "snippet"}), ensure_ascii=False)
+                for result in web_search
+            )
+            try:
+                result = ContactInfos.model_validate(
+                    await chain.ainvoke({"company": company, "results": results})
+                )
+                contacts = {
+                    contact.url: ContactInfo.model_validate(contact.model_dump(exclude={"url"}))
+                    for contact in result.contacts
+                    if contact.url in urls
+                }
+            except Exception as e:
+                logger.warning(f"Batch contact extraction failed, extracting results one by one: {e}")
+        missing = [result for result in web_search if result.url not in contacts]
+        extracted = await asyncio.gather(
+            *(self.extract_contact_from_web_search(company, result) for result in missing)
+        )
+        contacts.update({result.url: contact for result, contact in zip(missing, extracted)})
+        return contacts
+
     async def extract_interesting_job_titles_from_profile(self, profile: Profile) -> list[str]:
         """
         Extract job titles of interesting prospects from the user profile using the LLM.
+        The titles are kept per profile and prompt version, so later runs reuse them.
 
         Args:
             profile (Profile): The user profile data.
@@ -127,19 +149,18 @@ class EnrichChain:
         Returns:
             list[str]: A list of job titles considered interesting prospects. Returns an empty list if none found or on error.
         """
-        prompt = self.prompt_loader.load_prompt("job_titles")
-        prompt_template = ChatPromptTemplate.from_messages([
-            (
-                "user",
-                (
-                    prompt
-                ),
-            )
-        ])
-        chain = prompt_template | self.llm_client.with_structured_output(JobTitles)
+        key = hashlib.sha256(
+            f"{self.chains.version('job_titles')}:{profile.model_dump_json()}".encode("utf-8")
+        ).hexdigest()
+        if key in self.job_titles:
+            return self.job_titles[key]
+        chain = self.chains.chain("job_titles", self.llm_client, JobTitles, priority=ENRICHMENT)
         try:
             result = await chain.ainvoke({"profile": profile})
             result = JobTitles.model_validate(result)  # Validate the structure
+            if len(self.job_titles) >= self.JOB_TITLES_CACHE_SIZE:
+                del self.job_titles[next(iter(self.job_titles))]
+            self.job_titles[key] = result.job_titles
             return result.job_titles
         except Exception as e:
             logger.error(f"Error in extract_interesting_job_titles_from_profile: {e}\n{traceback.format_exc()}")
@@ -8,4 +8,19 @@ class ContactInfo(BaseModel):
     email: list[str]
     title: str
     phone: str
-    profile_url: list[str]
\ No newline at end of file
+    profile_url: list[str]
+
+class SearchResultContactInfo(ContactInfo):
+    """
+    Contact extracted from one search result of a batch.
+    """
+    url: str = Field(..., description="URL of the search result the contact comes from")
+
+
+class ContactInfos(BaseModel):
+    """
+    Contacts extracted from a batch of search results.
+    """
+    contacts: list[SearchResultContactInfo] = Field(
+        ..., description="One contact per search result of the batch"
+    )
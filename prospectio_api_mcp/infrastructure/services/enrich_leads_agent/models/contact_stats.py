@@ -0,0 +1,18 @@
+from pydantic import BaseModel, Field
+
+
+class ContactEnrichmentStats(BaseModel):
+    """
+    Represents the cost and yield of the contact enrichment of one company.
+    Step times are summed over the concurrent tasks, so they may exceed the total.
+    """
+
+    company: str = Field(..., description="Name of the company")
+    searches: int = Field(0, description="Web searches sent, one per target job title")
+    results: int = Field(0, description="Profile pages found by the searches")
+    contacts: int = Field(0, description="Contacts extracted from the profile pages")
+    emails: int = Field(0, description="Email addresses checked")
+    search_seconds: float = Field(0.0, description="Time spent in web searches")
+    extract_seconds: float = Field(0.0, description="Time spent in contact extractions, queueing included")
+    validate_seconds: float = Field(0.0, description="Time spent validating email addresses")
+    total_seconds: float = Field(0.0, description="Wall time of the contact enrichment of the company")
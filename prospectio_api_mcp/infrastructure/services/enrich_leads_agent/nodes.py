@@ -1,12 +1,14 @@
 import asyncio
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from langgraph.types import Send
-from config import LLMConfig
+from config import EnrichConfig, LLMConfig
 from domain.entities.company import Company, CompanyEntity
 from domain.entities.contact import Contact, ContactEntity
-from domain.entities.job import JobEntity
+from domain.entities.job import Job
 from domain.entities.leads import Leads
-from domain.entities.profile import Profile
+from domain.ports.metrics import MetricsPort
 from infrastructure.api.llm_client_factory import LLMClientFactory
 from infrastructure.services.enrich_leads_agent.chains.decision_chain import (
     DecisionChain,
@@ -14,11 +16,15 @@ from infrastructure.services.enrich_leads_agent.chains.decision_chain import (
 from infrastructure.services.enrich_leads_agent.chains.enrich_chain import EnrichChain
 from infrastructure.services.enrich_leads_agent.models.contact_info import ContactInfo
 from infrastructure.services.enrich_leads_agent.models.company_info import CompanyInfo
+from infrastructure.services.enrich_leads_agent.models.contact_stats import ContactEnrichmentStats
 from infrastructure.services.enrich_leads_agent.models.make_decision import (
     MakeDecisionResult,
 )
 from infrastructure.services.enrich_leads_agent.state import OverallEnrichLeadsState
 from infrastructure.services.enrich_leads_agent.tools.crawl_client import CrawlClient
+from infrastructure.services.enrich_leads_agent.models.search_results_model import (
+    SearchResultModel,
+)
 from infrastructure.services.enrich_leads_agent.tools.duck_duck_go_client import (
     DuckDuckGoClient,
 )
@@ -31,9 +37,12 @@ from email_validator import validate_email, caching_resolver, EmailNotValidError
 logger = logging.getLogger(__name__)
 
 
-class EnrichLeadsNodes:
+class EnrichLeadsNodes(MetricsPort):
     """
     Nodes for the WebSearch agent.
+    The nodes keep no state of their own: the leads and profile of a run travel in the graph
+    state and in the payload of the tasks it sends, so one instance serves concurrent runs.
+    Only the contact enrichment statistics are accumulated across runs.
     """
 
     def __init__(self):
@@ -44,21 +53,26 @@ class EnrichLeadsNodes:
             agent_params (AgentParams): Parameters for agent configuration.
         """
         self.resolver = caching_resolver(timeout=10)
-        concurrent_calls = LLMConfig().CONCURRENT_CALLS # type: ignore
-        self.semaphore = asyncio.Semaphore(concurrent_calls)
-        decision_model = LLMConfig().DECISION_MODEL # type: ignore
+        config = LLMConfig() # type: ignore
         decision_llm_client = LLMClientFactory(
-            model=decision_model, config=LLMConfig() # type: ignore
+            model=config.DECISION_MODEL, config=config
         ).create_client()
         enrich_llm_client = LLMClientFactory(
-            model=LLMConfig().ENRICH_MODEL, config=LLMConfig() # type: ignore
+            model=config.ENRICH_MODEL, config=config
         ).create_client()
         self.decision_chain = DecisionChain(decision_llm_client)
         self.enrich_chain = EnrichChain(enrich_llm_client)
-        self.profile = Profile(
-            job_title=None, location=None, bio=None, work_experience=[]
-        ) # type: ignore
-        self.leads = Leads(companies=CompanyEntity(companies=[]), contacts=ContactEntity(contacts=[]), jobs=JobEntity(jobs=[])) # type: ignore
+        enrich_config = EnrichConfig()
+        # Shared by every run, to keep the search engine below its rate limit
+        self.search_slots = asyncio.Semaphore(max(enrich_config.ENRICH_SEARCH_CONCURRENCY, 1))
+        self.contact_batch_size = max(enrich_config.ENRICH_CONTACT_BATCH_SIZE, 1)
+        self.email_executor = ThreadPoolExecutor(
+            max_workers=max(enrich_config.ENRICH_EMAIL_WORKERS, 1),
+            thread_name_prefix="validate_email",
+        )
+        self.contact_stats = ContactEnrichmentStats(company="*")
+        self.companies = 0
+        self.company_seconds_max = 0.0
 
     async def first_step(
         self, state: OverallEnrichLeadsState
@@ -70,8 +84,6 @@ class EnrichLeadsNodes:
             EnrichLeadsState: Initial state with input data.
         """
         state["step"] = ["Analysis of the lead's data."]
-        self.profile = state["profile"]
-        self.leads = state["leads"]
         return state
 
     async def create_enrich_companies_tasks(
@@ -95,6 +107,26 @@ class EnrichLeadsNodes:
 
         return {"companies_tasks": companies_tasks}
 
+    async def prepare_contacts(self, state: OverallEnrichLeadsState) -> dict:
+        """
+        Compute once per run what the contact enrichment of every company needs: the titles
+        of the prospects to look for, and the jobs of each company.
+
+        Returns:
+            dict: Update of the state with the target job titles and the jobs by company id.
+        """
+        leads: Leads = state["leads"]
+        job_titles = await self.enrich_chain.extract_interesting_job_titles_from_profile(state["profile"])
+        jobs_by_company: dict[str, list[Job]] = {}
+        for job in leads.jobs.jobs if leads.jobs else []:
+            if job.company_id:
+                jobs_by_company.setdefault(job.company_id, []).append(job)
+        return {
+            "step": ["Prepared the prospect titles and jobs of each company."],
+            "job_titles": job_titles,
+            "jobs_by_company": jobs_by_company,
+        }
+
     async def create_enrich_contacts_tasks(
         self, state: OverallEnrichLeadsState
     ) -> dict:
@@ -110,7 +142,14 @@ class EnrichLeadsNodes:
             return {"contacts_tasks": []}
 
         contacts_tasks = [
-            Send("enrich_contacts", {"company": company})
+            Send(
+                "enrich_contacts",
+                {
+                    "company": company,
+                    "job_titles": state["job_titles"],
+                    "jobs": state["jobs_by_company"].get(company.id or "", []),
+                },
+            )
             for company in leads.companies.companies
         ]
 
@@ -118,56 +157,167 @@ class EnrichLeadsNodes:
 
     async def enrich_contacts(
         self, state: OverallEnrichLeadsState
-    ) -> OverallEnrichLeadsState:
+    ) -> dict:
         """
         Enrich the contacts data in the state.
+        The task brings the target job titles and the jobs of the company, computed once per
+        run by prepare_contacts. A company without jobs has no contact to link and is skipped.
+        The searches of the titles run concurrently within ENRICH_SEARCH_CONCURRENCY, the
+        profiles found are extracted by batches of ENRICH_CONTACT_BATCH_SIZE as soon as their
+        search returns, and the email addresses are validated in a thread pool.
+
+        Returns:
+            dict: Update of the state with the contacts found for the company.
         """
         company: Company = state["company"] # type: ignore
+        jobs: list[Job] = state["jobs"]
 
         state["step"] = [f"Enriched contact for company: {company.name}"]
 
-        job_titles = await self.enrich_chain.extract_interesting_job_titles_from_profile(self.profile)
-        search_results = []
-        contacts = []
-        
-        for job_title in job_titles:
-            search_results = await DuckDuckGoClient().search(
-                f"{company.name} {job_title} site:fr.linkedin.com", 10
+        if not jobs:
+            return {"step": state["step"], "enriched_contacts": []}
+
+        start = time.perf_counter()
+        stats = ContactEnrichmentStats(company=company.name or "")
+
+        async def contacts_for(job_title: str) -> list[Contact | None]:
+            async with self.search_slots:
+                searched = time.perf_counter()
+                search_results = await DuckDuckGoClient().search(
+                    f"{company.name} {job_title} site:fr.linkedin.com", 10
+                )
+                stats.search_seconds += time.perf_counter() - searched
+            profiles = [
+                result for result in search_results
+                if "/in" in result.url and urllib.parse.urlparse(result.url).path not in ("", "/")
+            ]
+            stats.searches += 1
+            stats.results += len(profiles)
+            batches = [
+                profiles[i:i + self.contact_batch_size]
+                for i in range(0, len(profiles), self.contact_batch_size)
+            ]
+            # The extractions of every search run together, bounded by the LLM scheduler
+            found = await asyncio.gather(*(self._contacts(company, jobs[-1], batch, stats) for batch in batches))
+            return [contact for contacts in found for contact in contacts]
+
+        found = await asyncio.gather(*(contacts_for(job_title) for job_title in state["job_titles"]))
+        contacts = [contact for contacts in found for contact in contacts if contact is not None]
+
+        stats.contacts = len(contacts)
+        stats.total_seconds = time.perf_counter() - start
+        self._record(stats)
+
+        return {"step": state["step"], "enriched_contacts": contacts}
+
+    async def _contacts(
+        self, company: Company, job: Job, results: list[SearchResultModel], stats: ContactEnrichmentStats
+    ) -> list[Contact | None]:
+        """
+        Extract the contacts of profile pages found by a search, with a single call for a
+        batch, and check their email addresses.
+
+        Args:
+            company (Company): The company of the contacts.
+            job (Job): The job the contacts are linked to.
+            results (list[SearchResultModel]): The search results of the profile pages.
+            stats (ContactEnrichmentStats): Statistics of the company, updated.
+
+        Returns:
+            list[Contact | None]: The contact of each result, None when its extraction failed.
+        """
+        extracted = time.perf_counter()
+        contact_infos = await self.enrich_chain.extract_contacts_from_web_search(company.name or '', results)
+        stats.extract_seconds += time.perf_counter() - extracted
+        return await asyncio.gather(
+            *(self._contact(company, job, contact_infos.get(result.url), stats) for result in results)
+        )
+
+    async def _contact(
+        self, company: Company, job: Job, contact_info: ContactInfo | None, stats: ContactEnrichmentStats
+    ) -> Contact | None:
+        """
+        Build a contact from its extracted information and check its email addresses.
+
+        Args:
+            company (Company): The company of the contact.
+            job (Job): The job the contact is linked to.
+            contact_info (ContactInfo | None): The extracted information, None when the extraction failed.
+            stats (ContactEnrichmentStats): Statistics of the company, updated.
+
+        Returns:
+            Contact | None: The contact, None when the extraction failed.
+        """
+        if contact_info is None:
+            return None
+        validated = time.perf_counter()
+        emails = await asyncio.gather(*(self._validate_email(mail) for mail in contact_info.email or []))
+        stats.validate_seconds += time.perf_counter() - validated
+        stats.emails += len(emails)
+        return Contact(
+            company_id=company.id,
+            job_id=job.id,
+            name=contact_info.name,
+            email=[email for email in emails if email is not None],
+            title=contact_info.title,
+            phone=contact_info.phone,
+            profile_url=", ".join(contact_info.profile_url)
+        ) # type: ignore
+
+    async def _validate_email(self, mail: str) -> str | None:
+        """
+        Check an email address and the mail server of its domain, in the thread pool since
+        the DNS lookups are blocking.
+
+        Args:
+            mail (str): The email address.
+
+        Returns:
+            str | None: The normalized address, None when it is not deliverable.
+        """
+        try:
+            emailinfo = await asyncio.get_running_loop().run_in_executor(
+                self.email_executor,
+                lambda: validate_email(mail, check_deliverability=True, dns_resolver=self.resolver),
             )
+            return emailinfo.email
+        except EmailNotValidError as e:
+            logger.warning(f"Invalid email {mail}: {e}")
+            return None
 
-            for result in search_results:
-                if "/in" in result.url and urllib.parse.urlparse(result.url).path not in ("", "/"):
-                    contact_info: ContactInfo = await self.enrich_chain.extract_contact_from_web_search(
-                        company.name or '', result
-                    ) # type: ignore
-                    valid_email = []
-                    for mail in contact_info.email if contact_info.email else []:
-                        try:
-                            emailinfo = validate_email(mail, 
-                                                        check_deliverability=True,
-                                                        dns_resolver=self.resolver)
-                            valid_email.append(emailinfo.email)
-                        except EmailNotValidError as e:
-                            logger.warning(f"Invalid email {mail}: {e}")
-                    for job in self.leads.jobs.jobs: # type: ignore
-                        if company.id == job.company_id:
-                            contact = Contact(
-                                company_id=company.id,
-                                job_id=job.id,
-                                name=contact_info.name,
-                                email=valid_email,
-                                title=contact_info.title,
-                                phone=contact_info.phone,
-                                profile_url=", ".join(contact_info.profile_url)
-                            ) # type: ignore
-                    contacts.append(contact)
-
-        state["enriched_contacts"] = contacts
+    def _record(self, stats: ContactEnrichmentStats) -> None:
+        """
+        Log the statistics of a company and add them to the totals.
+
+        Args:
+            stats (ContactEnrichmentStats): Statistics of the contact enrichment of a company.
+        """
+        logger.info(
+            f"Contacts of {stats.company}: {stats.contacts} from {stats.results} profiles "
+            f"of {stats.searches} searches in {stats.total_seconds:.2f}s "
+            f"(search {stats.search_seconds:.2f}s, extract {stats.extract_seconds:.2f}s, "
+            f"validate {stats.validate_seconds:.2f}s)"
+        )
+        self.companies += 1
+        self.company_seconds_max = max(self.company_seconds_max, stats.total_seconds)
+        for field in ContactEnrichmentStats.model_fields:
+            if field != "company":
+                setattr(self.contact_stats, field, getattr(self.contact_stats, field) + getattr(stats, field))
+
+    def get_metrics(self) -> dict[str, float]:
+        """
+        Report the contact enrichment totals over every company.
+
+        Returns:
+            dict[str, float]: The contact enrichment metrics.
+        """
+        totals = self.contact_stats.model_dump(exclude={"company"})
+        return {
+            "companies": self.companies,
+            **{name: round(value, 6) for name, value in totals.items()},
+            "total_seconds_max": round(self.company_seconds_max, 6),
+        }
 
-        state["company"] = []
-        
-        return state
-    
     async def make_company_decision(
         self, state: OverallEnrichLeadsState
     ) -> OverallEnrichLeadsState:
@@ -262,27 +412,26 @@ class EnrichLeadsNodes:
     
     async def aggregate(
         self, state: OverallEnrichLeadsState
-    ) -> OverallEnrichLeadsState:
+    ) -> dict:
         """
         Aggregate enriched contacts into the leads data.
+        It runs after each branch of the graph, so only the updated leads are returned: the
+        whole state would add the enriched lists to themselves again.
 
         Returns:
-            OverallEnrichLeadsState: State with aggregated contacts.
+            dict: Update of the state with the aggregated leads.
         """
-        state["step"] = ["Aggregated enriched data into leads."]
+        leads: Leads = state["leads"]
         if "enriched_contacts" in state:
             contacts = state["enriched_contacts"]
-            leads: Leads = self.leads # type: ignore
             if not leads.contacts:
                 leads.contacts = ContactEntity(contacts=[]) # type: ignore
             leads.contacts.contacts = contacts  # type: ignore
 
         if "enriched_company" in state:
             companies = state["enriched_company"]
-            if not companies:
+            if not leads.companies:
                 leads.companies = CompanyEntity(companies=[]) # type: ignore
-            leads: Leads = self.leads # type: ignore
             leads.companies.companies = companies  # type: ignore
 
-        state["leads"] = leads
-        return state
+        return {"step": ["Aggregated enriched data into leads."], "leads": leads}
@@ -3,6 +3,7 @@ from typing import TypedDict
 from domain.entities import company
 from domain.entities.leads import Leads
 from domain.entities.company import Company
+from domain.entities.job import Job
 from typing import Annotated
 import operator
 
@@ -21,3 +22,6 @@ class OverallEnrichLeadsState(TypedDict):
     companies_tasks: list[dict]
     enrich_companies_tasks: list[dict]
     contacts_tasks: list[dict]
+    job_titles: list[str]
+    jobs_by_company: dict[str, list[Job]]
+    jobs: list[Job]
@@ -1,20 +1,28 @@
+from typing import Optional
 from config import LLMConfig
 from domain.entities.contact import Contact
 from domain.entities.profile import Profile
 from domain.entities.prospect_message import ProspectMessage
 from domain.ports.generate_message import GenerateMessagePort
-from domain.services.prompt_loader import PromptLoader
 from infrastructure.api.llm_client_factory import LLMClientFactory
-from langchain.prompts import PromptTemplate
+from infrastructure.api.llm_scheduler import INTERACTIVE
+from infrastructure.services.chain_registry import ChainRegistry
 from infrastructure.dto.database.company import Company
 
 class GenerateMessageLLM(GenerateMessagePort):
 
-    def __init__(self):
-        model = LLMConfig().PROSPECTING_MODEL # type: ignore
+    def __init__(self, chains: Optional[ChainRegistry] = None):
+        """
+        Initialize the message generator.
+
+        Args:
+            chains (Optional[ChainRegistry]): Registry of the prepared chains, the shared one by default.
+        """
+        self.chains = chains or ChainRegistry.shared()
+        config = LLMConfig() # type: ignore
         self.llm_client = LLMClientFactory(
-            model=model,
-            config=LLMConfig(), # type: ignore
+            model=config.PROSPECTING_MODEL,
+            config=config,
         ).create_client()
 
     async def get_message(
@@ -31,16 +39,9 @@ class GenerateMessageLLM(GenerateMessagePort):
         Returns:
             str: The generated prospecting message.
         """
-        prompt = PromptLoader().load_prompt("prospecting_message")
-        template = PromptTemplate(
-            input_variables=[
-                "profile",
-                "contact",
-                "company"
-            ],
-            template=prompt,
+        chain = self.chains.chain(
+            "prospecting_message", self.llm_client, ProspectMessage, chat=False, priority=INTERACTIVE
         )
-        chain = template | self.llm_client.with_structured_output(ProspectMessage)
         result = await chain.ainvoke(
             {
                 "profile": profile,
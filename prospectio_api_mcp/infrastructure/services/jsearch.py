@@ -1,18 +1,25 @@
 from uuid import uuid4
 import httpx
-from typing import TypeVar
+from collections import deque
+from typing import Any, AsyncIterator, Optional
 from prospectio_api_mcp.domain.ports.fetch_leads import FetchLeadsPort
 from infrastructure.dto.rapidapi.jsearch import JSearchResponseDTO
 from config import JsearchConfig
 from infrastructure.api.client import BaseApiClient
+from infrastructure.api.rapidapi_key_pool import RapidApiKeyPool
+from infrastructure.services.query_metrics import QueryMetrics
+from domain.ports.response_cache import ResponseCachePort
 from domain.entities.company import Company, CompanyEntity
 from domain.entities.job import Job, JobEntity
+from domain.entities.fetch_stats import QueryStats
 from prospectio_api_mcp.domain.entities.leads import Leads
 from datetime import datetime
 import asyncio
+import logging
+import time
 
 
-T = TypeVar("T")
+logger = logging.getLogger(__name__)
 
 
 class JsearchAPI(FetchLeadsPort):
@@ -20,16 +27,37 @@ class JsearchAPI(FetchLeadsPort):
     Adapter for the JSearch API to fetch job data.
     """
 
-    def __init__(self, config: JsearchConfig) -> None:
+    PAGE_SIZE = 10
+
+    def __init__(
+        self,
+        config: JsearchConfig,
+        client: Optional[BaseApiClient] = None,
+        key_pool: Optional[RapidApiKeyPool] = None,
+        response_cache: Optional[ResponseCachePort] = None,
+        query_metrics: Optional[QueryMetrics] = None,
+    ) -> None:
         """
         Initialize JSearchAPI with configuration.
 
         Args:
             config (JSearchConfig): JSearch API configuration object.
+            client (Optional[BaseApiClient]): Shared HTTP client, a private one when omitted.
+            key_pool (Optional[RapidApiKeyPool]): Shared scheduler of the RapidAPI keys, a private one when omitted.
+            response_cache (Optional[ResponseCachePort]): Cache of the raw responses, disabled when omitted.
+            query_metrics (Optional[QueryMetrics]): Shared counters of the queries, private ones when omitted.
         """
         self.api_base = config.JSEARCH_API_URL
         self.api_keys = config.RAPIDAPI_API_KEY
+        self.client = client or BaseApiClient()
+        self.key_pool = key_pool or RapidApiKeyPool(self.api_keys, config.RAPIDAPI_KEY_COOLDOWN)
+        self.response_cache = response_cache
         self.search_endpoint = "/search"
+        self.max_pages = config.JSEARCH_MAX_PAGES
+        self.max_queries = config.JSEARCH_MAX_QUERIES
+        self.concurrency = config.JSEARCH_CONCURRENCY
+        self.key_max_wait = config.RAPIDAPI_KEY_MAX_WAIT
+        self.query_metrics = query_metrics or QueryMetrics()
 
     def _get_headers(self, api_key: str) -> dict[str, str]:
         """
@@ -47,14 +75,13 @@ class JsearchAPI(FetchLeadsPort):
             "x-rapidapi-key": api_key,
         }
     
-    async def _make_request_with_retry(self, endpoint: str, params: dict, key_index: int = 0) -> JSearchResponseDTO:
+    async def _make_request_with_retry(self, endpoint: str, params: dict) -> JSearchResponseDTO:
         """
-        Make API request with recursive retry logic for different API keys on 429 errors.
+        Make API request through the response cache when configured.
 
         Args:
             endpoint (str): The API endpoint to call.
             params (dict): Request parameters.
-            key_index (int): Current key index to try.
 
         Returns:
             JSearchResponseDTO: The parsed response data.
@@ -62,43 +89,62 @@ class JsearchAPI(FetchLeadsPort):
         Raises:
             Exception: If all API keys are exhausted or other errors occur.
         """
-        if key_index >= len(self.api_keys):
-            raise Exception("All API keys exhausted due to rate limiting")
+        if self.response_cache is None:
+            payload = await self._request_payload(endpoint, params)
+        else:
+            payload = await self.response_cache.fetch(
+                "jsearch", endpoint, params, lambda: self._request_payload(endpoint, params)
+            )
+        return JSearchResponseDTO(**payload)
+
+    async def _request_payload(self, endpoint: str, params: dict) -> Any:
+        """
+        Make API request with the key of the pool having the most remaining quota,
+        retrying with another key on 429 errors.
+
+        Args:
+            endpoint (str): The API endpoint to call.
+            params (dict): Request parameters.
 
-        headers = self._get_headers(self.api_keys[key_index])
-        client = BaseApiClient(self.api_base, headers)
-        result = await client.get(endpoint, params)
-        
-        if result.status_code == 429:
-            await client.close()
-            return await self._make_request_with_retry(endpoint, params, key_index + 1)
-        
-        return await self._check_error(client, result, JSearchResponseDTO)
+        Returns:
+            Any: The JSON payload of the response.
+
+        Raises:
+            Exception: If all API keys are exhausted or other errors occur.
+        """
+        for _ in range(len(self.key_pool.keys)):
+            api_key = self.key_pool.acquire()
+            result = None
+            try:
+                result = await self.client.get(
+                    f"{self.api_base.rstrip('/')}{endpoint}", params, self._get_headers(api_key)
+                )
+            finally:
+                self.key_pool.release(api_key, result)
+
+            if result.status_code != 429:
+                return await self._check_error(result)
+
+        raise Exception("All API keys exhausted due to rate limiting")
 
     async def _check_error(
-        self, client: BaseApiClient, result: httpx.Response, dto_type: type[T]
-    ) -> T:
+        self, result: httpx.Response
+    ) -> Any:
         """
-        Check the HTTP response for errors and parse the response into the given DTO type.
-        Closes the client after processing.
+        Check the HTTP response for errors and return its JSON payload.
 
         Args:
-            client (BaseApiClient): The API client instance to close.
             result (httpx.Response): The HTTP response from the API call.
-            dto_type (type[T]): The DTO class to parse the response into.
 
         Raises:
             Exception: If the response status code is not 200.
 
         Returns:
-            T: An instance of the DTO type with the response data.
+            Any: The JSON payload of the response.
         """
         if result.status_code != 200:
-            await client.close()
             raise Exception(f"Failed to fetch leads: {result.text}")
-        dto = dto_type(**result.json())
-        await client.close()
-        return dto
+        return result.json()
 
     async def to_company_entity(
         self, dto: JSearchResponseDTO
@@ -153,15 +199,134 @@ class JsearchAPI(FetchLeadsPort):
             jobs.append(job_entity)
         return JobEntity(jobs=jobs) # type: ignore
 
-    async def process_results(
-        self, company_result: CompanyEntity, job_result: JobEntity, params: dict
-    ) -> None:
-        await asyncio.sleep(1)  # Rate limiting to avoid hitting API limits
+    def _search_params(self, location: str, title: str, page: int) -> dict:
+        """
+        Build the parameters of the query for one page of a job title.
+
+        Args:
+            location (str): The location to search jobs in.
+            title (str): The job title.
+            page (int): The page number, starting at 1.
+
+        Returns:
+            dict: The request parameters.
+        """
+        return {
+            "query": f"{title} in {location}",
+            "page": page,
+            "num_pages": 1,
+            "date_posted": "month",
+            "country": location[0:2].lower(),
+        }
+
+    async def _search_page(self, location: str, title: str, page: int) -> tuple[Leads, QueryStats]:
+        """
+        Fetch one page of a job title and convert it into leads.
+
+        Args:
+            location (str): The location to search jobs in.
+            title (str): The job title.
+            page (int): The page number, starting at 1.
+
+        Returns:
+            tuple[Leads, QueryStats]: The leads of the page and the query statistics.
+        """
+        params = self._search_params(location, title, page)
+        start = time.perf_counter()
         jsearch = await self._make_request_with_retry(self.search_endpoint, params)
         company_entity, ids = await self.to_company_entity(jsearch)
         job_entity = await self.to_job_entity(jsearch, ids)
-        company_result.companies.extend(company_entity.companies)
-        job_result.jobs.extend(job_entity.jobs)
+        stats = QueryStats(
+            provider="jsearch",
+            query=params["query"],
+            page=page,
+            latency_ms=round((time.perf_counter() - start) * 1000, 2),
+            results=len(job_entity.jobs),
+        ) # type: ignore
+        return Leads(companies=company_entity, jobs=job_entity, contacts=None), stats # type: ignore
+
+    async def stream_leads(self, location: str, job_title: list[str]) -> AsyncIterator[Leads]:
+        """
+        Stream the pages of every job title as they complete.
+        The first page of every title is planned first, then the next page of the titles whose
+        last page was full, within max_pages per title and max_queries overall. At most
+        concurrency queries run at once, and no query is started while every key cools down:
+        the fetch waits for the first key to come back, unless that takes more than
+        key_max_wait seconds, in which case the remaining queries are skipped.
+
+        Args:
+            location (str): The location to search jobs in.
+            job_title (list[str]): List of job titles to search for.
+
+        Yields:
+            Leads: The companies and jobs of one page.
+
+        Raises:
+            Exception: If no query succeeded, e.g. every key was cooling down.
+        """
+        titles = list(dict.fromkeys(title.strip() for title in job_title if title and title.strip()))
+        planned: deque[tuple[str, int]] = deque((title, 1) for title in titles)
+        running: dict[asyncio.Task, tuple[str, int]] = {}
+        queries = 0
+        succeeded = 0
+        errors: list[Exception] = []
+        try:
+            while planned or running:
+                while (
+                    planned
+                    and len(running) < self.concurrency
+                    and queries < self.max_queries
+                    and self.key_pool.available()
+                ):
+                    title, page = planned.popleft()
+                    running[asyncio.create_task(self._search_page(location, title, page))] = (title, page)
+                    queries += 1
+                if not running and planned and queries < self.max_queries:
+                    wait = self.key_pool.next_available_in()
+                    if wait <= self.key_max_wait:
+                        logger.warning(f"Every RapidAPI key is cooling down, waiting {wait:.1f}s for JSearch")
+                        await asyncio.sleep(wait)
+                        continue
+                    error = Exception(
+                        f"Every RapidAPI key is cooling down for {wait:.0f}s, "
+                        f"{len(planned)} JSearch queries skipped"
+                    )
+                    logger.warning(str(error))
+                    errors.append(error)
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    title, page = running.pop(task)
+                    try:
+                        leads, stats = task.result()
+                    except Exception as e:
+                        errors.append(e)
+                        self.query_metrics.record(
+                            QueryStats(
+                                provider="jsearch",
+                                query=self._search_params(location, title, page)["query"],
+                                page=page,
+                                latency_ms=0.0,
+                                error=str(e),
+                            ) # type: ignore
+                        )
+                        logger.warning(f"JSearch query {title!r} page {page} failed: {e}")
+                        continue
+                    succeeded += 1
+                    self.query_metrics.record(stats)
+                    logger.info(
+                        f"JSearch query {stats.query!r} page {page}: "
+                        f"{stats.results} jobs in {stats.latency_ms:.0f}ms"
+                    )
+                    if stats.results >= self.PAGE_SIZE and page < self.max_pages:
+                        planned.append((title, page + 1))
+                    yield leads
+        finally:
+            for task in running:
+                task.cancel()
+        if errors and not succeeded:
+            raise errors[0]
 
     async def fetch_leads(self, location: str, job_title: list[str]) -> Leads:
         """
@@ -174,26 +339,12 @@ class JsearchAPI(FetchLeadsPort):
         Returns:
             Leads: The leads containing companies and jobs data.
         """
-        params_list = []
         company_result: CompanyEntity = CompanyEntity(companies=[]) # type: ignore
         job_result: JobEntity = JobEntity(jobs=[]) # type: ignore
 
-        for title in job_title[:2]:
-            params = {
-                "query": f"{title} in {location}",
-                "page": 1,
-                "num_pages": 1,
-                "date_posted": "month",
-                "country": location[0:2].lower(),
-            }
-            params_list.append(params)
-
-        await asyncio.gather(
-            *[
-                self.process_results(company_result, job_result, params)
-                for params in params_list
-            ]
-        )
+        async for leads in self.stream_leads(location, job_title):
+            company_result.companies.extend(leads.companies.companies)
+            job_result.jobs.extend(leads.jobs.jobs)
 
         # Combine results into a Leads object
         leads = Leads(
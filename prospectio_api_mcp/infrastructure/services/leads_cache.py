@@ -0,0 +1,224 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+from config import CacheConfig
+from domain.ports.leads_cache import LeadsCachePort
+
+
+class InMemoryLeadsCache(LeadsCachePort):
+    """
+    In-process TTL and LRU cache of serialized leads pages.
+    """
+
+    def __init__(self, ttl: float = 30.0, max_entries: int = 512):
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl (float): Lifetime of an entry in seconds.
+            max_entries (int): Number of entries kept before evicting the least recently used.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._generation = 0
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def generation(self) -> int:
+        """
+        Return the current cache generation.
+
+        Returns:
+            int: The generation to read and write entries with.
+        """
+        return self._generation
+
+    async def get(self, generation: int, key: str) -> Optional[str]:
+        """
+        Retrieve a cached entry, refreshing its LRU position.
+
+        Args:
+            generation (int): The generation returned by generation().
+            key (str): The entry key.
+
+        Returns:
+            Optional[str]: The serialized entry, or None on a miss.
+        """
+        entry = self._entries.get(key) if generation == self._generation else None
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    async def set(self, generation: int, key: str, value: str) -> None:
+        """
+        Store an entry unless a write happened while it was computed.
+
+        Args:
+            generation (int): The generation returned by generation() before computing the value.
+            key (str): The entry key.
+            value (str): The serialized entry.
+        """
+        if generation != self._generation:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self) -> int:
+        """
+        Bump the generation and drop every entry.
+
+        Returns:
+            int: The new generation.
+        """
+        self._generation += 1
+        self._entries.clear()
+        self.invalidations += 1
+        return self._generation
+
+    def get_metrics(self) -> dict[str, float]:
+        """
+        Report the cache hits, misses and size.
+
+        Returns:
+            dict[str, float]: The cache metrics.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._entries),
+            "generation": self._generation,
+            "invalidations": self.invalidations,
+        }
+
+
+class RedisLeadsCache(LeadsCachePort):
+    """
+    Leads cache stored in a Redis-compatible server, shared by every worker.
+    The generation is a Redis counter and entries expire through the server TTL.
+    """
+
+    def __init__(self, url: str, ttl: float = 30.0, prefix: str = "prospectio:leads"):
+        """
+        Initialize the Redis client.
+
+        Args:
+            url (str): Redis connection URL (e.g. redis://localhost:6379/0).
+            ttl (float): Lifetime of an entry in seconds.
+            prefix (str): Prefix of every key written by the cache.
+
+        Raises:
+            ImportError: If the redis package is not installed.
+        """
+        try:
+            from redis import asyncio as redis
+        except ImportError as e:
+            raise ImportError(
+                "The redis package is required for LEADS_CACHE_BACKEND=redis (pip install redis)"
+            ) from e
+        self.client = redis.from_url(url, decode_responses=True)
+        self.ttl = ttl
+        self.prefix = prefix
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def generation(self) -> int:
+        """
+        Return the current cache generation.
+
+        Returns:
+            int: The generation to read and write entries with.
+        """
+        generation = await self.client.get(f"{self.prefix}:generation")
+        return int(generation) if generation else 0
+
+    async def get(self, generation: int, key: str) -> Optional[str]:
+        """
+        Retrieve a cached entry.
+
+        Args:
+            generation (int): The generation returned by generation().
+            key (str): The entry key.
+
+        Returns:
+            Optional[str]: The serialized entry, or None on a miss.
+        """
+        value = await self.client.get(f"{self.prefix}:{generation}:{key}")
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    async def set(self, generation: int, key: str, value: str) -> None:
+        """
+        Store an entry under the generation it was computed with.
+
+        Args:
+            generation (int): The generation returned by generation() before computing the value.
+            key (str): The entry key.
+            value (str): The serialized entry.
+        """
+        await self.client.set(
+            f"{self.prefix}:{generation}:{key}", value, px=int(self.ttl * 1000)
+        )
+
+    async def invalidate(self) -> int:
+        """
+        Increment the shared generation counter.
+
+        Returns:
+            int: The new generation.
+        """
+        self.invalidations += 1
+        return int(await self.client.incr(f"{self.prefix}:generation"))
+
+    def get_metrics(self) -> dict[str, float]:
+        """
+        Report the hits and misses seen by this worker.
+
+        Returns:
+            dict[str, float]: The cache metrics.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+def create_leads_cache(config: CacheConfig) -> Optional[LeadsCachePort]:
+    """
+    Build the leads cache selected by the configuration.
+
+    Args:
+        config (CacheConfig): The cache configuration.
+
+    Raises:
+        ValueError: If the backend is unknown or Redis is selected without REDIS_URL.
+
+    Returns:
+        Optional[LeadsCachePort]: The cache, or None when caching is disabled.
+    """
+    if config.LEADS_CACHE_BACKEND == "none":
+        return None
+    if config.LEADS_CACHE_BACKEND == "memory":
+        return InMemoryLeadsCache(config.LEADS_CACHE_TTL, config.LEADS_CACHE_MAX_ENTRIES)
+    if config.LEADS_CACHE_BACKEND == "redis":
+        if not config.REDIS_URL:
+            raise ValueError("REDIS_URL is required for LEADS_CACHE_BACKEND=redis")
+        return RedisLeadsCache(config.REDIS_URL, config.LEADS_CACHE_TTL)
+    raise ValueError(f"Unsupported leads cache backend: {config.LEADS_CACHE_BACKEND}")
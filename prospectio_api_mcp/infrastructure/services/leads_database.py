@@ -1,7 +1,12 @@
-from typing import List, Optional
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy import or_, select
+from typing import Callable, List, Optional, Sequence
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy import (
+    JSON, ColumnElement, FromClause, Integer, Select, bindparam, func, literal, literal_column, or_, select, text, true, tuple_,
+    update,
+)
+from sqlalchemy.orm import InstrumentedAttribute
 from domain.entities import job
+from domain.ports.leads_cache import LeadsCachePort
 from domain.ports.leads_repository import LeadsRepositoryPort
 from domain.entities.leads import Leads
 from infrastructure.dto.database.company import Company as CompanyDB
@@ -10,8 +15,101 @@ from infrastructure.dto.database.contact import Contact as ContactDB
 from domain.entities.company import Company, CompanyEntity
 from domain.entities.job import Job, JobEntity
 from domain.entities.contact import Contact, ContactEntity
+from domain.entities.search import SearchFilters
+from domain.entities.upsert_result import UpsertResult
+from infrastructure.services.database_engine import DatabaseEngine
+from infrastructure.services.pagination import Paginator
 from datetime import datetime
-from math import ceil
+from uuid import uuid4
+import json
+import logging
+import time
+
+
+logger = logging.getLogger(__name__)
+
+# Column types of the upsert input rows, in the order of the records built below.
+_COMPANY_COLUMNS = {
+    "id": "UUID", "name": "TEXT", "industry": "TEXT", "compatibility": "TEXT",
+    "source": "TEXT", "location": "TEXT", "size": "TEXT", "revenue": "TEXT",
+    "website": "TEXT", "description": "TEXT", "opportunities": "TEXT[]",
+}
+_JOB_COLUMNS = {
+    "id": "UUID", "company_id": "UUID", "date_creation": "TIMESTAMPTZ", "description": "TEXT",
+    "job_title": "TEXT", "location": "TEXT", "salary": "TEXT", "job_seniority": "TEXT",
+    "job_type": "TEXT", "sectors": "TEXT", "apply_url": "TEXT[]", "compatibility_score": "INTEGER",
+}
+_CONTACT_COLUMNS = {
+    "id": "UUID", "company_id": "UUID", "job_id": "UUID", "name": "TEXT",
+    "email": "TEXT[]", "title": "TEXT", "phone": "TEXT", "profile_url": "TEXT",
+}
+
+# Normalized keys backing the unique indexes of database/init.sql.
+_COMPANY_KEY = "lower(trim({alias}.name))"
+_JOB_KEY = (
+    "job_dedup_key({alias}.job_title, {alias}.location, {alias}.company_id, "
+    "{alias}.job_type, {alias}.description)"
+)
+# The job key is stored in a generated column, the unique index is on that column.
+_JOB_STORED_KEY = "{alias}.dedup_key"
+_CONTACT_KEY = "contact_dedup_key({alias}.company_id, {alias}.name, {alias}.title)"
+
+# Sort key of the jobs listing, matches the idx_jobs_score_id expression index.
+_JOB_SCORE_KEY = func.coalesce(JobDB.compatibility_score, literal_column("-1"))
+
+
+def _contains(column: InstrumentedAttribute, terms: Sequence[Optional[str]]) -> Optional[ColumnElement[bool]]:
+    """
+    Match the rows whose column contains any of the terms, case-insensitively.
+    The ILIKE patterns are served by the pg_trgm GIN indexes of database/init.sql.
+
+    Args:
+        column (InstrumentedAttribute): The text column to search.
+        terms (Sequence[Optional[str]]): The searched terms, LIKE wildcards are matched literally.
+            Empty terms are ignored.
+
+    Returns:
+        Optional[ColumnElement[bool]]: The search condition, None when there is no term.
+    """
+    escaped = [
+        term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        for term in terms if term
+    ]
+    if not escaped:
+        return None
+    return or_(*[column.ilike(f"%{term}%", escape="\\") for term in escaped])
+
+
+def _where(statement: Select, *conditions: Optional[ColumnElement[bool]]) -> Select:
+    """
+    Filter a statement on the conditions that are set.
+
+    Args:
+        statement (Select): The statement to filter.
+        *conditions (Optional[ColumnElement[bool]]): The conditions, None for an unset filter.
+
+    Returns:
+        Select: The filtered statement, unchanged when no condition is set.
+    """
+    conditions = tuple(condition for condition in conditions if condition is not None)
+    return statement.where(*conditions) if conditions else statement
+
+
+def _json_object(table: FromClause, columns: dict[str, str]) -> ColumnElement:
+    """
+    Build a JSON object of the given columns of a table.
+
+    Args:
+        table (FromClause): The table or its alias.
+        columns (dict[str, str]): The columns to include, by name.
+
+    Returns:
+        ColumnElement: The json_build_object expression.
+    """
+    return func.json_build_object(
+        *[element for name in columns for element in (literal_column(f"'{name}'"), table.c[name])],
+        type_=JSON,
+    )
 
 
 class LeadsDatabase(LeadsRepositoryPort):
@@ -20,83 +118,452 @@ class LeadsDatabase(LeadsRepositoryPort):
     Handles inserting leads data into the database using async operations.
     """
 
-    def __init__(self, database_url: str):
+    def __init__(
+        self,
+        database: DatabaseEngine,
+        paginator: Optional[Paginator] = None,
+        bulk_insert: bool = False,
+        cache: Optional[LeadsCachePort] = None,
+    ):
         """
         Initialize the leads database repository.
 
         Args:
-            database_url (str): Async database connection URL (should start with postgresql+asyncpg://).
+            database (DatabaseEngine): Registry of the engine shared with the other repositories.
+            paginator (Optional[Paginator]): Pagination engine, exact counts by default.
+            bulk_insert (bool): Stream upsert input rows with COPY instead of a JSON parameter,
+                when the driver supports it.
+            cache (Optional[LeadsCachePort]): Cache of the read pages, invalidated by every write.
         """
-        self.database_url = database_url
-        self.engine = create_async_engine(database_url)
+        self.database = database
+        self.paginator = paginator or Paginator()
+        self.bulk_insert = bulk_insert
+        self.cache = cache
+        self._leads_statements: dict[tuple[bool, bool], Select] = {}
 
-    async def save_leads(self, leads: Leads) -> None:
+    async def save_leads(self, leads: Leads) -> UpsertResult:
         """
-        Insert leads into the database using async SQLAlchemy.
+        Upsert leads into the database in a single transaction.
+
+        Companies, jobs and contacts are written in that order, one statement per table.
+        Rows already stored with the same ID are updated, duplicates of stored rows are
+        skipped and the references of the children are redirected to the stored rows.
 
         Args:
             leads (Leads): The leads data to insert containing companies, jobs, and contacts.
+
+        Returns:
+            UpsertResult: IDs actually inserted and mapping of the skipped companies, jobs and
+                contacts to the stored ones.
         """
-        async with AsyncSession(self.engine) as session:
-            try:
-                # Prepare collections for batch insert
-                companies_to_insert: List[CompanyDB] = []
-                jobs_to_insert: List[JobDB] = []
-                contacts_to_insert: List[ContactDB] = []
-
-                # Process companies
-                if leads.companies and leads.companies.companies:
-                    for company_data in leads.companies.companies:
-                        company_db = self._convert_company_to_db(company_data)
-                        companies_to_insert.append(company_db)
-
-                # Process jobs
-                if leads.jobs and leads.jobs.jobs:
-                    for job_data in leads.jobs.jobs:
-                        job_db = self._convert_job_to_db(job_data)
-                        jobs_to_insert.append(job_db)
-
-                # Process contacts
-                if leads.contacts and leads.contacts.contacts:
-                    for contact_data in leads.contacts.contacts:
-                        contact_db = self._convert_contact_to_db(contact_data)
-                        contacts_to_insert.append(contact_db)
-
-                session.add_all(companies_to_insert)
-                await session.flush()
-
-                session.add_all(jobs_to_insert)
-                await session.flush()
-
-                session.add_all(contacts_to_insert)
-                await session.commit()
+        companies = leads.companies.companies if leads.companies else []
+        jobs = leads.jobs.jobs if leads.jobs else []
+        contacts = leads.contacts.contacts if leads.contacts else []
+        start = time.perf_counter()
+        async with self.database.engine.begin() as connection:
+            companies_result = await self._upsert(
+                connection, "companies", _COMPANY_COLUMNS, _COMPANY_KEY, _COMPANY_KEY,
+                self._with_ids(companies, self._company_record),
+            )
+            for job in jobs:
+                job.company_id = companies_result.existing.get(job.company_id or "", job.company_id)
+            jobs_result = await self._upsert(
+                connection, "jobs", _JOB_COLUMNS, _JOB_KEY, _JOB_STORED_KEY,
+                self._with_ids(jobs, self._job_record),
+            )
+            for contact in contacts:
+                contact.company_id = companies_result.existing.get(contact.company_id or "", contact.company_id)
+                contact.job_id = jobs_result.existing.get(contact.job_id or "", contact.job_id)
+            contacts_result = await self._upsert(
+                connection, "contacts", _CONTACT_COLUMNS, _CONTACT_KEY, _CONTACT_KEY,
+                self._with_ids(contacts, self._contact_record),
+            )
+        await self._after_write()
+        elapsed = time.perf_counter() - start
+        rows = len(companies) + len(jobs) + len(contacts)
+        logger.info(
+            f"Upserted {rows} rows in {elapsed:.3f}s "
+            f"({rows / elapsed if elapsed > 0 else 0:.0f} rows/s)"
+        )
+        return UpsertResult(
+            inserted=companies_result.inserted + jobs_result.inserted + contacts_result.inserted,
+            existing={**companies_result.existing, **jobs_result.existing, **contacts_result.existing},
+        )
 
-            except Exception as e:
-                await session.rollback()
-                raise e
+    async def match_companies(self, companies: CompanyEntity) -> UpsertResult:
+        """
+        Resolve companies to the stored ones with the same normalized name, without writing.
+
+        Args:
+            companies (CompanyEntity): The companies to look up, missing IDs are generated in place.
+
+        Returns:
+            UpsertResult: IDs of the companies not stored yet and mapping of the others to the stored ones.
+        """
+        records = self._with_ids(companies.companies, self._company_record)
+        rows = await self._match("companies", _COMPANY_COLUMNS, _COMPANY_KEY, _COMPANY_KEY, records)
+        result = UpsertResult()
+        for row in rows:
+            if row.id is None:
+                result.inserted.append(row.input_id)
+            else:
+                result.existing[row.input_id] = row.id
+        return result
+
+    async def match_jobs(self, jobs: JobEntity) -> UpsertResult:
+        """
+        Resolve jobs to the stored ones with the same normalized title, location, company, type
+        and description, without writing. A stored job without compatibility score, left by an
+        interrupted insertion, is returned as not stored yet and takes the ID of the stored row
+        so saving it completes that row.
+
+        Args:
+            jobs (JobEntity): The jobs to look up, missing IDs are generated in place.
+
+        Returns:
+            UpsertResult: IDs of the jobs not stored yet and mapping of the others to the stored ones.
+        """
+        records = self._with_ids(jobs.jobs, self._job_record)
+        rows = await self._match(
+            "jobs", _JOB_COLUMNS, _JOB_KEY, _JOB_STORED_KEY, records,
+            complete="stored.compatibility_score IS NOT NULL",
+        )
+        result = UpsertResult()
+        for row in rows:
+            if row.id is None:
+                result.inserted.append(row.input_id)
+                continue
+            result.existing[row.input_id] = row.id
+            if not row.complete:
+                result.inserted.append(row.id)
+        for job in jobs.jobs:
+            if job.id in result.existing and result.existing[job.id] in result.inserted:
+                job.id = result.existing[job.id]
+        return result
+
+    async def _after_write(self) -> None:
+        """
+        Drop the cached counts and bump the cache generation so no stale page is served.
+        """
+        self.paginator.invalidate()
+        if self.cache is not None:
+            await self.cache.invalidate()
+
+    async def _match(
+        self,
+        table: str,
+        columns: dict[str, str],
+        key: str,
+        stored_key: str,
+        records: list[tuple],
+        complete: str = "true",
+    ) -> list:
+        """
+        Look up the stored rows sharing the normalized key of each record, without writing.
+
+        Args:
+            table (str): The table name.
+            columns (dict[str, str]): The column names and SQL types, in record order.
+            key (str): The normalized key expression of a record, formatted with the input alias.
+            stored_key (str): The expression of the unique index, formatted with the stored alias.
+            records (list[tuple]): The rows to look up, ordered like columns.
+            complete (str): Condition on the stored row telling whether it was fully saved.
+
+        Returns:
+            list: One row per record with its input_id, the stored id (None when not stored)
+                and whether the stored row is complete.
+        """
+        if not records:
+            return []
+        definitions = ", ".join(f"{name} {sql_type}" for name, sql_type in columns.items())
+        rows = [dict(zip(columns, record)) for record in records]
+        statement = text(f"""
+            SELECT input.id::text AS input_id, stored.id::text AS id, {complete} AS complete
+            FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS input({definitions})
+            LEFT JOIN {table} AS stored ON {stored_key.format(alias="stored")} = {key.format(alias="input")}
+        """)
+        async with self.database.engine.connect() as connection:
+            result = await connection.execute(statement, {"rows": json.dumps(rows, default=str)})
+            return list(result.fetchall())
+
+    async def _upsert(
+        self,
+        connection: AsyncConnection,
+        table: str,
+        columns: dict[str, str],
+        key: str,
+        stored_key: str,
+        records: list[tuple],
+    ) -> UpsertResult:
+        """
+        Upsert records into a table with a single statement.
+
+        Records whose ID is already stored update that row (NULL values keep the stored ones),
+        the others are inserted with ON CONFLICT DO NOTHING so the unique indexes on the
+        normalized keys drop duplicates. Every record is then resolved to the stored row ID,
+        whether it was updated, inserted, or a duplicate of a row in the batch or the table.
+        In bulk mode the records are copied into a temporary staging table first, when the
+        driver supports COPY (asyncpg), otherwise they are passed as a JSON parameter too.
+
+        Args:
+            connection (AsyncConnection): The connection of the current transaction.
+            table (str): The table name.
+            columns (dict[str, str]): The column names and SQL types, in record order.
+            key (str): The normalized key expression of a record, formatted with the input alias.
+            stored_key (str): The expression of the unique index, formatted with the table alias,
+                so the lookup of the stored rows is served by that index.
+            records (list[tuple]): The rows to upsert, ordered like columns.
+
+        Returns:
+            UpsertResult: IDs actually inserted and mapping of the other records to the stored rows.
+        """
+        if not records:
+            return UpsertResult()
+        names = ", ".join(columns)
+        copy = None
+        if self.bulk_insert:
+            raw_connection = await connection.get_raw_connection()
+            copy = getattr(raw_connection.driver_connection, "copy_records_to_table", None)
+            if copy is None:
+                logger.warning("The database driver does not support COPY, bulk insert disabled")
+                self.bulk_insert = False
+        if copy is not None:
+            staging = f"_upsert_{table}"
+            await connection.execute(
+                text(f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS SELECT {names} FROM {table} WITH NO DATA")
+            )
+            await copy(staging, records=records, columns=list(columns))
+            source, parameters = f"SELECT * FROM {staging}", {}
+        else:
+            definitions = ", ".join(f"{name} {sql_type}" for name, sql_type in columns.items())
+            source = f"SELECT * FROM jsonb_to_recordset(CAST(:rows AS jsonb)) AS r({definitions})"
+            rows = [dict(zip(columns, record)) for record in records]
+            parameters = {"rows": json.dumps(rows, default=str)}
+        assignments = ", ".join(
+            f"{name} = coalesce(input.{name}, target.{name})" for name in columns if name != "id"
+        )
+        statement = text(f"""
+            WITH input AS ({source}),
+            updated AS (
+                UPDATE {table} AS target SET {assignments}
+                FROM input WHERE target.id = input.id
+                RETURNING target.id
+            ),
+            inserted AS (
+                INSERT INTO {table} ({names})
+                SELECT {names} FROM input
+                WHERE input.id NOT IN (SELECT id FROM updated)
+                ON CONFLICT DO NOTHING
+                RETURNING id, {stored_key.format(alias=table)} AS key
+            )
+            SELECT input.id::text AS input_id,
+                coalesce(updated.id, own.id, batch.id, stored.id)::text AS id,
+                own.id IS NOT NULL AS inserted
+            FROM input
+            LEFT JOIN updated ON updated.id = input.id
+            LEFT JOIN inserted AS own ON own.id = input.id
+            LEFT JOIN inserted AS batch ON batch.key = {key.format(alias="input")}
+            LEFT JOIN {table} AS stored ON {stored_key.format(alias="stored")} = {key.format(alias="input")}
+        """)
+        result = await connection.execute(statement, parameters)
+        upsert_result = UpsertResult()
+        for row in result.fetchall():
+            if row.inserted:
+                upsert_result.inserted.append(row.input_id)
+            elif row.id is not None:
+                upsert_result.existing[row.input_id] = row.id
+        return upsert_result
+
+    def _with_ids(self, entities: Sequence[Company | Job | Contact], to_record: Callable) -> list[tuple]:
+        """
+        Generate the missing IDs of the entities in place and convert them into records.
+
+        Args:
+            entities (Sequence[Company | Job | Contact]): The domain entities to write.
+            to_record (Callable): The converter building the record of one entity.
+
+        Returns:
+            list[tuple]: The records, in entity order.
+        """
+        for entity in entities:
+            entity.id = entity.id or str(uuid4())
+        return [to_record(entity) for entity in entities]
+
+    def _company_record(self, company: Company) -> tuple:
+        """
+        Convert a domain company into an upsert record ordered like _COMPANY_COLUMNS.
 
-    async def get_jobs(self, offset: int, limit: int) -> JobEntity:
+        Args:
+            company (Company): Domain company entity.
+
+        Returns:
+            tuple: The record to upsert.
+        """
+        return (
+            company.id,
+            company.name,
+            company.industry,
+            company.compatibility,
+            company.source,
+            company.location,
+            company.size,
+            company.revenue,
+            company.website,
+            company.description,
+            company.opportunities,
+        )
+
+    def _job_record(self, job: Job) -> tuple:
+        """
+        Convert a domain job into an upsert record ordered like _JOB_COLUMNS.
+
+        Args:
+            job (Job): Domain job entity.
+
+        Returns:
+            tuple: The record to upsert.
+        """
+        return (
+            job.id,
+            job.company_id or None,
+            (
+                datetime.fromisoformat(job.date_creation)
+                if job.date_creation
+                else datetime.now()
+            ),
+            job.description,
+            job.job_title,
+            job.location,
+            job.salary,
+            job.job_seniority,
+            job.job_type,
+            job.sectors,
+            job.apply_url,
+            job.compatibility_score,
+        )
+
+    def _contact_record(self, contact: Contact) -> tuple:
+        """
+        Convert a domain contact into an upsert record ordered like _CONTACT_COLUMNS.
+
+        Args:
+            contact (Contact): Domain contact entity.
+
+        Returns:
+            tuple: The record to upsert.
+        """
+        return (
+            contact.id,
+            contact.company_id or None,
+            contact.job_id or None,
+            contact.name,
+            contact.email,
+            contact.title,
+            contact.phone,
+            contact.profile_url,
+        )
+
+    def _jobs_page_statement(
+        self, offset: int, limit: int, cursor: Optional[str]
+    ) -> Select:
+        """
+        Build the statement selecting a page of jobs ordered by compatibility score.
+
+        Jobs are ordered on (compatibility_score, id) descending, unscored jobs last.
+        With a cursor the page starts right after the cursor's sort key (keyset pagination),
+        otherwise the offset is applied.
+
+        Args:
+            offset (int): Number of jobs to skip (ignored when a cursor is given).
+            limit (int): Maximum number of jobs to return.
+            cursor (Optional[str]): Opaque keyset cursor returned by the previous page.
+
+        Returns:
+            Select: The statement selecting the page of jobs.
+        """
+        stmt = select(JobDB).order_by(_JOB_SCORE_KEY.desc(), JobDB.id.desc()).limit(limit)
+        position = self.paginator.decode_cursor(cursor, ("score", "id"))
+        if position is None:
+            return stmt.offset(offset)
+        return stmt.where(
+            tuple_(_JOB_SCORE_KEY, JobDB.id)
+            < tuple_(literal(position["score"]), literal(position["id"], JobDB.id.type))
+        )
+
+    def _jobs_next_cursor(self, job_dbs: Sequence[JobDB], limit: int) -> Optional[str]:
+        """
+        Build the cursor pointing after the last job of a full page.
+
+        Args:
+            job_dbs (Sequence[JobDB]): The jobs of the current page.
+            limit (int): The requested page size.
+
+        Returns:
+            Optional[str]: The next cursor, or None when this is the last page.
+        """
+        if not job_dbs or len(job_dbs) < limit:
+            return None
+        last = job_dbs[-1]
+        score = last.compatibility_score if last.compatibility_score is not None else -1
+        return self.paginator.encode_cursor({"score": score, "id": last.id})
+
+    def _id_page_statement(
+        self, model: type[CompanyDB] | type[ContactDB], offset: int, limit: int, cursor: Optional[str]
+    ) -> Select:
+        """
+        Build the statement selecting a page of rows ordered by id.
+
+        Args:
+            model (type[CompanyDB] | type[ContactDB]): The model to page through.
+            offset (int): Number of rows to skip (ignored when a cursor is given).
+            limit (int): Maximum number of rows to return.
+            cursor (Optional[str]): Opaque keyset cursor returned by the previous page.
+
+        Returns:
+            Select: The statement selecting the page of rows.
+        """
+        stmt = select(model).order_by(model.id).limit(limit)
+        position = self.paginator.decode_cursor(cursor, ("id",))
+        if position is None:
+            return stmt.offset(offset)
+        return stmt.where(model.id > literal(position["id"], model.id.type))
+
+    def _id_next_cursor(self, rows: Sequence[CompanyDB] | Sequence[ContactDB], limit: int) -> Optional[str]:
+        """
+        Build the cursor pointing after the last row of a full page ordered by id.
+
+        Args:
+            rows (Sequence[CompanyDB] | Sequence[ContactDB]): The rows of the current page.
+            limit (int): The requested page size.
+
+        Returns:
+            Optional[str]: The next cursor, or None when this is the last page.
+        """
+        if not rows or len(rows) < limit:
+            return None
+        return self.paginator.encode_cursor({"id": rows[-1].id})
+
+    async def get_jobs(
+        self, offset: int, limit: int, cursor: Optional[str] = None
+    ) -> JobEntity:
         """
         Retrieve jobs from the database with pagination.
 
         Args:
-            offset (int): Number of jobs to skip.
+            offset (int): Number of jobs to skip (ignored when a cursor is given).
             limit (int): Maximum number of jobs to return.
+            cursor (Optional[str]): Opaque keyset cursor returned by the previous page.
 
         Returns:
             JobEntity: Domain entity containing list of jobs.
         """
-        async with AsyncSession(self.engine) as session:
+        async with self.database.session() as session:
             try:
-                total_jobs_result = await session.execute(select(JobDB.id))
-                total_jobs = total_jobs_result.scalars().all()
-                total_pages = ceil(len(total_jobs) / limit) if limit > 0 else 1
+                total_jobs = await self.paginator.count(session, JobDB)
+                total_pages = self.paginator.pages(total_jobs, limit)
 
                 result = await session.execute(
-                    select(JobDB)
-                    .order_by(JobDB.compatibility_score.desc())
-                    .offset(offset)
-                    .limit(limit)
+                    self._jobs_page_statement(offset, limit, cursor)
                 )
                 job_dbs = result.scalars().all()
 
@@ -109,7 +576,11 @@ class LeadsDatabase(LeadsRepositoryPort):
 
 
                 jobs = [self._convert_db_to_job(job_db, companies_map.get(job_db.company_id)) for job_db in job_dbs]
-                return JobEntity(jobs=jobs, pages=total_pages)
+                return JobEntity(
+                    jobs=jobs,
+                    pages=total_pages,
+                    next_cursor=self._jobs_next_cursor(job_dbs, limit),
+                )
             except Exception as e:
                 raise e
 
@@ -126,37 +597,41 @@ class LeadsDatabase(LeadsRepositoryPort):
         Returns:
             JobEntity: Domain entity containing the list of jobs matching the criteria. Returns an empty JobEntity if no jobs are found.
         """
-        async with AsyncSession(self.engine) as session:
+        async with self.database.session() as session:
             try:
-                stmt = select(JobDB).where(
-                    or_(*[JobDB.job_title.ilike(f"%{t}%") for t in title]),
-                    or_(*[JobDB.location.ilike(f"%{loc}%") for loc in location]),
+                stmt = (
+                    select(JobDB, CompanyDB.name)
+                    .outerjoin(CompanyDB, CompanyDB.id == JobDB.company_id)
                 )
+                stmt = _where(stmt, _contains(JobDB.job_title, title), _contains(JobDB.location, location))
                 result = await session.execute(stmt)
-                job_db = result.scalars().all()
-
-                if job_db:
-                    jobs = [self._convert_db_to_job(job) for job in job_db] # type: ignore
-                    return JobEntity(jobs=jobs) # type: ignore
-                return JobEntity(jobs=[]) # type: ignore
+                jobs = [
+                    self._convert_db_to_job(job_db, company_name)
+                    for job_db, company_name in result.all()
+                ]
+                return JobEntity(jobs=jobs) # type: ignore
 
             except Exception as e:
                 raise e
 
     async def get_companies_by_names(self, company_names: List[str]) -> CompanyEntity:
         """
-        Retrieve companies by their names from the database.
+        Retrieve companies by their normalized names from the database.
 
         Args:
-            company_names (List[str]): List of company names to search for.
+            company_names (List[str]): List of company names to search for (case-insensitive, exact match).
 
         Returns:
             CompanyEntity: Domain entity containing list of companies matching the names.
         """
-        async with AsyncSession(self.engine) as session:
+        async with self.database.session() as session:
             try:
                 result = await session.execute(
-                    select(CompanyDB).where(CompanyDB.name.in_(company_names))
+                    select(CompanyDB).where(
+                        func.lower(func.trim(CompanyDB.name)).in_(
+                            [name.strip().lower() for name in company_names]
+                        )
+                    )
                 )
                 company_dbs = result.scalars().all()
 
@@ -170,54 +645,62 @@ class LeadsDatabase(LeadsRepositoryPort):
             except Exception as e:
                 raise e
 
-    async def get_companies(self, offset: int, limit: int) -> CompanyEntity:
+    async def get_companies(
+        self, offset: int, limit: int, cursor: Optional[str] = None
+    ) -> CompanyEntity:
         """
         Retrieve companies from the database with pagination.
 
         Args:
-            offset (int): Number of companies to skip (default: 0).
-            limit (int): Maximum number of companies to return (default: 10).
+            offset (int): Number of companies to skip (ignored when a cursor is given).
+            limit (int): Maximum number of companies to return.
+            cursor (Optional[str]): Opaque keyset cursor returned by the previous page.
 
         Returns:
             CompanyEntity: Domain entity containing list of companies.
         """
-        async with AsyncSession(self.engine) as session:
+        async with self.database.session() as session:
             try:
-                total_companies_result = await session.execute(select(CompanyDB.id))
-                total_companies = total_companies_result.scalars().all()
-                total_pages = ceil(len(total_companies) / limit) if limit > 0 else 1
+                total_companies = await self.paginator.count(session, CompanyDB)
+                total_pages = self.paginator.pages(total_companies, limit)
 
                 result = await session.execute(
-                    select(CompanyDB).order_by(CompanyDB.id).offset(offset).limit(limit)
+                    self._id_page_statement(CompanyDB, offset, limit, cursor)
                 )
                 company_dbs = result.scalars().all()
                 companies = [
                     self._convert_db_to_company(company_db)
                     for company_db in company_dbs
                 ]
-                return CompanyEntity(companies=companies, pages=total_pages) # type: ignore
+                return CompanyEntity(
+                    companies=companies,
+                    pages=total_pages,
+                    next_cursor=self._id_next_cursor(company_dbs, limit),
+                )
             except Exception as e:
                 raise e
 
-    async def get_contacts(self, offset: int, limit: int) -> ContactEntity:
+    async def get_contacts(
+        self, offset: int, limit: int, cursor: Optional[str] = None
+    ) -> ContactEntity:
         """
         Retrieve contacts from the database with pagination.
 
         Args:
-            offset (int): Number of contacts to skip (default: 0).
-            limit (int): Maximum number of contacts to return (default: 10).
+            offset (int): Number of contacts to skip (ignored when a cursor is given).
+            limit (int): Maximum number of contacts to return.
+            cursor (Optional[str]): Opaque keyset cursor returned by the previous page.
 
         Returns:
             ContactEntity: Domain entity containing list of contacts.
         """
-        async with AsyncSession(self.engine) as session:
+        async with self.database.session() as session:
             try:
-                total_contacts_result = await session.execute(select(ContactDB.id))
-                total_contacts = total_contacts_result.scalars().all()
-                total_pages = ceil(len(total_contacts) / limit) if limit > 0 else 1
+                total_contacts = await self.paginator.count(session, ContactDB)
+                total_pages = self.paginator.pages(total_contacts, limit)
 
                 result = await session.execute(
-                    select(ContactDB).order_by(ContactDB.id).offset(offset).limit(limit)
+                    self._id_page_statement(ContactDB, offset, limit, cursor)
                 )
 
                 contact_dbs = result.scalars().all()
@@ -243,7 +726,11 @@ class LeadsDatabase(LeadsRepositoryPort):
                     )
                     for contact_db in contact_dbs
                 ]
-                return ContactEntity(contacts=contacts, pages=total_pages)
+                return ContactEntity(
+                    contacts=contacts,
+                    pages=total_pages,
+                    next_cursor=self._id_next_cursor(contact_dbs, limit),
+                )
             except Exception as e:
                 raise e
 
@@ -260,22 +747,200 @@ class LeadsDatabase(LeadsRepositoryPort):
         Returns:
             ContactEntity: Domain entity containing the list of contacts matching both name and title criteria. Returns an empty ContactEntity if no contacts are found.
         """
-        async with AsyncSession(self.engine) as session:
+        async with self.database.session() as session:
             try:
-                stmt = select(ContactDB).where(
-                    or_(*[ContactDB.name.ilike(f"%{name}%") for name in names])
-                    & or_(*[ContactDB.title.ilike(f"%{title}%") for title in titles])
+                stmt = (
+                    select(ContactDB, CompanyDB.name, JobDB.job_title)
+                    .outerjoin(CompanyDB, CompanyDB.id == ContactDB.company_id)
+                    .outerjoin(JobDB, JobDB.id == ContactDB.job_id)
                 )
+                stmt = _where(stmt, _contains(ContactDB.name, names), _contains(ContactDB.title, titles))
                 result = await session.execute(stmt)
-                contact_dbs = result.scalars().all()
                 contacts = [
-                    self._convert_db_to_contact(contact_db) # type: ignore
-                    for contact_db in contact_dbs
+                    self._convert_db_to_contact(contact_db, company_name, job_title)
+                    for contact_db, company_name, job_title in result.all()
                 ]
                 return ContactEntity(contacts=contacts) # type: ignore
             except Exception as e:
                 raise e
-    
+
+    def _search_jobs_statement(self, filters: SearchFilters, limit: int) -> Select:
+        """
+        Build the statement searching jobs, best scored first.
+
+        Args:
+            filters (SearchFilters): The search filters, unset ones are ignored.
+            limit (int): Maximum number of jobs to return.
+
+        Returns:
+            Select: The statement, without WHERE clause when no filter is set.
+        """
+        stmt = select(JobDB, CompanyDB.name).outerjoin(CompanyDB, CompanyDB.id == JobDB.company_id)
+        stmt = _where(
+            stmt,
+            _contains(JobDB.job_title, [filters.job_title]),
+            _contains(JobDB.location, [filters.location]),
+            _contains(CompanyDB.name, [filters.company]),
+        )
+        return stmt.order_by(_JOB_SCORE_KEY.desc(), JobDB.id.desc()).limit(limit)
+
+    def _search_companies_statement(self, filters: SearchFilters, limit: int) -> Select:
+        """
+        Build the statement searching companies.
+
+        Args:
+            filters (SearchFilters): The search filters, unset ones are ignored.
+            limit (int): Maximum number of companies to return.
+
+        Returns:
+            Select: The statement, without WHERE clause when no filter is set.
+        """
+        stmt = _where(select(CompanyDB), _contains(CompanyDB.name, [filters.company]))
+        return stmt.order_by(CompanyDB.id).limit(limit)
+
+    def _search_contacts_statement(self, filters: SearchFilters, limit: int) -> Select:
+        """
+        Build the statement searching contacts by name or title.
+
+        Args:
+            filters (SearchFilters): The search filters, unset ones are ignored.
+            limit (int): Maximum number of contacts to return.
+
+        Returns:
+            Select: The statement, without WHERE clause when no filter is set.
+        """
+        stmt = (
+            select(ContactDB, CompanyDB.name, JobDB.job_title)
+            .outerjoin(CompanyDB, CompanyDB.id == ContactDB.company_id)
+            .outerjoin(JobDB, JobDB.id == ContactDB.job_id)
+        )
+        contact = (
+            or_(
+                _contains(ContactDB.name, [filters.contact]),
+                _contains(ContactDB.title, [filters.contact]),
+            )
+            if filters.contact
+            else None
+        )
+        stmt = _where(stmt, contact, _contains(CompanyDB.name, [filters.company]))
+        return stmt.order_by(ContactDB.id).limit(limit)
+
+    async def search_jobs(self, filters: SearchFilters, limit: int) -> JobEntity:
+        """
+        Search jobs matching the job title, location and company filters.
+
+        Args:
+            filters (SearchFilters): The search filters, unset ones are ignored.
+            limit (int): Maximum number of jobs to return.
+
+        Returns:
+            JobEntity: Domain entity containing the matching jobs, best scored first.
+        """
+        async with self.database.session() as session:
+            try:
+                result = await session.execute(self._search_jobs_statement(filters, limit))
+                jobs = [
+                    self._convert_db_to_job(job_db, company_name)
+                    for job_db, company_name in result.all()
+                ]
+                return JobEntity(jobs=jobs) # type: ignore
+            except Exception as e:
+                raise e
+
+    async def search_companies(self, filters: SearchFilters, limit: int) -> CompanyEntity:
+        """
+        Search companies matching the company filter.
+
+        Args:
+            filters (SearchFilters): The search filters, unset ones are ignored.
+            limit (int): Maximum number of companies to return.
+
+        Returns:
+            CompanyEntity: Domain entity containing the matching companies.
+        """
+        async with self.database.session() as session:
+            try:
+                result = await session.execute(self._search_companies_statement(filters, limit))
+                companies = [
+                    self._convert_db_to_company(company_db)
+                    for company_db in result.scalars().all()
+                ]
+                return CompanyEntity(companies=companies) # type: ignore
+            except Exception as e:
+                raise e
+
+    async def search_contacts(self, filters: SearchFilters, limit: int) -> ContactEntity:
+        """
+        Search contacts matching the contact and company filters.
+
+        Args:
+            filters (SearchFilters): The search filters, unset ones are ignored.
+            limit (int): Maximum number of contacts to return.
+
+        Returns:
+            ContactEntity: Domain entity containing the matching contacts.
+        """
+        async with self.database.session() as session:
+            try:
+                result = await session.execute(self._search_contacts_statement(filters, limit))
+                contacts = [
+                    self._convert_db_to_contact(contact_db, company_name, job_title)
+                    for contact_db, company_name, job_title in result.all()
+                ]
+                return ContactEntity(contacts=contacts) # type: ignore
+            except Exception as e:
+                raise e
+
+    async def save_embeddings(
+        self, jobs: dict[str, list[float]], companies: dict[str, list[float]]
+    ) -> None:
+        """
+        Store the description embeddings of jobs and companies with one bulk update per table.
+
+        Args:
+            jobs (dict[str, list[float]]): Embedding of each job description, keyed by job ID.
+            companies (dict[str, list[float]]): Embedding of each company description, keyed by company ID.
+        """
+        async with self.database.engine.begin() as connection:
+            for table, embeddings in ((JobDB.__table__, jobs), (CompanyDB.__table__, companies)):
+                if embeddings:
+                    # Rows deleted or merged in the meantime are skipped
+                    await connection.execute(
+                        update(table)
+                        .where(table.c.id == bindparam("row_id"))
+                        .values(description_embedding=bindparam("embedding")),
+                        [
+                            {"row_id": id, "embedding": embedding}
+                            for id, embedding in embeddings.items()
+                        ],
+                    )
+
+    async def get_similar_jobs(self, embedding: list[float], limit: int) -> JobEntity:
+        """
+        Retrieve the jobs whose description is the closest to an embedding, by cosine distance.
+        The ordering is served by the HNSW index of the description embeddings.
+
+        Args:
+            embedding (list[float]): The embedding to compare the job descriptions with.
+            limit (int): Maximum number of jobs to return.
+
+        Returns:
+            JobEntity: Domain entity containing the jobs, most similar first.
+        """
+        async with self.database.session() as session:
+            result = await session.execute(
+                select(JobDB, CompanyDB.name)
+                .outerjoin(CompanyDB, CompanyDB.id == JobDB.company_id)
+                .where(JobDB.description_embedding.is_not(None))
+                .order_by(JobDB.description_embedding.cosine_distance(embedding))
+                .limit(limit)
+            )
+            jobs = [
+                self._convert_db_to_job(job_db, company_name)
+                for job_db, company_name in result.all()
+            ]
+            return JobEntity(jobs=jobs) # type: ignore
+
     async def get_contact_by_id(self, contact_id: str) -> Optional[Contact]:
         """
         Retrieve a contact by its ID from the database.
@@ -286,7 +951,7 @@ class LeadsDatabase(LeadsRepositoryPort):
         Returns:
             Optional[Contact]: The contact entity if found, otherwise None.
         """
-        async with AsyncSession(self.engine) as session:
+        async with self.database.session() as session:
             try:
                 result = await session.execute(
                     select(ContactDB).where(ContactDB.id == contact_id)
@@ -307,7 +972,7 @@ class LeadsDatabase(LeadsRepositoryPort):
         Returns:
             Optional[Company]: The company entity if found, otherwise None.
         """
-        async with AsyncSession(self.engine) as session:
+        async with self.database.session() as session:
             try:
                 result = await session.execute(
                     select(CompanyDB).where(CompanyDB.id == company_id)
@@ -319,154 +984,143 @@ class LeadsDatabase(LeadsRepositoryPort):
             except Exception as e:
                 raise e
 
+    def _leads_page_statement(self, keyset: bool, with_count: bool) -> Select:
+        """
+        Build the single statement reading a page of leads, once per variant.
+
+        Each row is a job of the page with its company and its contacts (by job or by company)
+        aggregated as JSON through lateral joins, optionally along with the total number of jobs.
+        Only the columns of the domain entities are read, not the embeddings nor the dedup key.
+        The page bounds are bind parameters ('limit' with 'offset', or 'score' and 'id' for
+        keyset pagination) so the statement is built and compiled only once.
+
+        Args:
+            keyset (bool): Whether the page starts after a cursor instead of an offset.
+            with_count (bool): Whether to select the total number of jobs.
+
+        Returns:
+            Select: The statement selecting the page of leads.
+        """
+        variant = (keyset, with_count)
+        if variant in self._leads_statements:
+            return self._leads_statements[variant]
+        page_statement = (
+            select(*[JobDB.__table__.c[name] for name in _JOB_COLUMNS])
+            .order_by(_JOB_SCORE_KEY.desc(), JobDB.id.desc())
+            .limit(bindparam("limit", type_=Integer))
+        )
+        if keyset:
+            page_statement = page_statement.where(
+                tuple_(_JOB_SCORE_KEY, JobDB.id)
+                < tuple_(bindparam("score", type_=Integer), bindparam("id", type_=JobDB.id.type))
+            )
+        else:
+            page_statement = page_statement.offset(bindparam("offset", type_=Integer))
+        page = page_statement.subquery("page")
+        company = CompanyDB.__table__.alias("company")
+        contact = ContactDB.__table__.alias("contact")
+        company_json = (
+            select(_json_object(company, _COMPANY_COLUMNS).label("company"))
+            .where(company.c.id == page.c.company_id)
+            .lateral("company_json")
+        )
+        contacts_json = (
+            select(func.json_agg(_json_object(contact, _CONTACT_COLUMNS), type_=JSON).label("contacts"))
+            .where(
+                or_(contact.c.job_id == page.c.id, contact.c.company_id == page.c.company_id)
+            )
+            .lateral("contacts_json")
+        )
+        columns = [page, company_json.c.company, contacts_json.c.contacts]
+        if with_count:
+            columns.append(self.paginator.count_expression(JobDB).label("total_jobs"))
+        statement = (
+            select(*columns)
+            .select_from(
+                page.outerjoin(company_json, true()).outerjoin(contacts_json, true())
+            )
+            .order_by(
+                func.coalesce(page.c.compatibility_score, literal_column("-1")).desc(),
+                page.c.id.desc(),
+            )
+        )
+        self._leads_statements[variant] = statement
+        return statement
+
     async def get_leads(
         self,
         offset: int,
-        limit: int
+        limit: int,
+        cursor: Optional[str] = None
     ) -> Leads:
         """
-        Retrieve paginated jobs and only the related companies and contacts for those jobs.
+        Retrieve paginated jobs and only the related companies and contacts for those jobs,
+        in a single round trip.
 
         Args:
-            jobs_offset (int): Number of jobs to skip (default: 0).
-            jobs_limit (int): Maximum number of jobs to return (default: 10).
+            offset (int): Number of jobs to skip (ignored when a cursor is given).
+            limit (int): Maximum number of jobs to return.
+            cursor (Optional[str]): Opaque keyset cursor returned by the previous page.
 
         Returns:
             Leads: Domain entity containing jobs, their companies, and their contacts.
         """
-        async with AsyncSession(self.engine) as session:
+        async with self.database.session() as session:
             try:
-
-                total_jobs_result = await session.execute(select(JobDB.id))
-                total_jobs = total_jobs_result.scalars().all()
-                total_pages = ceil(len(total_jobs) / limit) if limit > 0 else 1
-
-                jobs_result = await session.execute(
-                    select(JobDB)
-                    .order_by(JobDB.compatibility_score.desc())
-                    .offset(offset)
-                    .limit(limit)
+                position = self.paginator.decode_cursor(cursor, ("score", "id"))
+                parameters = (
+                    {"limit": limit, "offset": offset}
+                    if position is None
+                    else {"limit": limit, **position}
                 )
-                job_dbs = jobs_result.scalars().all()
-                jobs = [self._convert_db_to_job(job_db) for job_db in job_dbs] # type: ignore
-                job_ids = [job_db.id for job_db in job_dbs]
-                company_ids = list(
-                    {
-                        job_db.company_id
-                        for job_db in job_dbs
-                        if job_db.company_id is not None
-                    }
+                total_jobs = self.paginator.cached(JobDB)
+                result = await session.execute(
+                    self._leads_page_statement(position is not None, total_jobs is None),
+                    parameters,
                 )
-
-                if company_ids:
-                    companies_result = await session.execute(
-                        select(CompanyDB).where(CompanyDB.id.in_(company_ids))
+                rows = result.all()
+                if total_jobs is None:
+                    total_jobs = (
+                        self.paginator.record(JobDB, int(rows[0].total_jobs))
+                        if rows
+                        else await self.paginator.count(session, JobDB)
                     )
-                    company_dbs = companies_result.scalars().all()
-                else:
-                    company_dbs = []
-                companies = [
-                    self._convert_db_to_company(company_db)
-                    for company_db in company_dbs
-                ]
 
-                if job_ids or company_ids:
-                    contacts_result = await session.execute(
-                        select(ContactDB).where(
-                            (ContactDB.job_id.in_(job_ids))
-                            | (ContactDB.company_id.in_(company_ids))
-                        )
-                    )
-                    contact_dbs = contacts_result.scalars().all()
-                else:
-                    contact_dbs = []
+                companies: dict[str, Company] = {}
+                contact_rows: dict[str, dict] = {}
+                for row in rows:
+                    if row.company:
+                        companies.setdefault(row.company["id"], Company.model_validate(row.company))
+                    for contact_row in row.contacts or []:
+                        contact_rows.setdefault(contact_row["id"], contact_row)
+
+                companies_map = {company.id: company.name for company in companies.values()}
+                jobs = [
+                    self._convert_db_to_job(row, companies_map.get(row.company_id)) # type: ignore
+                    for row in rows
+                ]
+                jobs_map = {row.id: row.job_title for row in rows}
                 contacts = [
-                    self._convert_db_to_contact(contact_db) # type: ignore
-                    for contact_db in contact_dbs
+                    Contact.model_validate(
+                        {
+                            **contact_row,
+                            "company_name": companies_map.get(contact_row["company_id"]),
+                            "job_title": jobs_map.get(contact_row["job_id"]),
+                        }
+                    )
+                    for contact_row in contact_rows.values()
                 ]
 
                 return Leads(
-                    companies=CompanyEntity(companies=companies), # type: ignore
+                    companies=CompanyEntity(companies=list(companies.values())), # type: ignore
                     jobs=JobEntity(jobs=jobs), # type: ignore
                     contacts=ContactEntity(contacts=contacts), # type: ignore
-                    pages=total_pages
+                    pages=self.paginator.pages(total_jobs, limit),
+                    next_cursor=self._jobs_next_cursor(rows, limit), # type: ignore
                 )
             except Exception as e:
                 raise e
 
-    def _convert_company_to_db(self, company_data: Company) -> CompanyDB:
-        """
-        Convert domain company entity to database company model.
-
-        Args:
-            company_data: Domain company entity.
-
-        Returns:
-            CompanyDB: Database company model.
-        """
-        return CompanyDB(
-            id=company_data.id,
-            name=company_data.name,
-            industry=company_data.industry,
-            compatibility=company_data.compatibility,
-            source=company_data.source,
-            location=company_data.location,
-            size=company_data.size,
-            revenue=company_data.revenue,
-            website=company_data.website,
-            description=company_data.description,
-            opportunities=company_data.opportunities,
-        )
-
-    def _convert_job_to_db(self, job_data: Job) -> JobDB:
-        """
-        Convert domain job entity to database job model.
-
-        Args:
-            job_data: Domain job entity.
-
-        Returns:
-            JobDB: Database job model.
-        """
-        return JobDB(
-            id=job_data.id,
-            company_id=job_data.company_id,
-            date_creation=(
-                datetime.fromisoformat(job_data.date_creation)
-                if job_data.date_creation
-                else datetime.fromisoformat(datetime.now().isoformat())
-            ),
-            description=job_data.description,
-            job_title=job_data.job_title,
-            location=job_data.location,
-            salary=job_data.salary,
-            job_seniority=job_data.job_seniority,
-            job_type=job_data.job_type,
-            sectors=job_data.sectors,
-            apply_url=job_data.apply_url,
-            compatibility_score=job_data.compatibility_score,
-        )
-
-    def _convert_contact_to_db(self, contact_data: Contact) -> ContactDB:
-        """
-        Convert domain contact entity to database contact model.
-
-        Args:
-            contact_data: Domain contact entity.
-
-        Returns:
-            ContactDB: Database contact model.
-        """
-        return ContactDB(
-            company_id=contact_data.company_id,
-            job_id=contact_data.job_id,
-            name=contact_data.name,
-            email=contact_data.email,
-            title=contact_data.title,
-            phone=contact_data.phone,
-            profile_url=contact_data.profile_url,
-        )
-
     def _convert_db_to_job(self, job_db: JobDB, company_name: Optional[str]) -> Job:
         """
         Convert database job model to domain job entity.
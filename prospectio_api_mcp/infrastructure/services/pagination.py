@@ -0,0 +1,194 @@
+import base64
+import json
+import time
+import uuid
+from math import ceil
+from typing import Any, Optional
+from sqlalchemy import ColumnElement, case, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from domain.ports.leads_repository import InvalidCursorError
+from infrastructure.dto.database.base import Base
+
+
+class Paginator:
+    """
+    Pagination engine shared by the SQLAlchemy repositories.
+    Computes totals server-side (exact, cached or approximate) and encodes
+    opaque keyset cursors so deep pages cost the same as the first one.
+    """
+
+    COUNT_STRATEGIES = ("exact", "cached", "approximate")
+
+    def __init__(self, count_strategy: str = "exact", cache_ttl: float = 30.0):
+        """
+        Initialize the paginator.
+
+        Args:
+            count_strategy (str): 'exact' runs COUNT(*), 'cached' reuses an exact count for
+                cache_ttl seconds, 'approximate' reads pg_class.reltuples.
+            cache_ttl (float): Lifetime in seconds of a cached count.
+        """
+        if count_strategy not in self.COUNT_STRATEGIES:
+            raise ValueError(f"Unsupported count strategy: {count_strategy}")
+        self.count_strategy = count_strategy
+        self.cache_ttl = cache_ttl
+        self._counts: dict[str, tuple[float, int]] = {}
+
+    async def count(self, session: AsyncSession, model: type[Base]) -> int:
+        """
+        Count the rows of the table mapped by the given model.
+
+        Args:
+            session (AsyncSession): The session used to run the count.
+            model (type[Base]): The SQLAlchemy model whose table is counted.
+
+        Returns:
+            int: The number of rows (estimated when using the approximate strategy).
+        """
+        cached = self.cached(model)
+        if cached is not None:
+            return cached
+        result = await session.execute(select(self.count_expression(model)))
+        return self.record(model, int(result.scalar_one()))
+
+    def cached(self, model: type[Base]) -> Optional[int]:
+        """
+        Return the cached count of a table when the cached strategy holds a fresh one.
+
+        Args:
+            model (type[Base]): The SQLAlchemy model whose table is counted.
+
+        Returns:
+            Optional[int]: The cached count, or None when it must be computed.
+        """
+        if self.count_strategy != "cached":
+            return None
+        cached = self._counts.get(model.__tablename__)
+        if cached and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+        return None
+
+    def count_expression(self, model: type[Base]) -> ColumnElement[int]:
+        """
+        Build the SQL expression computing the row count of a table, so the count can be
+        embedded in another statement instead of costing its own round trip.
+        The cached strategy is served by cached() before reaching the database.
+
+        Args:
+            model (type[Base]): The SQLAlchemy model whose table is counted.
+
+        Returns:
+            ColumnElement[int]: An estimate falling back to COUNT(*), or COUNT(*).
+        """
+        table = model.__tablename__
+        exact = select(func.count()).select_from(model).scalar_subquery()
+        if self.count_strategy == "approximate":
+            estimate = (
+                select(text("reltuples::bigint"))
+                .select_from(text("pg_class"))
+                .where(text("oid = to_regclass(:table)").bindparams(table=table))
+                .scalar_subquery()
+            )
+            return case((estimate > 0, estimate), else_=exact)
+        return exact
+
+    def record(self, model: type[Base], total: int) -> int:
+        """
+        Remember a count returned by a statement built with count_expression.
+
+        Args:
+            model (type[Base]): The SQLAlchemy model whose table was counted.
+            total (int): The row count.
+
+        Returns:
+            int: The row count, unchanged.
+        """
+        table = model.__tablename__
+        cached = self._counts.get(table)
+        if not cached or time.monotonic() - cached[0] >= self.cache_ttl:
+            self._counts[table] = (time.monotonic(), total)
+        return total
+
+    def invalidate(self) -> None:
+        """
+        Drop every cached count, typically after a write.
+        """
+        self._counts.clear()
+
+    @staticmethod
+    def pages(total: int, limit: int) -> int:
+        """
+        Compute the number of pages for a total and a page size.
+
+        Args:
+            total (int): Total number of rows.
+            limit (int): Page size.
+
+        Returns:
+            int: The number of pages.
+        """
+        return ceil(total / limit) if limit > 0 else 1
+
+    @staticmethod
+    def encode_cursor(values: dict[str, Any]) -> str:
+        """
+        Encode the sort key of the last row of a page into an opaque cursor.
+
+        Args:
+            values (dict[str, Any]): JSON serializable sort key values.
+
+        Returns:
+            str: The URL-safe cursor.
+        """
+        payload = json.dumps(values, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: Optional[str], keys: tuple[str, ...]) -> Optional[dict[str, Any]]:
+        """
+        Decode an opaque cursor produced by encode_cursor.
+
+        Args:
+            cursor (Optional[str]): The cursor received from the client.
+            keys (tuple[str, ...]): The sort keys the cursor must contain.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or does not match the expected keys.
+
+        Returns:
+            Optional[dict[str, Any]]: The sort key values, or None when no cursor is given.
+        """
+        if not cursor:
+            return None
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        except (ValueError, UnicodeError) as e:
+            raise InvalidCursorError("Invalid pagination cursor") from e
+        if not isinstance(values, dict) or set(values) != set(keys):
+            raise InvalidCursorError("Invalid pagination cursor")
+        if not all(Paginator._valid_cursor_value(key, value) for key, value in values.items()):
+            raise InvalidCursorError("Invalid pagination cursor")
+        return values
+
+    @staticmethod
+    def _valid_cursor_value(key: str, value: Any) -> bool:
+        """
+        Check the type of a sort key value, so a forged cursor never reaches the query.
+
+        Args:
+            key (str): The sort key, a nullable integer score or a UUID id.
+            value (Any): The decoded value.
+
+        Returns:
+            bool: Whether the value fits the sort key.
+        """
+        if key == "score":
+            return value is None or (isinstance(value, int) and not isinstance(value, bool))
+        if key == "id":
+            try:
+                uuid.UUID(value)
+            except (TypeError, ValueError, AttributeError):
+                return False
+            return True
+        return False
@@ -1,11 +1,11 @@
 from typing import Optional, List
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy import select
 from domain.ports.profile_respository import ProfileRepositoryPort
 from domain.entities.profile import Profile
 from domain.entities.work_experience import WorkExperience
 from infrastructure.dto.database.profile import ProfileDTO
+from infrastructure.services.database_engine import DatabaseEngine
 
 
 class ProfileDatabase(ProfileRepositoryPort):
@@ -14,16 +14,14 @@ class ProfileDatabase(ProfileRepositoryPort):
     Handles inserting and updating profile data in the database using async operations.
     """
 
-    def __init__(self, database_url: str):
+    def __init__(self, database: DatabaseEngine):
         """
         Initialize the profile database repository.
 
         Args:
-            database_url (str): Async database connection URL (should start with postgresql+asyncpg://).
+            database (DatabaseEngine): Registry of the engine shared with the other repositories.
         """
-        self.database_url = database_url
-        self.engine = create_async_engine(database_url)
-        self.async_session = async_sessionmaker(self.engine)
+        self.database = database
 
     def _convert_dto_to_entity(self, profile_dto: ProfileDTO) -> Profile:
         """
@@ -59,7 +57,7 @@ class ProfileDatabase(ProfileRepositoryPort):
         Returns:
             Optional[Profile]: The profile entity if found, None otherwise.
         """
-        async with self.async_session() as session:
+        async with self.database.session() as session:
             try:
                 stmt = select(ProfileDTO).where(ProfileDTO.id == 1)
                 result = await session.execute(stmt)
@@ -82,7 +80,7 @@ class ProfileDatabase(ProfileRepositoryPort):
         Returns:
             ProfileDTO: The created or updated profile with database ID.
         """
-        async with self.async_session() as session:
+        async with self.database.session() as session:
             try:
                 # Convert work_experience to JSON format
                 profile_data = profile.model_dump()
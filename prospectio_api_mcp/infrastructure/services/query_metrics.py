@@ -0,0 +1,56 @@
+import statistics
+from collections import deque
+from domain.entities.fetch_stats import QueryStats
+from domain.ports.metrics import MetricsPort
+
+
+class QueryMetrics(MetricsPort):
+    """
+    Cost and yield of the queries sent to a lead provider, accumulated over every fetch.
+    The median latency is computed over the most recent queries only.
+    """
+
+    def __init__(self, window: int = 1000):
+        """
+        Initialize the counters.
+
+        Args:
+            window (int): Number of recent query latencies the median is computed over.
+        """
+        self.queries = 0
+        self.errors = 0
+        self.results = 0
+        self.latency_ms_max = 0.0
+        self.latencies_ms: deque[float] = deque(maxlen=window)
+
+    def record(self, stats: QueryStats) -> None:
+        """
+        Add a query to the counters.
+
+        Args:
+            stats (QueryStats): The statistics of the query.
+        """
+        self.queries += 1
+        if stats.error is not None:
+            self.errors += 1
+            return
+        self.results += stats.results
+        self.latency_ms_max = max(self.latency_ms_max, stats.latency_ms)
+        self.latencies_ms.append(stats.latency_ms)
+
+    def get_metrics(self) -> dict[str, float]:
+        """
+        Report the queries sent, their latency and the jobs they returned.
+
+        Returns:
+            dict[str, float]: The query metrics.
+        """
+        succeeded = self.queries - self.errors
+        return {
+            "queries": self.queries,
+            "errors": self.errors,
+            "results": self.results,
+            "results_per_query": round(self.results / succeeded, 3) if succeeded else 0.0,
+            "latency_ms_p50": round(statistics.median(self.latencies_ms), 2) if self.latencies_ms else 0.0,
+            "latency_ms_max": round(self.latency_ms_max, 2),
+        }
@@ -0,0 +1,268 @@
+import asyncio
+import hashlib
+import json
+import logging
+import zlib
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from domain.ports.response_cache import ResponseCachePort
+from infrastructure.dto.database.provider_response import ProviderResponse
+from infrastructure.services.database_engine import DatabaseEngine
+
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseResponseCache(ResponseCachePort):
+    """
+    Cache of the lead provider responses stored in PostgreSQL.
+    A fresh entry is served as is. An entry older than the TTL of its provider but within
+    the stale window is served immediately while a background request refreshes it.
+    Concurrent requests for the same key share a single provider call.
+    """
+
+    def __init__(
+        self,
+        database: DatabaseEngine,
+        ttl: float = 21600.0,
+        ttls: Optional[dict[str, float]] = None,
+        stale_ttl: float = 86400.0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            database (DatabaseEngine): Registry of the shared engine.
+            ttl (float): Lifetime in seconds of a fresh entry.
+            ttls (Optional[dict[str, float]]): Lifetime per provider, overriding ttl.
+            stale_ttl (float): Seconds after expiry during which a stale entry is still served.
+        """
+        self.database = database
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.stale_ttl = stale_ttl
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.errors = 0
+
+    @staticmethod
+    def normalize_params(params: dict[str, Any]) -> dict[str, Any]:
+        """
+        Normalize request parameters so equivalent searches share an entry.
+
+        Args:
+            params (dict[str, Any]): The request parameters.
+
+        Returns:
+            dict[str, Any]: The parameters without empty values, strings trimmed and lowercased.
+        """
+        return {
+            key: " ".join(value.lower().split()) if isinstance(value, str) else value
+            for key, value in sorted(params.items())
+            if value is not None and value != ""
+        }
+
+    @classmethod
+    def cache_key(cls, provider: str, endpoint: str, params: dict[str, Any]) -> str:
+        """
+        Build the key of a provider request.
+
+        Args:
+            provider (str): The provider name.
+            endpoint (str): The provider endpoint.
+            params (dict[str, Any]): The request parameters.
+
+        Returns:
+            str: The SHA-256 hex digest of the provider, endpoint and normalized parameters.
+        """
+        normalized = json.dumps(cls.normalize_params(params), sort_keys=True, default=str)
+        return hashlib.sha256(f"{provider}:{endpoint}:{normalized}".encode("utf-8")).hexdigest()
+
+    async def fetch(
+        self,
+        provider: str,
+        endpoint: str,
+        params: dict[str, Any],
+        request: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the payload of a provider request, from the cache when possible.
+
+        Args:
+            provider (str): The provider name, e.g. jsearch.
+            endpoint (str): The provider endpoint.
+            params (dict[str, Any]): The request parameters.
+            request (Callable[[], Awaitable[Any]]): Performs the request and returns
+                its JSON payload, called on a miss or to revalidate a stale entry.
+
+        Returns:
+            Any: The JSON payload.
+        """
+        key = self.cache_key(provider, endpoint, params)
+        entry = await self._read(key)
+        if entry is not None:
+            payload, age = entry
+            ttl = self.ttls.get(provider, self.ttl)
+            if age < ttl:
+                self.hits += 1
+                return payload
+            if age < ttl + self.stale_ttl:
+                self.stale_hits += 1
+                if key not in self._inflight:
+                    self.refreshes += 1
+                    self._refresh(key, provider, endpoint, params, request)
+                return payload
+        self.misses += 1
+        return await asyncio.shield(self._refresh(key, provider, endpoint, params, request))
+
+    def _refresh(
+        self,
+        key: str,
+        provider: str,
+        endpoint: str,
+        params: dict[str, Any],
+        request: Callable[[], Awaitable[Any]],
+    ) -> asyncio.Task:
+        """
+        Start, or join, the provider request refreshing an entry.
+
+        Args:
+            key (str): The cache key.
+            provider (str): The provider name.
+            endpoint (str): The provider endpoint.
+            params (dict[str, Any]): The request parameters.
+            request (Callable[[], Awaitable[Any]]): Performs the request.
+
+        Returns:
+            asyncio.Task: The task resolving to the fresh payload.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._request_and_store(key, provider, endpoint, params, request))
+            self._inflight[key] = task
+            task.add_done_callback(self._on_refreshed(key))
+        return task
+
+    def _on_refreshed(self, key: str) -> Callable[[asyncio.Task], None]:
+        """
+        Build the callback releasing the in-flight slot of a key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Callable[[asyncio.Task], None]: The done callback.
+        """
+        def done(task: asyncio.Task) -> None:
+            self._inflight.pop(key, None)
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning(f"Provider request {key[:12]} failed: {task.exception()}")
+        return done
+
+    async def _request_and_store(
+        self,
+        key: str,
+        provider: str,
+        endpoint: str,
+        params: dict[str, Any],
+        request: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Call the provider and store its payload.
+
+        Args:
+            key (str): The cache key.
+            provider (str): The provider name.
+            endpoint (str): The provider endpoint.
+            params (dict[str, Any]): The request parameters.
+            request (Callable[[], Awaitable[Any]]): Performs the request.
+
+        Returns:
+            Any: The fresh payload.
+        """
+        payload = await request()
+        await self._write(key, provider, endpoint, params, payload)
+        return payload
+
+    async def _read(self, key: str) -> Optional[tuple[Any, float]]:
+        """
+        Read an entry and its age. Storage errors are logged and treated as misses.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[tuple[Any, float]]: The payload and its age in seconds, or None.
+        """
+        try:
+            async with self.database.session() as session:
+                result = await session.execute(
+                    select(ProviderResponse.payload, ProviderResponse.fetched_at).where(
+                        ProviderResponse.cache_key == key
+                    )
+                )
+                row = result.first()
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Provider response cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        age = (datetime.now(timezone.utc) - row.fetched_at).total_seconds()
+        return json.loads(zlib.decompress(row.payload)), age
+
+    async def _write(
+        self, key: str, provider: str, endpoint: str, params: dict[str, Any], payload: Any
+    ) -> None:
+        """
+        Store the compressed payload of a request. Storage errors are logged and ignored.
+
+        Args:
+            key (str): The cache key.
+            provider (str): The provider name.
+            endpoint (str): The provider endpoint.
+            params (dict[str, Any]): The request parameters.
+            payload (Any): The JSON payload.
+        """
+        compressed = zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+        statement = insert(ProviderResponse).values(
+            cache_key=key,
+            provider=provider,
+            endpoint=endpoint,
+            params=self.normalize_params(params),
+            payload=compressed,
+            fetched_at=datetime.now(timezone.utc),
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[ProviderResponse.cache_key],
+            set_={"payload": statement.excluded.payload, "fetched_at": statement.excluded.fetched_at},
+        )
+        try:
+            async with self.database.engine.begin() as connection:
+                await connection.execute(statement)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Provider response cache write failed: {e}")
+
+    def get_metrics(self) -> dict[str, float]:
+        """
+        Report the cache hits, stale hits, misses and background refreshes.
+
+        Returns:
+            dict[str, float]: The cache metrics.
+        """
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 4) if lookups else 0.0,
+            "refreshes": self.refreshes,
+            "refreshing": len(self._inflight),
+            "errors": self.errors,
+        }
@@ -0,0 +1,102 @@
+import logging
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from domain.ports.score_cache import ScoreCachePort
+from infrastructure.dto.database.compatibility_score import CompatibilityScoreCache
+from infrastructure.services.database_engine import DatabaseEngine
+
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseScoreCache(ScoreCachePort):
+    """
+    Cache of the compatibility scores stored in PostgreSQL.
+    Entries never expire: a change of profile, job, model or prompt produces a new key.
+    """
+
+    def __init__(self, database: DatabaseEngine):
+        """
+        Initialize the cache.
+
+        Args:
+            database (DatabaseEngine): Registry of the shared engine.
+        """
+        self.database = database
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+
+    async def get_scores(self, keys: list[str]) -> dict[str, int]:
+        """
+        Look up the scores of several keys in one query. Storage errors are logged and treated as misses.
+
+        Args:
+            keys (list[str]): The score keys.
+
+        Returns:
+            dict[str, int]: The cached scores, keyed by score key.
+        """
+        if not keys:
+            return {}
+        try:
+            async with self.database.session() as session:
+                result = await session.execute(
+                    select(CompatibilityScoreCache.cache_key, CompatibilityScoreCache.score).where(
+                        CompatibilityScoreCache.cache_key.in_(set(keys))
+                    )
+                )
+                scores = {row.cache_key: row.score for row in result}
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Compatibility score cache read failed: {e}")
+            scores = {}
+        self.hits += sum(1 for key in keys if key in scores)
+        self.misses += sum(1 for key in keys if key not in scores)
+        return scores
+
+    async def save_scores(self, scores: dict[str, int], model: str, prompt_version: str) -> None:
+        """
+        Store computed scores. Storage errors are logged and ignored.
+
+        Args:
+            scores (dict[str, int]): The scores, keyed by score key.
+            model (str): The model that computed the scores.
+            prompt_version (str): Version of the scoring prompt.
+        """
+        if not scores:
+            return
+        statement = insert(CompatibilityScoreCache).values(
+            [
+                {"cache_key": key, "model": model, "prompt_version": prompt_version, "score": score}
+                for key, score in scores.items()
+            ]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[CompatibilityScoreCache.cache_key],
+            set_={"score": statement.excluded.score, "created_at": statement.excluded.created_at},
+        )
+        try:
+            async with self.database.engine.begin() as connection:
+                await connection.execute(statement)
+            self.writes += len(scores)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Compatibility score cache write failed: {e}")
+
+    def get_metrics(self) -> dict[str, float]:
+        """
+        Report the cache hits, misses and stored scores.
+
+        Returns:
+            dict[str, float]: The cache metrics.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "writes": self.writes,
+            "errors": self.errors,
+        }
@@ -1,4 +1,5 @@
-from typing import Dict
+from typing import Dict, Optional
+from domain.entities.pipeline_stats import StageStats
 from domain.ports.task_manager import TaskManagerPort
 from domain.entities.task import Task
 
@@ -26,12 +27,25 @@ class InMemoryTaskManager(TaskManagerPort):
         self.tasks[task_id] = task
         return task
 
-    async def update_task(self, task_id: str, message: str, status: str) -> Task:
+    async def update_task(
+        self,
+        task_id: str,
+        message: str,
+        status: str,
+        stages: Optional[list[StageStats]] = None,
+        enrichment_startup_seconds: Optional[float] = None,
+        prefiltered_jobs: Optional[int] = None,
+    ) -> Task:
         """
         Update the status of a background task.
 
         Args:
             task_id (str): Unique task identifier.
+            stages (Optional[list[StageStats]]): Progress of the pipeline stages, unchanged when None.
+            enrichment_startup_seconds (Optional[float]): Startup latency of an enrichment, the
+                longest one is kept.
+            prefiltered_jobs (Optional[int]): Number of jobs scored by the pre-filter so far,
+                unchanged when None.
 
         Returns:
             str: The updated task ID.
@@ -39,6 +53,14 @@ class InMemoryTaskManager(TaskManagerPort):
         if task_id in self.tasks:
             self.tasks[task_id].message = message
             self.tasks[task_id].status = status
+            if stages is not None:
+                self.tasks[task_id].stages = stages
+            if enrichment_startup_seconds is not None:
+                self.tasks[task_id].enrichment_startup_seconds = max(
+                    self.tasks[task_id].enrichment_startup_seconds or 0.0, enrichment_startup_seconds
+                )
+            if prefiltered_jobs is not None:
+                self.tasks[task_id].prefiltered_jobs = prefiltered_jobs
             return self.tasks[task_id]
         else:
             raise ValueError(f"Task with ID {task_id} not found.")
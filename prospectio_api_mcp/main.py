@@ -3,56 +3,124 @@ from typing import Callable
 from fastapi import FastAPI, BackgroundTasks
 from application.api.leads_routes import leads_router
 from application.api.profile_routes import profile_router
+from application.api.metrics_routes import metrics_router
+from application.api.debug_routes import debug_router
 from domain.ports import task_manager
+from infrastructure.api.llm_scheduler import LLMScheduler
+from infrastructure.services.chain_registry import ChainRegistry
 from infrastructure.services.compatibility_score import CompatibilityScoreLLM
 from infrastructure.services.enrich_leads_agent.agent import EnrichLeadsAgent
 from infrastructure.services.enrich_leads_agent.tools.crawl_client import CrawlClient
 from infrastructure.services.generate_message import GenerateMessageLLM
 from infrastructure.services.profile_database import ProfileDatabase
+from infrastructure.services.database_engine import DatabaseEngine
+from infrastructure.services.embedder import LLMEmbedder
+from infrastructure.services.leads_cache import create_leads_cache
+from infrastructure.services.response_cache import DatabaseResponseCache
+from infrastructure.services.score_cache import DatabaseScoreCache
 from application.api.mcp_routes import mcp_prospectio
-from config import ActiveJobsDBConfig, JsearchConfig
+from config import ActiveJobsDBConfig, HttpClientConfig, JsearchConfig
 from domain.services.leads.strategies.active_jobs_db import ActiveJobsDBStrategy
 from domain.services.leads.strategies.jsearch import JsearchStrategy
+from infrastructure.api.client import BaseApiClient
+from infrastructure.api.rapidapi_key_pool import RapidApiKeyPool
 from infrastructure.services.active_jobs_db import ActiveJobsDBAPI
 from infrastructure.services.jsearch import JsearchAPI
+from infrastructure.services.query_metrics import QueryMetrics
 from config import AppConfig
 from infrastructure.services.leads_database import LeadsDatabase
-from config import DatabaseConfig
+from infrastructure.services.pagination import Paginator
+from config import CacheConfig, DatabaseConfig, EmbeddingConfig, ResponseCacheConfig, ScoreCacheConfig
 from config import AppConfig
 from fastapi.middleware.cors import CORSMiddleware
 from infrastructure.services.task_manager import InMemoryTaskManager
 
 
+http_client = BaseApiClient(HttpClientConfig())
+jsearch_keys = RapidApiKeyPool(JsearchConfig().RAPIDAPI_API_KEY, JsearchConfig().RAPIDAPI_KEY_COOLDOWN) # type: ignore
+active_jobs_db_keys = RapidApiKeyPool(
+    ActiveJobsDBConfig().RAPIDAPI_API_KEY, ActiveJobsDBConfig().RAPIDAPI_KEY_COOLDOWN # type: ignore
+)
+jsearch_queries = QueryMetrics()
+active_jobs_db_queries = QueryMetrics()
+database_engine = DatabaseEngine(DatabaseConfig()) # type: ignore
+response_cache_config = ResponseCacheConfig()
+response_cache = DatabaseResponseCache(
+    database_engine,
+    response_cache_config.RESPONSE_CACHE_TTL,
+    response_cache_config.RESPONSE_CACHE_TTLS,
+    response_cache_config.RESPONSE_CACHE_STALE_TTL,
+) if response_cache_config.RESPONSE_CACHE_ENABLED else None
+
 _LEADS_STRATEGIES: dict[str, Callable] = {
     "jsearch": lambda location, job_title: JsearchStrategy(
-        port=JsearchAPI(JsearchConfig()), location=location, job_title=job_title # type: ignore
+        port=JsearchAPI(JsearchConfig(), http_client, jsearch_keys, response_cache, jsearch_queries), location=location, job_title=job_title # type: ignore
     ),
     "active_jobs_db": lambda location, job_title: ActiveJobsDBStrategy(
-        port=ActiveJobsDBAPI(ActiveJobsDBConfig()), # type: ignore
+        port=ActiveJobsDBAPI(ActiveJobsDBConfig(), http_client, active_jobs_db_keys, response_cache, active_jobs_db_queries), # type: ignore
         location=location,
         job_title=job_title,
     ),
 }
 
 in_memory_task_manager = InMemoryTaskManager()
+chain_registry = ChainRegistry.shared()
+score_cache = DatabaseScoreCache(database_engine) if ScoreCacheConfig().SCORE_CACHE_ENABLED else None
+compatibility_score = CompatibilityScoreLLM(score_cache, chain_registry)
+leads_cache = create_leads_cache(CacheConfig()) # type: ignore
+profile_database = ProfileDatabase(database_engine)
+embedding_config = EmbeddingConfig()
+embedder = LLMEmbedder(embedding_config) if embedding_config.EMBEDDINGS_ENABLED else None
+enrich_leads_agent = EnrichLeadsAgent(in_memory_task_manager)
 
 leads_routes = leads_router(
     _LEADS_STRATEGIES,
-    LeadsDatabase(DatabaseConfig().DATABASE_URL), # type: ignore
-    CompatibilityScoreLLM(),
-    ProfileDatabase(DatabaseConfig().DATABASE_URL), # type: ignore
-    EnrichLeadsAgent(in_memory_task_manager),
-    GenerateMessageLLM(),
-    in_memory_task_manager
+    LeadsDatabase(
+        database_engine,
+        Paginator(DatabaseConfig().COUNT_STRATEGY, DatabaseConfig().COUNT_CACHE_TTL), # type: ignore
+        DatabaseConfig().BULK_INSERT, # type: ignore
+        leads_cache,
+    ),
+    compatibility_score,
+    profile_database,
+    enrich_leads_agent,
+    GenerateMessageLLM(chain_registry),
+    in_memory_task_manager,
+    leads_cache,
+    embedder,
 )
 
-profile_routes = profile_router(ProfileDatabase(DatabaseConfig().DATABASE_URL)) # type: ignore
+profile_routes = profile_router(profile_database)
+
+metrics_routes = metrics_router(
+    {
+        "database": database_engine,
+        "http": http_client,
+        "jsearch_keys": jsearch_keys,
+        "active_jobs_db_keys": active_jobs_db_keys,
+        "jsearch_queries": jsearch_queries,
+        "active_jobs_db_queries": active_jobs_db_queries,
+        "compatibility_score": compatibility_score,
+        "chains": chain_registry,
+        "llm_scheduler": LLMScheduler.shared(),
+        "enrich_contacts": enrich_leads_agent.EnrichLeadsNodes,
+        **({"leads_cache": leads_cache} if leads_cache else {}),
+        **({"response_cache": response_cache} if response_cache else {}),
+        **({"score_cache": score_cache} if score_cache else {}),
+        **({"embedder": embedder} if embedder else {}),
+    }
+)
+
+
+debug_routes = debug_router(enrich_leads_agent)
 
 
 @contextlib.asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage the lifespan of both HTTP and stdio MCP servers."""
     async with contextlib.AsyncExitStack() as stack:
+        await stack.enter_async_context(database_engine.run())
+        await stack.enter_async_context(http_client.run())
         await CrawlClient().crawl_page("https://www.google.fr")
         if AppConfig().EXPOSE == "streamable": # type: ignore
             await stack.enter_async_context(mcp_prospectio.session_manager.run())
@@ -76,6 +144,8 @@ MCP_PATH = "/prospectio/"
 
 app.include_router(leads_routes, prefix=REST_PATH, tags=["Prospects"])
 app.include_router(profile_routes, prefix=REST_PATH, tags=["Profile"])
+app.include_router(metrics_routes, prefix=REST_PATH, tags=["Metrics"])
+app.include_router(debug_routes, prefix=REST_PATH, tags=["Debug"])
 
 if AppConfig().EXPOSE == "streamable": # type: ignore
     app.mount(MCP_PATH, mcp_prospectio.streamable_http_app())
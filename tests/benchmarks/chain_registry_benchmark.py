@@ -0,0 +1,69 @@
+"""
+Benchmark of the per-call overhead of preparing an LLM chain, without calling the LLM.
+Compares reading the prompt file and building the template and the structured output
+runnable on every call with taking the chain from the registry.
+
+Usage (from the repository root, no database or network needed):
+
+    python tests/benchmarks/chain_registry_benchmark.py --runs 2000
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "prospectio_api_mcp"))
+
+from langchain_core.prompts import ChatPromptTemplate  # noqa: E402
+from langchain_ollama import ChatOllama  # noqa: E402
+from domain.services.prompt_loader import PromptLoader  # noqa: E402
+from domain.services.prompt_registry import PromptRegistry  # noqa: E402
+from infrastructure.services.chain_registry import ChainRegistry  # noqa: E402
+from infrastructure.services.enrich_leads_agent.models.contact_info import ContactInfo  # noqa: E402
+
+
+def summary(name: str, samples: list[float]) -> str:
+    samples = sorted(samples)
+    p50 = statistics.median(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return f"{name:<22} p50={p50 * 1e6:.1f}us p99={p99 * 1e6:.1f}us mean={statistics.mean(samples) * 1e6:.1f}us"
+
+
+def measure(prepare: Callable[[], object], runs: int) -> list[float]:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        prepare()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main(args: argparse.Namespace) -> None:
+    # The client is only used to build the runnables, nothing is sent to Ollama
+    llm_client = ChatOllama(model="qwen2.5:7b")
+
+    def rebuilt() -> object:
+        prompt = PromptLoader().load_prompt("contact_info")
+        template = ChatPromptTemplate.from_messages([("user", prompt)])
+        return template | llm_client.with_structured_output(ContactInfo)
+
+    registry = ChainRegistry(PromptRegistry(hot_reload=args.hot_reload, reload_interval=0.0))
+
+    def cached() -> object:
+        return registry.chain("contact_info", llm_client, ContactInfo)
+
+    print(f"{args.runs} chain preparations")
+    print(summary("rebuilt on every call", measure(rebuilt, args.runs)))
+    print(summary("registry", measure(cached, args.runs)))
+    print(registry.get_metrics())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=2000)
+    parser.add_argument(
+        "--hot-reload", action="store_true", help="Check the prompt file on every call (worst case)"
+    )
+    main(parser.parse_args())
@@ -0,0 +1,111 @@
+"""
+Benchmark of the contact extraction from LinkedIn search results, one result per LLM call
+compared with batches of results, on the fixture set of fixtures/contact_search_results.json.
+
+Without --live, only the prompts are rendered and their tokens estimated (no LLM needed).
+With --live, the extractions are sent to ENRICH_MODEL and their latency and token usage
+reported, the results of a company being extracted concurrently as in the enrichment agent.
+
+Usage (from the repository root):
+
+    python tests/benchmarks/contact_batch_benchmark.py --batch-sizes 1 5 10
+    python -m dotenv -f .env run -- python tests/benchmarks/contact_batch_benchmark.py --live --batch-sizes 1 5
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "prospectio_api_mcp"))
+
+from langchain_core.callbacks import get_usage_metadata_callback  # noqa: E402
+from infrastructure.api.llm_scheduler import CHARS_PER_TOKEN, LLMScheduler  # noqa: E402
+from infrastructure.services.enrich_leads_agent.models.search_results_model import SearchResultModel  # noqa: E402
+
+FIXTURE = Path(__file__).parent / "fixtures" / "contact_search_results.json"
+
+
+def load() -> list[tuple[str, list[SearchResultModel]]]:
+    return [
+        (company["company"], [SearchResultModel(**result) for result in company["results"]])
+        for company in json.loads(FIXTURE.read_text())
+    ]
+
+
+def batches(results: list[SearchResultModel], size: int) -> list[list[SearchResultModel]]:
+    return [results[i:i + size] for i in range(0, len(results), size)]
+
+
+def estimate(fixture: list[tuple[str, list[SearchResultModel]]], sizes: list[int]) -> None:
+    # Rendering the prompts needs no client nor LLM configuration
+    from domain.services.prompt_registry import PromptRegistry
+    from infrastructure.services.chain_registry import ChainRegistry
+
+    registry = ChainRegistry(PromptRegistry(), LLMScheduler(1))
+    single = registry.template("contact_info")
+    batch = registry.template("contact_info_batch")
+    total = sum(len(results) for _, results in fixture)
+    baseline = None
+    print(f"{len(fixture)} companies, {total} search results (estimated prompt tokens)")
+    for size in sizes:
+        calls = tokens = 0
+        for company, results in fixture:
+            for group in batches(results, size):
+                if len(group) == 1:
+                    prompt = single.format(company=company, title=group[0].title, url=group[0].url, snippet=group[0].snippet)
+                else:
+                    lines = "\n".join(
+                        json.dumps(result.model_dump(include={"url", "title", "snippet"}), ensure_ascii=False)
+                        for result in group
+                    )
+                    prompt = batch.format(company=company, results=lines)
+                calls += 1
+                tokens += len(prompt) // CHARS_PER_TOKEN
+        baseline = baseline or tokens
+        print(
+            f"batch size {size:>3}: {calls:>3} calls, {tokens:>6} prompt tokens, "
+            f"{tokens / total:.0f} per result ({100 * (1 - tokens / baseline):.0f}% fewer)"
+        )
+
+
+async def live(fixture: list[tuple[str, list[SearchResultModel]]], sizes: list[int]) -> None:
+    from config import LLMConfig
+    from infrastructure.api.llm_client_factory import LLMClientFactory
+    from infrastructure.services.enrich_leads_agent.chains.enrich_chain import EnrichChain
+
+    config = LLMConfig()  # type: ignore
+    chain = EnrichChain(LLMClientFactory(model=config.ENRICH_MODEL, config=config).create_client())
+    total = sum(len(results) for _, results in fixture)
+    print(f"{len(fixture)} companies, {total} search results on {config.ENRICH_MODEL}")
+    for size in sizes:
+        extracted = 0
+        with get_usage_metadata_callback() as usage:
+            start = time.perf_counter()
+            for company, results in fixture:
+                found = await asyncio.gather(
+                    *(chain.extract_contacts_from_web_search(company, group) for group in batches(results, size))
+                )
+                extracted += sum(1 for contacts in found for contact in contacts.values() if contact)
+            seconds = time.perf_counter() - start
+        tokens = sum(model["total_tokens"] for model in usage.usage_metadata.values())
+        print(
+            f"batch size {size:>3}: {seconds:.1f}s ({seconds / len(fixture):.2f}s per company), "
+            f"{tokens} tokens ({tokens / total:.0f} per result), {extracted}/{total} contacts"
+        )
+
+
+def main(args: argparse.Namespace) -> None:
+    fixture = load()
+    if args.live:
+        asyncio.run(live(fixture, args.batch_sizes))
+    else:
+        estimate(fixture, args.batch_sizes)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 5, 10])
+    parser.add_argument("--live", action="store_true", help="Send the extractions to ENRICH_MODEL")
+    main(parser.parse_args())
@@ -0,0 +1,125 @@
+"""
+Benchmark of LeadsDatabase.get_leads against the previous multi-query read path.
+
+Usage (from the repository root, with DATABASE_URL pointing at a disposable database):
+
+    python tests/benchmarks/get_leads_benchmark.py --seed 2000 --runs 200 --limit 3
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "prospectio_api_mcp"))
+
+from sqlalchemy import select  # noqa: E402
+from config import DatabaseConfig  # noqa: E402
+from domain.entities.company import Company, CompanyEntity  # noqa: E402
+from domain.entities.contact import Contact, ContactEntity  # noqa: E402
+from domain.entities.job import Job, JobEntity  # noqa: E402
+from domain.entities.leads import Leads  # noqa: E402
+from infrastructure.dto.database.company import Company as CompanyDB  # noqa: E402
+from infrastructure.dto.database.contact import Contact as ContactDB  # noqa: E402
+from infrastructure.dto.database.job import Job as JobDB  # noqa: E402
+from infrastructure.services.database_engine import DatabaseEngine  # noqa: E402
+from infrastructure.services.leads_database import LeadsDatabase  # noqa: E402
+
+
+async def multi_query_get_leads(db: LeadsDatabase, offset: int, limit: int) -> Leads:
+    """
+    Previous read path: count, job page, companies IN (...), contacts IN (...) OR IN (...).
+    """
+    async with db.database.session() as session:
+        total_jobs = await db.paginator.count(session, JobDB)
+        job_dbs = (await session.execute(db._jobs_page_statement(offset, limit, None))).scalars().all()
+        job_ids = [job_db.id for job_db in job_dbs]
+        company_ids = list({job_db.company_id for job_db in job_dbs if job_db.company_id})
+        company_dbs = (
+            (await session.execute(select(CompanyDB).where(CompanyDB.id.in_(company_ids)))).scalars().all()
+            if company_ids else []
+        )
+        companies_map = {company_db.id: company_db.name for company_db in company_dbs}
+        jobs_map = {job_db.id: job_db.job_title for job_db in job_dbs}
+        contact_dbs = (
+            await session.execute(
+                select(ContactDB).where(
+                    ContactDB.job_id.in_(job_ids) | ContactDB.company_id.in_(company_ids)
+                )
+            )
+        ).scalars().all()
+        return Leads(
+            companies=CompanyEntity(companies=[db._convert_db_to_company(c) for c in company_dbs]),  # type: ignore
+            jobs=JobEntity(jobs=[db._convert_db_to_job(j, companies_map.get(j.company_id)) for j in job_dbs]),  # type: ignore
+            contacts=ContactEntity(contacts=[  # type: ignore
+                db._convert_db_to_contact(c, companies_map.get(c.company_id), jobs_map.get(c.job_id))  # type: ignore
+                for c in contact_dbs
+            ]),
+            pages=db.paginator.pages(total_jobs, limit),
+        )
+
+
+async def seed(db: LeadsDatabase, count: int) -> None:
+    """
+    Insert count companies, each with one job and two contacts.
+    """
+    tag = uuid4().hex[:8]
+    companies = [Company(id=str(uuid4()), name=f"bench {tag} company {i}") for i in range(count)]  # type: ignore
+    jobs = [
+        Job(id=str(uuid4()), company_id=company.id, job_title=f"engineer {i}", location="paris",  # type: ignore
+            date_creation="2025-01-01T00:00:00", compatibility_score=i % 100)
+        for i, company in enumerate(companies)
+    ]
+    contacts = [
+        Contact(company_id=job.company_id, job_id=job.id, name=f"contact {tag} {i} {n}",  # type: ignore
+                title="cto", email=[f"c{i}{n}@example.com"])
+        for i, job in enumerate(jobs) for n in range(2)
+    ]
+    await db.save_leads(Leads(
+        companies=CompanyEntity(companies=companies),  # type: ignore
+        jobs=JobEntity(jobs=jobs),  # type: ignore
+        contacts=ContactEntity(contacts=contacts),  # type: ignore
+    ))
+
+
+def summary(name: str, samples: list[float]) -> str:
+    samples = sorted(samples)
+    p50 = statistics.median(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return f"{name:<12} p50={p50 * 1000:.2f}ms p99={p99 * 1000:.2f}ms mean={statistics.mean(samples) * 1000:.2f}ms"
+
+
+async def main(args: argparse.Namespace) -> None:
+    database = DatabaseEngine(DatabaseConfig())  # type: ignore
+    db = LeadsDatabase(database)
+    async with database.run():
+        if args.seed:
+            await seed(db, args.seed)
+        offsets = [i * args.limit for i in range(args.pages)]
+        for offset in offsets:
+            expected = await multi_query_get_leads(db, offset, args.limit)
+            actual = await db.get_leads(offset, args.limit)
+            for field, key in (("jobs", "jobs"), ("companies", "companies"), ("contacts", "contacts")):
+                expected_ids = {item.id for item in getattr(getattr(expected, field), key)}
+                actual_ids = {item.id for item in getattr(getattr(actual, field), key)}
+                assert expected_ids == actual_ids, f"{field} differ at offset {offset}"
+        timings: dict[str, list[float]] = {"multi-query": [], "single": []}
+        for run in range(args.runs):
+            offset = offsets[run % len(offsets)]
+            for name, read in (("multi-query", multi_query_get_leads), ("single", LeadsDatabase.get_leads)):
+                start = time.perf_counter()
+                await read(db, offset, args.limit)
+                timings[name].append(time.perf_counter() - start)
+        for name, samples in timings.items():
+            print(summary(name, samples))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seed", type=int, default=0, help="Number of leads to insert before measuring")
+    parser.add_argument("--runs", type=int, default=200, help="Number of measured reads per implementation")
+    parser.add_argument("--limit", type=int, default=3, help="Page size")
+    parser.add_argument("--pages", type=int, default=20, help="Number of distinct pages to read")
+    asyncio.run(main(parser.parse_args()))
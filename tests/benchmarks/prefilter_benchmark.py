@@ -0,0 +1,84 @@
+"""
+Benchmark of the compatibility pre-filter on synthetic job descriptions.
+Reports the time spent counting the query terms in the descriptions and the time of the
+vectorized BM25 scoring, separately.
+
+Usage (from the repository root, no database or network needed):
+
+    python tests/benchmarks/prefilter_benchmark.py --jobs 5000 --words 400 --runs 20
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "prospectio_api_mcp"))
+
+import numpy as np  # noqa: E402
+from domain.entities.job import Job  # noqa: E402
+from domain.entities.profile import Profile  # noqa: E402
+from domain.entities.work_experience import WorkExperience  # noqa: E402
+from domain.services.leads.prefilter import JobPrefilter  # noqa: E402
+
+VOCABULARY = (
+    "python java react kubernetes docker sales marketing finance data cloud aws rust go fastapi "
+    "postgresql team product customer growth platform engineer developer senior manager remote "
+    "we are looking for an experienced to join our and with the of in on at you will build"
+).split()
+
+LOCATIONS = ["Paris, France", "Lyon", "Remote", "Berlin, Germany", "London", ""]
+
+
+def summary(name: str, samples: list[float]) -> str:
+    samples = sorted(samples)
+    p50 = statistics.median(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return f"{name:<16} p50={p50 * 1000:.2f}ms p99={p99 * 1000:.2f}ms mean={statistics.mean(samples) * 1000:.2f}ms"
+
+
+def main(args: argparse.Namespace) -> None:
+    random.seed(0)
+    jobs = [
+        Job(  # type: ignore
+            id=str(i),
+            description=" ".join(random.choices(VOCABULARY, k=args.words)),
+            location=random.choice(LOCATIONS),
+        )
+        for i in range(args.jobs)
+    ]
+    profile = Profile(  # type: ignore
+        job_title="Senior Python Developer",
+        location="Paris",
+        technos=["Python", "FastAPI", "PostgreSQL", "Docker", "AWS"],
+        work_experience=[WorkExperience(position="Backend engineer")],  # type: ignore
+    )
+    prefilter = JobPrefilter(threshold=args.threshold)
+    query = prefilter.query(profile)
+    terms = sorted(query, key=len, reverse=True)
+    weights = np.array([query[term] for term in terms])
+
+    timings: dict[str, list[float]] = {"term counting": [], "bm25 scoring": [], "split": []}
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        tf, lengths = prefilter.term_frequencies(terms, jobs)
+        timings["term counting"].append(time.perf_counter() - start)
+        start = time.perf_counter()
+        prefilter.bm25(tf, lengths, weights)
+        timings["bm25 scoring"].append(time.perf_counter() - start)
+        start = time.perf_counter()
+        candidates, skipped = prefilter.split(profile, jobs)
+        timings["split"].append(time.perf_counter() - start)
+    print(f"{args.jobs} jobs of {args.words} words, {len(skipped)} under the threshold {args.threshold}")
+    for name, samples in timings.items():
+        print(summary(name, samples))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=5000, help="Number of jobs")
+    parser.add_argument("--words", type=int, default=400, help="Words per description")
+    parser.add_argument("--runs", type=int, default=20, help="Number of measured runs")
+    parser.add_argument("--threshold", type=float, default=0.3, help="Pre-filter threshold")
+    main(parser.parse_args())
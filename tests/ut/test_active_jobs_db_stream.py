@@ -0,0 +1,128 @@
+import asyncio
+import httpx
+import pytest
+from config import ActiveJobsDBConfig
+from infrastructure.api.client import BaseApiClient
+from infrastructure.services.active_jobs_db import ActiveJobsDBAPI
+
+
+class FakeActiveJobsDBServer:
+    """
+    In-process Active Jobs DB endpoint serving a fixed number of jobs by offset.
+    """
+
+    def __init__(self, total: int, delay: float = 0.0):
+        """
+        Initialize the server.
+
+        Args:
+            total: Number of jobs matching every search.
+            delay: Seconds spent on each request.
+        """
+        self.total = total
+        self.delay = delay
+        self.calls: list[tuple[int, int]] = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        """
+        Serve the requested offset page.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            httpx.Response: The jobs between offset and offset + limit.
+        """
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        self.calls.append((offset, limit))
+        await asyncio.sleep(self.delay)
+        jobs = [
+            {"id": f"job_{index}", "title": "Python Developer", "organization": f"Company {index}"}
+            for index in range(offset, min(offset + limit, self.total))
+        ]
+        return httpx.Response(200, json=jobs)
+
+
+def active_jobs_db_api(server: FakeActiveJobsDBServer, **settings) -> ActiveJobsDBAPI:
+    """
+    Create an adapter served by the fake server.
+
+    Args:
+        server: The fake Active Jobs DB server.
+        settings: Configuration overrides.
+
+    Returns:
+        ActiveJobsDBAPI: The adapter.
+    """
+    config = ActiveJobsDBConfig(
+        ACTIVE_JOBS_DB_URL="https://active-jobs-db.p.rapidapi.com",
+        RAPIDAPI_API_KEY=["test-rapidapi-key"],
+        **settings,
+    )
+    return ActiveJobsDBAPI(config, BaseApiClient(transport=httpx.MockTransport(server.handler)))
+
+
+class TestActiveJobsDBStream:
+    """Test suite for the offset-paged Active Jobs DB fetch."""
+
+    @pytest.mark.asyncio
+    async def test_walks_offsets_until_short_page(self):
+        """
+        Test that pages are fetched until one comes back short.
+        """
+        server = FakeActiveJobsDBServer(total=25)
+        api = active_jobs_db_api(server, ACTIVE_JOBS_DB_PAGE_SIZE=10, ACTIVE_JOBS_DB_MAX_JOBS=100)
+
+        chunks = [len(leads.jobs.jobs) async for leads in api.stream_leads("France", ["python"])]
+
+        assert chunks == [10, 10, 5]
+        assert server.calls == [(0, 10), (10, 10), (20, 10)]
+        assert api.query_metrics.get_metrics()["queries"] == 3
+        assert api.query_metrics.get_metrics()["results_per_query"] == round(25 / 3, 3)
+
+    @pytest.mark.asyncio
+    async def test_stops_at_target_count(self):
+        """
+        Test that the last page is shrunk to reach exactly the target count.
+        """
+        server = FakeActiveJobsDBServer(total=100)
+        api = active_jobs_db_api(server, ACTIVE_JOBS_DB_PAGE_SIZE=10, ACTIVE_JOBS_DB_MAX_JOBS=15)
+
+        leads = await api.fetch_leads("France", ["python"])
+
+        assert len(leads.jobs.jobs) == len(leads.companies.companies) == 15
+        assert server.calls == [(0, 10), (10, 5)]
+
+    @pytest.mark.asyncio
+    async def test_stops_when_time_budget_is_spent(self):
+        """
+        Test that no page is requested once the time budget is spent.
+        """
+        server = FakeActiveJobsDBServer(total=100, delay=0.02)
+        api = active_jobs_db_api(
+            server, ACTIVE_JOBS_DB_PAGE_SIZE=10, ACTIVE_JOBS_DB_MAX_JOBS=100, ACTIVE_JOBS_DB_TIME_BUDGET=0.01
+        )
+
+        leads = await api.fetch_leads("France", ["python"])
+
+        assert len(leads.jobs.jobs) == 10
+        assert server.calls == [(0, 10)]
+
+    @pytest.mark.asyncio
+    async def test_prefetches_next_page_while_caller_processes(self):
+        """
+        Test that the next page is already requested when a chunk is yielded,
+        and that an empty first page yields nothing.
+        """
+        server = FakeActiveJobsDBServer(total=30)
+        api = active_jobs_db_api(server, ACTIVE_JOBS_DB_PAGE_SIZE=10, ACTIVE_JOBS_DB_MAX_JOBS=100)
+
+        async for _ in api.stream_leads("France", ["python"]):
+            await asyncio.sleep(0.01)
+            break
+        assert server.calls[:2] == [(0, 10), (10, 10)]
+
+        empty = FakeActiveJobsDBServer(total=0)
+        api = active_jobs_db_api(empty)
+        assert [leads async for leads in api.stream_leads("France", ["python"])] == []
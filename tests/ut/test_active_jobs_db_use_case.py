@@ -7,6 +7,7 @@ from domain.entities.contact import ContactEntity
 from domain.entities.job import Job, JobEntity
 from domain.entities.leads import Leads
 from domain.entities.profile import Profile
+from domain.entities.upsert_result import UpsertResult
 from domain.entities.work_experience import WorkExperience
 from domain.ports.profile_respository import ProfileRepositoryPort
 from domain.ports.task_manager import TaskManagerPort
@@ -26,6 +27,7 @@ from infrastructure.services.enrich_leads_agent.tools.crawl_client import CrawlC
 from infrastructure.services.enrich_leads_agent.tools.duck_duck_go_client import DuckDuckGoClient
 from infrastructure.services.leads_database import LeadsDatabase
 from domain.entities.leads_result import LeadsResult
+from infrastructure.services.database_engine import DatabaseEngine
 from infrastructure.services.profile_database import ProfileDatabase
 from config import DatabaseConfig, ActiveJobsDBConfig
 from domain.ports.enrich_leads import EnrichLeadsPort
@@ -116,7 +118,7 @@ class TestActiveJobsDBUseCase:
         Returns:
             ProfileDatabase: Configured profile database repository.
         """
-        return ProfileDatabase(database_config.DATABASE_URL)
+        return ProfileDatabase(DatabaseEngine(database_config))
 
     @pytest.fixture
     def active_jobs_db_config(self) -> ActiveJobsDBConfig:
@@ -281,7 +283,7 @@ class TestActiveJobsDBUseCase:
         Returns:
             ActiveJobsDBStrategy: Configured Active Jobs DB strategy.
         """
-        return LeadsDatabase(DatabaseConfig().DATABASE_URL) # type: ignore
+        return LeadsDatabase(DatabaseEngine(DatabaseConfig())) # type: ignore
     
     @pytest.fixture
     def compatibility_score_llm(self) -> CompatibilityScore:
@@ -301,7 +303,7 @@ class TestActiveJobsDBUseCase:
         Returns:
             ProfileRepositoryPort: Mocked profile repository.
         """
-        return ProfileDatabase(DatabaseConfig().DATABASE_URL) # type: ignore
+        return ProfileDatabase(DatabaseEngine(DatabaseConfig())) # type: ignore
     
     @pytest.fixture
     def leads_processor(self) -> LeadsProcessor:
@@ -604,13 +606,12 @@ class TestActiveJobsDBUseCase:
             mock_crawl.return_value = crawl_page
             mock_search.return_value = search
 
-            mock_repo.save_leads = AsyncMock(return_value=None)
+            mock_repo.save_leads = AsyncMock(side_effect=lambda leads: UpsertResult(inserted=[j.id for j in leads.jobs.jobs] + [c.id for c in leads.contacts.contacts])) # type: ignore
             mock_repo.get_jobs = AsyncMock(return_value=JobEntity(jobs=[])) # type: ignore
             mock_repo.get_companies = AsyncMock(return_value=CompanyEntity(companies=[], pages=1))
             mock_repo.get_contacts = AsyncMock(return_value=ContactEntity(contacts=[], pages=1)) # type: ignore
-            mock_repo.get_jobs_by_title_and_location = AsyncMock(return_value=JobEntity(jobs=[])) # type: ignore
-            mock_repo.get_companies_by_names = AsyncMock(return_value=CompanyEntity(companies=[])) # type: ignore
-            mock_repo.get_contacts_by_name_and_title = AsyncMock(return_value=ContactEntity(contacts=[])) # type: ignore
+            mock_repo.match_companies = AsyncMock(side_effect=lambda companies: UpsertResult(inserted=[c.id for c in companies.companies])) # type: ignore
+            mock_repo.match_jobs = AsyncMock(side_effect=lambda jobs: UpsertResult(inserted=[j.id for j in jobs.jobs])) # type: ignore
             mock_repo.get_leads = AsyncMock(return_value=None)
 
             result = await use_case.insert_leads()
@@ -674,13 +675,12 @@ class TestActiveJobsDBUseCase:
             mock_crawl.return_value = crawl_page
             mock_search.return_value = search
             
-            mock_repo.save_leads = AsyncMock(return_value=None)
+            mock_repo.save_leads = AsyncMock(side_effect=lambda leads: UpsertResult(inserted=[j.id for j in leads.jobs.jobs] + [c.id for c in leads.contacts.contacts])) # type: ignore
             mock_repo.get_jobs = AsyncMock(return_value=JobEntity(jobs=[])) # type: ignore
             mock_repo.get_companies = AsyncMock(return_value=CompanyEntity(companies=[], pages=1))
             mock_repo.get_contacts = AsyncMock(return_value=ContactEntity(contacts=[], pages=1))
-            mock_repo.get_jobs_by_title_and_location = AsyncMock(return_value=jobs_database)
-            mock_repo.get_companies_by_names = AsyncMock(return_value=companies_database)
-            mock_repo.get_contacts_by_name_and_title = AsyncMock(return_value=ContactEntity(contacts=[])) # type: ignore
+            mock_repo.match_companies = AsyncMock(side_effect=lambda companies: UpsertResult(existing={c.id: companies_database.companies[0].id for c in companies.companies})) # type: ignore
+            mock_repo.match_jobs = AsyncMock(side_effect=lambda jobs: UpsertResult(existing={j.id: jobs_database.jobs[0].id for j in jobs.jobs})) # type: ignore
             mock_repo.get_leads = AsyncMock(return_value=None)
 
             mock_get.return_value = active_jobs_response_mock
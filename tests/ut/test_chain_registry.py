@@ -0,0 +1,103 @@
+import os
+from pathlib import Path
+import pytest
+from langchain_core.runnables import RunnableLambda
+from domain.services.prompt_loader import PromptLoader
+from domain.services.prompt_registry import PromptRegistry
+from infrastructure.services.chain_registry import ChainRegistry
+from infrastructure.services.enrich_leads_agent.models.job_titles import JobTitles
+
+
+class FakeStructuredLLM:
+    """
+    Client recording the structured output runnables it builds.
+    """
+
+    def __init__(self):
+        """
+        Initialize the fake client.
+        """
+        self.built: list[tuple] = []
+
+    def with_structured_output(self, schema, include_raw: bool = False) -> RunnableLambda:
+        """
+        Build a runnable echoing the rendered prompt.
+
+        Args:
+            schema: The output schema.
+            include_raw: Return the raw message along with the parsed output.
+
+        Returns:
+            RunnableLambda: The fake runnable.
+        """
+        self.built.append((schema, include_raw))
+        return RunnableLambda(lambda prompt: prompt.to_string())
+
+
+class TestChainRegistry:
+    """Test suite for the preloaded prompts and the reused chains."""
+
+    @pytest.fixture
+    def loader(self, tmp_path: Path) -> PromptLoader:
+        """
+        Create a loader reading a single prompt from a temporary folder.
+
+        Args:
+            tmp_path: Temporary folder of the test.
+
+        Returns:
+            PromptLoader: The loader.
+        """
+        path = tmp_path / "job_titles.md"
+        path.write_text("Titles for {profile}")
+        loader = PromptLoader()
+        loader.prompt_mapping = {"job_titles": str(path)}
+        return loader
+
+    def test_prompts_are_versioned_by_content(self, loader: PromptLoader) -> None:
+        """
+        Test that a prompt version only depends on its text.
+        """
+        first = PromptRegistry(loader)
+        second = PromptRegistry(loader)
+
+        assert first.get("job_titles").text == "Titles for {profile}"
+        assert first.get("job_titles").version == second.get("job_titles").version
+        assert len(first.version("job_titles")) == 12
+
+    @pytest.mark.asyncio
+    async def test_chain_is_built_once_per_client_and_schema(self, loader: PromptLoader) -> None:
+        """
+        Test that the same chain is returned until the client or the schema changes.
+        """
+        registry = ChainRegistry(PromptRegistry(loader))
+        llm = FakeStructuredLLM()
+
+        chain = registry.chain("job_titles", llm, JobTitles) # type: ignore
+        assert registry.chain("job_titles", llm, JobTitles) is chain # type: ignore
+        assert registry.chain("job_titles", llm, JobTitles, include_raw=True) is not chain # type: ignore
+        assert registry.chain("job_titles", FakeStructuredLLM(), JobTitles) is not chain # type: ignore
+        assert llm.built == [(JobTitles, False), (JobTitles, True)]
+        assert await chain.ainvoke({"profile": "a developer"}) == "Human: Titles for a developer"
+        assert registry.get_metrics()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_hot_reload_rebuilds_changed_prompts(self, loader: PromptLoader) -> None:
+        """
+        Test that an edited prompt file gets a new version and a new chain.
+        """
+        prompts = PromptRegistry(loader, hot_reload=True, reload_interval=0.0)
+        registry = ChainRegistry(prompts)
+        llm = FakeStructuredLLM()
+        chain = registry.chain("job_titles", llm, JobTitles) # type: ignore
+        version = prompts.get("job_titles").version
+
+        path = loader.prompt_path("job_titles")
+        Path(path).write_text("Prospect titles for {profile}")
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+
+        reloaded = registry.chain("job_titles", llm, JobTitles) # type: ignore
+        assert reloaded is not chain
+        assert prompts.get("job_titles").version != version
+        assert await reloaded.ainvoke({"profile": "a developer"}) == "Human: Prospect titles for a developer"
@@ -0,0 +1,298 @@
+import re
+from unittest.mock import patch
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+from domain.entities.compatibility_score import CompatibilityScore, CompatibilityScores
+from domain.entities.job import Job, JobEntity
+from domain.entities.profile import Profile
+from domain.ports.score_cache import ScoreCachePort
+from domain.services.leads.leads_processor import LeadsProcessor
+from infrastructure.services.chain_registry import ChainRegistry
+from infrastructure.services.compatibility_score import CompatibilityScoreLLM
+
+
+class FakeScoringLLM:
+    """
+    Structured output chat model scoring a job by the number in its description,
+    reporting the prompt length as token usage.
+    """
+
+    def __init__(self, drop: tuple[str, ...] = (), broken: bool = False):
+        """
+        Initialize the fake model.
+
+        Args:
+            drop: Batch keys left out of the batch answers.
+            broken: Answer every batch with an unparsable output.
+        """
+        self.drop = drop
+        self.broken = broken
+        self.prompts: list[str] = []
+
+    def with_structured_output(self, schema, include_raw: bool = False) -> RunnableLambda:
+        """
+        Build the runnable answering the prompts with the given schema.
+
+        Args:
+            schema: CompatibilityScore or CompatibilityScores.
+            include_raw: Must be True, the raw message carries the token usage.
+
+        Returns:
+            RunnableLambda: The fake structured output runnable.
+        """
+        assert include_raw
+
+        def answer(prompt) -> dict:
+            text = prompt.to_string()
+            self.prompts.append(text)
+            raw = AIMessage(
+                content="",
+                usage_metadata={"input_tokens": len(text) // 4, "output_tokens": 10, "total_tokens": 0},
+            )
+            if schema is CompatibilityScore:
+                score = int(re.search(r"score me (\d+)", text).group(1)) # type: ignore
+                return {"raw": raw, "parsed": CompatibilityScore(score=score), "parsing_error": None}
+            if self.broken:
+                return {"raw": raw, "parsed": None, "parsing_error": ValueError("not json")}
+            jobs = re.findall(r'"job_id": "(job_\d+)".*?score me (\d+)', text)
+            parsed = CompatibilityScores(
+                scores=[{"job_id": key, "score": int(score)} for key, score in jobs if key not in self.drop] # type: ignore
+            )
+            return {"raw": raw, "parsed": parsed, "parsing_error": None}
+
+        return RunnableLambda(answer)
+
+
+class TestCompatibilityScoreBatch:
+    """Test suite for the batched compatibility scoring."""
+
+    @pytest.fixture
+    def profile(self) -> Profile:
+        """
+        Create a test profile.
+
+        Returns:
+            Profile: The profile.
+        """
+        return Profile(
+            job_title="Python developer",
+            location="Paris",
+            bio="Backend engineer. " * 50,
+            work_experience=[],
+        ) # type: ignore
+
+    @pytest.fixture
+    def jobs(self) -> JobEntity:
+        """
+        Create seven jobs with a long description and one without description.
+
+        Returns:
+            JobEntity: The jobs.
+        """
+        jobs = [
+            Job(id=f"id-{i}", description=f"score me {10 * i} " + "lorem ipsum " * 400, location="Paris") # type: ignore
+            for i in range(1, 8)
+        ]
+        return JobEntity(jobs=jobs + [Job(id="id-empty", description=None)]) # type: ignore
+
+    def scorer(self, llm: FakeScoringLLM, batch_size: int) -> tuple[CompatibilityScoreLLM, LeadsProcessor]:
+        """
+        Build the scoring adapter on a fake model and the processor using it.
+
+        Args:
+            llm: The fake model.
+            batch_size: Jobs per scoring call.
+
+        Returns:
+            tuple[CompatibilityScoreLLM, LeadsProcessor]: The adapter and the processor.
+        """
+        scoring = CompatibilityScoreLLM()
+        scoring.llm_client = llm # type: ignore
+        scoring.job_token_budget = 50
+        processor = LeadsProcessor(scoring)
+        processor.batch_size = batch_size
+        return scoring, processor
+
+    @pytest.mark.asyncio
+    async def test_batches_match_single_scores_with_fewer_tokens(self, profile: Profile, jobs: JobEntity):
+        """
+        Test that batching gives the same scores as single calls in fewer calls and tokens.
+
+        Args:
+            profile: The test profile.
+            jobs: The test jobs.
+        """
+        single_llm = FakeScoringLLM()
+        single, processor = self.scorer(single_llm, batch_size=1)
+        await processor.calculate_compatibility_scores(profile, jobs)
+        single_scores = [job.compatibility_score for job in jobs.jobs]
+
+        batch_llm = FakeScoringLLM()
+        batch, processor = self.scorer(batch_llm, batch_size=3)
+        await processor.calculate_compatibility_scores(profile, jobs)
+
+        assert [job.compatibility_score for job in jobs.jobs] == single_scores == [10, 20, 30, 40, 50, 60, 70, 0]
+        assert len(single_llm.prompts) == 7
+        # Batches of 3, 3 and 1 job, the last one scored as a single job
+        assert len(batch_llm.prompts) == 3
+        assert all(len(prompt) < 2 * len(single_llm.prompts[0]) for prompt in batch_llm.prompts)
+
+        single_metrics = single.get_metrics()
+        batch_metrics = batch.get_metrics()
+        assert single_metrics["single_jobs"] == 7
+        assert batch_metrics["batch_jobs"] == 6
+        assert batch_metrics["single_jobs"] == 1
+        assert batch_metrics["fallbacks"] == 0
+        assert batch_metrics["batch_tokens_per_job"] < single_metrics["single_tokens_per_job"] / 2
+
+    @pytest.mark.asyncio
+    async def test_missing_or_unparsable_scores_fall_back_to_single_calls(self, profile: Profile, jobs: JobEntity):
+        """
+        Test that jobs left out of a batch answer, or of an unparsable one, are scored one by one.
+
+        Args:
+            profile: The test profile.
+            jobs: The test jobs.
+        """
+        llm = FakeScoringLLM(drop=("job_2",))
+        scoring, processor = self.scorer(llm, batch_size=7)
+        await processor.calculate_compatibility_scores(profile, jobs)
+
+        assert [job.compatibility_score for job in jobs.jobs] == [10, 20, 30, 40, 50, 60, 70, 0]
+        assert len(llm.prompts) == 2
+        assert scoring.get_metrics()["fallbacks"] == 1
+
+        llm = FakeScoringLLM(broken=True)
+        scoring, processor = self.scorer(llm, batch_size=7)
+        with patch("infrastructure.services.compatibility_score.logger") as logger:
+            await processor.calculate_compatibility_scores(profile, jobs)
+
+        assert [job.compatibility_score for job in jobs.jobs] == [10, 20, 30, 40, 50, 60, 70, 0]
+        assert len(llm.prompts) == 8
+        assert scoring.get_metrics()["fallbacks"] == 7
+        logger.warning.assert_called_once()
+
+    def test_descriptions_are_truncated_to_the_token_budget(self, jobs: JobEntity):
+        """
+        Test that the descriptions of a batch are cut on a word boundary.
+
+        Args:
+            jobs: The test jobs.
+        """
+        scoring, _ = self.scorer(FakeScoringLLM(), batch_size=3)
+        rendered = scoring.format_jobs({"job_1": jobs.jobs[0]})
+
+        assert rendered.startswith('{"job_id": "job_1", "location": "Paris", "description": "score me 10 lorem')
+        assert rendered.endswith(' ..."}')
+        assert len(rendered) < 50 * 4 + 80
+
+
+class InMemoryScoreCache(ScoreCachePort):
+    """Score cache kept in a dictionary."""
+
+    def __init__(self):
+        self.scores: dict[str, int] = {}
+        self.lookups: list[list[str]] = []
+
+    async def get_scores(self, keys: list[str]) -> dict[str, int]:
+        self.lookups.append(keys)
+        return {key: self.scores[key] for key in keys if key in self.scores}
+
+    async def save_scores(self, scores: dict[str, int], model: str, prompt_version: str) -> None:
+        self.scores.update(scores)
+
+    def get_metrics(self) -> dict[str, float]:
+        return {"entries": len(self.scores)}
+
+
+class TestScoreCache:
+    """Test suite for the compatibility score cache."""
+
+    @pytest.fixture
+    def profile(self) -> Profile:
+        """
+        Create a test profile.
+
+        Returns:
+            Profile: The profile.
+        """
+        return Profile(job_title="Python developer", location="Paris", bio="Backend engineer", technos=["python"]) # type: ignore
+
+    def scorer(self, llm: FakeScoringLLM, cache: InMemoryScoreCache, batch_size: int) -> LeadsProcessor:
+        """
+        Build a processor scoring with a fake model and a cache.
+
+        Args:
+            llm: The fake model.
+            cache: The score cache.
+            batch_size: Jobs per scoring call.
+
+        Returns:
+            LeadsProcessor: The processor.
+        """
+        scoring = CompatibilityScoreLLM(cache)
+        scoring.llm_client = llm # type: ignore
+        processor = LeadsProcessor(scoring)
+        processor.batch_size = batch_size
+        return processor
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("batch_size", [1, 4])
+    async def test_known_jobs_skip_the_llm(self, profile: Profile, batch_size: int):
+        """
+        Test that a job already scored for the same profile is not sent again, even under
+        another ID, and that a profile change misses the cache.
+
+        Args:
+            profile: The test profile.
+            batch_size: Jobs per scoring call.
+        """
+        cache = InMemoryScoreCache()
+        llm = FakeScoringLLM()
+        first = JobEntity(jobs=[
+            Job(id="a", description="score me 10", location="Paris"),
+            Job(id="b", description="score me 20", location="Paris"),
+        ]) # type: ignore
+        await self.scorer(llm, cache, batch_size).calculate_compatibility_scores(profile, first)
+        calls = len(llm.prompts)
+        assert len(cache.scores) == 2
+
+        # The same posting from another provider, plus a new one
+        second = JobEntity(jobs=[
+            Job(id="c", description="score me 10", location="Paris"),
+            Job(id="d", description="score me 30", location="Paris"),
+        ]) # type: ignore
+        await self.scorer(llm, cache, batch_size).calculate_compatibility_scores(profile, second)
+        assert [job.compatibility_score for job in second.jobs] == [10, 30]
+        assert len(llm.prompts) == calls + 1
+        assert "score me 10" not in llm.prompts[-1]
+
+        # Fields unused by the prompt keep the key, the ones it uses change it
+        profile.technos = ["go"]
+        await self.scorer(llm, cache, batch_size).calculate_compatibility_scores(profile, second)
+        assert len(llm.prompts) == calls + 1
+        profile.bio = "Data engineer"
+        await self.scorer(llm, cache, batch_size).calculate_compatibility_scores(profile, second)
+        assert len(llm.prompts) > calls + 1
+        assert len(cache.scores) == 5
+
+    def test_key_covers_job_model_and_prompt(self, profile: Profile):
+        """
+        Test that the key changes with the job content, the model and the prompt version.
+
+        Args:
+            profile: The test profile.
+        """
+        scoring = CompatibilityScoreLLM(InMemoryScoreCache())
+        profile_hash = scoring.profile_hash(profile)
+        key = scoring.score_key(profile_hash, "description", "Paris")
+
+        assert key == scoring.score_key(profile_hash, "description", "Paris")
+        assert key != scoring.score_key(profile_hash, "description", "Lyon")
+        assert key != scoring.score_key(profile_hash, "other description", "Paris")
+        scoring.model = "Ollama/other"
+        assert key != scoring.score_key(profile_hash, "description", "Paris")
+        scoring.model = CompatibilityScoreLLM().model
+        with patch.object(ChainRegistry, "version", return_value="changed"):
+            assert key != scoring.score_key(profile_hash, "description", "Paris")
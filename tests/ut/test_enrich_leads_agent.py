@@ -0,0 +1,363 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+import pytest
+from langchain_core.runnables import RunnableLambda
+from domain.entities.company import Company, CompanyEntity
+from domain.entities.contact import ContactEntity
+from domain.entities.job import Job, JobEntity
+from domain.entities.leads import Leads
+from domain.entities.profile import Profile
+from infrastructure.services.enrich_leads_agent import nodes
+from infrastructure.services.enrich_leads_agent.agent import EnrichLeadsAgent
+from infrastructure.services.enrich_leads_agent.chains.decision_chain import DecisionChain
+from infrastructure.services.enrich_leads_agent.chains.enrich_chain import EnrichChain
+from infrastructure.services.enrich_leads_agent.models.company_info import CompanyInfo
+from infrastructure.services.enrich_leads_agent.models.contact_info import ContactInfo, ContactInfos
+from infrastructure.services.enrich_leads_agent.models.job_titles import JobTitles
+from infrastructure.services.enrich_leads_agent.models.make_decision import MakeDecisionResult
+from infrastructure.services.enrich_leads_agent.models.search_results_model import SearchResultModel
+from infrastructure.services.enrich_leads_agent.tools.crawl_client import CrawlClient
+from infrastructure.services.enrich_leads_agent.tools.duck_duck_go_client import DuckDuckGoClient
+from infrastructure.services.task_manager import InMemoryTaskManager
+
+
+async def pause(text: str) -> None:
+    """
+    Yield to the event loop for a delay depending on a text, so concurrent runs interleave.
+
+    Args:
+        text: The text deciding the delay.
+    """
+    await asyncio.sleep(0.001 * (len(text) % 5))
+
+
+async def fake_job_titles(profile: Profile) -> list[str]:
+    await pause(profile.job_title or "")
+    return [profile.job_title or ""]
+
+
+async def fake_search(query: str, max_results: int) -> list[SearchResultModel]:
+    await pause(query)
+    slug = query.split(" site:")[0].replace(" ", "-")
+    return [SearchResultModel(title=query, url=f"https://fr.linkedin.com/in/{slug}")]
+
+
+async def fake_contact(company_name: str, result: SearchResultModel) -> ContactInfo:
+    await pause(result.url)
+    return ContactInfo(name=company_name, email=[], title=result.title, phone="", profile_url=[result.url])
+
+
+async def fake_description(company_name: str, pages: list[str]) -> str:
+    await pause(company_name)
+    return f"Description of {company_name}"
+
+
+async def fake_company_info(pages: list[str]) -> CompanyInfo:
+    await pause(pages[0])
+    return CompanyInfo(industry=["Software"], compatibility="80", location=[pages[0]], size="10", revenue="1M")
+
+
+class FakeGraph:
+    """
+    Compiled graph streaming recorded updates.
+    """
+
+    def __init__(self, updates: list[dict]):
+        """
+        Initialize the fake graph.
+
+        Args:
+            updates: The updates streamed by every run.
+        """
+        self.updates = updates
+        self.runs = 0
+
+    async def astream(self, input: dict, stream_mode: str):
+        """
+        Stream the updates of a run.
+
+        Args:
+            input: The initial state.
+            stream_mode: The stream mode.
+        """
+        self.runs += 1
+        for update in self.updates:
+            yield update
+
+
+class FakeTitlesLLM:
+    """
+    Client answering the job titles prompt with fixed titles.
+    """
+
+    def __init__(self):
+        """
+        Initialize the fake client.
+        """
+        self.calls = 0
+
+    def with_structured_output(self, schema, include_raw: bool = False) -> RunnableLambda:
+        """
+        Build a runnable counting its calls.
+
+        Args:
+            schema: The output schema.
+            include_raw: Return the raw message along with the parsed output.
+
+        Returns:
+            RunnableLambda: The fake runnable.
+        """
+        def answer(prompt) -> JobTitles:
+            self.calls += 1
+            return JobTitles(job_titles=["CTO"])
+        return RunnableLambda(answer)
+
+
+class FakeContactsLLM:
+    """
+    Client extracting a contact from the URLs of the prompt, leaving out the last one of a batch.
+    """
+
+    def __init__(self, broken_batch: bool = False):
+        """
+        Initialize the fake client.
+
+        Args:
+            broken_batch: Answer the batch prompt with an unparsable output.
+        """
+        self.broken_batch = broken_batch
+        self.calls: list[str] = []
+
+    def with_structured_output(self, schema, include_raw: bool = False) -> RunnableLambda:
+        """
+        Build a runnable answering the single or batch contact prompt.
+
+        Args:
+            schema: The output schema.
+            include_raw: Return the raw message along with the parsed output.
+
+        Returns:
+            RunnableLambda: The fake runnable.
+        """
+        def answer(prompt):
+            urls = [word for word in prompt.to_string().replace('"', " ").split() if word.startswith("https://")]
+            self.calls.append(schema.__name__)
+            if schema is ContactInfos:
+                if self.broken_batch:
+                    raise ValueError("Unparsable output")
+                urls = sorted(set(urls) - {"https://fr.linkedin.com/in/john-doe-053a4411a"})
+                return ContactInfos(contacts=[
+                    {"url": url, "name": url.rsplit("/", 1)[1], "email": [], "title": "CTO", "phone": "", "profile_url": [url]}
+                    for url in urls[:-1]
+                ])
+            return ContactInfo(name=urls[-1].rsplit("/", 1)[1], email=[], title="CTO", phone="", profile_url=[urls[-1]])
+        return RunnableLambda(answer)
+
+
+class TestEnrichLeadsAgent:
+    """Test suite for the compiled enrichment graph."""
+
+    @pytest.fixture
+    def task_manager(self) -> InMemoryTaskManager:
+        """
+        Create a task manager for testing.
+
+        Returns:
+            InMemoryTaskManager: The task manager.
+        """
+        return InMemoryTaskManager()
+
+    def test_graph_is_drawn_without_rendering(self, task_manager: InMemoryTaskManager) -> None:
+        """
+        Test that the graph is compiled at construction and drawn as Mermaid text.
+        """
+        agent = EnrichLeadsAgent(task_manager)
+
+        diagram = agent.draw()
+        assert "first_step" in diagram
+        assert "aggregate" in diagram
+
+    @pytest.mark.asyncio
+    async def test_runs_reuse_the_graph_and_report_startup(self, task_manager: InMemoryTaskManager) -> None:
+        """
+        Test that every run streams the same compiled graph and records its startup latency.
+        """
+        agent = EnrichLeadsAgent(task_manager)
+        agent.graph = FakeGraph([  # type: ignore
+            {"first_step": {"step": ["Starting enrichment"]}},
+            {"aggregate": {"aggregate": {"enriched_companies": [], "enriched_contacts": []}}},
+        ])
+        await task_manager.submit_task("task")
+        leads = Leads(companies=CompanyEntity(companies=[]), contacts=ContactEntity(contacts=[]))
+        profile = Profile(job_title="Developer", location="FR", bio="", work_experience=[], technos=[])
+
+        with patch.object(EnrichLeadsAgent, "build_graph") as build_graph:
+            await agent.execute(leads, profile, "task")
+            await agent.execute(leads, profile, "task")
+
+        build_graph.assert_not_called()
+        assert agent.graph.runs == 2  # type: ignore
+        task = await task_manager.get_task_status("task")
+        assert task.message == "Enrichment step: ['Starting enrichment']"
+        assert task.enrichment_startup_seconds is not None
+        assert task.enrichment_startup_seconds >= 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_are_isolated(self, task_manager: InMemoryTaskManager) -> None:
+        """
+        Test that 20 enrichments sharing one agent each get the contacts and descriptions of
+        their own leads and profile.
+        """
+        agent = EnrichLeadsAgent(task_manager)
+        runs = []
+        for i in range(20):
+            await task_manager.submit_task(f"task-{i}")
+            leads = Leads(
+                companies=CompanyEntity(companies=[Company(id=f"c{i}", name=f"Company {i}")]),
+                jobs=JobEntity(jobs=[Job(id=f"j{i}", company_id=f"c{i}")]),
+                contacts=ContactEntity(contacts=[]),
+            )
+            profile = Profile(job_title=f"Title {i}", location="FR", bio="", work_experience=[], technos=[])
+            runs.append((leads, profile, f"task-{i}"))
+
+        with patch.object(EnrichChain, "extract_interesting_job_titles_from_profile", AsyncMock(side_effect=fake_job_titles)), \
+            patch.object(EnrichChain, "extract_contact_from_web_search", AsyncMock(side_effect=fake_contact)), \
+            patch.object(EnrichChain, "get_company_description", AsyncMock(side_effect=fake_description)), \
+            patch.object(EnrichChain, "extract_other_info_from_description", AsyncMock(side_effect=fake_company_info)), \
+            patch.object(DecisionChain, "decide_enrichment", AsyncMock(return_value=MakeDecisionResult(result=True))), \
+            patch.object(DuckDuckGoClient, "search", AsyncMock(side_effect=fake_search)), \
+            patch.object(CrawlClient, "crawl_page", AsyncMock(side_effect=lambda url: url)):
+            results = await asyncio.gather(*(agent.execute(*run) for run in runs))
+
+        for i, leads in enumerate(results):
+            contacts = leads.contacts.contacts  # type: ignore
+            companies = leads.companies.companies  # type: ignore
+            assert leads is runs[i][0]
+            assert [(c.company_id, c.job_id, c.name) for c in contacts] == [(f"c{i}", f"j{i}", f"Company {i}")]
+            assert contacts[0].title == f"Company {i} Title {i} site:fr.linkedin.com"
+            assert [c.id for c in companies] == [f"c{i}"]
+            assert companies[0].description == f"Description of Company {i}"
+            assert f"Company-{i}" in (companies[0].location or "")
+
+    @pytest.mark.asyncio
+    async def test_contacts_use_titles_and_jobs_prepared_once(self, task_manager: InMemoryTaskManager) -> None:
+        """
+        Test that the prospect titles are extracted once per run, and that each company only
+        searches contacts for its own jobs.
+        """
+        agent = EnrichLeadsAgent(task_manager)
+        await task_manager.submit_task("task")
+        leads = Leads(
+            companies=CompanyEntity(companies=[
+                Company(id="c1", name="Company 1"),
+                Company(id="c2", name="Company 2"),
+                Company(id="c3", name="Company 3"),
+            ]),
+            jobs=JobEntity(jobs=[Job(id="j1", company_id="c1"), Job(id="j2", company_id="c2")]),
+            contacts=ContactEntity(contacts=[]),
+        )
+        profile = Profile(job_title="Developer", location="FR", bio="", work_experience=[], technos=[])
+
+        with patch.object(EnrichChain, "extract_interesting_job_titles_from_profile", AsyncMock(side_effect=fake_job_titles)) as job_titles, \
+            patch.object(EnrichChain, "extract_contact_from_web_search", AsyncMock(side_effect=fake_contact)), \
+            patch.object(EnrichChain, "get_company_description", AsyncMock(side_effect=fake_description)), \
+            patch.object(EnrichChain, "extract_other_info_from_description", AsyncMock(side_effect=fake_company_info)), \
+            patch.object(DecisionChain, "decide_enrichment", AsyncMock(return_value=MakeDecisionResult(result=False))), \
+            patch.object(DuckDuckGoClient, "search", AsyncMock(side_effect=fake_search)) as search:
+            result = await agent.execute(leads, profile, "task")
+
+        job_titles.assert_awaited_once()
+        assert search.await_count == 2
+        contacts = sorted(result.contacts.contacts, key=lambda c: c.company_id)  # type: ignore
+        assert [(c.company_id, c.job_id) for c in contacts] == [("c1", "j1"), ("c2", "j2")]
+
+    @pytest.mark.asyncio
+    async def test_job_titles_are_cached_per_profile(self) -> None:
+        """
+        Test that the prospect titles of a profile are extracted once across runs.
+        """
+        llm = FakeTitlesLLM()
+        chain = EnrichChain(llm)  # type: ignore
+        profile = Profile(job_title="Developer", location="FR", bio="", work_experience=[], technos=[])
+
+        assert await chain.extract_interesting_job_titles_from_profile(profile) == ["CTO"]
+        assert await chain.extract_interesting_job_titles_from_profile(profile.model_copy()) == ["CTO"]
+        assert llm.calls == 1
+        await chain.extract_interesting_job_titles_from_profile(profile.model_copy(update={"technos": ["Python"]}))
+        assert llm.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_contact_steps_run_concurrently(self, task_manager: InMemoryTaskManager) -> None:
+        """
+        Test that the searches of a company overlap within their limit, that emails are
+        validated off the event loop, and that the company statistics are recorded.
+        """
+        agent = EnrichLeadsAgent(task_manager)
+        agent.EnrichLeadsNodes.search_slots = asyncio.Semaphore(2)
+        running = 0
+        peak = 0
+        threads: set[str] = set()
+
+        async def slow_search(query: str, max_results: int) -> list[SearchResultModel]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return await fake_search(query, max_results)
+
+        async def contact_with_email(company_name: str, result: SearchResultModel) -> ContactInfo:
+            contact = await fake_contact(company_name, result)
+            contact.email = ["a@company.fr"]
+            return contact
+
+        def validate(mail: str, **kwargs):
+            threads.add(threading.current_thread().name)
+            return type("EmailInfo", (), {"email": mail})()
+
+        state = {
+            "company": Company(id="c1", name="Company 1"),
+            "job_titles": ["CTO", "VP", "Head", "Lead"],
+            "jobs": [Job(id="j1", company_id="c1")],
+            "step": [],
+        }
+        with patch.object(EnrichChain, "extract_contact_from_web_search", AsyncMock(side_effect=contact_with_email)), \
+            patch.object(DuckDuckGoClient, "search", AsyncMock(side_effect=slow_search)), \
+            patch.object(nodes, "validate_email", validate):
+            result = await agent.EnrichLeadsNodes.enrich_contacts(state)  # type: ignore
+
+        assert peak == 2
+        assert [contact.title for contact in result["enriched_contacts"]] == [
+            f"Company 1 {title} site:fr.linkedin.com" for title in ["CTO", "VP", "Head", "Lead"]
+        ]
+        assert all(contact.email == ["a@company.fr"] for contact in result["enriched_contacts"])
+        assert threads and all(name.startswith("validate_email") for name in threads)
+        metrics = agent.EnrichLeadsNodes.get_metrics()
+        assert metrics["companies"] == 1
+        assert metrics["searches"] == 4
+        assert metrics["contacts"] == 4
+        assert metrics["emails"] == 4
+        assert metrics["total_seconds_max"] > 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("broken_batch, calls", [(False, 2), (True, 4)])
+    async def test_contacts_are_extracted_by_batch(self, broken_batch: bool, calls: int) -> None:
+        """
+        Test that a batch of results is extracted with one call, and that the results missing
+        from its answer, or all of them when it cannot be parsed, are extracted one by one.
+        """
+        llm = FakeContactsLLM(broken_batch)
+        chain = EnrichChain(llm)  # type: ignore
+        results = [
+            SearchResultModel(title=f"Person {i}", url=f"https://fr.linkedin.com/in/person-{i}", snippet="CTO")
+            for i in range(3)
+        ]
+
+        contacts = await chain.extract_contacts_from_web_search("Company", results)
+
+        assert {url: contact.name for url, contact in contacts.items()} == {  # type: ignore
+            f"https://fr.linkedin.com/in/person-{i}": f"person-{i}" for i in range(3)
+        }
+        assert len(llm.calls) == calls
+        assert llm.calls[0] == "ContactInfos"
@@ -1,7 +1,12 @@
 import pytest
 from unittest.mock import AsyncMock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from application.api.leads_routes import leads_router
 from application.use_cases.get_leads import GetLeadsUseCase
 from config import DatabaseConfig
+from infrastructure.services.leads_cache import InMemoryLeadsCache
+from infrastructure.services.pagination import Paginator
 from domain.entities.leads import Leads
 from domain.entities.company import Company, CompanyEntity
 from domain.entities.job import Job, JobEntity
@@ -335,3 +340,77 @@ class TestGetLeads:
         assert result.contacts is not None
         assert len(result.contacts.contacts) == 2
         assert result.contacts.contacts[0].name == "Marie Dubois"
+
+    @pytest.mark.asyncio
+    async def test_get_jobs_with_cursor(
+        self,
+        jobs_use_case: GetLeadsUseCase,
+        mock_repository: AsyncMock
+    ):
+        """
+        Test that the keyset cursor is forwarded to the repository.
+        
+        Args:
+            jobs_use_case: The configured use case for jobs.
+            mock_repository: The mock repository.
+        """
+        # Execute the use case with a cursor
+        await jobs_use_case.get_leads(0, 3, "eyJzY29yZSI6OTUsImlkIjoiam9iXzEifQ")
+        
+        # Verify the cursor reached the repository
+        mock_repository.get_jobs.assert_called_once_with(0, 3, "eyJzY29yZSI6OTUsImlkIjoiam9iXzEifQ")
+
+    @pytest.mark.asyncio
+    async def test_get_companies_cached(
+        self,
+        mock_repository: AsyncMock
+    ):
+        """
+        Test that a cached page is served without hitting the repository until a write invalidates it.
+        
+        Args:
+            mock_repository: The mock repository.
+        """
+        cache = InMemoryLeadsCache(ttl=60.0)
+        use_case = GetLeadsUseCase(type="companies", repository=mock_repository, cache=cache)
+
+        first = await use_case.get_leads(0, 2)
+        second = await use_case.get_leads(0, 2)
+
+        # Second call is served from the cache
+        assert second == first
+        mock_repository.get_companies.assert_called_once_with(0, 2, None)
+        assert cache.get_metrics()["hits"] == 1
+
+        # A write bumps the generation and the next call reaches the repository
+        await cache.invalidate()
+        await use_case.get_leads(0, 2)
+        assert mock_repository.get_companies.call_count == 2
+
+    def test_invalid_cursor_is_a_bad_request(self, mock_repository: AsyncMock):
+        """
+        Test that a malformed cursor, or one with values of the wrong type, is answered with a 400 instead of a 500.
+
+        Args:
+            mock_repository: The mock repository.
+        """
+        def decode(offset: int, limit: int, cursor: str):
+            return Paginator().decode_cursor(cursor, ("score", "id"))
+
+        mock_repository.get_jobs.side_effect = decode
+        app = FastAPI()
+        app.include_router(
+            leads_router({}, mock_repository, *(AsyncMock() for _ in range(5))) # type: ignore
+        )
+
+        client = TestClient(app)
+
+        for cursor in (
+            "not-a-cursor",
+            Paginator.encode_cursor({"score": "x", "id": "not-a-uuid"}),
+            Paginator.encode_cursor({"score": 80, "id": 12}),
+        ):
+            response = client.get("/leads/jobs/0/3", params={"cursor": cursor})
+
+            assert response.status_code == 400
+            assert response.json()["detail"] == "Invalid pagination cursor"
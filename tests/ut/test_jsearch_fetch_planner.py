@@ -0,0 +1,133 @@
+import asyncio
+import httpx
+import pytest
+from config import JsearchConfig
+from infrastructure.api.client import BaseApiClient
+from infrastructure.services.jsearch import JsearchAPI
+from infrastructure.services.query_metrics import QueryMetrics
+
+
+class FakeJsearchServer:
+    """
+    In-process JSearch endpoint returning a fixed number of jobs per title and page.
+    """
+
+    def __init__(self, results: dict[str, list[int]]):
+        """
+        Initialize the server.
+
+        Args:
+            results: Number of jobs returned by each page of each title.
+        """
+        self.results = results
+        self.calls: list[tuple[str, int]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        """
+        Serve a search request after a short delay.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            httpx.Response: The JSearch payload of the requested page.
+        """
+        title = request.url.params["query"].split(" in ")[0]
+        page = int(request.url.params["page"])
+        self.calls.append((title, page))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01 * page)
+        self.in_flight -= 1
+        pages = self.results.get(title, [])
+        count = pages[page - 1] if page <= len(pages) else 0
+        data = [
+            {"employer_name": f"{title} company {page}-{index}", "job_title": title, "job_id": f"{title}-{page}-{index}"}
+            for index in range(count)
+        ]
+        return httpx.Response(200, json={"status": "OK", "request_id": "fake", "data": data})
+
+
+class TestJsearchFetchPlanner:
+    """Test suite for the multi-title, multi-page JSearch fetch."""
+
+    @pytest.fixture
+    def jsearch_config(self) -> JsearchConfig:
+        """
+        Create a test configuration with a budget of 6 queries, 2 at a time.
+
+        Returns:
+            JsearchConfig: Test configuration object.
+        """
+        return JsearchConfig(
+            JSEARCH_API_URL="https://jsearch.p.rapidapi.com",
+            RAPIDAPI_API_KEY=["test-rapidapi-key"],
+            JSEARCH_MAX_PAGES=3,
+            JSEARCH_MAX_QUERIES=6,
+            JSEARCH_CONCURRENCY=2,
+        )
+
+    @pytest.mark.asyncio
+    async def test_expands_titles_and_pages_within_budget(self, jsearch_config: JsearchConfig):
+        """
+        Test that every title is searched, full pages are followed and the budget is respected.
+
+        Args:
+            jsearch_config: The test configuration.
+        """
+        server = FakeJsearchServer({"python": [10, 10, 3], "java": [4], "rust": [10, 10, 10]})
+        api = JsearchAPI(jsearch_config, BaseApiClient(transport=httpx.MockTransport(server.handler)))
+
+        leads = await api.fetch_leads("france", ["python", "java", "rust", "python "])
+
+        # First pages of every title, then the next pages of the full ones until the budget is spent
+        assert sorted(server.calls[:3]) == [("java", 1), ("python", 1), ("rust", 1)]
+        assert len(server.calls) == 6
+        assert ("java", 2) not in server.calls
+        assert server.max_in_flight <= 2
+        metrics = api.query_metrics.get_metrics()
+        assert len(leads.jobs.jobs) == len(leads.companies.companies) == metrics["results"]
+        assert metrics["queries"] == 6
+        assert metrics["errors"] == 0
+        assert 0 < metrics["latency_ms_p50"] <= metrics["latency_ms_max"]
+
+    @pytest.mark.asyncio
+    async def test_streams_pages_as_they_complete(self, jsearch_config: JsearchConfig):
+        """
+        Test that the first page is yielded before the slower queries finish.
+
+        Args:
+            jsearch_config: The test configuration.
+        """
+        server = FakeJsearchServer({"python": [10, 10, 10], "java": [10, 10, 10]})
+        api = JsearchAPI(jsearch_config, BaseApiClient(transport=httpx.MockTransport(server.handler)))
+
+        yielded_after: list[int] = []
+        async for leads in api.stream_leads("france", ["python", "java"]):
+            assert len(leads.jobs.jobs) == 10
+            yielded_after.append(len(server.calls))
+
+        assert len(yielded_after) == 6
+        assert yielded_after[0] < len(server.calls)
+
+    @pytest.mark.asyncio
+    async def test_query_metrics_accumulate_across_fetches(self, jsearch_config: JsearchConfig):
+        """
+        Test that the adapters of successive fetches report into the same shared metrics.
+
+        Args:
+            jsearch_config: The test configuration.
+        """
+        server = FakeJsearchServer({"python": [4], "java": [2]})
+        query_metrics = QueryMetrics()
+        client = BaseApiClient(transport=httpx.MockTransport(server.handler))
+
+        await JsearchAPI(jsearch_config, client, query_metrics=query_metrics).fetch_leads("france", ["python"])
+        await JsearchAPI(jsearch_config, client, query_metrics=query_metrics).fetch_leads("france", ["java"])
+
+        metrics = query_metrics.get_metrics()
+        assert metrics["queries"] == 2
+        assert metrics["results"] == 6
+        assert metrics["results_per_query"] == 3.0
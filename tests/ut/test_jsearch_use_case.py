@@ -6,6 +6,7 @@ from domain.entities.compatibility_score import CompatibilityScore
 from domain.entities.contact import ContactEntity
 from domain.entities.job import Job, JobEntity
 from domain.entities.profile import Profile
+from domain.entities.upsert_result import UpsertResult
 from domain.ports.enrich_leads import EnrichLeadsPort
 from domain.ports.profile_respository import ProfileRepositoryPort
 from domain.ports.task_manager import TaskManagerPort
@@ -21,10 +22,12 @@ from infrastructure.services.enrich_leads_agent.models.make_decision import Make
 from infrastructure.services.enrich_leads_agent.models.search_results_model import SearchResultModel
 from infrastructure.services.enrich_leads_agent.tools.crawl_client import CrawlClient
 from infrastructure.services.enrich_leads_agent.tools.duck_duck_go_client import DuckDuckGoClient
+from infrastructure.api.client import BaseApiClient
 from infrastructure.services.jsearch import JsearchAPI
 from config import DatabaseConfig, JsearchConfig
 from infrastructure.services.leads_database import LeadsDatabase
 from domain.entities.leads_result import LeadsResult
+from infrastructure.services.database_engine import DatabaseEngine
 from infrastructure.services.profile_database import ProfileDatabase
 from infrastructure.services.task_manager import InMemoryTaskManager
 
@@ -169,7 +172,7 @@ class TestJsearchUseCase:
         Returns:
             ActiveJobsDBStrategy: Configured Active Jobs DB strategy.
         """
-        return LeadsDatabase(DatabaseConfig().DATABASE_URL) # type: ignore
+        return LeadsDatabase(DatabaseEngine(DatabaseConfig())) # type: ignore
 
     @pytest.fixture
     def compatibility_score_llm(self) -> CompatibilityScore:
@@ -189,7 +192,7 @@ class TestJsearchUseCase:
         Returns:
             ProfileRepositoryPort: Mocked profile repository.
         """
-        return ProfileDatabase(DatabaseConfig().DATABASE_URL) # type: ignore
+        return ProfileDatabase(DatabaseEngine(DatabaseConfig())) # type: ignore
     
     @pytest.fixture
     def leads_processor(self) -> LeadsProcessor:
@@ -464,13 +467,12 @@ class TestJsearchUseCase:
             mock_crawl.return_value = crawl_page
             mock_search.return_value = search
 
-            mock_repo.save_leads = AsyncMock(return_value=None)
+            mock_repo.save_leads = AsyncMock(side_effect=lambda leads: UpsertResult(inserted=[j.id for j in leads.jobs.jobs] + [c.id for c in leads.contacts.contacts])) # type: ignore
             mock_repo.get_jobs = AsyncMock(return_value=JobEntity(jobs=[], pages=1))
             mock_repo.get_companies = AsyncMock(return_value=CompanyEntity(companies=[], pages=1))
             mock_repo.get_contacts = AsyncMock(return_value=ContactEntity(contacts=[], pages=1)) # type: ignore
-            mock_repo.get_jobs_by_title_and_location = AsyncMock(return_value=JobEntity(jobs=[])) # type: ignore
-            mock_repo.get_companies_by_names = AsyncMock(return_value=CompanyEntity(companies=[])) # type: ignore
-            mock_repo.get_contacts_by_name_and_title = AsyncMock(return_value=ContactEntity(contacts=[])) # type: ignore
+            mock_repo.match_companies = AsyncMock(side_effect=lambda companies: UpsertResult(inserted=[c.id for c in companies.companies])) # type: ignore
+            mock_repo.match_jobs = AsyncMock(side_effect=lambda jobs: UpsertResult(inserted=[j.id for j in jobs.jobs])) # type: ignore
             mock_repo.get_leads = AsyncMock(return_value=None)
             # Execute the use case
             result = await use_case.insert_leads()
@@ -484,6 +486,9 @@ class TestJsearchUseCase:
             assert result.jobs == "insert of 1 jobs"
             assert result.contacts == "insert of 0 contacts"
             assert task.status == "completed"
+            assert [stage.name for stage in task.stages] == ["fetch", "deduplicate", "diff", "score", "enrich", "persist"]
+            assert task.stages[-1].jobs == 1
+            assert task.prefiltered_jobs == 0
 
     @pytest.mark.asyncio
     async def test_get_leads_success_no_insert(
@@ -537,13 +542,12 @@ class TestJsearchUseCase:
             mock_crawl.return_value = crawl_page
             mock_search.return_value = search
             
-            mock_repo.save_leads = AsyncMock(return_value=None)
+            mock_repo.save_leads = AsyncMock(side_effect=lambda leads: UpsertResult(inserted=[j.id for j in leads.jobs.jobs] + [c.id for c in leads.contacts.contacts])) # type: ignore
             mock_repo.get_jobs = AsyncMock(return_value=JobEntity(jobs=[], pages=1))
             mock_repo.get_companies = AsyncMock(return_value=CompanyEntity(companies=[], pages=1))
             mock_repo.get_contacts = AsyncMock(return_value=ContactEntity(contacts=[], pages=1))
-            mock_repo.get_jobs_by_title_and_location = AsyncMock(return_value=jobs_database)
-            mock_repo.get_companies_by_names = AsyncMock(return_value=companies_database)
-            mock_repo.get_contacts_by_name_and_title = AsyncMock(return_value=ContactEntity(contacts=[])) # type: ignore
+            mock_repo.match_companies = AsyncMock(side_effect=lambda companies: UpsertResult(existing={c.id: companies_database.companies[0].id for c in companies.companies})) # type: ignore
+            mock_repo.match_jobs = AsyncMock(side_effect=lambda jobs: UpsertResult(existing={j.id: jobs_database.jobs[0].id for j in jobs.jobs})) # type: ignore
             mock_repo.get_leads = AsyncMock(return_value=None)
             
             # Execute the use case
@@ -558,3 +562,34 @@ class TestJsearchUseCase:
             assert result.jobs == "insert of 0 jobs"
             assert result.contacts == "insert of 0 contacts"
             assert task.status == "completed"
+
+    @pytest.mark.asyncio
+    async def test_key_rotation_reuses_shared_client(
+        self,
+        jsearch_config: JsearchConfig,
+        sample_jsearch_response: dict
+    ) -> None:
+        """
+        Test that a 429 retries with the next key through the same pooled client.
+        
+        Args:
+            jsearch_config: The test configuration.
+            sample_jsearch_response: Mock JSearch response.
+        """
+        jsearch_config.RAPIDAPI_API_KEY = ["exhausted-key", "fresh-key"]
+        http_client = BaseApiClient()
+        api = JsearchAPI(jsearch_config, http_client)
+        rate_limited = MagicMock(status_code=429)
+        success = MagicMock(status_code=200)
+        success.json.return_value = sample_jsearch_response
+
+        async with http_client.run():
+            shared = http_client.client
+            with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
+                mock_get.side_effect = [rate_limited, success]
+                await api._make_request_with_retry(api.search_endpoint, {"query": "python"})
+                assert http_client.client is shared
+
+        keys = [call.kwargs["headers"]["x-rapidapi-key"] for call in mock_get.call_args_list]
+        assert keys == ["exhausted-key", "fresh-key"]
+        assert http_client.get_metrics()["requests"] == 2
@@ -0,0 +1,164 @@
+import json
+import pytest
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, Optional
+from domain.entities.company import Company, CompanyEntity
+from domain.entities.contact import Contact, ContactEntity
+from domain.entities.job import Job, JobEntity
+from domain.entities.leads import Leads
+from infrastructure.services.leads_database import LeadsDatabase
+
+
+class FakeConnection:
+    """
+    Connection recording the statements and COPY calls of a transaction.
+    Every upserted record is reported as inserted.
+    """
+
+    def __init__(self, copy: bool):
+        """
+        Initialize the connection.
+
+        Args:
+            copy: Whether the driver connection supports COPY.
+        """
+        self.statements: list[tuple[str, dict]] = []
+        self.copied: dict[str, tuple[list[str], list[tuple]]] = {}
+        driver = SimpleNamespace()
+        if copy:
+            driver.copy_records_to_table = self.copy_records_to_table
+        self.raw_connection = SimpleNamespace(driver_connection=driver)
+
+    async def get_raw_connection(self) -> SimpleNamespace:
+        return self.raw_connection
+
+    async def copy_records_to_table(self, table: str, records: list[tuple], columns: list[str]) -> None:
+        self.copied[table] = (columns, records)
+
+    async def execute(self, statement: Any, parameters: Optional[dict] = None) -> SimpleNamespace:
+        sql = str(statement)
+        self.statements.append((sql, parameters or {}))
+        if "rows" in (parameters or {}):
+            ids = [row["id"] for row in json.loads(parameters["rows"])] # type: ignore
+        else:
+            staging = next((table for table in self.copied if f"FROM {table}" in sql), None)
+            ids = [str(record[0]) for record in self.copied[staging][1]] if staging else []
+        rows = [SimpleNamespace(input_id=id, id=id, inserted=True) for id in ids]
+        return SimpleNamespace(fetchall=lambda: rows)
+
+
+def leads() -> Leads:
+    """
+    Build the same leads on every call.
+
+    Returns:
+        Leads: A company with a job and a contact.
+    """
+    company_id = "00000000-0000-0000-0000-000000000001"
+    job_id = "00000000-0000-0000-0000-000000000002"
+    return Leads(
+        companies=CompanyEntity(companies=[Company(id=company_id, name="Acme", opportunities=["python"])]), # type: ignore
+        jobs=JobEntity(jobs=[
+            Job(
+                id=job_id, company_id=company_id, job_title="Python developer", location="Paris",
+                date_creation="2025-01-02T03:04:05", apply_url=["https://acme.test/jobs/1"], compatibility_score=80,
+            ) # type: ignore
+        ]),
+        contacts=ContactEntity(contacts=[
+            Contact(
+                id="00000000-0000-0000-0000-000000000003", company_id=company_id, job_id=job_id,
+                name="jane doe", title="cto", email=["jane@acme.test"],
+            ) # type: ignore
+        ]),
+    ) # type: ignore
+
+
+class TestLeadsDatabaseBulkInsert:
+    """Test suite for the COPY bulk mode of the leads upserts."""
+
+    async def save(self, bulk_insert: bool, copy: bool) -> tuple[LeadsDatabase, FakeConnection, Any]:
+        """
+        Save the test leads through a recording connection.
+
+        Args:
+            bulk_insert: Whether the repository uses the bulk mode.
+            copy: Whether the driver supports COPY.
+
+        Returns:
+            tuple[LeadsDatabase, FakeConnection, Any]: The repository, the connection and the upsert result.
+        """
+        connection = FakeConnection(copy)
+
+        @asynccontextmanager
+        async def begin():
+            yield connection
+
+        repository = LeadsDatabase(SimpleNamespace(engine=SimpleNamespace(begin=begin)), bulk_insert=bulk_insert) # type: ignore
+        result = await repository.save_leads(leads())
+        return repository, connection, result
+
+    @staticmethod
+    def input_rows(connection: FakeConnection) -> list[list[dict]]:
+        """
+        Read the rows fed to each upsert, whether copied or passed as a JSON parameter.
+
+        Args:
+            connection: The recording connection.
+
+        Returns:
+            list[list[dict]]: The input rows of each upsert, in execution order, as JSON values.
+        """
+        upserts = []
+        for sql, parameters in connection.statements:
+            if "CREATE TEMP TABLE" in sql:
+                continue
+            if "rows" in parameters:
+                upserts.append(json.loads(parameters["rows"]))
+                continue
+            staging = next(table for table in connection.copied if f"FROM {table}" in sql)
+            columns, records = connection.copied[staging]
+            upserts.append(json.loads(json.dumps([dict(zip(columns, record)) for record in records], default=str)))
+        return upserts
+
+    @staticmethod
+    def upsert_bodies(connection: FakeConnection) -> list[str]:
+        """
+        Strip the input source of each upsert statement.
+
+        Args:
+            connection: The recording connection.
+
+        Returns:
+            list[str]: The statements from their UPDATE on.
+        """
+        return [sql.split("updated AS", 1)[1] for sql, _ in connection.statements if "updated AS" in sql]
+
+    @pytest.mark.asyncio
+    async def test_copy_and_json_paths_write_the_same_rows(self) -> None:
+        """
+        Test that the COPY staging tables feed the upserts with the rows of the JSON parameter.
+        """
+        _, rows_connection, rows_result = await self.save(bulk_insert=False, copy=True)
+        _, copy_connection, copy_result = await self.save(bulk_insert=True, copy=True)
+
+        assert set(copy_connection.copied) == {"_upsert_companies", "_upsert_jobs", "_upsert_contacts"}
+        assert not rows_connection.copied
+        assert self.input_rows(copy_connection) == self.input_rows(rows_connection)
+        assert len(self.input_rows(copy_connection)) == 3
+        assert self.upsert_bodies(copy_connection) == self.upsert_bodies(rows_connection)
+        assert copy_result == rows_result
+        assert len(copy_result.inserted) == 3
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_json_without_copy(self) -> None:
+        """
+        Test that the bulk mode falls back to the JSON parameter when the driver has no COPY.
+        """
+        _, rows_connection, rows_result = await self.save(bulk_insert=False, copy=False)
+        repository, fallback_connection, fallback_result = await self.save(bulk_insert=True, copy=False)
+
+        assert not any("CREATE TEMP TABLE" in sql for sql, _ in fallback_connection.statements)
+        assert fallback_connection.statements == rows_connection.statements
+        assert fallback_result == rows_result
+        assert repository.bulk_insert is False
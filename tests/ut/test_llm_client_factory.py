@@ -0,0 +1,57 @@
+import pytest
+from config import LLMConfig
+from infrastructure.api.llm_client_factory import LLMClientFactory
+
+
+class TestLLMClientFactory:
+    """Test suite for the shared LLM clients."""
+
+    @pytest.fixture(autouse=True)
+    def clear_registry(self):
+        """
+        Start and end every test with an empty client registry.
+        """
+        LLMClientFactory.clear()
+        yield
+        LLMClientFactory.clear()
+
+    @pytest.fixture
+    def config(self) -> LLMConfig:
+        """
+        Create the LLM configuration from the environment, with a smaller Ollama pool.
+
+        Returns:
+            LLMConfig: The configuration.
+        """
+        config = LLMConfig() # type: ignore
+        config.LLM_PROVIDER_MAX_CONNECTIONS = {"Ollama": 4}
+        return config
+
+    def test_same_model_shares_one_client(self, config: LLMConfig) -> None:
+        """
+        Test that every service asking for the same model gets the same client.
+        """
+        client = LLMClientFactory("Ollama/qwen2.5:7b", config).create_client()
+
+        assert LLMClientFactory("Ollama/qwen2.5:7b", LLMConfig()).create_client() is client # type: ignore
+        assert LLMClientFactory("Ollama/qwen2.5:3b", config).create_client() is not client
+        config.TEMPERATURE = 0.5
+        assert LLMClientFactory("Ollama/qwen2.5:7b", config).create_client() is not client
+
+    def test_pools_are_sized_per_provider(self, config: LLMConfig) -> None:
+        """
+        Test that the provider override caps the connection pool of its clients only.
+        """
+        factory = LLMClientFactory("Ollama/qwen2.5:7b", config)
+
+        assert factory.limits("Ollama").max_connections == 4
+        assert factory.limits("Ollama").max_keepalive_connections == 4
+        assert factory.limits("OpenRouter").max_connections == config.LLM_MAX_CONNECTIONS
+        assert factory.create_client().client_kwargs == {"limits": factory.limits("Ollama")} # type: ignore
+
+    def test_unknown_provider_is_rejected(self, config: LLMConfig) -> None:
+        """
+        Test that a model without a known provider prefix raises a ValueError.
+        """
+        with pytest.raises(ValueError):
+            LLMClientFactory("Unknown/model", config).create_client()
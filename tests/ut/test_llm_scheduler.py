@@ -0,0 +1,156 @@
+import asyncio
+import httpx
+import pytest
+from infrastructure.api.llm_scheduler import (
+    BULK,
+    ENRICHMENT,
+    INTERACTIVE,
+    LLMScheduler,
+    _Bucket,
+    retry_after,
+)
+
+
+def rate_limited(retry_after: str = "0") -> httpx.HTTPStatusError:
+    """
+    Build the error of a 429 answer.
+
+    Args:
+        retry_after: The Retry-After header of the answer.
+
+    Returns:
+        httpx.HTTPStatusError: The error.
+    """
+    request = httpx.Request("POST", "http://llm/chat")
+    response = httpx.Response(429, headers={"retry-after": retry_after}, request=request)
+    return httpx.HTTPStatusError("Too Many Requests", request=request, response=response)
+
+
+class TestLLMScheduler:
+    """Test suite for the process-wide admission of the LLM calls."""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_is_capped_across_callers(self) -> None:
+        """
+        Test that concurrent callers of one model never exceed its in-flight limit,
+        while another model keeps its own slots.
+        """
+        scheduler = LLMScheduler(2, {"OpenRouter": {"in_flight": 3}})
+        running = {"Ollama/a": 0, "OpenRouter/b": 0}
+        peaks = {"Ollama/a": 0, "OpenRouter/b": 0}
+
+        def call(model: str):
+            async def send():
+                running[model] += 1
+                peaks[model] = max(peaks[model], running[model])
+                await asyncio.sleep(0.01)
+                running[model] -= 1
+                return model
+            return send
+
+        results = await asyncio.gather(
+            *(scheduler.run(model, call(model)) for model in ["Ollama/a", "OpenRouter/b"] * 10)
+        )
+
+        assert results == ["Ollama/a", "OpenRouter/b"] * 10
+        assert peaks == {"Ollama/a": 2, "OpenRouter/b": 3}
+        metrics = scheduler.get_metrics()
+        assert metrics["Ollama/a_calls"] == 10
+        assert metrics["Ollama/a_in_flight"] == 0
+        assert metrics["Ollama/a_queue_wait_seconds_max"] > 0
+
+    @pytest.mark.asyncio
+    async def test_waiting_calls_are_served_by_priority(self) -> None:
+        """
+        Test that an interactive call queued after bulk ones is admitted first.
+        """
+        scheduler = LLMScheduler(1)
+        order: list[str] = []
+        gate = asyncio.Event()
+
+        async def blocking():
+            await gate.wait()
+            return "first"
+
+        def call(name: str):
+            async def send():
+                order.append(name)
+                return name
+            return send
+
+        first = asyncio.create_task(scheduler.run("Ollama/a", blocking))
+        await asyncio.sleep(0)
+        queued = [
+            asyncio.create_task(scheduler.run("Ollama/a", call("bulk"), BULK)),
+            asyncio.create_task(scheduler.run("Ollama/a", call("enrichment"), ENRICHMENT)),
+            asyncio.create_task(scheduler.run("Ollama/a", call("interactive"), INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.get_metrics()["Ollama/a_queued"] == 3
+        gate.set()
+        await asyncio.gather(first, *queued)
+
+        assert order == ["interactive", "enrichment", "bulk"]
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_call_is_retried(self) -> None:
+        """
+        Test that a 429 is retried after its Retry-After delay and counted.
+        """
+        scheduler = LLMScheduler(2, max_retries=2)
+        attempts = 0
+
+        async def send():
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise rate_limited()
+            return "ok"
+
+        assert await scheduler.run("Ollama/a", send) == "ok"
+        assert attempts == 3
+        assert scheduler.get_metrics()["Ollama/a_rate_limited"] == 2
+        assert scheduler.get_metrics()["Ollama/a_in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_other_errors_and_exhausted_retries_are_raised(self) -> None:
+        """
+        Test that only 429s are retried, and at most max_retries times.
+        """
+        scheduler = LLMScheduler(1, max_retries=1, backoff_base=0.0)
+
+        async def failing():
+            raise ValueError("invalid output")
+
+        async def limited():
+            raise rate_limited()
+
+        with pytest.raises(ValueError):
+            await scheduler.run("Ollama/a", failing)
+        with pytest.raises(httpx.HTTPStatusError):
+            await scheduler.run("Ollama/a", limited)
+        assert scheduler.get_metrics()["Ollama/a_rate_limited"] == 1
+        assert scheduler.get_metrics()["Ollama/a_in_flight"] == 0
+
+    def test_retry_after_header_is_read(self) -> None:
+        """
+        Test that the delay of a 429 comes from its Retry-After header.
+        """
+        assert retry_after(rate_limited("2.5")) == 2.5
+        assert retry_after(rate_limited("soon")) == 0.0
+        assert retry_after(ValueError("invalid output")) is None
+
+    def test_bucket_refills_per_minute(self) -> None:
+        """
+        Test that a spent budget refills continuously over a minute.
+        """
+        now = [0.0]
+        bucket = _Bucket(60, lambda: now[0])
+
+        assert bucket.delay(60) == 0.0
+        bucket.spend(60)
+        assert bucket.delay(1) == pytest.approx(1.0)
+        now[0] = 30.0
+        assert bucket.delay(30) == 0.0
+        assert bucket.delay(45) == pytest.approx(15.0)
+        assert _Bucket(None, lambda: now[0]).delay(1000) == 0.0
@@ -0,0 +1,115 @@
+import asyncio
+import pytest
+from domain.services.pipeline import Pipeline, Stage
+
+
+class TestPipeline:
+    """Test suite for the staged ingestion pipeline."""
+
+    @staticmethod
+    async def numbers(count: int, produced: list[int]):
+        """
+        Yield the numbers of a source, recording how far it got.
+
+        Args:
+            count: Number of items.
+            produced: Receives every yielded item.
+        """
+        for i in range(count):
+            produced.append(i)
+            yield i
+
+    @pytest.mark.asyncio
+    async def test_items_flow_through_stages_and_batches(self):
+        """
+        Test that every item goes through the stages and reaches the last one in batches.
+        """
+        produced: list[int] = []
+        batches: list[list[int]] = []
+
+        async def double(item: int) -> int:
+            await asyncio.sleep(0.001 * (item % 3))
+            return item * 2
+
+        async def drop_odd(item: int):
+            return item if item % 4 == 0 else None
+
+        async def persist(batch: list[int]) -> None:
+            await asyncio.sleep(0.005)
+            batches.append(batch)
+
+        pipeline = Pipeline(
+            [
+                Stage("double", double, concurrency=3),
+                Stage("filter", drop_odd),
+                Stage("persist", persist, batch_size=4),
+            ],
+            queue_size=2,
+        )
+        stages = await pipeline.run(self.numbers(20, produced))
+
+        assert sorted(i for batch in batches for i in batch) == [i * 2 for i in range(0, 20, 2)]
+        assert all(len(batch) <= 4 for batch in batches)
+        assert len(batches) < 10
+        assert [stage.name for stage in stages] == ["fetch", "double", "filter", "persist"]
+        assert [stage.items for stage in stages] == [20, 20, 20, 10]
+        assert stages[1].concurrency == 3
+        assert all(stage.queue_depth == 0 and stage.in_flight == 0 for stage in stages)
+
+    @pytest.mark.asyncio
+    async def test_full_queue_holds_back_the_source(self):
+        """
+        Test that a slow stage stops the source once the queues are full.
+        """
+        produced: list[int] = []
+        release = asyncio.Event()
+        progress = []
+
+        async def slow(item: int) -> int:
+            await release.wait()
+            return item
+
+        async def report(stages) -> None:
+            progress.append(stages)
+
+        pipeline = Pipeline([Stage("slow", slow)], queue_size=2, on_progress=report)
+        run = asyncio.create_task(pipeline.run(self.numbers(100, produced)))
+        await asyncio.sleep(0.05)
+
+        # One item in the worker, two queued and one waiting for a free slot
+        assert len(produced) == 4
+        assert pipeline.stats()[1].queue_depth == 2
+        assert pipeline.stats()[1].in_flight == 1
+
+        release.set()
+        stages = await run
+        assert stages[1].items == 100
+        assert progress[-1][1].items == 100
+
+    @pytest.mark.asyncio
+    async def test_failing_stage_cancels_the_pipeline(self):
+        """
+        Test that the first error stops every stage and is raised to the caller.
+        """
+        produced: list[int] = []
+        cancelled = []
+
+        async def fail(item: int) -> int:
+            if item == 3:
+                raise ValueError("boom")
+            return item
+
+        async def hang(item: int) -> int:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(item)
+                raise
+            return item
+
+        pipeline = Pipeline([Stage("fail", fail), Stage("hang", hang, concurrency=2)])
+        with pytest.raises(ValueError, match="boom"):
+            await asyncio.wait_for(pipeline.run(self.numbers(100, produced)), timeout=1)
+
+        assert sorted(cancelled) == [0, 1]
+        assert len(produced) < 100
@@ -0,0 +1,143 @@
+import threading
+import pytest
+from unittest.mock import AsyncMock
+from domain.entities.compatibility_score import CompatibilityScore
+from domain.entities.job import Job, JobEntity
+from domain.entities.profile import Profile
+from domain.entities.work_experience import WorkExperience
+from domain.ports.compatibility_score import CompatibilityScorePort
+from domain.services.leads.leads_processor import LeadsProcessor
+from domain.services.leads.prefilter import JobPrefilter
+
+
+class TestJobPrefilter:
+    """Test suite for the local pre-filter of the compatibility scoring."""
+
+    @pytest.fixture
+    def profile(self) -> Profile:
+        """
+        Create a Python backend profile based in Paris.
+
+        Returns:
+            Profile: The profile.
+        """
+        return Profile(
+            job_title="Senior Python Developer",
+            location="Paris",
+            technos=["Python", "FastAPI", "PostgreSQL", "C++"],
+            work_experience=[WorkExperience(position="Backend engineer")],
+        ) # type: ignore
+
+    @pytest.fixture
+    def jobs(self) -> list[Job]:
+        """
+        Create jobs from a close match to an unrelated one.
+
+        Returns:
+            list[Job]: The jobs.
+        """
+        return [
+            Job(id="sales", description="Account executive selling software licences to retail chains.", location="Paris"),
+            Job(id="python-lyon", description="Backend developer: Python, FastAPI and PostgreSQL services.", location="Lyon"),
+            Job(id="python-paris", description="Senior Python developer. Python, FastAPI, PostgreSQL, some C++.", location="Paris, France"),
+            Job(id="java", description="Java developer working on Spring services and PostgreSQL.", location="Remote"),
+            Job(id="c", description="Embedded C engineer writing firmware, with pythonic test scripts.", location="Berlin"),
+        ] # type: ignore
+
+    def test_relevance_ranks_matching_jobs_first(self, profile: Profile, jobs: list[Job]):
+        """
+        Test that the relevance follows the techno overlap and the location match, deterministically.
+
+        Args:
+            profile: The test profile.
+            jobs: The test jobs.
+        """
+        prefilter = JobPrefilter(threshold=0.22)
+        relevance = prefilter.relevance(profile, jobs)
+
+        assert relevance.tolist() == prefilter.relevance(profile, jobs).tolist()
+        assert ((relevance >= 0) & (relevance <= 1)).all()
+        ranked = [job.id for job in prefilter.split(profile, jobs)[0]]
+        assert ranked == ["python-paris", "java", "python-lyon"]
+        # C and pythonic are not the C++ and Python technos, only engineer matches
+        assert relevance[4] < 0.05
+        assert relevance[1] > relevance[0]
+
+    def test_jobs_under_threshold_get_heuristic_score(self, profile: Profile, jobs: list[Job]):
+        """
+        Test that irrelevant jobs are scored locally with a score under the threshold.
+
+        Args:
+            profile: The test profile.
+            jobs: The test jobs.
+        """
+        candidates, skipped = JobPrefilter(threshold=0.22).split(profile, jobs)
+
+        assert {job.id for job in skipped} == {"sales", "c"}
+        assert all(job.compatibility_score is not None and job.compatibility_score < 22 for job in skipped)
+        assert all(job.compatibility_score is None for job in candidates)
+
+    def test_empty_profile_keeps_every_job(self, jobs: list[Job]):
+        """
+        Test that a profile without any query term does not filter anything out.
+
+        Args:
+            jobs: The test jobs.
+        """
+        candidates, skipped = JobPrefilter(threshold=0.9).split(Profile(), jobs) # type: ignore
+
+        assert [job.id for job in candidates] == [job.id for job in jobs]
+        assert skipped == []
+
+    @pytest.mark.asyncio
+    async def test_skipped_jobs_do_not_reach_the_llm(self, profile: Profile, jobs: list[Job]):
+        """
+        Test that the processor only calls the LLM for the relevant jobs, best ones first.
+
+        Args:
+            profile: The test profile.
+            jobs: The test jobs.
+        """
+        port = AsyncMock(spec=CompatibilityScorePort)
+        port.get_compatibility_score.return_value = CompatibilityScore(score=90)
+        processor = LeadsProcessor(port)
+        processor.prefilter = JobPrefilter(threshold=0.22)
+        entity = JobEntity(jobs=jobs + [Job(id="empty")]) # type: ignore
+
+        await processor.calculate_compatibility_scores(profile, entity)
+
+        described = [call.kwargs["job_description"] for call in port.get_compatibility_score.call_args_list]
+        assert len(described) == 3
+        assert described[0].startswith("Senior Python developer")
+        scores = {job.id: job.compatibility_score for job in entity.jobs}
+        assert scores["python-paris"] == scores["python-lyon"] == scores["java"] == 90
+        assert scores["sales"] < 22 and scores["c"] < 22 and scores["empty"] == 0
+        assert processor.prefiltered == 2
+
+    @pytest.mark.asyncio
+    async def test_large_chunks_are_prefiltered_off_the_event_loop(
+        self, profile: Profile, jobs: list[Job], monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Test that a chunk above PREFILTER_INLINE_JOBS is pre-filtered in a worker thread
+        with the same outcome.
+
+        Args:
+            profile: The test profile.
+            jobs: The test jobs.
+            monkeypatch: Lowers the inline threshold.
+        """
+        monkeypatch.setattr("domain.services.leads.leads_processor.PREFILTER_INLINE_JOBS", 0)
+        port = AsyncMock(spec=CompatibilityScorePort)
+        port.get_compatibility_score.return_value = CompatibilityScore(score=90)
+        processor = LeadsProcessor(port)
+        processor.prefilter = JobPrefilter(threshold=0.22)
+        calls = []
+        split = processor.prefilter.split
+        processor.prefilter.split = lambda *args: calls.append(threading.current_thread()) or split(*args) # type: ignore
+
+        await processor.calculate_compatibility_scores(profile, JobEntity(jobs=jobs)) # type: ignore
+
+        assert calls and calls[0] is not threading.main_thread()
+        assert port.get_compatibility_score.await_count == 3
+        assert processor.prefiltered == 2
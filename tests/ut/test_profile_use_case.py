@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import patch, AsyncMock
 from application.use_cases.profile import ProfileUseCase
+from infrastructure.services.database_engine import DatabaseEngine
 from infrastructure.services.profile_database import ProfileDatabase
 from config import DatabaseConfig
 from domain.entities.profile import Profile
@@ -92,7 +93,7 @@ class TestProfileUseCase:
         Returns:
             ProfileDatabase: Configured profile database repository.
         """
-        return ProfileDatabase(database_config.DATABASE_URL)
+        return ProfileDatabase(DatabaseEngine(database_config))
 
     @pytest.fixture
     def profile_use_case(self, profile_database: ProfileDatabase) -> ProfileUseCase:
@@ -0,0 +1,261 @@
+import asyncio
+import httpx
+import pytest
+from config import ActiveJobsDBConfig, JsearchConfig
+from infrastructure.api.client import BaseApiClient
+from infrastructure.api.rapidapi_key_pool import RapidApiKeyPool
+from infrastructure.services.active_jobs_db import ActiveJobsDBAPI
+from infrastructure.services.jsearch import JsearchAPI
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeRapidApiServer:
+    """
+    In-process RapidAPI gateway enforcing a request quota per key and
+    reporting it through the x-ratelimit-requests-* headers.
+    """
+
+    def __init__(self, quotas: dict[str, int], reset: int = 3600, body: object = None):
+        """
+        Initialize the server.
+
+        Args:
+            quotas: Number of requests allowed per key.
+            reset: Seconds until the quotas reset, as reported to the clients.
+            body: JSON body of the successful responses.
+        """
+        self.quotas = dict(quotas)
+        self.limits = dict(quotas)
+        self.reset = reset
+        self.body = body if body is not None else {"status": "OK", "data": []}
+        self.calls: list[str] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """
+        Serve a request, consuming the quota of its key.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            httpx.Response: 200 with the body, 403 for unknown keys or 429 once the quota is spent.
+        """
+        key = request.headers.get("x-rapidapi-key", "")
+        self.calls.append(key)
+        if key not in self.quotas:
+            return httpx.Response(403, json={"message": "You are not subscribed to this API."})
+        headers = {
+            "x-ratelimit-requests-limit": str(self.limits[key]),
+            "x-ratelimit-requests-reset": str(self.reset),
+        }
+        if self.quotas[key] <= 0:
+            headers["x-ratelimit-requests-remaining"] = "0"
+            return httpx.Response(429, json={"message": "Too many requests"}, headers=headers)
+        self.quotas[key] -= 1
+        headers["x-ratelimit-requests-remaining"] = str(self.quotas[key])
+        return httpx.Response(200, json=self.body, headers=headers)
+
+    def client(self) -> BaseApiClient:
+        """
+        Build a shared client whose requests are served by this fake server.
+
+        Returns:
+            BaseApiClient: The client.
+        """
+        return BaseApiClient(transport=httpx.MockTransport(self.handler))
+
+
+class TestRapidApiKeyPool:
+    """Test suite for the RapidAPI key scheduler."""
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        """
+        Create a manually advanced clock.
+
+        Returns:
+            FakeClock: The clock.
+        """
+        return FakeClock()
+
+    @pytest.fixture
+    def jsearch_config(self) -> JsearchConfig:
+        """
+        Create a test configuration for JSearch API.
+
+        Returns:
+            JsearchConfig: Test configuration object.
+        """
+        return JsearchConfig(
+            JSEARCH_API_URL="https://jsearch.p.rapidapi.com",
+            RAPIDAPI_API_KEY=["key-a", "key-b", "key-c"],
+        )
+
+    @pytest.mark.asyncio
+    async def test_picks_key_with_most_remaining_quota(
+        self, jsearch_config: JsearchConfig, clock: FakeClock
+    ):
+        """
+        Test that requests spread over the keys according to their reported quota.
+
+        Args:
+            jsearch_config: The test configuration.
+            clock: The fake clock.
+        """
+        server = FakeRapidApiServer({"key-a": 2, "key-b": 10, "key-c": 5})
+        pool = RapidApiKeyPool(jsearch_config.RAPIDAPI_API_KEY, clock=clock)
+        api = JsearchAPI(jsearch_config, server.client(), pool)
+
+        for _ in range(12):
+            await api._make_request_with_retry(api.search_endpoint, {"query": "python"})
+
+        # Every key is probed once, then the fullest one is used until the quotas level out
+        assert server.calls[:3] == ["key-a", "key-b", "key-c"]
+        assert server.calls.count("key-b") > server.calls.count("key-c") > server.calls.count("key-a")
+        assert sum(server.quotas.values()) == 5
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_key_cools_down_until_reset(
+        self, jsearch_config: JsearchConfig, clock: FakeClock
+    ):
+        """
+        Test that a key answering 429 is skipped until the reset time it reported.
+
+        Args:
+            jsearch_config: The test configuration.
+            clock: The fake clock.
+        """
+        server = FakeRapidApiServer({"key-a": 0, "key-b": 0, "key-c": 1}, reset=120)
+        pool = RapidApiKeyPool(jsearch_config.RAPIDAPI_API_KEY, clock=clock)
+        api = JsearchAPI(jsearch_config, server.client(), pool)
+
+        await api._make_request_with_retry(api.search_endpoint, {"query": "python"})
+        assert server.calls == ["key-a", "key-b", "key-c"]
+
+        # key-c spent its last request: every key is cooling down
+        with pytest.raises(Exception, match="All API keys exhausted"):
+            await api._make_request_with_retry(api.search_endpoint, {"query": "python"})
+        assert len(server.calls) == 3
+
+        metrics = pool.get_metrics()
+        assert metrics["key_0_rate_limited"] == 1
+        assert metrics["key_0_cooldown_seconds"] == 120
+        assert metrics["key_2_requests"] == 1
+
+        # Once the quota resets the keys are probed again
+        clock.now += 121
+        server.quotas = {"key-a": 5, "key-b": 5, "key-c": 5}
+        await api._make_request_with_retry(api.search_endpoint, {"query": "python"})
+        assert len(server.calls) == 4
+
+    def test_throttled_key_with_quota_left_cools_down_for_retry_after(self, clock: FakeClock):
+        """
+        Test that a 429 leaving quota is waited out for its Retry-After, not the quota period.
+
+        Args:
+            clock: The fake clock.
+        """
+        pool = RapidApiKeyPool(["key-a", "key-b"], default_cooldown=30, clock=clock)
+        quota_left = {"x-ratelimit-requests-remaining": "42", "x-ratelimit-requests-reset": "86400"}
+
+        pool.release(pool.acquire(), httpx.Response(429, headers={**quota_left, "retry-after": "5"}))
+        pool.release(pool.acquire(), httpx.Response(429, headers=quota_left))
+
+        metrics = pool.get_metrics()
+        assert metrics["key_0_rate_limited"] == metrics["key_1_rate_limited"] == 1
+        assert metrics["key_0_cooldown_seconds"] == 5
+        assert metrics["key_1_cooldown_seconds"] == 30
+        assert pool.next_available_in() == 5
+
+    @pytest.mark.asyncio
+    async def test_pool_is_shared_between_adapters(self, clock: FakeClock):
+        """
+        Test that JSearch and Active Jobs DB requests draw from the same pool and client.
+
+        Args:
+            clock: The fake clock.
+        """
+        keys = ["key-a", "key-b"]
+        server = FakeRapidApiServer({"key-a": 1, "key-b": 3})
+        client = server.client()
+        pool = RapidApiKeyPool(keys, clock=clock)
+        jsearch = JsearchAPI(
+            JsearchConfig(JSEARCH_API_URL="https://jsearch.p.rapidapi.com", RAPIDAPI_API_KEY=keys),
+            client,
+            pool,
+        )
+        active_jobs_db = ActiveJobsDBAPI(
+            ActiveJobsDBConfig(ACTIVE_JOBS_DB_URL="https://active-jobs-db.p.rapidapi.com", RAPIDAPI_API_KEY=keys),
+            client,
+            pool,
+        )
+
+        async with client.run():
+            await asyncio.gather(
+                jsearch._make_request_with_retry(jsearch.search_endpoint, {"query": "python"}),
+                jsearch._make_request_with_retry(jsearch.search_endpoint, {"query": "java"}),
+            )
+            server.body = []
+            await active_jobs_db._make_request_with_retry(active_jobs_db.endpoint, {"limit": 10})
+            await active_jobs_db._make_request_with_retry(active_jobs_db.endpoint, {"limit": 10})
+
+        # Concurrent requests take different keys, then the remaining quota drives the choice
+        assert sorted(server.calls[:2]) == ["key-a", "key-b"]
+        assert server.calls[2:] == ["key-b", "key-b"]
+        assert client.get_metrics()["requests"] == 4
+        metrics = pool.get_metrics()
+        assert metrics["key_0_requests"] + metrics["key_1_requests"] == 4
+        assert metrics["key_0_in_flight"] == metrics["key_1_in_flight"] == 0
+        assert not any(key in name for name in metrics for key in keys + ["ey-a", "ey-b"])
+
+    @pytest.mark.asyncio
+    async def test_fetch_waits_for_a_cooling_down_key(
+        self, clock: FakeClock, monkeypatch: pytest.MonkeyPatch
+    ):
+        """
+        Test that a JSearch fetch waits for the first key to come back when every key
+        cools down, and fails instead of stopping silently when that takes too long.
+
+        Args:
+            clock: The fake clock.
+            monkeypatch: Replaces the sleep by an advance of the fake clock.
+        """
+        keys = ["key-a", "key-b"]
+        server = FakeRapidApiServer({"key-a": 5, "key-b": 5})
+        pool = RapidApiKeyPool(keys, clock=clock)
+        api = JsearchAPI(
+            JsearchConfig(
+                JSEARCH_API_URL="https://jsearch.p.rapidapi.com", RAPIDAPI_API_KEY=keys, RAPIDAPI_KEY_MAX_WAIT=30
+            ),
+            server.client(),
+            pool,
+        )
+        slept: list[float] = []
+
+        async def sleep(delay: float) -> None:
+            slept.append(delay)
+            clock.now += delay
+
+        monkeypatch.setattr("infrastructure.services.jsearch.asyncio.sleep", sleep)
+        pool.keys[0].cooldown_until = clock.now + 20
+        pool.keys[1].cooldown_until = clock.now + 40
+
+        await api.fetch_leads("france", ["python"])
+        assert slept == [20]
+        assert server.calls == ["key-a"]
+
+        # Beyond the maximum wait the queries are skipped and the fetch fails
+        for state in pool.keys:
+            state.cooldown_until = clock.now + 120
+        with pytest.raises(Exception, match="cooling down"):
+            await api.fetch_leads("france", ["python"])
+        assert server.calls == ["key-a"]
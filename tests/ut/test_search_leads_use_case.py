@@ -0,0 +1,86 @@
+import warnings
+import pytest
+from unittest.mock import AsyncMock
+from sqlalchemy.dialects import postgresql
+from application.use_cases.search_leads import SearchLeadsUseCase
+from config import DatabaseConfig
+from domain.entities.job import Job, JobEntity
+from domain.entities.search import SearchFilters, SearchResult
+from infrastructure.services.database_engine import DatabaseEngine
+from infrastructure.services.leads_database import LeadsDatabase
+
+
+class TestSearchLeads:
+    """Test suite for the search leads use case implementation."""
+
+    @pytest.fixture
+    def mock_repository(self) -> AsyncMock:
+        """
+        Create a mock repository returning one matching job.
+
+        Returns:
+            AsyncMock: Mock repository.
+        """
+        repository = AsyncMock()
+        repository.search_jobs.return_value = JobEntity(
+            jobs=[
+                Job(
+                    id="job_1",
+                    company_id="company_1",
+                    company_name="Tech Solutions Inc",
+                    job_title="Senior Python Developer",
+                    location="Paris, France",
+                ) # type: ignore
+            ]
+        )
+        return repository
+
+    @pytest.mark.asyncio
+    async def test_search_jobs_success(self, mock_repository: AsyncMock) -> None:
+        """
+        Test that a job search forwards the filters and reports its metadata.
+
+        Args:
+            mock_repository: The mock repository.
+        """
+        filters = SearchFilters(job_title="python", location="paris") # type: ignore
+        result = await SearchLeadsUseCase("jobs", mock_repository).search(filters, 10)
+
+        mock_repository.search_jobs.assert_called_once_with(filters, 10)
+        assert isinstance(result, SearchResult)
+        assert isinstance(result.results, JobEntity)
+        assert result.results.jobs[0].id == "job_1"
+        assert result.metadata.type == "jobs"
+        assert result.metadata.count == 1
+        assert result.metadata.elapsed_ms >= 0
+
+    @pytest.mark.asyncio
+    async def test_search_unsupported_type(self, mock_repository: AsyncMock) -> None:
+        """
+        Test that searching an unsupported type raises a KeyError.
+
+        Args:
+            mock_repository: The mock repository.
+        """
+        with pytest.raises(KeyError):
+            await SearchLeadsUseCase("leads", mock_repository).search(SearchFilters(), 10) # type: ignore
+
+    @pytest.mark.parametrize("builder", ["_search_jobs_statement", "_search_companies_statement", "_search_contacts_statement"])
+    def test_empty_filters_build_no_where_clause(self, builder: str) -> None:
+        """
+        Test that a search without any filter reads the rows unfiltered, without building
+        an empty condition.
+
+        Args:
+            builder: The name of the search statement builder.
+        """
+        repository = LeadsDatabase(DatabaseEngine(DatabaseConfig())) # type: ignore
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            unfiltered = str(getattr(repository, builder)(SearchFilters(), 10).compile(dialect=postgresql.dialect()))
+            filtered = str(
+                getattr(repository, builder)(SearchFilters(company="acme"), 10).compile(dialect=postgresql.dialect()) # type: ignore
+            )
+
+        assert "WHERE" not in unfiltered
+        assert "WHERE" in filtered and "ILIKE" in filtered
@@ -0,0 +1,214 @@
+import hashlib
+import math
+from unittest.mock import AsyncMock, patch
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from application.use_cases.insert_leads import InsertLeadsUseCase
+from application.use_cases.similar_jobs import SimilarJobsUseCase
+from config import EmbeddingConfig
+from domain.entities.company import Company, CompanyEntity
+from domain.entities.contact import ContactEntity
+from domain.entities.job import Job, JobEntity
+from domain.entities.leads import Leads
+from domain.entities.profile import Profile
+from domain.entities.upsert_result import UpsertResult
+from domain.entities.work_experience import WorkExperience
+from domain.ports.embedder import EmbedderPort
+from domain.services.leads.leads_processor import LeadsProcessor
+from infrastructure.api.llm_client_factory import LLMClientFactory
+from infrastructure.services.embedder import LLMEmbedder
+
+
+class FakeEmbedder(EmbedderPort):
+    """
+    Embedder hashing the words of a text into a normalized bag of words vector,
+    so texts sharing words have a positive cosine similarity.
+    """
+
+    def __init__(self, dimensions: int = 64, broken: bool = False):
+        """
+        Initialize the fake embedder.
+
+        Args:
+            dimensions: Size of the vectors.
+            broken: Fail every call.
+        """
+        self.dimensions = dimensions
+        self.broken = broken
+        self.texts: list[str] = []
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed the texts.
+
+        Args:
+            texts: The texts to embed.
+
+        Returns:
+            One vector per text.
+        """
+        if self.broken:
+            raise ConnectionError("embedding model unavailable")
+        self.texts.extend(texts)
+        vectors = []
+        for text in texts:
+            vector = [0.0] * self.dimensions
+            for word in text.lower().split():
+                vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % self.dimensions] += 1.0
+            norm = math.sqrt(sum(value * value for value in vector)) or 1.0
+            vectors.append([value / norm for value in vector])
+        return vectors
+
+    def get_metrics(self) -> dict[str, float]:
+        """
+        Report the number of embedded texts.
+
+        Returns:
+            The fake metrics.
+        """
+        return {"texts": len(self.texts)}
+
+
+class TestSimilarJobs:
+    """Test suite for the description embeddings and the similar jobs search."""
+
+    @pytest.fixture
+    def profile(self) -> Profile:
+        """
+        Create a Python developer profile.
+
+        Returns:
+            Profile: The profile.
+        """
+        return Profile(
+            job_title="Python Developer",
+            location="Paris",
+            bio="Backend developer",
+            work_experience=[WorkExperience(position="Data Engineer", description="ETL pipelines")], # type: ignore
+            technos=["python", "fastapi"],
+        )
+
+    @pytest.fixture
+    def saved_leads(self) -> Leads:
+        """
+        Create saved leads, one job and one company lacking a description.
+
+        Returns:
+            Leads: The leads.
+        """
+        return Leads(
+            companies=CompanyEntity(companies=[
+                Company(id="company_1", name="Acme", description="Python consulting"), # type: ignore
+                Company(id="company_2", name="Blank"), # type: ignore
+            ]), # type: ignore
+            jobs=JobEntity(jobs=[
+                Job(id="job_1", job_title="Python Developer", description="python fastapi backend"), # type: ignore
+                Job(id="job_2", job_title="Java Developer", description="java spring"), # type: ignore
+                Job(id="job_3", job_title="No description"), # type: ignore
+            ]), # type: ignore
+            contacts=ContactEntity(contacts=[]), # type: ignore
+        ) # type: ignore
+
+    def insert_use_case(self, repository: AsyncMock, embedder: EmbedderPort) -> InsertLeadsUseCase:
+        """
+        Build an insertion use case around a repository and an embedder.
+
+        Args:
+            repository: The mock repository.
+            embedder: The embedder.
+
+        Returns:
+            InsertLeadsUseCase: The use case.
+        """
+        return InsertLeadsUseCase(
+            "task", AsyncMock(), repository, AsyncMock(), AsyncMock(), AsyncMock(), AsyncMock(),
+            embedder=embedder,
+        )
+
+    @pytest.mark.asyncio
+    async def test_embed_stage_saves_description_embeddings(self, saved_leads: Leads) -> None:
+        """
+        Test that the embed stage stores one vector per job and company with a description.
+        """
+        repository = AsyncMock()
+        embedder = FakeEmbedder()
+        await self.insert_use_case(repository, embedder)._embed(saved_leads)
+
+        jobs, companies = repository.save_embeddings.call_args.args
+        assert set(jobs) == {"job_1", "job_2"}
+        assert set(companies) == {"company_1"}
+        assert len(embedder.texts) == 3
+        [expected] = await FakeEmbedder().embed(["Python Developer\npython fastapi backend"])
+        assert jobs["job_1"] == expected
+
+    @pytest.mark.asyncio
+    async def test_persist_forwards_only_inserted_jobs(self, saved_leads: Leads) -> None:
+        """
+        Test that the jobs already stored are neither counted nor embedded again.
+        """
+        repository = AsyncMock()
+        repository.save_leads.return_value = UpsertResult(inserted=["job_1"], existing={"job_2": "job_2"})
+        use_case = self.insert_use_case(repository, FakeEmbedder())
+        use_case.leads_processor = LeadsProcessor(AsyncMock())
+        use_case.inserted = {"companies": 0, "jobs": 0, "contacts": 0}
+        use_case.pending_companies = {}
+
+        forwarded = await use_case._persist([saved_leads])
+
+        assert use_case.inserted["jobs"] == 1
+        assert [job.id for job in forwarded.jobs.jobs] == ["job_1"] # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_embed_stage_failure_does_not_fail_insertion(self, saved_leads: Leads) -> None:
+        """
+        Test that an unavailable embedding model only skips the embeddings.
+        """
+        repository = AsyncMock()
+        await self.insert_use_case(repository, FakeEmbedder(broken=True))._embed(saved_leads)
+
+        repository.save_embeddings.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_similar_jobs_queries_by_profile_embedding(self, profile: Profile) -> None:
+        """
+        Test that the profile is embedded and the ranking delegated to the repository.
+        """
+        repository = AsyncMock()
+        repository.get_similar_jobs.return_value = JobEntity(jobs=[Job(id="job_1")]) # type: ignore
+        profile_repository = AsyncMock()
+        profile_repository.get_profile.return_value = profile
+        embedder = FakeEmbedder()
+
+        result = await SimilarJobsUseCase(repository, profile_repository, embedder).get_similar_jobs(5)
+
+        assert result.jobs[0].id == "job_1"
+        assert embedder.texts == [
+            "Python Developer\npython, fastapi\nBackend developer\nData Engineer: ETL pipelines"
+        ]
+        [expected] = await FakeEmbedder().embed(embedder.texts)
+        repository.get_similar_jobs.assert_called_once_with(expected, 5)
+
+    @pytest.mark.asyncio
+    async def test_similar_jobs_requires_embeddings(self) -> None:
+        """
+        Test that the search fails clearly when the embeddings are disabled.
+        """
+        with pytest.raises(ValueError, match="EMBEDDINGS_ENABLED"):
+            await SimilarJobsUseCase(AsyncMock(), AsyncMock(), None).get_similar_jobs(5)
+
+    @pytest.mark.asyncio
+    async def test_llm_embedder_batches_texts(self) -> None:
+        """
+        Test that the embedder sends EMBEDDING_BATCH_SIZE texts per call, keeping their order.
+        """
+        fake = DeterministicFakeEmbedding(size=8)
+        config = EmbeddingConfig(EMBEDDING_MODEL="Ollama/nomic-embed-text", EMBEDDING_BATCH_SIZE=2) # type: ignore
+        with patch.object(LLMClientFactory, "create_embeddings", return_value=fake):
+            embedder = LLMEmbedder(config)
+        texts = ["a", "b", "c", "d", "e"]
+
+        vectors = await embedder.embed(texts)
+
+        assert vectors == fake.embed_documents(texts)
+        assert embedder.get_metrics()["calls"] == 3
+        assert embedder.get_metrics()["texts"] == 5